@@ -1,16 +1,37 @@
 """
 io_iii.api._bus — In-process session event log (Phase 9 M9.2).
 
-Provides a content-safe, append-only event log per session.  SSE subscribers
-read from the log using a cursor (integer offset into the list).
+Provides a content-safe, bounded event log per session.  SSE subscribers
+read from the log using a cursor (absolute event sequence number).
 
-Design: poll-based rather than push-based.
-- publish() appends to the per-session list under a threading.Lock.
-- get_events_since() returns all events from `cursor` onward.
+Design: push-based wakeups over a bounded ring buffer.
+- publish() appends to the per-session buffer under a threading.Lock and wakes
+  that session's subscribers immediately: threads blocked in
+  Subscription.wait() via a condition variable, coroutines awaiting
+  Subscription.wait_async() via a per-subscriber asyncio.Event set with
+  call_soon_threadsafe. Idle subscribers consume no CPU.
+- Subscription.drain() yields events from the subscriber's cursor straight out
+  of the shared list; fan-out to N subscribers copies nothing. Event dicts
+  are shared between subscribers and must be treated as read-only.
+- get_events_since() is kept for non-subscribing readers and returns a copy.
+- Retention is bounded (BusLimits): each session keeps at most max_events /
+  max_bytes (oldest trimmed first); sessions idle past ttl_seconds, or beyond
+  max_sessions (least recently active first), are evicted unless a
+  subscriber is attached. A subscriber whose cursor fell behind the buffer
+  receives a synthetic events_dropped event with the missed count.
 
-Content-safety (ADR-003): events contain structural metadata only.
+Transient events: publish_transient() hands an event to the subscribers
+attached at that moment and never stores it, so it is not replayed to late
+subscribers, not kept for ttl_seconds and does not count against
+max_events / max_bytes. Each subscriber queues at most max_events of them
+(oldest dropped first, reported through events_dropped); drain() yields
+them in publish order relative to the stored events.
+
+Content-safety (ADR-003): stored events contain structural metadata only.
 No prompt text, model output, persona content, or memory values appear in
-any event payload.
+any stored event payload. The one event type that carries model output,
+turn_output_delta, is transient and exists only behind the content release
+gate (ADR-026).
 
 Event types (ADR-025 §4):
     session_state           — current state on stream connect
@@ -19,41 +40,436 @@ Event types (ADR-025 §4):
     steward_gate_triggered  — when session status → paused
     session_closed          — when session status → closed
     runbook_completed       — after cmd_runbook returns
+    turn_output_delta       — transient; output text chunks (stream=true turns)
     keepalive               — synthetic; emitted by SSE endpoint, not stored here
+    events_dropped          — synthetic; yielded by Subscription.drain(), not stored
 """
 from __future__ import annotations
 
+import asyncio
+import json
 import threading
 import time
-from typing import Any, Dict, List
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+# Defaults; override with configure() / configure_from_runtime().
+_DEFAULT_MAX_EVENTS: int = 1000
+_DEFAULT_MAX_BYTES: int = 1024 * 1024
+_DEFAULT_TTL_SECONDS: float = 3600.0
+_DEFAULT_MAX_SESSIONS: int = 1024
+
+# Synthetic event yielded by Subscription.drain() when a slow subscriber's
+# cursor fell behind the ring buffer.  Never stored in the log.
+EVENTS_DROPPED_EVENT = "events_dropped"
+
+
+@dataclass(frozen=True)
+class BusLimits:
+    """
+    Retention bounds for the event log (runtime.yaml ``event_bus`` block).
+
+    max_events / max_bytes bound each session's ring buffer; ttl_seconds
+    evicts sessions idle for longer than that; max_sessions bounds the number
+    of retained sessions (least recently active evicted first). Sessions with
+    live subscribers are never evicted.
+    """
+    max_events: int = _DEFAULT_MAX_EVENTS
+    max_bytes: int = _DEFAULT_MAX_BYTES
+    ttl_seconds: float = _DEFAULT_TTL_SECONDS
+    max_sessions: int = _DEFAULT_MAX_SESSIONS
+
 
 _lock = threading.Lock()
-# session_id → ordered list of event dicts
-_log: Dict[str, List[Dict[str, Any]]] = {}
+_limits = BusLimits()
+_counters: Dict[str, int] = {"events_trimmed": 0, "sessions_evicted": 0}
+
+
+class _Channel:
+    """
+    Per-session ring buffer plus its live subscribers (guarded by _lock).
+
+    Cursors are absolute sequence numbers: events[0] has sequence `base`.
+    Trimming the front advances `base`, so a cursor below it means the
+    subscriber missed events.
+    """
+
+    __slots__ = ("events", "sizes", "base", "bytes", "subscribers", "cond", "last_active")
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+        self.sizes: List[int] = []
+        self.base = 0
+        self.bytes = 0
+        self.subscribers: Set["Subscription"] = set()
+        self.cond = threading.Condition(_lock)
+        self.last_active = time.monotonic()
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.events)
+
+    def trim(self, limits: BusLimits) -> None:
+        drop = max(0, len(self.events) - limits.max_events)
+        freed = sum(self.sizes[:drop])
+        while drop < len(self.events) - 1 and self.bytes - freed > limits.max_bytes:
+            freed += self.sizes[drop]
+            drop += 1
+        if drop:
+            del self.events[:drop]
+            del self.sizes[:drop]
+            self.base += drop
+            self.bytes -= freed
+            _counters["events_trimmed"] += drop
+
+
+# session_id → channel, least recently active first
+_channels: "OrderedDict[str, _Channel]" = OrderedDict()
+
+
+def _event_size(entry: Dict[str, Any]) -> int:
+    try:
+        return len(json.dumps(entry, default=str))
+    except (TypeError, ValueError):
+        return 256
+
+
+def _touch(session_id: str) -> _Channel:
+    """Return (creating if needed) the channel and mark it most recently active. Caller holds _lock."""
+    channel = _channels.get(session_id)
+    if channel is None:
+        channel = _channels[session_id] = _Channel()
+    else:
+        _channels.move_to_end(session_id)
+    channel.last_active = time.monotonic()
+    return channel
+
+
+def _evict_locked(now: float) -> None:
+    """Drop idle (TTL) and excess (LRU) sessions without subscribers. Caller holds _lock."""
+    limits = _limits
+    excess = len(_channels) - limits.max_sessions
+    for session_id in list(_channels):
+        channel = _channels[session_id]
+        expired = limits.ttl_seconds > 0 and now - channel.last_active > limits.ttl_seconds
+        if not expired and excess <= 0:
+            break  # LRU order: everything after this is newer
+        if channel.subscribers:
+            continue
+        del _channels[session_id]
+        _counters["sessions_evicted"] += 1
+        excess -= 1
+
+
+def configure(
+    *,
+    max_events: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    ttl_seconds: Optional[float] = None,
+    max_sessions: Optional[int] = None,
+) -> BusLimits:
+    """
+    Update retention limits (None keeps the current value) and apply them.
+
+    Raises:
+        ValueError('EVENT_BUS_CONFIG_INVALID: ...') for non-positive limits.
+    """
+    global _limits
+    if ttl_seconds is not None and (
+        not isinstance(ttl_seconds, (int, float)) or isinstance(ttl_seconds, bool)
+    ):
+        raise ValueError("EVENT_BUS_CONFIG_INVALID: ttl_seconds must be a number")
+    current = _limits
+    updated = BusLimits(
+        max_events=current.max_events if max_events is None else max_events,
+        max_bytes=current.max_bytes if max_bytes is None else max_bytes,
+        ttl_seconds=current.ttl_seconds if ttl_seconds is None else float(ttl_seconds),
+        max_sessions=current.max_sessions if max_sessions is None else max_sessions,
+    )
+    for name in ("max_events", "max_bytes", "max_sessions"):
+        value = getattr(updated, name)
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"EVENT_BUS_CONFIG_INVALID: {name} must be a positive integer")
+    if updated.ttl_seconds < 0:
+        raise ValueError("EVENT_BUS_CONFIG_INVALID: ttl_seconds must be >= 0")
+    if updated == current:
+        return current
+    with _lock:
+        _limits = updated
+        for channel in _channels.values():
+            channel.trim(updated)
+        _evict_locked(time.monotonic())
+    return updated
+
+
+def configure_from_runtime(runtime_cfg: Dict[str, Any]) -> BusLimits:
+    """
+    Apply the optional ``event_bus`` block from runtime.yaml::
+
+        event_bus:
+          max_events: 1000      # per session
+          max_bytes: 1048576    # per session
+          ttl_seconds: 3600     # idle session eviction (0 = never)
+          max_sessions: 1024    # LRU bound on retained sessions
+
+    Absent keys fall back to the defaults.
+    """
+    raw = (runtime_cfg or {}).get("event_bus")
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        raise ValueError("EVENT_BUS_CONFIG_INVALID: event_bus must be a mapping")
+    return configure(
+        max_events=raw.get("max_events", _DEFAULT_MAX_EVENTS),
+        max_bytes=raw.get("max_bytes", _DEFAULT_MAX_BYTES),
+        ttl_seconds=raw.get("ttl_seconds", _DEFAULT_TTL_SECONDS),
+        max_sessions=raw.get("max_sessions", _DEFAULT_MAX_SESSIONS),
+    )
 
 
 def publish(session_id: str, event_type: str, payload: Dict[str, Any]) -> None:
-    """Append a content-safe event to the session log (thread-safe)."""
+    """Append a content-safe event to the session log and wake subscribers (thread-safe)."""
+    entry = {
+        "event": event_type,
+        "data": payload,
+        "ts": time.time(),
+    }
+    size = _event_size(entry)
+    with _lock:
+        channel = _touch(session_id)
+        channel.events.append(entry)
+        channel.sizes.append(size)
+        channel.bytes += size
+        channel.trim(_limits)
+        channel.cond.notify_all()
+        waiting = [s for s in channel.subscribers if s._loop is not None]
+        _evict_locked(channel.last_active)
+    for sub in waiting:
+        sub._wake_async()
+
+
+def publish_transient(session_id: str, event_type: str, payload: Dict[str, Any]) -> int:
+    """
+    Hand an event to the currently attached subscribers without storing it.
+
+    Returns the number of subscribers it was queued for (0: nobody is
+    listening and the event is discarded).
+    """
     entry = {
         "event": event_type,
         "data": payload,
         "ts": time.time(),
     }
     with _lock:
-        _log.setdefault(session_id, []).append(entry)
+        channel = _channels.get(session_id)
+        if channel is None or not channel.subscribers:
+            return 0
+        for sub in channel.subscribers:
+            sub._queue_transient(channel.end, entry, _limits.max_events)
+        channel.cond.notify_all()
+        subscribers = list(channel.subscribers)
+    for sub in subscribers:
+        if sub._loop is not None:
+            sub._wake_async()
+    return len(subscribers)
 
 
 def get_events_since(session_id: str, cursor: int) -> List[Dict[str, Any]]:
-    """Return all events from *cursor* onward (non-blocking, thread-safe)."""
+    """
+    Return retained events with sequence >= *cursor* (non-blocking, thread-safe).
+
+    Events already trimmed from the ring buffer are silently skipped; use a
+    Subscription to be told about drops.
+    """
     with _lock:
-        events = _log.get(session_id, [])
-        return list(events[cursor:])
+        channel = _channels.get(session_id)
+        if channel is None:
+            return []
+        return list(channel.events[max(0, cursor - channel.base):])
 
 
 def clear(session_id: str) -> None:
-    """Remove all stored events for a session (e.g. after TTL expiry)."""
+    """
+    Remove all stored events for a session.
+
+    Live subscribers stay attached and continue with events published after
+    the clear (not reported as dropped).
+    """
     with _lock:
-        _log.pop(session_id, None)
+        channel = _channels.get(session_id)
+        if channel is None:
+            return
+        if not channel.subscribers:
+            del _channels[session_id]
+            return
+        channel.base = channel.end
+        channel.events = []
+        channel.sizes = []
+        channel.bytes = 0
+        for sub in channel.subscribers:
+            sub.cursor = channel.base
+
+
+def evict_idle() -> None:
+    """Run TTL / LRU eviction now (publish() also does this as it goes)."""
+    with _lock:
+        _evict_locked(time.monotonic())
+
+
+def subscriber_count(session_id: Optional[str] = None) -> int:
+    """Number of live subscribers for *session_id*, or across all sessions."""
+    with _lock:
+        if session_id is not None:
+            channel = _channels.get(session_id)
+            return len(channel.subscribers) if channel is not None else 0
+        return sum(len(c.subscribers) for c in _channels.values())
+
+
+def stats() -> Dict[str, int]:
+    """Content-safe retention metrics for the whole bus."""
+    with _lock:
+        return {
+            "sessions": len(_channels),
+            "events": sum(len(c.events) for c in _channels.values()),
+            "bytes": sum(c.bytes for c in _channels.values()),
+            "subscribers": sum(len(c.subscribers) for c in _channels.values()),
+            "events_trimmed": _counters["events_trimmed"],
+            "sessions_evicted": _counters["sessions_evicted"],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Subscriptions
+# ---------------------------------------------------------------------------
+
+class Subscription:
+    """
+    A cursor into one session's log that is woken when events are published.
+
+    Use as a context manager (or call close()) so the subscriber count stays
+    accurate:
+
+        with subscribe(session_id) as sub:
+            while await sub.wait_async(timeout=30):
+                for event in sub.drain():
+                    ...
+    """
+
+    def __init__(self, session_id: str, cursor: int = 0) -> None:
+        self.session_id = session_id
+        self.cursor = cursor
+        self.dropped = 0
+        # (stored-event sequence it follows, event) for publish_transient()
+        self._transient: Deque[Tuple[int, Dict[str, Any]]] = deque()
+        self._transient_missed = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        with _lock:
+            channel = _touch(session_id)
+            channel.subscribers.add(self)
+            self._channel = channel
+
+    def _pending(self) -> bool:
+        # Caller holds _lock.
+        return self.cursor < self._channel.end or bool(self._transient) or self._transient_missed > 0
+
+    def _queue_transient(self, position: int, entry: Dict[str, Any], limit: int) -> None:
+        # Caller holds _lock.
+        self._transient.append((position, entry))
+        while len(self._transient) > limit:
+            self._transient.popleft()
+            self._transient_missed += 1
+
+    def _wake_async(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass  # loop already closed; the subscriber is gone
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until unread events exist; False on timeout."""
+        with _lock:
+            return self._channel.cond.wait_for(self._pending, timeout)
+
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """Await unread events without blocking the event loop; False on timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - loop.time()
+            with _lock:
+                if self._pending():
+                    return True
+                if remaining is not None and remaining <= 0:
+                    return False
+                wakeup = self._wakeup = asyncio.Event()
+                self._loop = loop
+            try:
+                await asyncio.wait_for(wakeup.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with _lock:
+                    self._loop = None
+                    self._wakeup = None
+
+    def drain(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield unread events in order and advance the cursor past each one.
+
+        Reads the shared ring buffer in place, so no slice is copied per
+        subscriber.  If the cursor fell behind the buffer (events trimmed
+        before this subscriber read them), a synthetic events_dropped event
+        carrying the count is yielded first and the cursor jumps forward.
+        Transient events are yielded after the stored events published
+        before them.
+        """
+        while True:
+            with _lock:
+                channel = self._channel
+                if self._transient_missed or self.cursor < channel.base:
+                    missed = self._transient_missed + max(0, channel.base - self.cursor)
+                    self._transient_missed = 0
+                    self.cursor = max(self.cursor, channel.base)
+                    self.dropped += missed
+                    event: Dict[str, Any] = {
+                        "event": EVENTS_DROPPED_EVENT,
+                        "data": {"dropped": missed},
+                        "ts": time.time(),
+                    }
+                elif self._transient and self._transient[0][0] <= self.cursor:
+                    event = self._transient.popleft()[1]
+                elif self.cursor < channel.end:
+                    event = channel.events[self.cursor - channel.base]
+                    self.cursor += 1
+                elif self._transient:
+                    event = self._transient.popleft()[1]  # follows an event trimmed or cleared since
+                else:
+                    return
+            yield event
+
+    def close(self) -> None:
+        with _lock:
+            channel = self._channel
+            channel.subscribers.discard(self)
+            channel.last_active = time.monotonic()
+            if _channels.get(self.session_id) is channel:
+                _channels.move_to_end(self.session_id)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def subscribe(session_id: str, cursor: int = 0) -> Subscription:
+    """Attach a new subscriber to *session_id* starting at *cursor*."""
+    return Subscription(session_id, cursor)
 
 
 # Sentinel event type: causes the SSE generator to terminate gracefully.
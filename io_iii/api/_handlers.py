@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from io_iii.capabilities.builtins import builtin_registry
 from io_iii.core.dependencies import RuntimeDependencies
@@ -23,15 +23,14 @@ from io_iii.core.dialogue_session import (
     DEFAULT_SESSION_STORAGE,
     DialogueTurnResult,
     SESSION_STATUS_CLOSED,
-    load_session,
     new_session,
     run_turn,
-    save_session,
     session_status_summary,
 )
 from io_iii.core.engine import ExecutionResult
 from io_iii.core.runbook import Runbook
 from io_iii.core.runbook_runner import run as runbook_runner_run
+from io_iii.core.session_cache import load_session_cached, save_session_cached
 from io_iii.core.session_mode import (
     DEFAULT_SESSION_MODE,
     SessionMode,
@@ -40,6 +39,7 @@ from io_iii.core.session_mode import (
 )
 from io_iii.core.session_state import SessionState
 from io_iii.core.task_spec import TaskSpec
+from io_iii.providers.async_ollama_provider import AsyncOllamaProvider
 from io_iii.providers.ollama_provider import OllamaProvider
 import io_iii.core.orchestrator as _orchestrator
 
@@ -67,6 +67,7 @@ def _build_deps() -> RuntimeDependencies:
         ollama_provider_factory=OllamaProvider.from_config,
         challenger_fn=None,
         capability_registry=builtin_registry(),
+        async_provider_factory=AsyncOllamaProvider.from_config,
     )
 
 
@@ -154,14 +155,18 @@ def handle_runbook(body: dict, cfg) -> Tuple[int, dict]:
     Request body:
         runbook     — Runbook definition dict (required)
         audit       — bool (optional; default False)
+        max_parallel — positive int (optional; default 1 = sequential steps)
 
     Response includes step-level execution results (primary output surface).
     """
     runbook_data = body.get("runbook")
     audit = bool(body.get("audit", False))
+    max_parallel = body.get("max_parallel", 1)
 
     if not isinstance(runbook_data, dict):
         return 400, _err("INVALID_REQUEST_BODY", "runbook must be an object")
+    if not isinstance(max_parallel, int) or isinstance(max_parallel, bool) or max_parallel < 1:
+        return 400, _err("INVALID_REQUEST_BODY", "max_parallel must be a positive integer")
 
     try:
         runbook = Runbook.from_dict(runbook_data)
@@ -171,7 +176,9 @@ def handle_runbook(body: dict, cfg) -> Tuple[int, dict]:
     deps = _build_deps()
 
     try:
-        result = runbook_runner_run(runbook=runbook, cfg=cfg, deps=deps, audit=audit)
+        result = runbook_runner_run(
+            runbook=runbook, cfg=cfg, deps=deps, audit=audit, max_parallel=max_parallel,
+        )
     except Exception as e:
         failure = getattr(e, "runtime_failure", None)
         code = failure.code if failure else type(e).__name__
@@ -245,15 +252,15 @@ def handle_session_start(body: dict, cfg) -> Tuple[int, dict]:
                 audit=audit,
             )
         except Exception as e:
-            save_session(session, storage_root)
+            save_session_cached(session, storage_root, cfg.runtime)
             failure = getattr(e, "runtime_failure", None)
             code = failure.code if failure else type(e).__name__
             return 500, _err(code)
 
-        save_session(session, storage_root)
+        save_session_cached(session, storage_root, cfg.runtime)
         return 200, _turn_result_payload(turn_result)
 
-    save_session(session, storage_root)
+    save_session_cached(session, storage_root, cfg.runtime)
     return 201, {
         "session_id": session.session_id,
         "session_mode": session.session_mode.value,
@@ -286,7 +293,7 @@ def handle_session_turn(session_id: str, body: dict, cfg) -> Tuple[int, dict]:
     storage_root = _session_storage(cfg.runtime)
 
     try:
-        session = load_session(session_id, storage_root)
+        session = load_session_cached(session_id, storage_root, cfg.runtime)
     except ValueError as e:
         code = str(e).split(":")[0]
         return 404, _err(code)
@@ -294,10 +301,10 @@ def handle_session_turn(session_id: str, body: dict, cfg) -> Tuple[int, dict]:
     action = body.get("action")
     if session.is_paused():
         if action == "close":
-            return _do_close(session, storage_root)
+            return _do_close(session, storage_root, cfg.runtime)
         elif action in ("approve", "redirect"):
             session.status = "active"
-            save_session(session, storage_root)
+            save_session_cached(session, storage_root, cfg.runtime)
             if action == "approve" and not body.get("prompt"):
                 return 200, {
                     "session_id": session.session_id,
@@ -332,16 +339,16 @@ def handle_session_turn(session_id: str, body: dict, cfg) -> Tuple[int, dict]:
             audit=audit,
         )
     except ValueError as e:
-        save_session(session, storage_root)
+        save_session_cached(session, storage_root, cfg.runtime)
         code = str(e).split(":")[0]
         return 409, _err(code)
     except Exception as e:
-        save_session(session, storage_root)
+        save_session_cached(session, storage_root, cfg.runtime)
         failure = getattr(e, "runtime_failure", None)
         code = failure.code if failure else type(e).__name__
         return 500, _err(code)
 
-    save_session(session, storage_root)
+    save_session_cached(session, storage_root, cfg.runtime)
     status_code = 202 if turn_result.session.is_paused() else 200
     return status_code, _turn_result_payload(turn_result)
 
@@ -358,7 +365,7 @@ def handle_session_state(session_id: str, cfg) -> Tuple[int, dict]:
     """
     storage_root = _session_storage(cfg.runtime)
     try:
-        session = load_session(session_id, storage_root)
+        session = load_session_cached(session_id, storage_root, cfg.runtime)
     except ValueError as e:
         code = str(e).split(":")[0]
         return 404, _err(code)
@@ -378,12 +385,12 @@ def handle_session_delete(session_id: str, cfg) -> Tuple[int, dict]:
     """
     storage_root = _session_storage(cfg.runtime)
     try:
-        session = load_session(session_id, storage_root)
+        session = load_session_cached(session_id, storage_root, cfg.runtime)
     except ValueError as e:
         code = str(e).split(":")[0]
         return 404, _err(code)
 
-    return _do_close(session, storage_root)
+    return _do_close(session, storage_root, cfg.runtime)
 
 
 # ---------------------------------------------------------------------------
@@ -419,11 +426,11 @@ def _turn_result_payload(turn_result: DialogueTurnResult) -> dict:
     return payload
 
 
-def _do_close(session, storage_root: Path) -> Tuple[int, dict]:
+def _do_close(session, storage_root: Path, runtime_config: Optional[dict] = None) -> Tuple[int, dict]:
     """Mark session closed, persist, return content-safe summary."""
     session.status = SESSION_STATUS_CLOSED
     session.updated_at = _utcnow()
-    save_session(session, storage_root)
+    save_session_cached(session, storage_root, runtime_config)
     return 200, {
         "session_id": session.session_id,
         "status": SESSION_STATUS_CLOSED,
@@ -445,11 +452,14 @@ def execute_session_turn(
     *,
     persona_mode: str = "executor",
     audit: bool = False,
+    on_output_delta: Optional[Callable[[str], None]] = None,
 ) -> Tuple[Optional[DialogueTurnResult], Optional[str]]:
     """
     Load a session, execute one turn, save, and return the result.
 
     Used by both the M9.1 turn endpoint and the M9.2 SSE stream handler.
+    on_output_delta, when given, receives output text deltas as they are
+    produced (streaming SSE only; see engine.run for audit buffering).
 
     Returns:
         (DialogueTurnResult, None)  on success
@@ -458,7 +468,7 @@ def execute_session_turn(
     storage_root = _session_storage(cfg.runtime)
 
     try:
-        session = load_session(session_id, storage_root)
+        session = load_session_cached(session_id, storage_root, cfg.runtime)
     except ValueError as e:
         return None, str(e).split(":")[0]
 
@@ -477,14 +487,15 @@ def execute_session_turn(
             gate=gate,
             persona_mode=persona_mode,
             audit=audit,
+            on_output_delta=on_output_delta,
         )
     except ValueError as e:
-        save_session(session, storage_root)
+        save_session_cached(session, storage_root, cfg.runtime)
         return None, str(e).split(":")[0]
     except Exception as e:
-        save_session(session, storage_root)
+        save_session_cached(session, storage_root, cfg.runtime)
         failure = getattr(e, "runtime_failure", None)
         return None, failure.code if failure else type(e).__name__
 
-    save_session(session, storage_root)
+    save_session_cached(session, storage_root, cfg.runtime)
     return turn_result, None
@@ -5,16 +5,21 @@ Provides SSE formatting and the session stream handler.
 
 SSE event sequence for GET /session/{id}/stream:
     turn_started          — content-safe: session_id, turn_index, persona_mode
+    turn_output_delta     — incremental model text (stream=true only; user-facing)
     turn_output           — model response text (user-facing; not logged/forwarded)
     turn_completed        — content-safe governance metadata
     steward_gate_triggered — emitted instead of turn_completed when gate fires
 
-Execution is synchronous (engine is frozen; no token streaming). Events are
-emitted after the full turn completes — pseudo-streaming over SSE.
+Execution is synchronous. By default events are emitted after the full turn
+completes — pseudo-streaming over SSE. With stream=True the engine forwards
+provider chunks as turn_output_delta events while the turn runs; when audit
+is enabled the engine buffers and releases a single post-gate delta instead.
+turn_output is always sent and remains the authoritative final text.
 
 Content policy (ADR-003 / ADR-025 §4 + §5):
-    turn_output is the only event carrying model output. It is never written
-    to metadata.jsonl or included in webhook payloads (M9.3).
+    turn_output_delta and turn_output are the only events carrying model
+    output. They are never written to metadata.jsonl or included in webhook
+    payloads (M9.3).
 """
 from __future__ import annotations
 
@@ -54,6 +59,7 @@ def format_sse(event: str, data: dict) -> bytes:
 
 _SSE_SESSION_EVENTS: frozenset = frozenset({
     "turn_started",
+    "turn_output_delta",
     "turn_output",
     "turn_completed",
     "steward_gate_triggered",
@@ -84,6 +90,7 @@ def stream_session_turn(
     *,
     persona_mode: str = "executor",
     audit: bool = False,
+    stream: bool = False,
 ) -> None:
     """
     Execute one bounded session turn and emit SSE events to wfile (M9.2).
@@ -94,6 +101,7 @@ def stream_session_turn(
     Event sequence:
         1. turn_started          — emitted immediately (content-safe metadata)
         2. [turn execution runs synchronously]
+           turn_output_delta     — zero or more text chunks (stream=True only)
         3a. turn_output          — model response text (on success)
             turn_completed       — governance metadata (on success, no pause)
         3b. turn_output          — model response text (on pause)
@@ -107,9 +115,10 @@ def stream_session_turn(
         wfile:        writable byte stream (HTTP response body)
         persona_mode: persona route (default "executor")
         audit:        challenger audit flag
+        stream:       emit turn_output_delta events while the turn executes
 
     Content policy (ADR-025 §5):
-        turn_output carries model text — it is the user-facing result.
+        turn_output_delta / turn_output carry model text — the user-facing result.
         All other events are content-safe (structural metadata only).
     """
     # Emit turn_started immediately so the client gets feedback before execution
@@ -119,13 +128,21 @@ def stream_session_turn(
     }))
     _flush(wfile)
 
-    # Execute the turn synchronously (engine is frozen; no token streaming)
+    def _emit_delta(delta: str) -> None:
+        wfile.write(format_sse("turn_output_delta", {
+            "session_id": session_id,
+            "delta": delta,
+        }))
+        _flush(wfile)
+
+    # Execute the turn synchronously; deltas (if any) are written as they arrive.
     turn_result, error_code = execute_session_turn(
         session_id=session_id,
         prompt=prompt,
         cfg=cfg,
         persona_mode=persona_mode,
         audit=audit,
+        on_output_delta=_emit_delta if stream else None,
     )
 
     if error_code is not None:
@@ -0,0 +1,313 @@
+"""
+io_iii.api._warmup — Model warm-up and keep-alive for ``serve``.
+
+routing_table.yaml declares a fixed constellation (executor, challenger,
+explorer, ...). Without warm-up, the first request to each model after an
+idle period pays the full Ollama model load time. When enabled, the API
+server starts a ModelWarmupManager at startup that:
+
+1. resolves every routed mode and collects the distinct ollama models the
+   router would select (the primary target, or the secondary when the
+   primary is unusable — ADR-002 operational fallback);
+2. preloads them in parallel (/api/generate without a prompt);
+3. re-pings each model on a schedule with ``keep_alive`` so Ollama keeps it
+   resident between requests.
+
+Per-model state is exposed on GET /health under ``models``::
+
+    {"mistral:latest": {"state": "warm", "load_ms": 2140,
+                        "last_ping_ms": 12, "pings": 3, "error_code": null}}
+
+States: cold (not yet attempted) → loading → warm | failed. A failed ping
+marks the model failed; the next successful ping marks it warm again.
+
+Configuration (runtime.yaml; absent block = disabled)::
+
+    model_warmup:
+      enabled: true
+      keep_alive: 30m              # forwarded to Ollama (default 30m)
+      ping_interval_seconds: 240   # keep-alive schedule; 0 = preload only
+      parallelism: 4               # concurrent preloads at startup
+
+Warm-up never blocks startup and never fails a request: it runs on
+background threads, and errors only show up in the /health state.
+Content policy (ADR-003): no prompt or model output is involved — only model
+names, states, timings, and exception type names are recorded.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from io_iii.routing import _parse_target, resolve_route
+
+MODEL_COLD = "cold"
+MODEL_LOADING = "loading"
+MODEL_WARM = "warm"
+MODEL_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class WarmupSettings:
+    """Parsed ``model_warmup`` block from runtime.yaml."""
+    keep_alive: Union[str, int] = "30m"
+    ping_interval_seconds: float = 240.0
+    parallelism: int = 4
+
+
+def load_warmup_settings(runtime_config: Dict[str, Any]) -> Optional[WarmupSettings]:
+    """
+    Load WarmupSettings from a runtime config dict.
+
+    Returns None when the block is absent, false, or has enabled: false.
+    ``model_warmup: true`` enables it with defaults.
+
+    Raises:
+        ValueError('MODEL_WARMUP_CONFIG_INVALID: ...') on a malformed block.
+    """
+    raw = (runtime_config or {}).get("model_warmup")
+    if raw is None or raw is False:
+        return None
+    if raw is True:
+        return WarmupSettings()
+    if not isinstance(raw, dict):
+        raise ValueError("MODEL_WARMUP_CONFIG_INVALID: model_warmup must be a mapping or boolean")
+
+    enabled = raw.get("enabled", True)
+    if not isinstance(enabled, bool):
+        raise ValueError("MODEL_WARMUP_CONFIG_INVALID: enabled must be a boolean")
+    if not enabled:
+        return None
+
+    defaults = WarmupSettings()
+    keep_alive = raw.get("keep_alive", defaults.keep_alive)
+    valid_str = isinstance(keep_alive, str) and keep_alive.strip()
+    valid_int = isinstance(keep_alive, int) and not isinstance(keep_alive, bool)
+    if not (valid_str or valid_int):
+        raise ValueError("MODEL_WARMUP_CONFIG_INVALID: keep_alive must be a duration string or seconds")
+
+    interval = raw.get("ping_interval_seconds", defaults.ping_interval_seconds)
+    if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval < 0:
+        raise ValueError("MODEL_WARMUP_CONFIG_INVALID: ping_interval_seconds must be a number >= 0")
+
+    parallelism = raw.get("parallelism", defaults.parallelism)
+    if isinstance(parallelism, bool) or not isinstance(parallelism, int) or parallelism < 1:
+        raise ValueError("MODEL_WARMUP_CONFIG_INVALID: parallelism must be an integer >= 1")
+
+    return WarmupSettings(
+        keep_alive=keep_alive,
+        ping_interval_seconds=float(interval),
+        parallelism=parallelism,
+    )
+
+
+def routed_models(cfg) -> List[str]:
+    """
+    Return the distinct ollama models the router selects across all modes.
+
+    Order follows routing_table.yaml. Modes that resolve to the null
+    provider contribute nothing.
+    """
+    routing_cfg = (cfg.routing or {}).get("routing_table") or {}
+    modes = routing_cfg.get("modes") if isinstance(routing_cfg, dict) else None
+    models: List[str] = []
+    for mode in (modes or {}):
+        selection = resolve_route(
+            routing_cfg=routing_cfg,
+            mode=mode,
+            providers_cfg=cfg.providers,
+            supported_providers={"null", "ollama"},
+        )
+        if selection.selected_provider != "ollama" or not selection.selected_target:
+            continue
+        _, model = _parse_target(selection.selected_target)
+        if model not in models:
+            models.append(model)
+    return models
+
+
+class _ModelState:
+    __slots__ = ("state", "load_ms", "last_ping_ms", "last_ping_at", "pings", "error_code")
+
+    def __init__(self) -> None:
+        self.state = MODEL_COLD
+        self.load_ms: Optional[int] = None
+        self.last_ping_ms: Optional[int] = None
+        self.last_ping_at: Optional[float] = None
+        self.pings = 0
+        self.error_code: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "load_ms": self.load_ms,
+            "last_ping_ms": self.last_ping_ms,
+            "last_ping_at": self.last_ping_at,
+            "pings": self.pings,
+            "error_code": self.error_code,
+        }
+
+
+class ModelWarmupManager:
+    """
+    Preloads routed models in parallel and keeps them resident.
+
+    *provider* needs a ``preload(model=, keep_alive=)`` method
+    (OllamaProvider). start() returns immediately; the initial preload and
+    the keep-alive schedule run on daemon threads until close().
+    """
+
+    def __init__(self, models: List[str], settings: WarmupSettings, provider: Any) -> None:
+        self.settings = settings
+        self._provider = provider
+        self._lock = threading.Lock()
+        self._states: Dict[str, _ModelState] = {m: _ModelState() for m in models}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        cfg,
+        settings: WarmupSettings,
+        provider_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> "ModelWarmupManager":
+        if provider_factory is None:
+            from io_iii.providers.ollama_provider import OllamaProvider
+            provider_factory = OllamaProvider.from_config
+        return cls(routed_models(cfg), settings, provider_factory(cfg.providers))
+
+    @property
+    def models(self) -> List[str]:
+        return list(self._states)
+
+    def start(self) -> "ModelWarmupManager":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="io3-model-warmup", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        self.warm_all()
+        interval = self.settings.ping_interval_seconds
+        if interval <= 0:
+            return
+        while not self._stop.wait(interval):
+            for model in self._states:
+                if self._stop.is_set():
+                    return
+                self._load(model, initial=False)
+
+    def warm_all(self) -> None:
+        """Preload every model in parallel; returns when all attempts finished."""
+        models = self.models
+        if not models:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(self.settings.parallelism, len(models)),
+            thread_name_prefix="io3-model-preload",
+        ) as pool:
+            list(pool.map(lambda m: self._load(m, initial=True), models))
+
+    def _load(self, model: str, *, initial: bool) -> None:
+        st = self._states[model]
+        if initial:
+            with self._lock:
+                st.state = MODEL_LOADING
+        t0 = time.perf_counter()
+        try:
+            self._provider.preload(model=model, keep_alive=self.settings.keep_alive)
+        except Exception as exc:
+            with self._lock:
+                st.state = MODEL_FAILED
+                st.error_code = type(exc).__name__
+            return
+        elapsed_ms = int((time.perf_counter() - t0) * 1000)
+        with self._lock:
+            if initial or st.load_ms is None:
+                st.load_ms = elapsed_ms
+            if not initial:
+                st.pings += 1
+                st.last_ping_ms = elapsed_ms
+                st.last_ping_at = time.time()
+            st.state = MODEL_WARM
+            st.error_code = None
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Content-safe per-model state for /health."""
+        with self._lock:
+            return {model: st.as_dict() for model, st in self._states.items()}
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """Stop the keep-alive schedule (an in-flight preload is not interrupted)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide manager (one per serve process)
+# ---------------------------------------------------------------------------
+
+_manager_lock = threading.Lock()
+_manager: Optional[ModelWarmupManager] = None
+
+
+def start_model_warmup(
+    cfg,
+    provider_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+) -> Optional[ModelWarmupManager]:
+    """
+    Start the shared warm-up manager from *cfg* (IO3Config).
+
+    Returns None (and stops any previous manager) when the runtime.yaml
+    ``model_warmup`` block is absent or disabled.
+
+    Raises:
+        ValueError('MODEL_WARMUP_CONFIG_INVALID: ...') — see load_warmup_settings.
+    """
+    global _manager
+    settings = load_warmup_settings(cfg.runtime)
+    manager = None
+    if settings is not None:
+        manager = ModelWarmupManager.from_config(cfg, settings, provider_factory)
+    with _manager_lock:
+        old, _manager = _manager, manager
+    if old is not None:
+        old.close(timeout=0)
+    return manager.start() if manager is not None else None
+
+
+def get_warmup_manager() -> Optional[ModelWarmupManager]:
+    return _manager
+
+
+def shutdown_model_warmup(timeout: Optional[float] = 1.0) -> None:
+    """Stop and forget the shared warm-up manager (shutdown / test isolation)."""
+    global _manager
+    with _manager_lock:
+        old, _manager = _manager, None
+    if old is not None:
+        old.close(timeout=timeout)
+
+
+def health_models() -> Optional[Dict[str, Dict[str, Any]]]:
+    """Per-model warm-up state for /health, or None when warm-up is disabled."""
+    manager = _manager
+    return manager.status() if manager is not None else None
+
+
+def health_payload() -> Dict[str, Any]:
+    """
+    GET /health body for both servers: liveness plus, when model_warmup is
+    enabled, the per-model warm-up state (cold / loading / warm / failed,
+    load latency).
+    """
+    body: Dict[str, Any] = {"status": "ok", "runtime": "io-iii"}
+    models = health_models()
+    if models is not None:
+        body["models"] = models
+    return body
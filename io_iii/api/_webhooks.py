@@ -17,20 +17,49 @@ Configuration (runtime.yaml):
         runbook_complete:
             url: https://example.com/hooks/io-iii
 
-Dispatch is non-blocking: each call spawns a daemon thread that fires
-the request and discards the result. Errors are silently swallowed —
-webhook delivery is best-effort only (ADR-025 §6).
+Dispatch is non-blocking. Every call is queued on one shared
+WebhookDeliveryWorker — a fixed set of worker threads draining a bounded
+in-memory queue, with keep-alive connections per webhook host
+(providers/_http_pool), optional per-endpoint batching and
+exponential-backoff retries. Errors are silently swallowed — webhook
+delivery is best-effort only (ADR-025 §6).
+
+An optional ``delivery`` mapping inside the webhooks block tunes the worker;
+without it the defaults below apply (unbatched, one event per POST)::
+
+    webhooks:
+        delivery:
+            workers: 2                  # delivery threads (default 2)
+            queue_size: 1000            # pending events; beyond this, new events are dropped
+            batch_max: 1                # >1 = POST up to N events per endpoint as one batch
+            batch_wait_seconds: 0.05    # how long a worker gathers a batch
+            max_retries: 3              # retries after the first attempt (5xx / 429 / network)
+            backoff_seconds: 0.5        # first retry delay; doubles per attempt
+            backoff_max_seconds: 30     # retry delay cap
+
+A batch is POSTed as ``{"events": [<body>, ...]}`` with ``X-Io3-Event: batch``
+and ``X-Io3-Batch-Size``. The queue never blocks the caller: when it is full
+the event is dropped and counted. Counters (WebhookDeliveryWorker.stats) are
+content-free: delivered / failed / dropped / retried totals and delivery
+latency from enqueue to a 2xx response.
 
 Backward-compatible module-level dispatch() and get_webhook_url() functions
 are retained for existing call sites.
 """
 from __future__ import annotations
 
+import heapq
 import json
+import queue
 import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from io_iii.providers import _http_pool
 
 
 # ---------------------------------------------------------------------------
@@ -55,7 +84,7 @@ _DEFAULT_TIMEOUT_S = 5
 # ---------------------------------------------------------------------------
 
 def _fire(url: str, body: Dict[str, Any]) -> None:
-    """Send a single HTTP POST (called from a daemon thread)."""
+    """Send a single HTTP POST synchronously (retained for existing callers)."""
     data = json.dumps(body).encode("utf-8")
     req = urllib.request.Request(
         url,
@@ -70,25 +99,6 @@ def _fire(url: str, body: Dict[str, Any]) -> None:
         pass  # fire-and-forget; delivery is best-effort
 
 
-def _fire_event(url: str, event: str, body: Dict[str, Any], timeout: int) -> None:
-    """Send a single HTTP POST with per-event header and configurable timeout."""
-    data = json.dumps(body).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "X-Io3-Event": event,
-        },
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=timeout):
-            pass
-    except Exception:
-        pass  # fire-and-forget; delivery is best-effort
-
-
 # ---------------------------------------------------------------------------
 # Module-level dispatch (backward-compatible; used by app.py)
 # ---------------------------------------------------------------------------
@@ -99,9 +109,10 @@ def dispatch(
     payload: Dict[str, Any],
 ) -> None:
     """
-    Dispatch a content-safe webhook in a background daemon thread.
+    Dispatch a content-safe webhook in the background.
 
-    No-op when *url* is None or empty.
+    Queued on the shared delivery worker (configure_delivery, or default
+    settings when none is configured). No-op when *url* is None or empty.
 
     Args:
         url:        Webhook endpoint URL (from runtime.yaml ``webhook_url``).
@@ -112,8 +123,7 @@ def dispatch(
     if not url:
         return
     body = {"event": event_type, **payload}
-    t = threading.Thread(target=_fire, args=(url, body), daemon=True)
-    t.start()
+    shared_delivery_worker().submit(url, event_type, body, timeout=_DEFAULT_TIMEOUT_S)
 
 
 def get_webhook_url(runtime_cfg: Dict[str, Any]) -> Optional[str]:
@@ -138,8 +148,13 @@ class WebhookDispatcher:
         }
     """
 
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        worker: Optional["WebhookDeliveryWorker"] = None,
+    ) -> None:
         self._config: Dict[str, Any] = config if isinstance(config, dict) else {}
+        self._worker = worker
 
     @classmethod
     def from_runtime_config(cls, runtime_cfg: Dict[str, Any]) -> "WebhookDispatcher":
@@ -147,12 +162,22 @@ class WebhookDispatcher:
         Construct from a full runtime config dict.
 
         Reads the ``webhooks`` key; returns an empty dispatcher if absent
-        or malformed.
+        or malformed. Otherwise the dispatcher is bound to the shared
+        delivery worker, tuned by the optional ``webhooks.delivery`` block.
+
+        Raises:
+            ValueError('WEBHOOK_DELIVERY_INVALID: ...') for a malformed
+            delivery block.
         """
         webhooks = runtime_cfg.get("webhooks")
         if not isinstance(webhooks, dict):
             return cls({})
-        return cls(webhooks)
+        return cls(webhooks, worker=configure_delivery(runtime_cfg))
+
+    @property
+    def worker(self) -> Optional["WebhookDeliveryWorker"]:
+        """The bound delivery worker, or None to use the shared one at dispatch."""
+        return self._worker
 
     def is_configured(self, event: str) -> bool:
         """Return True if *event* is a known event type and has a non-empty URL."""
@@ -166,9 +191,11 @@ class WebhookDispatcher:
 
     def dispatch(self, event: str, payload: Dict[str, Any]) -> None:
         """
-        Dispatch a content-safe webhook in a background daemon thread.
+        Dispatch a content-safe webhook in the background.
 
-        No-op when event is unknown, config is absent, or URL is empty.
+        Queued on the bound delivery worker, or on the shared one when none
+        is bound. No-op when event is unknown, config is absent, or URL is
+        empty.
         Errors are silently swallowed (ADR-025 §6).
         """
         if event not in _WEBHOOK_EVENTS:
@@ -181,9 +208,380 @@ class WebhookDispatcher:
             return
         timeout = int(cfg.get("timeout_seconds", _DEFAULT_TIMEOUT_S))
         body = {"event": event, **payload}
-        t = threading.Thread(
-            target=_fire_event,
-            args=(url, event, body, timeout),
-            daemon=True,
-        )
-        t.start()
+        worker = self._worker or shared_delivery_worker()
+        worker.submit(url, event, body, timeout=timeout)
+
+
+# ---------------------------------------------------------------------------
+# Pooled delivery (tuned via webhooks.delivery)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class DeliverySettings:
+    """Parsed ``webhooks.delivery`` block from runtime.yaml."""
+    workers: int = 2
+    queue_size: int = 1000
+    batch_max: int = 1
+    batch_wait_seconds: float = 0.05
+    max_retries: int = 3
+    backoff_seconds: float = 0.5
+    backoff_max_seconds: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number *attempt* (1-based): exponential, capped."""
+        return min(self.backoff_seconds * (2 ** (attempt - 1)), self.backoff_max_seconds)
+
+
+_DELIVERY_INT_FIELDS: Tuple[Tuple[str, int], ...] = (
+    ("workers", 1),
+    ("queue_size", 1),
+    ("batch_max", 1),
+    ("max_retries", 0),
+)
+_DELIVERY_FLOAT_FIELDS: Tuple[str, ...] = (
+    "batch_wait_seconds",
+    "backoff_seconds",
+    "backoff_max_seconds",
+)
+
+
+def load_delivery_settings(runtime_cfg: Dict[str, Any]) -> DeliverySettings:
+    """
+    Load DeliverySettings from a runtime config dict.
+
+    Returns the defaults when ``webhooks.delivery`` is absent. Missing
+    fields take DeliverySettings defaults.
+
+    Raises:
+        ValueError('WEBHOOK_DELIVERY_INVALID: ...') if the block is not a
+        mapping or a declared value has the wrong type or range.
+    """
+    webhooks = (runtime_cfg or {}).get("webhooks")
+    if not isinstance(webhooks, dict) or webhooks.get("delivery") is None:
+        return DeliverySettings()
+    raw = webhooks["delivery"]
+    if not isinstance(raw, dict):
+        raise ValueError("WEBHOOK_DELIVERY_INVALID: webhooks.delivery must be a mapping")
+
+    values: Dict[str, Any] = {}
+    for name, minimum in _DELIVERY_INT_FIELDS:
+        if name not in raw:
+            continue
+        value = raw[name]
+        if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+            raise ValueError(
+                f"WEBHOOK_DELIVERY_INVALID: {name} must be an integer >= {minimum}"
+            )
+        values[name] = value
+    for name in _DELIVERY_FLOAT_FIELDS:
+        if name not in raw:
+            continue
+        value = raw[name]
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+            raise ValueError(f"WEBHOOK_DELIVERY_INVALID: {name} must be a non-negative number")
+        values[name] = float(value)
+    return DeliverySettings(**values)
+
+
+# Idle keep-alive connections retained per webhook host.
+_POOL_SIZE = 4
+
+# Longest a delivery thread blocks on an empty queue before re-checking
+# whether the worker was closed.
+_IDLE_POLL_S = 0.5
+
+
+def _post(url: str, data: bytes, headers: Dict[str, str], timeout: float) -> int:
+    """POST *data* on a keep-alive connection to the URL's host; return the status."""
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    pool = _http_pool.get_pool(f"{parts.scheme}://{parts.netloc}", pool_size=_POOL_SIZE)
+    status, _reason, _body = pool.request("POST", path, body=data, headers=headers, timeout=timeout)
+    return status
+
+
+@dataclass
+class _Delivery:
+    url: str
+    event: str
+    body: Dict[str, Any]
+    timeout: float
+    enqueued_at: float
+    attempt: int = 0
+
+
+class WebhookDeliveryWorker:
+    """
+    Bounded webhook delivery: a fixed thread pool draining a bounded queue.
+
+    submit() never blocks: it returns False (and counts a drop) when the
+    worker is closed or the queue is full. Threads start on first submit.
+    Failed attempts (network error, 5xx, 429) are re-queued with
+    exponential backoff up to max_retries; other statuses fail at once.
+    Thread-safe.
+    """
+
+    def __init__(self, settings: DeliverySettings) -> None:
+        self.settings = settings
+        self._queue: "queue.Queue[Optional[_Delivery]]" = queue.Queue(maxsize=settings.queue_size)
+        self._retry: List[Tuple[float, int, _Delivery]] = []
+        self._retry_seq = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._threads: List[threading.Thread] = []
+        self._pending = 0  # queued + awaiting retry + in flight
+        self._closed = False
+
+        self.delivered = 0
+        self.failed = 0
+        self.dropped = 0
+        self.retried = 0
+        self.requests = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def submit(self, url: str, event: str, body: Dict[str, Any], *, timeout: float) -> bool:
+        """Queue one event for delivery. Returns False if it was dropped."""
+        item = _Delivery(url, event, body, float(timeout), time.monotonic())
+        with self._lock:
+            if self._closed:
+                self.dropped += 1
+                return False
+            if not self._threads:
+                self._start_locked()
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self._pending += 1
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every accepted event is delivered or failed. False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Stop accepting events and let the workers exit once the queue drains.
+
+        Events awaiting a retry are counted as failed. Joins the worker
+        threads for up to *timeout* seconds (0 = do not wait).
+        """
+        with self._lock:
+            if self._closed:
+                threads = list(self._threads)
+            else:
+                self._closed = True
+                threads = list(self._threads)
+                for _ in threads:
+                    try:
+                        self._queue.put_nowait(None)
+                    except queue.Full:
+                        break  # idle workers see the closed flag on their next poll
+        if timeout:
+            deadline = time.monotonic() + timeout
+            for t in threads:
+                t.join(max(0.0, deadline - time.monotonic()))
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def _start_locked(self) -> None:
+        for i in range(self.settings.workers):
+            t = threading.Thread(target=self._run, name=f"io3-webhook-{i}", daemon=True)
+            self._threads.append(t)
+            t.start()
+
+    def _next(self) -> Optional[_Delivery]:
+        """Next due retry or queued event; None once closed and drained."""
+        while True:
+            with self._lock:
+                if self._closed and self._queue.empty():
+                    self._abandon_retries_locked()
+                    return None
+                wait = _IDLE_POLL_S
+                if self._retry:
+                    due = self._retry[0][0] - time.monotonic()
+                    if due <= 0:
+                        return heapq.heappop(self._retry)[2]
+                    wait = min(wait, due)
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                continue
+            if item is None:
+                with self._lock:
+                    self._abandon_retries_locked()
+                return None
+            return item
+
+    def _gather(self, first: _Delivery) -> List[_Delivery]:
+        """Collect up to batch_max events within batch_wait_seconds."""
+        batch = [first]
+        deadline = time.monotonic() + self.settings.batch_wait_seconds
+        while len(batch) < self.settings.batch_max:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put_nowait(None)  # leave the stop signal for _next
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            batch = self._gather(item) if self.settings.batch_max > 1 else [item]
+            by_url: Dict[str, List[_Delivery]] = {}
+            for d in batch:
+                by_url.setdefault(d.url, []).append(d)
+            for url, items in by_url.items():
+                self._deliver(url, items)
+
+    def _deliver(self, url: str, items: List[_Delivery]) -> None:
+        if len(items) == 1:
+            data = json.dumps(items[0].body).encode("utf-8")
+            headers = {"Content-Type": "application/json", "X-Io3-Event": items[0].event}
+        else:
+            data = json.dumps({"events": [d.body for d in items]}).encode("utf-8")
+            headers = {
+                "Content-Type": "application/json",
+                "X-Io3-Event": "batch",
+                "X-Io3-Batch-Size": str(len(items)),
+            }
+        try:
+            status = _post(url, data, headers, max(d.timeout for d in items))
+            ok = 200 <= status < 300
+            retryable = status >= 500 or status == 429
+        except Exception:
+            ok, retryable = False, True  # best-effort; nothing is logged (ADR-025 §6)
+
+        now = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            for d in items:
+                if ok:
+                    latency = now - d.enqueued_at
+                    self.delivered += 1
+                    self._latency_total += latency
+                    self._latency_max = max(self._latency_max, latency)
+                elif retryable and not self._closed and d.attempt < self.settings.max_retries:
+                    d.attempt += 1
+                    self.retried += 1
+                    self._retry_seq += 1
+                    heapq.heappush(
+                        self._retry, (now + self.settings.backoff(d.attempt), self._retry_seq, d),
+                    )
+                    continue
+                else:
+                    self.failed += 1
+                self._pending -= 1
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def _abandon_retries_locked(self) -> None:
+        if not self._retry:
+            return
+        self.failed += len(self._retry)
+        self._pending -= len(self._retry)
+        self._retry.clear()
+        if self._pending == 0:
+            self._idle.notify_all()
+
+    # ------------------------------------------------------------------
+    # Counters
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Content-safe snapshot of delivery counters."""
+        with self._lock:
+            return {
+                "workers": len(self._threads),
+                "queue_depth": self._queue.qsize(),
+                "retry_pending": len(self._retry),
+                "pending": self._pending,
+                "delivered": self.delivered,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "retried": self.retried,
+                "requests": self.requests,
+                "latency_ms_avg": (
+                    round(self._latency_total / self.delivered * 1000, 3) if self.delivered else None
+                ),
+                "latency_ms_max": round(self._latency_max * 1000, 3) if self.delivered else None,
+            }
+
+
+# ---------------------------------------------------------------------------
+# Process-wide delivery worker
+# ---------------------------------------------------------------------------
+
+_worker_lock = threading.Lock()
+_worker: Optional[WebhookDeliveryWorker] = None
+
+
+def get_delivery_worker(settings: DeliverySettings) -> WebhookDeliveryWorker:
+    """
+    Return the shared delivery worker for *settings*, creating it on first use.
+
+    A call with different settings (e.g. after a config change) replaces the
+    worker; the old one stops accepting events and exits once drained.
+    """
+    global _worker
+    with _worker_lock:
+        old = _worker
+        if old is not None and old.settings == settings:
+            return old
+        _worker = WebhookDeliveryWorker(settings)
+        current = _worker
+    if old is not None:
+        old.close(timeout=0)
+    return current
+
+
+def shared_delivery_worker() -> WebhookDeliveryWorker:
+    """Return the shared delivery worker, starting one with default settings if needed."""
+    with _worker_lock:
+        current = _worker
+    if current is not None:
+        return current
+    return get_delivery_worker(DeliverySettings())
+
+
+def configure_delivery(runtime_cfg: Dict[str, Any]) -> WebhookDeliveryWorker:
+    """
+    Apply the runtime config's ``webhooks.delivery`` block to the shared worker.
+
+    Returns the shared worker; an absent block means default settings.
+    Cheap when the settings are unchanged, so callers may invoke it per
+    request to pick up config reloads.
+
+    Raises:
+        ValueError('WEBHOOK_DELIVERY_INVALID: ...') — see load_delivery_settings.
+    """
+    return get_delivery_worker(load_delivery_settings(runtime_cfg))
+
+
+def shutdown_delivery_worker(timeout: Optional[float] = 5.0) -> None:
+    """Close and forget the shared delivery worker (shutdown / test isolation)."""
+    global _worker
+    with _worker_lock:
+        old, _worker = _worker, None
+    if old is not None:
+        old.close(timeout=timeout)
@@ -1,19 +1,23 @@
 """
 io_iii.api.app — Phase 9 HTTP API (ADR-025).
 
-Transport adapter only: every endpoint wraps an existing CLI command function
-by constructing an argparse.Namespace from the request body and capturing stdout
-as the response payload.  Zero new execution semantics (ADR-025 §1).
+Transport adapter only: every endpoint constructs an argparse.Namespace from the
+request body and calls the matching service-layer function (io_iii.cli
+execute_*), which returns a structured CommandResult.  The CLI renders the same
+result to stdout; the API uses its payload directly (no stdout capture, no JSON
+round-trip), so concurrent requests cannot interleave output.  Zero new
+execution semantics (ADR-025 §1).
 
 Routes (ADR-025 §2):
-    POST   /run                      → cmd_run
-    POST   /runbook                  → cmd_runbook
-    POST   /session/start            → cmd_session_start
-    POST   /session/{id}/turn        → cmd_session_continue
-    GET    /session/{id}/state       → cmd_session_status
-    DELETE /session/{id}             → cmd_session_close
+    POST   /run                      → execute_run
+    POST   /runbook                  → execute_runbook
+    POST   /session/start            → execute_session_start
+    POST   /session/{id}/turn        → execute_session_continue
+    GET    /session/{id}/state       → execute_session_status
+    GET    /sessions                 → execute_session_list (session index)
+    DELETE /session/{id}             → execute_session_close
     GET    /session/{id}/stream      → SSE event stream (M9.2)
-    GET    /health                   → liveness probe
+    GET    /health                   → liveness probe (+ model warm-up state)
     GET    /                         → static web UI (M9.5)
 
 Content-safety (ADR-003): no prompt text, model output, persona content,
@@ -22,21 +26,21 @@ or memory values appear in any response body or SSE event.
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import io
 import io as _io
 import json
 import os
 import time
 from argparse import Namespace
+from contextlib import asynccontextmanager
 from pathlib import Path, Path as _Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, Form, HTTPException, Request, Response, UploadFile
+from fastapi import FastAPI, Form, HTTPException, Query, Request, Response, UploadFile
 from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from io_iii.api import _bus as bus
+from io_iii.api import _warmup as warmup
 from io_iii.api import _webhooks as webhooks
 
 _UPLOAD_MAX_BYTES = 2 * 1024 * 1024  # 2 MB (ADR-029 §3)
@@ -48,16 +52,33 @@ _ALLOWED_EXTENSIONS = frozenset(
 # App factory
 # ---------------------------------------------------------------------------
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    """
+    Start model warm-up (runtime.yaml model_warmup) for the server's lifetime.
+
+    A malformed model_warmup block (MODEL_WARMUP_CONFIG_INVALID) fails
+    startup, as it does for the stdlib server.
+    """
+    from io_iii.config import load_io3_config
+    warmup.start_model_warmup(load_io3_config())
+    try:
+        yield
+    finally:
+        warmup.shutdown_model_warmup()
+
+
 app = FastAPI(
     title="IO-III Runtime API",
     description="Transport adapter for the IO-III governed LLM control-plane runtime.",
     version="0.9.0",
     docs_url="/docs",
     redoc_url=None,
+    lifespan=_lifespan,
 )
 
 # ---------------------------------------------------------------------------
-# CLI command import (lazy to keep startup fast)
+# Service-layer import (lazy to keep startup fast)
 # ---------------------------------------------------------------------------
 
 def _cli():
@@ -70,33 +91,29 @@ def _cli():
 # Invocation helper (ADR-025 §3)
 # ---------------------------------------------------------------------------
 
-def _invoke(cmd_fn, args_ns: Namespace) -> tuple[int, Dict[str, Any]]:
+def _call(execute_fn, args_ns: Namespace) -> tuple[int, Dict[str, Any]]:
     """
-    Call *cmd_fn(args_ns)* with stdout captured.
+    Call *execute_fn(args_ns)* and return (exit_code, result_dict).
 
-    Returns (exit_code, result_dict).  result_dict is parsed from the captured
-    JSON output.  If the command prints nothing, result_dict is {}.
-    Raises RuntimeError on non-JSON output (should never happen).
+    result_dict is the CommandResult payload made JSON-safe.  Failures that
+    carry no payload (CLI stderr-only) surface as {"status": "error",
+    "error_code": ...}; stderr text is never returned.  Unexpected exceptions
+    surface their type name only — no message or stack.
     """
-    buf = io.StringIO()
-    exit_code: int
-    with contextlib.redirect_stdout(buf):
-        try:
-            exit_code = int(cmd_fn(args_ns))
-        except SystemExit as exc:
-            exit_code = int(exc.code) if exc.code is not None else 1
-        except Exception as exc:
-            # Surface the error code but do not expose message/stack.
-            exit_code = 1
-            buf.write(json.dumps({"status": "error", "error_code": type(exc).__name__}))
-
-    raw = buf.getvalue().strip()
-    if not raw:
-        return exit_code, {}
+    from io_iii.cli._shared import _to_jsonable
+
     try:
-        return exit_code, json.loads(raw)
-    except json.JSONDecodeError:
-        return exit_code, {"status": "error", "error_code": "INVALID_JSON_OUTPUT"}
+        res = execute_fn(args_ns)
+    except SystemExit as exc:
+        return (int(exc.code) if exc.code is not None else 1), {}
+    except Exception as exc:
+        return 1, {"status": "error", "error_code": type(exc).__name__}
+
+    if res.payload is not None:
+        return res.exit_code, _to_jsonable(res.payload)
+    if res.error_code is not None:
+        return res.exit_code, {"status": "error", "error_code": res.error_code}
+    return res.exit_code, {}
 
 
 def _http_status(exit_code: int) -> int:
@@ -125,6 +142,7 @@ class RunRequest(BaseModel):
 class RunbookRequest(BaseModel):
     json_file: str
     audit: bool = False
+    max_parallel: int = 1                   # >1 runs independent steps concurrently
     config_dir: Optional[str] = None
 
 
@@ -143,6 +161,7 @@ class SessionTurnRequest(BaseModel):
     action: Optional[str] = None
     config_dir: Optional[str] = None
     file_ref: Optional[str] = None          # ADR-029
+    stream: bool = False                    # publish turn_output_delta (ADR-026 gated)
 
 
 # ---------------------------------------------------------------------------
@@ -178,14 +197,14 @@ def _extract_response(raw_result: Dict[str, Any], release: bool) -> Dict[str, An
     value, so callers pass the raw CLI result before stripping.
 
     Checks two locations:
-    - top-level ``message`` (session turn output from _emit_turn_result)
-    - nested ``result.message`` (cmd_run payload structure)
+    - top-level ``message`` (session turn payload)
+    - nested ``result.message`` (execute_run payload structure)
     """
     if not release:
         return {}
     # Session turn path: top-level message key
     msg = raw_result.get("message")
-    # cmd_run path: nested under result dict
+    # run path: nested under result dict
     if msg is None:
         msg = (raw_result.get("result") or {}).get("message")
     if not msg:
@@ -200,7 +219,7 @@ def _extract_response(raw_result: Dict[str, Any], release: bool) -> Dict[str, An
 @app.post("/run")
 def api_run(req: RunRequest) -> JSONResponse:
     """
-    Execute a single run.  Transport adapter for cmd_run (ADR-025 §2).
+    Execute a single run.  Transport adapter for execute_run (ADR-025 §2).
 
     Content-safe response: no prompt text or model output.
     """
@@ -215,7 +234,7 @@ def api_run(req: RunRequest) -> JSONResponse:
         config_dir=str(_cfg_dir(req.config_dir)) if req.config_dir else None,
     )
     release = _content_release_enabled()
-    exit_code, raw_result = _invoke(_cli().cmd_run, args)
+    exit_code, raw_result = _call(_cli().execute_run, args)
     response_field = _extract_response(raw_result, release)
     result = _strip_content(raw_result)
     result.update(response_field)
@@ -229,21 +248,23 @@ def api_run(req: RunRequest) -> JSONResponse:
 @app.post("/runbook")
 def api_runbook(req: RunbookRequest) -> JSONResponse:
     """
-    Execute a runbook.  Transport adapter for cmd_runbook (ADR-025 §2).
+    Execute a runbook.  Transport adapter for execute_runbook (ADR-025 §2).
 
     Fires RUNBOOK_COMPLETE webhook on completion (M9.3).
     """
     args = Namespace(
         json_file=req.json_file,
         audit=req.audit,
+        parallel=req.max_parallel,
         config_dir=str(_cfg_dir(req.config_dir)) if req.config_dir else None,
     )
-    exit_code, result = _invoke(_cli().cmd_runbook, args)
+    exit_code, result = _call(_cli().execute_runbook, args)
     result = _strip_content(result)
 
     # M9.3: webhook on RUNBOOK_COMPLETE
     runtime_cfg = _runtime_cfg()
     webhook_url = webhooks.get_webhook_url(runtime_cfg)
+    webhooks.configure_delivery(runtime_cfg)
     webhooks.dispatch(webhook_url, "RUNBOOK_COMPLETE", {
         "runbook_id": result.get("runbook_id"),
         "status": result.get("status"),
@@ -260,7 +281,7 @@ def api_runbook(req: RunbookRequest) -> JSONResponse:
 @app.post("/session/start")
 def api_session_start(req: SessionStartRequest) -> JSONResponse:
     """
-    Start a new dialogue session.  Transport adapter for cmd_session_start.
+    Start a new dialogue session.  Transport adapter for execute_session_start.
     """
     args = Namespace(
         mode=req.mode,
@@ -269,7 +290,7 @@ def api_session_start(req: SessionStartRequest) -> JSONResponse:
         audit=req.audit,
         config_dir=str(_cfg_dir(req.config_dir)) if req.config_dir else None,
     )
-    exit_code, result = _invoke(_cli().cmd_session_start, args)
+    exit_code, result = _call(_cli().execute_session_start, args)
     result = _strip_content(result)
 
     # Publish initial session_state event so SSE subscribers see it immediately.
@@ -294,10 +315,24 @@ def api_session_turn(session_id: str, req: SessionTurnRequest) -> JSONResponse:
     """
     Execute one turn on an existing session.
 
-    Transport adapter for cmd_session_continue.  Publishes content-safe events
+    Transport adapter for execute_session_continue.  Publishes content-safe events
     to the SSE bus before and after execution (M9.2).  Fires webhooks on
     STEWARD_GATE_TRIGGERED and SESSION_COMPLETE (M9.3).
+
+    With ``stream=true`` output deltas are published to the SSE bus as
+    ``turn_output_delta`` while the turn runs.  Deltas carry model text, so
+    they are only published when the content release gate is open (ADR-026);
+    otherwise the flag is ignored.  They go to the subscribers attached at
+    the time and are never stored in the replayable event log.
     """
+    release = _content_release_enabled()
+
+    def _publish_delta(delta: str) -> None:
+        bus.publish_transient(session_id, "turn_output_delta", {
+            "session_id": session_id,
+            "delta": delta,
+        })
+
     args = Namespace(
         session_id=session_id,
         prompt=req.prompt,
@@ -306,6 +341,7 @@ def api_session_turn(session_id: str, req: SessionTurnRequest) -> JSONResponse:
         action=req.action,
         config_dir=str(_cfg_dir(req.config_dir)) if req.config_dir else None,
         file_ref=req.file_ref,
+        on_output_delta=_publish_delta if (req.stream and release) else None,
     )
 
     # Publish turn_started before execution.
@@ -314,9 +350,8 @@ def api_session_turn(session_id: str, req: SessionTurnRequest) -> JSONResponse:
         "ts": time.time(),
     })
 
-    release = _content_release_enabled()
     t0 = time.perf_counter()
-    exit_code, raw_result = _invoke(_cli().cmd_session_continue, args)
+    exit_code, raw_result = _call(_cli().execute_session_continue, args)
     latency_ms = int((time.perf_counter() - t0) * 1000)
     response_field = _extract_response(raw_result, release)
     result = _strip_content(raw_result)
@@ -337,6 +372,7 @@ def api_session_turn(session_id: str, req: SessionTurnRequest) -> JSONResponse:
     session_status = result.get("session_status") or result.get("status")
     runtime_cfg = _runtime_cfg()
     webhook_url = webhooks.get_webhook_url(runtime_cfg)
+    webhooks.configure_delivery(runtime_cfg)
 
     if session_status == "paused":
         pause_info = result.get("pause") or {}
@@ -372,17 +408,48 @@ def api_session_turn(session_id: str, req: SessionTurnRequest) -> JSONResponse:
 @app.get("/session/{session_id}/state")
 def api_session_state(session_id: str, config_dir: Optional[str] = None) -> JSONResponse:
     """
-    Return content-safe session status.  Transport adapter for cmd_session_status.
+    Return content-safe session status.  Transport adapter for execute_session_status.
     """
     args = Namespace(
         session_id=session_id,
         config_dir=config_dir,
     )
-    exit_code, result = _invoke(_cli().cmd_session_status, args)
+    exit_code, result = _call(_cli().execute_session_status, args)
     result = _strip_content(result)
     return JSONResponse(content=result, status_code=_http_status(exit_code))
 
 
+# ---------------------------------------------------------------------------
+# Routes: GET /sessions
+# ---------------------------------------------------------------------------
+
+@app.get("/sessions")
+def api_session_list(
+    status: Optional[List[str]] = Query(default=None),
+    mode: Optional[str] = None,
+    sort: str = "updated_at",
+    order: str = "desc",
+    limit: int = 50,
+    offset: int = 0,
+    config_dir: Optional[str] = None,
+) -> JSONResponse:
+    """
+    Paginated, content-safe session listing from the session index.
+    Transport adapter for execute_session_list.
+    """
+    args = Namespace(
+        status=status,
+        mode=mode,
+        sort=sort,
+        asc=(order == "asc"),
+        limit=limit,
+        offset=offset,
+        config_dir=config_dir,
+    )
+    exit_code, result = _call(_cli().execute_session_list, args)
+    return JSONResponse(content=result, status_code=_http_status(exit_code))
+
+
 # ---------------------------------------------------------------------------
 # Routes: DELETE /session/{id}
 # ---------------------------------------------------------------------------
@@ -390,7 +457,7 @@ def api_session_state(session_id: str, config_dir: Optional[str] = None) -> JSON
 @app.delete("/session/{session_id}")
 def api_session_close(session_id: str, config_dir: Optional[str] = None) -> JSONResponse:
     """
-    Close a session.  Transport adapter for cmd_session_close.
+    Close a session.  Transport adapter for execute_session_close.
 
     Fires SESSION_COMPLETE webhook and publishes session_closed event (M9.3).
     """
@@ -398,7 +465,7 @@ def api_session_close(session_id: str, config_dir: Optional[str] = None) -> JSON
         session_id=session_id,
         config_dir=config_dir,
     )
-    exit_code, result = _invoke(_cli().cmd_session_close, args)
+    exit_code, result = _call(_cli().execute_session_close, args)
     result = _strip_content(result)
     # ADR-033 §6: clean up in-memory file store on session close.
     from io_iii.core.file_store import delete as _fs_delete
@@ -412,6 +479,7 @@ def api_session_close(session_id: str, config_dir: Optional[str] = None) -> JSON
         })
         runtime_cfg = _runtime_cfg()
         webhook_url = webhooks.get_webhook_url(runtime_cfg)
+        webhooks.configure_delivery(runtime_cfg)
         webhooks.dispatch(webhook_url, "SESSION_COMPLETE", {
             "session_id": session_id,
             "session_status": result.get("status"),
@@ -425,8 +493,7 @@ def api_session_close(session_id: str, config_dir: Optional[str] = None) -> JSON
 # Routes: GET /session/{id}/stream  — SSE (M9.2)
 # ---------------------------------------------------------------------------
 
-_SSE_POLL_INTERVAL = 1.0   # seconds between polls (override in tests via monkeypatching)
-_SSE_KEEPALIVE_EVERY = 30  # keepalive every N polls
+_SSE_KEEPALIVE_SECONDS = 30.0  # keepalive after this much inactivity
 
 
 @app.get("/session/{session_id}/stream")
@@ -437,43 +504,47 @@ async def api_session_stream(session_id: str) -> StreamingResponse:
     Emits:
         session_state           — current state on connect
         turn_started            — before a turn runs
+        turn_output_delta       — output text chunks (stream=true turns, only
+                                  when content_release is enabled; ADR-026;
+                                  live only, never replayed)
         turn_completed          — after a turn completes
         steward_gate_triggered  — on steward pause
         session_closed          — on session close / at_limit
+        events_dropped          — this client fell behind the bounded event log
         keepalive               — every 30 s of inactivity
 
-    Event data fields are structural metadata only (ADR-003).
-    No prompt text, model output, or memory values.
+    Event data fields are structural metadata only (ADR-003), except
+    turn_output_delta which exists only behind the content release gate.
+    No prompt text or memory values.
+
+    The generator subscribes to the bus and is woken as soon as an event is
+    published; it does not poll.
     """
-    async def generate():
-        cursor = 0
-        idle_polls = 0
+    try:
+        bus.configure_from_runtime(_runtime_cfg())
+    except ValueError:
+        pass  # invalid event_bus block: keep the current limits
 
-        # Emit current session state on connect.
-        try:
-            state_args = Namespace(session_id=session_id, config_dir=None)
-            _, state_result = await asyncio.to_thread(_invoke, _cli().cmd_session_status, state_args)
-            state_result = _strip_content(state_result)
-            yield _sse("session_state", state_result)
-        except Exception:
-            pass
-
-        while True:
-            await asyncio.sleep(_SSE_POLL_INTERVAL)
-            events = bus.get_events_since(session_id, cursor)
-            if events:
-                idle_polls = 0
-                for evt in events:
-                    cursor += 1
+    async def generate():
+        with bus.subscribe(session_id) as sub:
+            # Emit current session state on connect.
+            try:
+                state_args = Namespace(session_id=session_id, config_dir=None)
+                _, state_result = await asyncio.to_thread(_call, _cli().execute_session_status, state_args)
+                state_result = _strip_content(state_result)
+                yield _sse("session_state", state_result)
+            except Exception:
+                pass
+
+            while True:
+                if not await sub.wait_async(timeout=_SSE_KEEPALIVE_SECONDS):
+                    yield _sse("keepalive", {})
+                    continue
+                for evt in sub.drain():
                     # Sentinel: terminate generator cleanly (no yield).
                     if evt["event"] == bus.STREAM_CLOSE_EVENT:
                         return
                     yield _sse(evt["event"], evt["data"])
-            else:
-                idle_polls += 1
-                if idle_polls >= _SSE_KEEPALIVE_EVERY:
-                    idle_polls = 0
-                    yield _sse("keepalive", {})
 
     return StreamingResponse(
         generate(),
@@ -496,8 +567,13 @@ def _sse(event_type: str, data: Dict[str, Any]) -> str:
 
 @app.get("/health")
 def api_health() -> JSONResponse:
-    """Liveness probe.  No execution; no content-plane access."""
-    return JSONResponse({"status": "ok", "runtime": "io-iii"})
+    """
+    Liveness probe.  No execution; no content-plane access.
+
+    With model_warmup enabled, ``models`` carries per-model warm-up state
+    (cold / loading / warm / failed) and load latency.
+    """
+    return JSONResponse(warmup.health_payload())
 
 
 # ---------------------------------------------------------------------------
@@ -548,6 +624,13 @@ def _extract_file_text(filename: str, data: bytes) -> str:
     raise ValueError("UNSUPPORTED_FILE_TYPE")
 
 
+def _upload_store_error(exc: ValueError) -> JSONResponse:
+    return JSONResponse(
+        {"error": {"code": str(exc).split(":")[0], "message": "File could not be stored."}},
+        status_code=422,
+    )
+
+
 @app.post("/upload")
 async def api_upload(
     file: UploadFile,
@@ -557,6 +640,7 @@ async def api_upload(
     Accept a multipart file upload, extract text, store session-scoped.
     Returns {file_ref, filename, chars} on success.
     Content-safe: extracted text is never logged (ADR-029 §4, ADR-033 §3).
+    Hashing, extraction and file store I/O run off the event loop.
     """
     from io_iii.core import file_store
 
@@ -582,16 +666,28 @@ async def api_upload(
             status_code=422,
         )
 
+    source = await asyncio.to_thread(file_store.source_key, filename, data)
     try:
-        text = _extract_file_text(filename, data)
+        store = file_store.configure_file_store(_runtime_cfg())
     except ValueError as exc:
-        code = str(exc)
-        return JSONResponse(
-            {"error": {"code": code, "message": "Could not extract text from file."}},
-            status_code=422,
-        )
+        return _upload_store_error(exc)
+
+    # Identical bytes already extracted (any session) reuse the cached text.
+    text = await asyncio.to_thread(store.cached_text, source)
+    if text is None:
+        try:
+            text = await asyncio.to_thread(_extract_file_text, filename, data)
+        except ValueError as exc:
+            code = str(exc)
+            return JSONResponse(
+                {"error": {"code": code, "message": "Could not extract text from file."}},
+                status_code=422,
+            )
 
-    file_ref = file_store.store(session_id, text, filename)
+    try:
+        file_ref = await asyncio.to_thread(store.store, session_id, text, filename, source=source)
+    except ValueError as exc:
+        return _upload_store_error(exc)
     # Return structural metadata only — never the extracted text.
     return JSONResponse({"file_ref": file_ref, "filename": filename, "chars": len(text)})
 
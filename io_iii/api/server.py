@@ -1,7 +1,7 @@
 """
 io_iii.api.server — HTTP API server (Phase 9 M9.1, ADR-025).
 
-Single-threaded HTTP/1.1 server using Python stdlib http.server.
+HTTP server using Python stdlib http.server with a bounded worker pool.
 No external framework dependency (ADR-025 §8).
 
 Endpoints (ADR-025 §3):
@@ -12,10 +12,27 @@ Endpoints (ADR-025 §3):
     GET    /session/{id}/state      — session status summary (content-safe)
     DELETE /session/{id}            — close a session
     GET    /session/{id}/stream     — SSE stream for one turn (M9.2)
+    GET    /health                  — liveness probe (+ model warm-up state)
     GET    /                        — self-hosted web UI (M9.5)
 
 Start via CLI:
     python -m io_iii serve [--host 127.0.0.1] [--port 8080]
+                           [--workers 8] [--max-in-flight 32]
+
+Concurrency:
+    Each accepted connection is handled on a worker thread from a fixed pool,
+    so a long /run or an open SSE stream no longer blocks other clients.
+    Requests touching one session (turn, stream, state, delete) are
+    serialised per session_id; requests for different sessions run in
+    parallel. At most max_in_flight requests are admitted at once (running
+    plus queued for a worker); beyond that the server answers 503
+    SERVER_BUSY with Retry-After instead of queueing without bound.
+
+    Limits come from the optional runtime.yaml block (CLI flags override)::
+
+        api_server:
+          workers: 8          # worker threads
+          max_in_flight: 32   # admitted requests before 503
 
 Default bind: 127.0.0.1:8080 (loopback only; ADR-025 §8).
 
@@ -28,10 +45,15 @@ Content policy (ADR-003 / ADR-025):
 from __future__ import annotations
 
 import json
+import socket
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 from io_iii.api._handlers import (
@@ -43,35 +65,220 @@ from io_iii.api._handlers import (
     handle_session_turn,
 )
 from io_iii.api._sse import stream_session_turn
+from io_iii.api._warmup import health_payload, shutdown_model_warmup, start_model_warmup
 from io_iii.api._webhooks import (
     WEBHOOK_RUNBOOK_COMPLETE,
     WEBHOOK_SESSION_COMPLETE,
     WEBHOOK_STEWARD_GATE_TRIGGERED,
     WebhookDispatcher,
+    shutdown_delivery_worker,
 )
-from io_iii.config import load_io3_config, default_config_dir
+from io_iii.config import IO3Config, load_io3_config, default_config_dir
 
 # Path to bundled web UI static file (M9.5)
 _STATIC_DIR: Path = Path(__file__).parent / "static"
 _UI_PATH: Path = _STATIC_DIR / "index.html"
 
+_DEFAULT_WORKERS: int = 8
+_DEFAULT_MAX_IN_FLIGHT: int = 32
+_RETRY_AFTER_S: int = 1
+_REJECT_DRAIN_S: float = 0.2    # total, across the whole drain
+_REJECT_DRAIN_BYTES: int = 65536
+
+
+# ---------------------------------------------------------------------------
+# Concurrency primitives
+# ---------------------------------------------------------------------------
+
+class SessionLocks:
+    """
+    Per-session mutual exclusion.
+
+    Two requests for the same session_id never run their handlers at the
+    same time, so turns cannot race on <session_id>.session.json. Locks are
+    reference-counted and dropped once no request holds or waits for them.
+    """
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._locks: Dict[str, List[Any]] = {}  # session_id -> [lock, users]
+
+    @contextmanager
+    def hold(self, session_id: str) -> Iterator[None]:
+        with self._guard:
+            entry = self._locks.get(session_id)
+            if entry is None:
+                entry = [threading.Lock(), 0]
+                self._locks[session_id] = entry
+            entry[1] += 1
+        lock = entry[0]
+        try:
+            with lock:
+                yield
+        finally:
+            with self._guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[session_id]
+
+    def __len__(self) -> int:
+        with self._guard:
+            return len(self._locks)
+
+
+class BoundedThreadingHTTPServer(HTTPServer):
+    """
+    HTTPServer that handles connections on a fixed worker pool.
+
+    Admission is bounded: once max_in_flight requests are running or queued,
+    new connections receive an immediate 503 SERVER_BUSY (with Retry-After)
+    from the accept thread and are closed.
+    """
+
+    def __init__(
+        self,
+        server_address: Tuple[str, int],
+        handler_cls: Any,
+        *,
+        workers: int = _DEFAULT_WORKERS,
+        max_in_flight: int = _DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
+        super().__init__(server_address, handler_cls)
+        self.workers = workers
+        self.max_in_flight = max_in_flight
+        self.rejected = 0
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="io3-api")
+
+    def process_request(self, request, client_address) -> None:  # type: ignore[override]
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            try:
+                _reject_busy(request)
+            finally:
+                self.shutdown_request(request)
+            return
+        try:
+            self._pool.submit(self._process_in_worker, request, client_address)
+        except RuntimeError:  # pool already shut down
+            self._slots.release()
+            self.shutdown_request(request)
+
+    def _process_in_worker(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+def _reject_busy(request: socket.socket) -> None:
+    """
+    Answer 503 on a raw connection without occupying a worker.
+
+    The response is sent at once and the write side shut down. Whatever the
+    client already sent is then drained for at most _REJECT_DRAIN_S and
+    _REJECT_DRAIN_BYTES in total, so that closing the socket does not reset
+    the connection before the client reads the response. A slow client cannot
+    hold the accept thread past that deadline.
+    """
+    body = json.dumps({"status": "error", "error_code": "SERVER_BUSY"}).encode("utf-8")
+    try:
+        request.settimeout(_REJECT_DRAIN_S)
+        request.sendall(
+            b"HTTP/1.1 503 Service Unavailable\r\n"
+            b"Content-Type: application/json\r\n"
+            + f"Content-Length: {len(body)}\r\n".encode("ascii")
+            + f"Retry-After: {_RETRY_AFTER_S}\r\n".encode("ascii")
+            + b"Access-Control-Allow-Origin: *\r\n"
+            b"Connection: close\r\n\r\n"
+            + body
+        )
+        request.shutdown(socket.SHUT_WR)
+        deadline = time.monotonic() + _REJECT_DRAIN_S
+        drained = 0
+        while drained < _REJECT_DRAIN_BYTES:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            request.settimeout(left)
+            chunk = request.recv(4096)
+            if not chunk:
+                break
+            drained += len(chunk)
+    except OSError:
+        pass
+
+
+def resolve_server_limits(
+    runtime_cfg: Dict[str, Any],
+    *,
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Return (workers, max_in_flight) from explicit overrides, then the
+    runtime.yaml ``api_server`` block, then defaults.
+
+    Raises:
+        ValueError('API_SERVER_CONFIG_INVALID: ...') for non-positive values
+        or max_in_flight < workers.
+    """
+    raw = (runtime_cfg or {}).get("api_server")
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        raise ValueError("API_SERVER_CONFIG_INVALID: api_server must be a mapping")
+    if workers is None:
+        workers = raw.get("workers", _DEFAULT_WORKERS)
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError("API_SERVER_CONFIG_INVALID: workers must be a positive integer")
+    if max_in_flight is None:
+        max_in_flight = raw.get("max_in_flight", max(_DEFAULT_MAX_IN_FLIGHT, workers))
+    if not isinstance(max_in_flight, int) or isinstance(max_in_flight, bool) or max_in_flight < 1:
+        raise ValueError("API_SERVER_CONFIG_INVALID: max_in_flight must be a positive integer")
+    if max_in_flight < workers:
+        raise ValueError("API_SERVER_CONFIG_INVALID: max_in_flight must be >= workers")
+    return workers, max_in_flight
+
 
 # ---------------------------------------------------------------------------
 # Request handler
 # ---------------------------------------------------------------------------
 
-def _make_handler(cfg, dispatcher: WebhookDispatcher):
+def _make_handler(cfg, dispatcher: WebhookDispatcher, session_locks: Optional[SessionLocks] = None):
     """
     Factory that creates a request handler class with cfg and dispatcher injected.
 
     Returns a BaseHTTPRequestHandler subclass. Using a factory avoids the need
     for global state — each server instance gets its own handler class with the
     correct config bound in.
+
+    When *cfg* is an IO3Config, each request re-resolves it through the
+    load_io3_config cache (a stat per file, no YAML parsing unless a file
+    changed), so config edits apply without a restart.
+
+    Session-scoped endpoints run under *session_locks* (a fresh SessionLocks
+    when not supplied), one lock per session_id.
     """
+    reload_dir = cfg.config_dir if isinstance(cfg, IO3Config) else None
+    locks = session_locks if session_locks is not None else SessionLocks()
 
     class _APIHandler(BaseHTTPRequestHandler):
-        _cfg = cfg
         _dispatcher = dispatcher
+        _session_locks = locks
+
+        @property
+        def _cfg(self):
+            if reload_dir is None:
+                return cfg
+            return load_io3_config(reload_dir)
 
         # ------------------------------------------------------------------
         # Logging — suppress default request log lines (use stderr only for errors)
@@ -210,7 +417,8 @@ def _make_handler(cfg, dispatcher: WebhookDispatcher):
             else:
                 session_id = self._session_id_from_path(path, "turn")
                 if session_id:
-                    status, resp = handle_session_turn(session_id, body, self._cfg)
+                    with self._session_locks.hold(session_id):
+                        status, resp = handle_session_turn(session_id, body, self._cfg)
                     self._send_json(status, resp)
                     # Fire webhooks after response is sent
                     if resp.get("session_status") == "closed" or resp.get("status") == SESSION_STATUS_CLOSED:
@@ -242,6 +450,10 @@ def _make_handler(cfg, dispatcher: WebhookDispatcher):
                 self._serve_ui()
                 return
 
+            if path == "/health":
+                self._send_json(200, health_payload())
+                return
+
             # SSE session stream (M9.2)
             session_id = self._session_id_from_path(path, "stream")
             if session_id:
@@ -255,21 +467,25 @@ def _make_handler(cfg, dispatcher: WebhookDispatcher):
                     return
                 persona_mode = params.get("persona_mode", "executor")
                 audit = params.get("audit", "false").lower() == "true"
+                stream = params.get("stream", "false").lower() == "true"
                 self._send_sse_headers()
-                stream_session_turn(
-                    session_id=session_id,
-                    prompt=prompt,
-                    cfg=self._cfg,
-                    wfile=self.wfile,
-                    persona_mode=persona_mode,
-                    audit=audit,
-                )
+                with self._session_locks.hold(session_id):
+                    stream_session_turn(
+                        session_id=session_id,
+                        prompt=prompt,
+                        cfg=self._cfg,
+                        wfile=self.wfile,
+                        persona_mode=persona_mode,
+                        audit=audit,
+                        stream=stream,
+                    )
                 return
 
             # Session state
             session_id = self._session_id_from_path(path, "state")
             if session_id:
-                status, resp = handle_session_state(session_id, self._cfg)
+                with self._session_locks.hold(session_id):
+                    status, resp = handle_session_state(session_id, self._cfg)
                 self._send_json(status, resp)
                 return
 
@@ -283,7 +499,8 @@ def _make_handler(cfg, dispatcher: WebhookDispatcher):
             path, _ = self._parse_path()
             session_id = self._session_id_bare(path)
             if session_id:
-                status, resp = handle_session_delete(session_id, self._cfg)
+                with self._session_locks.hold(session_id):
+                    status, resp = handle_session_delete(session_id, self._cfg)
                 self._send_json(status, resp)
                 if status == 200:
                     self._dispatcher.dispatch(WEBHOOK_SESSION_COMPLETE, {
@@ -326,6 +543,8 @@ def start_server(
     host: str = "127.0.0.1",
     port: int = 8080,
     cfg_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
 ) -> None:
     """
     Start the IO-III HTTP API server (ADR-025 §8).
@@ -333,29 +552,39 @@ def start_server(
     Blocks until interrupted (Ctrl-C / SIGINT).
 
     Args:
-        host:    bind address (default: 127.0.0.1 — loopback only)
-        port:    listen port (default: 8080)
-        cfg_dir: path to IO-III config directory (default: auto-detected)
+        host:          bind address (default: 127.0.0.1 — loopback only)
+        port:          listen port (default: 8080)
+        cfg_dir:       path to IO-III config directory (default: auto-detected)
+        workers:       worker threads (default: runtime.yaml api_server.workers, else 8)
+        max_in_flight: admitted requests before 503 (default: api_server.max_in_flight, else 32)
     """
     if cfg_dir is None:
         cfg_dir = default_config_dir()
 
     cfg = load_io3_config(cfg_dir)
+    workers, max_in_flight = resolve_server_limits(
+        cfg.runtime, workers=workers, max_in_flight=max_in_flight,
+    )
     dispatcher = WebhookDispatcher.from_runtime_config(cfg.runtime)
     handler_cls = _make_handler(cfg, dispatcher)
 
-    server = HTTPServer((host, port), handler_cls)
+    server = BoundedThreadingHTTPServer(
+        (host, port), handler_cls, workers=workers, max_in_flight=max_in_flight,
+    )
     print(
         f"IO-III API server listening on http://{host}:{port}/ "
-        f"(config: {cfg_dir})",
+        f"(config: {cfg_dir}; workers={workers} max_in_flight={max_in_flight})",
         file=sys.stderr,
     )
     try:
+        start_model_warmup(cfg)
         server.serve_forever()
     except KeyboardInterrupt:
         print("\nIO-III API server stopped.", file=sys.stderr)
     finally:
         server.server_close()
+        shutdown_model_warmup()
+        shutdown_delivery_worker()
 
 
 # ---------------------------------------------------------------------------
@@ -365,6 +594,7 @@ def start_server(
 def cmd_serve(args) -> int:
     """
     CLI handler for: python -m io_iii serve [--host H] [--port P]
+                                            [--workers N] [--max-in-flight N]
 
     Phase 9 M9.1 (ADR-025 §8).
     """
@@ -372,11 +602,19 @@ def cmd_serve(args) -> int:
     port = int(getattr(args, "port", 8080) or 8080)
     cfg_dir_raw = getattr(args, "config_dir", None)
     cfg_dir = Path(cfg_dir_raw) if cfg_dir_raw else None
+    workers = getattr(args, "workers", None)
+    max_in_flight = getattr(args, "max_in_flight", None)
 
     try:
-        start_server(host=host, port=port, cfg_dir=cfg_dir)
+        start_server(
+            host=host, port=port, cfg_dir=cfg_dir,
+            workers=workers, max_in_flight=max_in_flight,
+        )
     except OSError as e:
         print(f"API_SERVER_FAILED: {e}", file=sys.stderr)
         return 2  # configuration/binding error → exit code 2
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
 
     return 0
@@ -9,6 +9,10 @@ Python resolves function globals from the module where the function is defined,
 so patching io_iii.cli.X only works for functions whose __globals__ == cli.__dict__.
 
 All other commands live in their domain submodules and are re-exported here.
+
+Service layer: commands used by the HTTP API are split into execute_*(args),
+which returns a structured CommandResult, and a thin cmd_*(args) wrapper that
+renders it for the terminal. The API calls execute_* directly.
 """
 from __future__ import annotations
 
@@ -29,6 +33,8 @@ from io_iii.capabilities.builtins import builtin_registry
 
 # ---- Shared utilities ----
 from ._shared import (
+    CommandResult,
+    _emit,
     _to_jsonable,
     _print,
     _get_cfg_dir,
@@ -39,7 +45,7 @@ from ._shared import (
 
 # ---- Domain submodules ----
 from ._run import cmd_capabilities, cmd_config_show, cmd_route, cmd_about
-from ._runbook import cmd_runbook
+from ._runbook import cmd_runbook, execute_runbook
 from ._replay import _emit_replay_resume_result
 from io_iii.core.replay_resume import (
     replay as _replay,
@@ -48,6 +54,7 @@ from io_iii.core.replay_resume import (
 )
 from ._memory import (
     cmd_memory_write,
+    cmd_memory_migrate,
     cmd_session_export,
     cmd_session_import,
     _build_minimal_session_state,
@@ -58,6 +65,14 @@ from ._session_shell import (
     cmd_session_continue,
     cmd_session_status,
     cmd_session_close,
+    cmd_session_list,
+    cmd_session_gc,
+    execute_session_start,
+    execute_session_continue,
+    execute_session_status,
+    execute_session_close,
+    execute_session_list,
+    execute_session_gc,
 )
 
 
@@ -73,6 +88,7 @@ __all__ = [
     "cmd_replay",
     "cmd_resume",
     "cmd_memory_write",
+    "cmd_memory_migrate",
     "cmd_session_export",
     "cmd_session_import",
     "cmd_validate",
@@ -81,7 +97,18 @@ __all__ = [
     "cmd_session_continue",
     "cmd_session_status",
     "cmd_session_close",
+    "cmd_session_list",
+    "cmd_session_gc",
     "cmd_serve",
+    "CommandResult",
+    "execute_run",
+    "execute_runbook",
+    "execute_session_start",
+    "execute_session_continue",
+    "execute_session_status",
+    "execute_session_close",
+    "execute_session_list",
+    "execute_session_gc",
 ]
 
 
@@ -144,6 +171,16 @@ def cmd_resume(args) -> int:
 
 
 def cmd_run(args) -> int:
+    return _emit(execute_run(args))
+
+
+def execute_run(args) -> CommandResult:
+    """
+    Single governed run (service layer for `run` and POST /run).
+
+    Returns a CommandResult instead of printing; see cmd_run for the CLI surface.
+    Unexpected failures propagate after error metadata has been logged.
+    """
     cfg_dir = _get_cfg_dir(args)
     cfg = load_io3_config(cfg_dir)
     request_id = make_request_id()
@@ -179,6 +216,7 @@ def cmd_run(args) -> int:
                 cfg.logging,
                 {
                     "request_id": request_id,
+                    "config_generation": getattr(cfg, "config_generation", None),
                     "mode": getattr(selection, "mode", None),
                     "provider": "ollama",
                     "model": None,
@@ -305,6 +343,7 @@ def cmd_run(args) -> int:
             cfg.logging,
             {
                 "request_id": request_id,
+                "config_generation": getattr(cfg, "config_generation", None),
                 "mode": state2.mode,
                 "provider": result.provider,
                 "model": result.model,
@@ -326,15 +365,14 @@ def cmd_run(args) -> int:
             },
         )
 
-        if getattr(args, "raw", False):
-            print(result.message)
-        else:
-            _print(payload)
-        return 0
+        return CommandResult(
+            exit_code=0,
+            payload=payload,
+            text=result.message if getattr(args, "raw", False) else None,
+        )
 
     except ProviderError as e:
         # M10.2: intercept before generic handler to emit plain-language hint on 404.
-        import sys as _sys
         _is_404 = "404" in e.detail
         _error_code = "PROVIDER_MODEL_NOT_FOUND" if _is_404 else e.code
         latency_ms = int((time.perf_counter() - t0) * 1000)
@@ -342,6 +380,7 @@ def cmd_run(args) -> int:
             cfg.logging,
             {
                 "request_id": request_id,
+                "config_generation": getattr(cfg, "config_generation", None),
                 "mode": getattr(selection, "mode", None),
                 "provider": getattr(selection, "selected_provider", None),
                 "model": None,
@@ -358,15 +397,18 @@ def cmd_run(args) -> int:
             },
         )
         if _is_404:
-            print(
-                f"\nModel not found in Ollama: {e.detail}\n\n"
-                "Check which models are available:\n"
-                "  ollama list\n\n"
-                "Then update architecture/runtime/config/routing_table.yaml "
-                "to use a model name that appears in that list.\n",
-                file=_sys.stderr,
+            return CommandResult(
+                exit_code=1,
+                error_code=_error_code,
+                stderr=(
+                    f"\nModel not found in Ollama: {e.detail}\n\n"
+                    "Check which models are available:\n"
+                    "  ollama list\n\n"
+                    "Then update architecture/runtime/config/routing_table.yaml "
+                    "to use a model name that appears in that list.\n"
+                ),
+                terminate=True,
             )
-            _sys.exit(1)
         raise
 
     except Exception as e:
@@ -380,6 +422,7 @@ def cmd_run(args) -> int:
             cfg.logging,
             {
                 "request_id": request_id,
+                "config_generation": getattr(cfg, "config_generation", None),
                 "mode": getattr(selection, "mode", None),
                 "provider": getattr(selection, "selected_provider", None),
                 "model": None,
@@ -491,6 +534,7 @@ def cmd_capability(args) -> int:
             cfg.logging,
             {
                 "request_id": request_id,
+                "config_generation": getattr(cfg, "config_generation", None),
                 "mode": state2.mode,
                 "provider": result.provider,
                 "model": result.model,
@@ -533,6 +577,7 @@ def cmd_capability(args) -> int:
             cfg.logging,
             {
                 "request_id": request_id,
+                "config_generation": getattr(cfg, "config_generation", None),
                 "mode": "capability",
                 "provider": "null",
                 "model": None,
@@ -650,6 +695,10 @@ def main(argv=None) -> int:
     p_runbook = sub.add_parser("runbook")
     p_runbook.add_argument("json_file", type=str, help="Path to a JSON file containing a Runbook definition")
     p_runbook.add_argument("--audit", action="store_true", help="Enable challenger audit pass per step")
+    p_runbook.add_argument(
+        "--parallel", type=int, default=1, metavar="N",
+        help="Run up to N independent steps concurrently (default: 1, sequential).",
+    )
     p_runbook.add_argument(
         "--output", choices=["json"], default="json",
         help="Output format (default: json; M9.4).",
@@ -686,6 +735,13 @@ def main(argv=None) -> int:
         help="Provenance string (default: human)",
     )
     p_memory_write.set_defaults(func=cmd_memory_write)
+    p_memory_migrate = p_memory_sub.add_parser("migrate")
+    p_memory_migrate.add_argument("--dest", required=True, help="Destination SQLite file (.db)")
+    p_memory_migrate.add_argument(
+        "--source", default=None,
+        help="Source directory store (default: storage_root from memory_packs.yaml)",
+    )
+    p_memory_migrate.set_defaults(func=cmd_memory_migrate)
 
     # Phase 7 M7.4 — portability validation (ADR-023 §6)
     p_validate = sub.add_parser("validate")
@@ -769,6 +825,41 @@ def main(argv=None) -> int:
     )
     p_session_close.set_defaults(func=cmd_session_close)
 
+    p_session_list = p_session_sub.add_parser("list")
+    p_session_list.add_argument(
+        "--status", action="append", default=None,
+        choices=["active", "paused", "closed", "at_limit"],
+        help="Filter by status (repeatable)",
+    )
+    p_session_list.add_argument("--mode", default=None, choices=["work", "steward"], help="Filter by session mode")
+    p_session_list.add_argument(
+        "--sort", default="updated_at",
+        choices=["session_id", "status", "session_mode", "turn_count", "created_at", "updated_at"],
+        help="Sort key (default: updated_at, newest first)",
+    )
+    p_session_list.add_argument("--asc", action="store_true", help="Sort ascending")
+    p_session_list.add_argument("--limit", type=int, default=50, help="Page size (default: 50)")
+    p_session_list.add_argument("--offset", type=int, default=0, help="Rows to skip (default: 0)")
+    p_session_list.add_argument("--reindex", action="store_true", help="Rebuild the session index from disk first")
+    p_session_list.add_argument(
+        "--output", choices=["json"], default="json",
+        help="Output format (default: json; M9.4).",
+    )
+    p_session_list.set_defaults(func=cmd_session_list)
+
+    p_session_gc = p_session_sub.add_parser("gc")
+    p_session_gc.add_argument(
+        "--older-than-days", type=float, default=None, dest="older_than_days",
+        help="Only archive sessions last updated more than N days ago",
+    )
+    p_session_gc.add_argument("--limit", type=int, default=None, help="Archive at most N sessions")
+    p_session_gc.add_argument("--dry-run", action="store_true", dest="dry_run", help="Report without archiving")
+    p_session_gc.add_argument(
+        "--output", choices=["json"], default="json",
+        help="Output format (default: json; M9.4).",
+    )
+    p_session_gc.set_defaults(func=cmd_session_gc)
+
     # Phase 9 M9.1 — HTTP server (ADR-025 §7)
     p_serve = sub.add_parser("serve", help="Start the IO-III HTTP API server (Phase 9)")
     p_serve.add_argument(
@@ -779,6 +870,14 @@ def main(argv=None) -> int:
         "--port", type=int, default=8080,
         help="Bind port (default: 8080)",
     )
+    p_serve.add_argument(
+        "--workers", type=int, default=None,
+        help="Worker threads (default: runtime.yaml api_server.workers, else 8)",
+    )
+    p_serve.add_argument(
+        "--max-in-flight", type=int, default=None,
+        help="Requests admitted before answering 503 (default: api_server.max_in_flight, else 32)",
+    )
     p_serve.set_defaults(func=cmd_serve)
 
     args = parser.parse_args(argv)
@@ -1,10 +1,12 @@
 """
-CLI commands: memory write, session export, session import (Phase 6 M6.6–M6.7 / ADR-022).
+CLI commands: memory write, memory migrate, session export, session import
+(Phase 6 M6.6–M6.7 / ADR-022).
 """
 from __future__ import annotations
 
 from io_iii.config import load_io3_config
 from io_iii.persona_contract import PERSONA_CONTRACT_VERSION
+from io_iii.memory.store import migrate_directory_store as _migrate_directory_store
 from io_iii.memory.write import memory_write as _memory_write
 from io_iii.core.snapshot import export_snapshot as _export_snapshot, import_snapshot as _import_snapshot
 
@@ -96,6 +98,35 @@ def cmd_memory_write(args) -> int:
         return 1
 
 
+def cmd_memory_migrate(args) -> int:
+    """
+    Copy a directory-layout memory store into a SQLite store.
+
+    Command surface:
+        python -m io_iii memory migrate --dest <path.db> [--source <dir>]
+
+    --source defaults to storage_root from memory_packs.yaml. The source is
+    left untouched; point storage_root at the .db file to switch backends.
+    Re-running is safe (records are replaced by (scope, key)).
+    """
+    source = getattr(args, "source", None)
+    if not source:
+        try:
+            from io_iii.memory.packs import PackLoader
+            cfg = load_io3_config(_get_cfg_dir(args))
+            source = PackLoader(cfg.config_dir / "memory_packs.yaml").storage_root
+        except Exception:
+            source = "./memory_store"
+
+    try:
+        copied = _migrate_directory_store(source, args.dest)
+    except ValueError as e:
+        _print({"status": "error", "error_code": str(e).split(":")[0].strip()})
+        return 1
+    _print({"status": "ok", "records_copied": copied, "dest": str(args.dest)})
+    return 0
+
+
 def cmd_session_export(args) -> int:
     """
     Export a portable session snapshot (Phase 6 M6.7 / ADR-022 §8).
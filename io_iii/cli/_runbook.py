@@ -13,16 +13,21 @@ import io_iii.core.runbook_runner as _runbook_runner
 from io_iii.core.dependencies import RuntimeDependencies
 from io_iii.capabilities.builtins import builtin_registry
 
-from ._shared import _get_cfg_dir, _print
+from ._shared import CommandResult, _emit, _get_cfg_dir
 
 
 def cmd_runbook(args) -> int:
+    return _emit(execute_runbook(args))
+
+
+def execute_runbook(args) -> CommandResult:
     """
     Execute a Runbook from a JSON file (Phase 4 M4.9 / ADR-016).
 
     Command surface:
         python -m io_iii runbook <json-file>
         python -m io_iii runbook <json-file> --audit
+        python -m io_iii runbook <json-file> --parallel 4
 
     Validation order (ADR-016 §3 — contractual):
         1. file exists and is readable
@@ -31,6 +36,8 @@ def cmd_runbook(args) -> int:
         4. execute through existing runbook execution path (runbook_runner.run)
         5. emit stable structural result
 
+    Returns a CommandResult; cmd_runbook renders it for the terminal.
+
     Thin veneer only (ADR-016 §4). Delegates entirely into runbook_runner.run().
     Does not call engine.run() directly. Does not own orchestration semantics.
     """
@@ -38,23 +45,25 @@ def cmd_runbook(args) -> int:
 
     # 1. File exists and is readable.
     if not json_path.exists() or not json_path.is_file():
-        _print({"status": "error", "error_code": "RUNBOOK_FILE_NOT_FOUND"})
-        return 1
+        return CommandResult(exit_code=1, payload={"status": "error", "error_code": "RUNBOOK_FILE_NOT_FOUND"})
 
     # 2. Valid JSON.
     try:
         raw_text = json_path.read_text(encoding="utf-8")
         data = json.loads(raw_text)
     except (json.JSONDecodeError, UnicodeDecodeError, OSError):
-        _print({"status": "error", "error_code": "RUNBOOK_INVALID_JSON"})
-        return 1
+        return CommandResult(exit_code=1, payload={"status": "error", "error_code": "RUNBOOK_INVALID_JSON"})
 
     # 3. Valid runbook schema through existing contract.
     try:
         runbook = Runbook.from_dict(data)
     except (ValueError, TypeError):
-        _print({"status": "error", "error_code": "RUNBOOK_SCHEMA_ERROR"})
-        return 1
+        return CommandResult(exit_code=1, payload={"status": "error", "error_code": "RUNBOOK_SCHEMA_ERROR"})
+
+    max_parallel = getattr(args, "parallel", None)
+    max_parallel = 1 if max_parallel is None else max_parallel
+    if max_parallel < 1:
+        return CommandResult(exit_code=1, payload={"status": "error", "error_code": "RUNBOOK_PARALLEL_INVALID"})
 
     # 4. Execute through existing runbook execution path.
     cfg_dir = _get_cfg_dir(args)
@@ -70,6 +79,7 @@ def cmd_runbook(args) -> int:
         cfg=cfg,
         deps=deps,
         audit=bool(getattr(args, "audit", False)),
+        max_parallel=max_parallel,
     )
 
     # 5. Emit stable structural result (ADR-016 §6).
@@ -92,7 +102,7 @@ def cmd_runbook(args) -> int:
                 if step_failure is not None:
                     failure_kind = step_failure.kind.value
                     failure_code = step_failure.code
-        _print({
+        return CommandResult(exit_code=1, payload={
             "status": "error",
             "runbook_id": result.runbook_id,
             "steps_completed": result.steps_completed,
@@ -102,9 +112,8 @@ def cmd_runbook(args) -> int:
             "failure_code": failure_code,
             "metadata_projection": metadata_summary,
         })
-        return 1
 
-    _print({
+    return CommandResult(exit_code=0, payload={
         "status": "ok",
         "runbook_id": result.runbook_id,
         "steps_completed": result.steps_completed,
@@ -112,4 +121,3 @@ def cmd_runbook(args) -> int:
         "failed_step_index": result.failed_step_index,
         "metadata_projection": metadata_summary,
     })
-    return 0
@@ -1,11 +1,17 @@
 """
 io_iii.cli._session_shell — Session shell CLI commands (Phase 8 M8.3).
 
-Provides four bounded session management commands:
+Provides bounded session management commands:
     session start    — initialise a new dialogue session (optionally run first turn)
     session continue — load an existing session and run one turn
     session status   — print content-safe session status summary
     session close    — terminate a session and print a content-safe summary
+    session list     — filtered, sorted, paginated listing from the session index
+    session gc       — archive closed sessions in bulk
+
+Each command is split into execute_session_*(args) -> CommandResult (service
+layer, shared with the HTTP API) and a cmd_session_*(args) wrapper that renders
+the result for the terminal.
 
 All output is content-safe (ADR-003): no prompt text, model output, persona content,
 or memory values appear in any printed field.
@@ -16,7 +22,6 @@ DEFAULT_SESSION_STORAGE (.io_iii/sessions).
 from __future__ import annotations
 
 import json
-import sys
 from pathlib import Path
 from typing import Any, Optional
 
@@ -28,12 +33,12 @@ from io_iii.core.dialogue_session import (
     SESSION_STATUS_CLOSED,
     DialogueSession,
     DialogueTurnResult,
-    load_session,
     new_session,
     run_turn,
-    save_session,
     session_status_summary,
 )
+from io_iii.core.session_cache import hold_session, load_session_cached, save_session_cached
+from io_iii.core.session_index import archive_closed_sessions, get_session_index, query_sessions
 from io_iii.core.session_mode import (
     DEFAULT_SESSION_MODE,
     SessionMode,
@@ -41,19 +46,17 @@ from io_iii.core.session_mode import (
     StewardThresholds,
     load_steward_thresholds,
 )
-from io_iii.memory.packs import PackLoader
-from io_iii.memory.policy import load_retrieval_policy
 from io_iii.memory.session_continuity import (
     SESSION_CONTINUITY_PACK_ID,
     SessionMemoryContext,
-    load_session_memory,
+    load_session_memory_cached,
 )
-from io_iii.memory.store import MemoryRecord, MemoryStore
-from io_iii.core.file_store import FileRefExpiredError, delete as _fs_delete
+from io_iii.memory.store import MemoryRecord
+from io_iii.core.file_store import FileRefExpiredError, configure_file_store as _fs_configure, delete as _fs_delete
 from io_iii.metadata_logging import append_metadata
 from io_iii.providers.ollama_provider import OllamaProvider
 
-from ._shared import _get_cfg_dir, _print
+from ._shared import CommandResult, _emit, _get_cfg_dir
 
 
 # ---------------------------------------------------------------------------
@@ -77,9 +80,9 @@ def _build_gate(cfg_runtime: dict, session: DialogueSession) -> StewardGate:
     )
 
 
-def _emit_turn_result(turn_result: DialogueTurnResult, cfg_runtime: dict | None = None) -> None:
+def _turn_payload(turn_result: DialogueTurnResult, cfg_runtime: dict | None = None) -> dict:
     """
-    Print turn result summary.
+    Build the turn result summary.
 
     When content_release is enabled in runtime.yaml (ADR-026), the model
     response text is included as ``message``. Otherwise only structural
@@ -111,7 +114,12 @@ def _emit_turn_result(turn_result: DialogueTurnResult, cfg_runtime: dict | None
         msg = getattr(turn_result.result, "message", None)
         if msg:
             payload["message"] = msg
-    _print(payload)
+    return payload
+
+
+def _stderr_failure(message: str) -> CommandResult:
+    """Exit-1 result whose only output is a ``CODE: detail`` line on stderr."""
+    return CommandResult(exit_code=1, error_code=message.split(":")[0], stderr=message)
 
 
 def _pause_summary(turn_result: DialogueTurnResult) -> dict:
@@ -148,20 +156,12 @@ def _load_continuity_memory(
     context is a SessionMemoryContext (content-safe) or None if pack is absent.
 
     Absent pack and absent store are both safe defaults — ([], None) is returned.
-    No memory writes are triggered (ADR-022 §7).
+    No memory writes are triggered (ADR-022 §7). Served from the resolved-pack
+    cache while packs, policy and store are unchanged.
     """
-    cfg_dir = cfg.config_dir
-
-    pack_loader = PackLoader(cfg_dir / "memory_packs.yaml")
-    policy = load_retrieval_policy(cfg_dir / "memory_retrieval_policy.yaml")
-    storage_root = pack_loader.storage_root
-    store = MemoryStore(storage_root)
-
-    return load_session_memory(
+    return load_session_memory_cached(
+        config_dir=cfg.config_dir,
         pack_id=pack_id,
-        pack_loader=pack_loader,
-        store=store,
-        policy=policy,
         route=route,
     )
 
@@ -171,6 +171,10 @@ def _load_continuity_memory(
 # ---------------------------------------------------------------------------
 
 def cmd_session_start(args) -> int:
+    return _emit(execute_session_start(args))
+
+
+def execute_session_start(args) -> CommandResult:
     """
     Initialise a new dialogue session (Phase 8 M8.3).
 
@@ -188,11 +192,9 @@ def cmd_session_start(args) -> int:
     try:
         session_mode = SessionMode(raw_mode)
     except ValueError:
-        print(
-            f"SESSION_MODE_INVALID: --mode must be 'work' or 'steward', got {raw_mode!r}",
-            file=sys.stderr,
+        return _stderr_failure(
+            f"SESSION_MODE_INVALID: --mode must be 'work' or 'steward', got {raw_mode!r}"
         )
-        return 1
 
     session = new_session(
         session_mode=session_mode,
@@ -219,17 +221,15 @@ def cmd_session_start(args) -> int:
                 audit=audit,
             )
         except Exception as e:
-            print(f"SESSION_TURN_FAILED: {type(e).__name__}", file=sys.stderr)
-            save_session(session, storage_root)
-            return 1
+            save_session_cached(session, storage_root, cfg.runtime)
+            return _stderr_failure(f"SESSION_TURN_FAILED: {type(e).__name__}")
 
-        save_session(session, storage_root)
-        _emit_turn_result(turn_result, cfg_runtime=cfg.runtime)
-        return 0
+        save_session_cached(session, storage_root, cfg.runtime)
+        return CommandResult(exit_code=0, payload=_turn_payload(turn_result, cfg_runtime=cfg.runtime))
 
     # No prompt — just initialise and save
-    save_session(session, storage_root)
-    _print({
+    save_session_cached(session, storage_root, cfg.runtime)
+    return CommandResult(exit_code=0, payload={
         "session_id": session.session_id,
         "session_mode": session.session_mode.value,
         "status": session.status,
@@ -237,7 +237,6 @@ def cmd_session_start(args) -> int:
         "max_turns": session.max_turns,
         "created_at": session.created_at,
     })
-    return 0
 
 
 # ---------------------------------------------------------------------------
@@ -245,6 +244,10 @@ def cmd_session_start(args) -> int:
 # ---------------------------------------------------------------------------
 
 def cmd_session_continue(args) -> int:
+    return _emit(execute_session_continue(args))
+
+
+def execute_session_continue(args) -> CommandResult:
     """
     Load an existing session and run one turn (Phase 8 M8.3).
 
@@ -262,51 +265,59 @@ def cmd_session_continue(args) -> int:
 
     session_id = getattr(args, "session_id", None)
     if not session_id:
-        print("SESSION_ID_REQUIRED: --session-id is required", file=sys.stderr)
-        return 1
+        return _stderr_failure("SESSION_ID_REQUIRED: --session-id is required")
 
+    # Load → turn → save runs under the per-session lock when the hot
+    # session cache is enabled (concurrent requests share the live object).
+    with hold_session(session_id, storage_root, cfg.runtime):
+        return _continue_session(args, cfg, storage_root, session_id)
+
+
+def _continue_session(args, cfg, storage_root: Path, session_id: str) -> CommandResult:
     try:
-        session = load_session(session_id, storage_root)
+        session = load_session_cached(session_id, storage_root, cfg.runtime)
     except ValueError as e:
-        print(str(e), file=sys.stderr)
-        return 1
+        return _stderr_failure(str(e))
 
     # Handle steward pause actions before running a new turn (ADR-024 §6.3).
     action = getattr(args, "action", None)
     if session.is_paused():
         if action == "close":
-            return _close_session(session, storage_root)
+            return _close_session(session, storage_root, cfg.runtime)
         elif action in ("approve", "redirect"):
             session.status = "active"
-            save_session(session, storage_root)
+            save_session_cached(session, storage_root, cfg.runtime)
             if action == "approve" and not getattr(args, "prompt", None):
-                _print({
+                return CommandResult(exit_code=0, payload={
                     "session_id": session.session_id,
                     "status": "active",
                     "message": "session_approved_awaiting_prompt",
                 })
-                return 0
         else:
             # Paused with no valid action — surface pause state.
             # Exit code 3: steward gate pause requires human action (ADR-025 §7).
-            _print({
+            return CommandResult(exit_code=3, payload={
                 "session_id": session.session_id,
                 "status": session.status,
                 "message": "session_paused_awaiting_action",
                 "valid_actions": ["approve", "redirect", "close"],
             })
-            return 3
 
     prompt = getattr(args, "prompt", None)
     if not prompt:
-        print("PROMPT_REQUIRED: --prompt is required for session continue", file=sys.stderr)
-        return 1
+        return _stderr_failure("PROMPT_REQUIRED: --prompt is required for session continue")
 
     persona_mode = getattr(args, "persona_mode", "executor") or "executor"
     gate = _build_gate(cfg.runtime, session)
     deps = _build_deps(cfg)
     audit = bool(getattr(args, "audit", False))
 
+    if getattr(args, "file_ref", None):
+        try:
+            _fs_configure(cfg.runtime)
+        except ValueError as e:
+            return _stderr_failure(str(e))
+
     # Auto-load session continuity memory (M8.6).
     # Absent pack is the safe default → ([], None). No writes triggered.
     sm_records, sm_context = _load_continuity_memory(cfg, route=persona_mode)
@@ -323,42 +334,40 @@ def cmd_session_continue(args) -> int:
             session_memory=sm_records if sm_records else None,
             memory_context=sm_context,
             file_ref=getattr(args, "file_ref", None),   # ADR-029
+            on_output_delta=getattr(args, "on_output_delta", None),
         )
     except FileRefExpiredError as e:
-        _print({
+        save_session_cached(session, storage_root, cfg.runtime)
+        return CommandResult(exit_code=1, payload={
             "session_id": session.session_id,
             "status": "error",
             "error_code": "FILE_REF_EXPIRED",
             "session_status": session.status,
         })
-        save_session(session, storage_root)
-        return 1
     except ValueError as e:
         code = str(e).split(":")[0]
-        _print({
+        save_session_cached(session, storage_root, cfg.runtime)
+        return CommandResult(exit_code=1, payload={
             "session_id": session.session_id,
             "status": "error",
             "error_code": code,
             "session_status": session.status,
         })
-        save_session(session, storage_root)
-        return 1
     except Exception as e:
-        _print({
+        save_session_cached(session, storage_root, cfg.runtime)
+        return CommandResult(exit_code=1, payload={
             "session_id": session.session_id,
             "status": "error",
             "error_code": type(e).__name__,
             "session_status": session.status,
         })
-        save_session(session, storage_root)
-        return 1
 
-    save_session(session, storage_root)
-    _emit_turn_result(turn_result, cfg_runtime=cfg.runtime)
+    save_session_cached(session, storage_root, cfg.runtime)
     # Exit code 3: steward gate pause triggered by this turn (ADR-025 §7).
-    if turn_result.pause_state is not None:
-        return 3
-    return 0
+    return CommandResult(
+        exit_code=3 if turn_result.pause_state is not None else 0,
+        payload=_turn_payload(turn_result, cfg_runtime=cfg.runtime),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -366,6 +375,10 @@ def cmd_session_continue(args) -> int:
 # ---------------------------------------------------------------------------
 
 def cmd_session_status(args) -> int:
+    return _emit(execute_session_status(args))
+
+
+def execute_session_status(args) -> CommandResult:
     """
     Print content-safe status summary for a session (Phase 8 M8.3).
 
@@ -378,17 +391,14 @@ def cmd_session_status(args) -> int:
 
     session_id = getattr(args, "session_id", None)
     if not session_id:
-        print("SESSION_ID_REQUIRED: --session-id is required", file=sys.stderr)
-        return 1
+        return _stderr_failure("SESSION_ID_REQUIRED: --session-id is required")
 
     try:
-        session = load_session(session_id, storage_root)
+        session = load_session_cached(session_id, storage_root, cfg.runtime)
     except ValueError as e:
-        print(str(e), file=sys.stderr)
-        return 1
+        return _stderr_failure(str(e))
 
-    _print(session_status_summary(session))
-    return 0
+    return CommandResult(exit_code=0, payload=session_status_summary(session))
 
 
 # ---------------------------------------------------------------------------
@@ -396,6 +406,10 @@ def cmd_session_status(args) -> int:
 # ---------------------------------------------------------------------------
 
 def cmd_session_close(args) -> int:
+    return _emit(execute_session_close(args))
+
+
+def execute_session_close(args) -> CommandResult:
     """
     Terminate a session and print a content-safe summary (Phase 8 M8.3).
 
@@ -411,27 +425,30 @@ def cmd_session_close(args) -> int:
 
     session_id = getattr(args, "session_id", None)
     if not session_id:
-        print("SESSION_ID_REQUIRED: --session-id is required", file=sys.stderr)
-        return 1
+        return _stderr_failure("SESSION_ID_REQUIRED: --session-id is required")
 
-    try:
-        session = load_session(session_id, storage_root)
-    except ValueError as e:
-        print(str(e), file=sys.stderr)
-        return 1
+    with hold_session(session_id, storage_root, cfg.runtime):
+        try:
+            session = load_session_cached(session_id, storage_root, cfg.runtime)
+        except ValueError as e:
+            return _stderr_failure(str(e))
 
-    return _close_session(session, storage_root)
+        return _close_session(session, storage_root, cfg.runtime)
 
 
-def _close_session(session: DialogueSession, storage_root: Path) -> int:
-    """Mark session closed, persist, and emit content-safe summary."""
+def _close_session(
+    session: DialogueSession,
+    storage_root: Path,
+    runtime_config: Optional[dict] = None,
+) -> CommandResult:
+    """Mark session closed, persist, and return a content-safe summary."""
     session.status = SESSION_STATUS_CLOSED
     import datetime as _dt
     session.updated_at = _dt.datetime.now(_dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    save_session(session, storage_root)
+    save_session_cached(session, storage_root, runtime_config)
     # ADR-033 §6: clean up in-memory file store on session close.
     _fs_delete(session.session_id)
-    _print({
+    return CommandResult(exit_code=0, payload={
         "session_id": session.session_id,
         "status": SESSION_STATUS_CLOSED,
         "session_mode": session.session_mode.value,
@@ -439,4 +456,101 @@ def _close_session(session: DialogueSession, storage_root: Path) -> int:
         "max_turns": session.max_turns,
         "updated_at": session.updated_at,
     })
-    return 0
+
+
+# ---------------------------------------------------------------------------
+# session list
+# ---------------------------------------------------------------------------
+
+def _arg_or(args, name: str, default: Any) -> Any:
+    value = getattr(args, name, None)
+    return default if value is None else value
+
+
+def cmd_session_list(args) -> int:
+    return _emit(execute_session_list(args))
+
+
+def execute_session_list(args) -> CommandResult:
+    """
+    List stored sessions from the session index (content-safe rows).
+
+    CLI:
+        python -m io_iii session list [--status S ...] [--mode work|steward]
+            [--sort updated_at] [--asc] [--limit 50] [--offset 0] [--reindex]
+    """
+    cfg_dir = _get_cfg_dir(args)
+    cfg = load_io3_config(cfg_dir)
+    storage_root = _session_storage(cfg.runtime)
+
+    if getattr(args, "reindex", False) and storage_root.is_dir():
+        get_session_index(storage_root).rebuild()
+
+    try:
+        page = query_sessions(
+            storage_root,
+            status=getattr(args, "status", None) or None,
+            session_mode=getattr(args, "mode", None),
+            order_by=getattr(args, "sort", None) or "updated_at",
+            descending=not getattr(args, "asc", False),
+            limit=_arg_or(args, "limit", 50),
+            offset=_arg_or(args, "offset", 0),
+        )
+    except ValueError as e:
+        return _stderr_failure(str(e))
+
+    return CommandResult(exit_code=0, payload={
+        "sessions": page.sessions,
+        "total": page.total,
+        "limit": page.limit,
+        "offset": page.offset,
+    })
+
+
+# ---------------------------------------------------------------------------
+# session gc
+# ---------------------------------------------------------------------------
+
+def cmd_session_gc(args) -> int:
+    return _emit(execute_session_gc(args))
+
+
+def execute_session_gc(args) -> CommandResult:
+    """
+    Archive closed sessions in bulk into <storage_root>/archive/.
+
+    --older-than-days N keeps sessions updated within the last N days;
+    --dry-run reports what would be archived without moving anything.
+
+    CLI:
+        python -m io_iii session gc [--older-than-days N] [--limit N] [--dry-run]
+    """
+    import datetime as _dt
+
+    cfg_dir = _get_cfg_dir(args)
+    cfg = load_io3_config(cfg_dir)
+    storage_root = _session_storage(cfg.runtime)
+
+    days = getattr(args, "older_than_days", None)
+    updated_before = None
+    if days:
+        cutoff = _dt.datetime.now(_dt.timezone.utc) - _dt.timedelta(days=days)
+        updated_before = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
+    dry_run = bool(getattr(args, "dry_run", False))
+
+    try:
+        archived = archive_closed_sessions(
+            storage_root,
+            updated_before=updated_before,
+            limit=getattr(args, "limit", None),
+            dry_run=dry_run,
+            runtime_config=cfg.runtime,
+        )
+    except ValueError as e:
+        return _stderr_failure(str(e))
+
+    return CommandResult(exit_code=0, payload={
+        "dry_run": dry_run,
+        "archived": len(archived),
+        "session_ids": archived,
+    })
@@ -6,6 +6,8 @@ Private to the cli package — import via cli/__init__.py for external use.
 from __future__ import annotations
 
 import json
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -34,6 +36,44 @@ def _print(obj: Any) -> None:
     print(json.dumps(_to_jsonable(obj), indent=2))
 
 
+@dataclass(frozen=True)
+class CommandResult:
+    """
+    Structured outcome of a command (service layer shared by CLI and HTTP API).
+
+    execute_* functions return a CommandResult and never print. cmd_* wrappers
+    render it with _emit(); io_iii.api.app returns payload directly, so no
+    stdout capture or JSON round-trip is involved.
+
+    Fields:
+        exit_code   process exit code (0 ok, 1 error, 3 steward pause)
+        payload     JSON document (CLI stdout); None when the command emits none
+        error_code  stable code for failures that carry no payload
+        stderr      human-oriented diagnostic (CLI stderr only; never returned by the API)
+        text        plain-text stdout used instead of payload (e.g. run --raw)
+        terminate   CLI raises SystemExit(exit_code) after emitting
+    """
+    exit_code: int
+    payload: Optional[Dict[str, Any]] = None
+    error_code: Optional[str] = None
+    stderr: Optional[str] = None
+    text: Optional[str] = None
+    terminate: bool = False
+
+
+def _emit(result: CommandResult) -> int:
+    """Render a CommandResult to stdout/stderr and return its exit code."""
+    if result.stderr is not None:
+        print(result.stderr, file=sys.stderr)
+    if result.text is not None:
+        print(result.text)
+    elif result.payload is not None:
+        _print(result.payload)
+    if result.terminate:
+        sys.exit(result.exit_code)
+    return result.exit_code
+
+
 def _get_cfg_dir(args) -> Path:
     if getattr(args, "config_dir", None):
         return Path(args.config_dir)
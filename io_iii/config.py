@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import dataclasses
+import os
+import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import subprocess
 import yaml
 
 
@@ -15,6 +19,9 @@ class IO3Config:
     logging: Dict[str, Any]
     routing: Dict[str, Any]
     runtime: Dict[str, Any]
+    # Process-wide parse counter: bumps every time any config dir is (re)parsed.
+    # Content-safe; recorded in metadata so log records can be tied to a reload.
+    config_generation: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -68,12 +75,63 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
     return data
 
 
-def load_io3_config(config_dir: Optional[Path] = None) -> IO3Config:
-    """
-    Load IO-III runtime configuration (architecture/runtime) from YAML files in config_dir.
-    """
-    cfg_dir = config_dir or default_config_dir()
+# ---------------------------------------------------------------------------
+# Process-wide cache (hot reload)
+# ---------------------------------------------------------------------------
+#
+# load_io3_config() is on every request path (CLI commands, API handlers), so
+# parsed configs are cached per directory and revalidated with a stat() of each
+# file — no YAML parsing unless something changed. A fingerprint covers mtime,
+# ctime, inode and size, so in-place edits and atomic rename-over writes are
+# both detected. A changed fingerprint triggers a full re-parse; the new
+# IO3Config is swapped in atomically and readers holding the old one keep a
+# consistent snapshot.
+#
+# Racy entries: a file modified within _RACY_WINDOW_NS of the snapshot could be
+# rewritten again inside the same timestamp tick without changing its
+# fingerprint, so such entries are re-parsed on every call until they age out.
+
+_CONFIG_FILES: Tuple[str, ...] = (
+    "providers.yaml",
+    "logging.yaml",
+    "routing_table.yaml",
+    "runtime.yaml",
+)
+_RACY_WINDOW_NS = 2_000_000_000
+
+_Fingerprint = Tuple[Optional[Tuple[int, int, int, int]], ...]
+
+_cache_lock = threading.Lock()
+_cache: Dict[str, Tuple[_Fingerprint, IO3Config, bool]] = {}
+_generation = 0
+
+
+def _fingerprint(cfg_dir: Path) -> _Fingerprint:
+    parts: List[Optional[Tuple[int, int, int, int]]] = []
+    for name in _CONFIG_FILES:
+        try:
+            st = os.stat(cfg_dir / name)
+        except OSError:
+            parts.append(None)
+            continue
+        parts.append((st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_size))
+    return tuple(parts)
+
+
+def _is_racy(fp: _Fingerprint, snapshot_ns: int) -> bool:
+    return any(
+        part is not None and snapshot_ns - part[0] < _RACY_WINDOW_NS
+        for part in fp
+    )
+
+
+def _same_content(a: IO3Config, b: IO3Config) -> bool:
+    return (a.providers, a.logging, a.routing, a.runtime) == (
+        b.providers, b.logging, b.routing, b.runtime
+    )
+
 
+def _parse_io3_config(cfg_dir: Path) -> IO3Config:
     providers = _load_yaml(cfg_dir / "providers.yaml")
     logging = _load_yaml(cfg_dir / "logging.yaml")
     routing = _load_yaml(cfg_dir / "routing_table.yaml")
@@ -89,3 +147,44 @@ def load_io3_config(config_dir: Optional[Path] = None) -> IO3Config:
         routing=routing,
         runtime=runtime,
     )
+
+
+def load_io3_config(config_dir: Optional[Path] = None) -> IO3Config:
+    """
+    Load IO-III runtime configuration (architecture/runtime) from YAML files in config_dir.
+
+    Cached per directory and revalidated by file fingerprint on every call; see
+    the cache notes above. Callers must treat the returned mappings as read-only.
+    """
+    global _generation
+
+    cfg_dir = Path(config_dir) if config_dir is not None else default_config_dir()
+    key = os.path.abspath(cfg_dir)
+
+    fp = _fingerprint(cfg_dir)
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry is not None and entry[0] == fp and not entry[2]:
+        cfg = entry[1]
+    else:
+        snapshot_ns = time.time_ns()
+        parsed = _parse_io3_config(cfg_dir)
+        with _cache_lock:
+            current = _cache.get(key)
+            if current is not None and _same_content(current[1], parsed):
+                # Touched but unchanged (or a racy re-check): keep the generation.
+                cfg = current[1]
+            else:
+                _generation += 1
+                cfg = dataclasses.replace(parsed, config_generation=_generation)
+            _cache[key] = (fp, cfg, _is_racy(fp, snapshot_ns))
+
+    if cfg.config_dir != cfg_dir:
+        cfg = dataclasses.replace(cfg, config_dir=cfg_dir)
+    return cfg
+
+
+def clear_config_cache() -> None:
+    """Drop every cached config; the next load_io3_config() re-parses."""
+    with _cache_lock:
+        _cache.clear()
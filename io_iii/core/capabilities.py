@@ -4,6 +4,9 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Iterable, Mapping, Optional, Protocol, runtime_checkable
 
+# Execution backends a capability may request (CapabilitySpec.isolation).
+CAPABILITY_ISOLATION_MODES = ("thread", "process")
+
 
 class CapabilityCategory(str, Enum):
     """
@@ -26,7 +29,7 @@ class CapabilityBounds:
     All bounds are enforced at invocation time by the engine's capability runner
     (_invoke_capability_once in engine.py):
     - max_input_chars: checked before invocation (CAPABILITY_INPUT_TOO_LARGE)
-    - timeout_ms: enforced via ThreadPoolExecutor timeout (CAPABILITY_TIMEOUT)
+    - timeout_ms: enforced by the shared capability executor (CAPABILITY_TIMEOUT)
     - max_output_chars: checked after invocation (CAPABILITY_OUTPUT_TOO_LARGE)
     - max_calls: architectural constraint — one invocation per engine.run() call
     """
@@ -59,6 +62,10 @@ class CapabilitySpec:
     input_schema: Optional[Dict[str, Any]] = None
     output_schema: Optional[Dict[str, Any]] = None
 
+    # Execution backend: "thread" (in-process) or "process" (sandboxed worker
+    # process, killed on timeout). None = the capability executor's default kind.
+    isolation: Optional[str] = None
+
     @property
     def id(self) -> str:
         """Alias for capability_id (stable external name)."""
@@ -141,6 +148,11 @@ class CapabilityRegistry:
             raise ValueError("CAPABILITY_BOUNDS_INVALID: timeout_ms must be >= 1")
         if b.max_input_chars < 1 or b.max_output_chars < 1:
             raise ValueError("CAPABILITY_BOUNDS_INVALID: max_input_chars/max_output_chars must be >= 1")
+        isolation = getattr(cap.spec, "isolation", None)
+        if isolation is not None and isolation not in CAPABILITY_ISOLATION_MODES:
+            raise ValueError(
+                f"CAPABILITY_ISOLATION_INVALID: isolation must be one of {list(CAPABILITY_ISOLATION_MODES)}"
+            )
 
         self._by_id[cid] = cap
 
@@ -0,0 +1,388 @@
+"""
+Shared, bounded executor for capability invocations (Phase 3 M3.15 bounds).
+
+_invoke_capability_once used to create a ThreadPoolExecutor(max_workers=1)
+per call just to enforce CapabilityBounds.timeout_ms: a thread was created
+and torn down on every invocation, and on timeout the ``with`` block still
+waited for the runaway capability to finish. Invocations now go through one
+process-wide CapabilityExecutor:
+
+- kind ``thread`` (default): a fixed set of daemon worker threads. A timed
+  out capability cannot be stopped, but its thread is abandoned and a
+  replacement started, so the pool keeps its capacity and neither the
+  caller nor interpreter shutdown waits for it.
+- kind ``process``: worker processes from a ProcessSandbox (capability_sandbox.py).
+  They are started ahead of use and reused; on timeout the worker running
+  the call gets SIGKILL and is replaced, so a CPU-heavy or runaway
+  capability really stops. Large payloads travel through shared memory.
+  Capabilities, the context and results must be picklable.
+
+The backend is chosen per capability by CapabilitySpec.isolation
+("thread" / "process"); capabilities that leave it unset use the executor
+kind.
+
+Admission is bounded: at most max_workers + queue_size invocations (either
+backend) may be pending; beyond that the call fails fast with
+CAPABILITY_BUSY. A timed-out thread call keeps its slot until its abandoned
+thread returns, so a capability that hangs repeatedly cannot grow the
+thread count past that limit. timeout_ms bounds the caller's total wait,
+queueing included.
+
+Configuration (runtime.yaml; absent block = thread pool with defaults)::
+
+    capability_executor:
+      kind: thread               # default backend: thread | process
+      max_workers: 4             # worker threads
+      queue_size: 64             # pending calls beyond the workers
+      process_workers: 2         # sandbox processes (started on first use)
+      shm_threshold_bytes: 65536 # pickled payloads this large go via shared memory
+
+Per-capability counters (stats()) are content-free: calls, errors, timeouts,
+queue wait and execution time.
+"""
+from __future__ import annotations
+
+import atexit
+import concurrent.futures
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from io_iii.core.capabilities import CAPABILITY_ISOLATION_MODES
+from io_iii.core.capability_sandbox import ProcessSandbox
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+_KINDS = CAPABILITY_ISOLATION_MODES
+
+
+@dataclass(frozen=True)
+class CapabilityExecutorSettings:
+    """Parsed ``capability_executor`` block from runtime.yaml."""
+    kind: str = EXECUTOR_THREAD
+    max_workers: int = 4
+    queue_size: int = 64
+    process_workers: int = 2
+    shm_threshold_bytes: int = 65_536
+
+
+def load_capability_executor_settings(runtime_config: Optional[Dict[str, Any]]) -> CapabilityExecutorSettings:
+    """
+    Load CapabilityExecutorSettings from a runtime config dict.
+
+    Returns the defaults when the block is absent.
+
+    Raises:
+        ValueError('CAPABILITY_EXECUTOR_INVALID: ...') on a malformed block.
+    """
+    raw = (runtime_config or {}).get("capability_executor")
+    if raw is None:
+        return CapabilityExecutorSettings()
+    if not isinstance(raw, dict):
+        raise ValueError("CAPABILITY_EXECUTOR_INVALID: capability_executor must be a mapping")
+
+    defaults = CapabilityExecutorSettings()
+    kind = raw.get("kind", defaults.kind)
+    if kind not in _KINDS:
+        raise ValueError(f"CAPABILITY_EXECUTOR_INVALID: kind must be one of {list(_KINDS)}")
+
+    def _int(key: str, minimum: int) -> int:
+        value = raw.get(key, getattr(defaults, key))
+        if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+            raise ValueError(f"CAPABILITY_EXECUTOR_INVALID: {key} must be an integer >= {minimum}")
+        return value
+
+    return CapabilityExecutorSettings(
+        kind=kind,
+        max_workers=_int("max_workers", 1),
+        queue_size=_int("queue_size", 0),
+        process_workers=_int("process_workers", 1),
+        shm_threshold_bytes=_int("shm_threshold_bytes", 0),
+    )
+
+
+@dataclass(frozen=True)
+class CapabilityTiming:
+    """Where one invocation spent its time (milliseconds)."""
+    queue_wait_ms: int
+    exec_ms: int
+
+
+def _timed_invoke(cap: Any, ctx: Any, payload: Mapping[str, Any]) -> Tuple[Any, int, int]:
+    """Run one capability; returns (result, start_ns, end_ns) on the monotonic clock."""
+    start = time.monotonic_ns()
+    res = cap.invoke(ctx, payload)
+    return res, start, time.monotonic_ns()
+
+
+class _Task:
+    __slots__ = ("fn", "args", "future", "done", "abandoned")
+
+    def __init__(self, fn, args) -> None:
+        self.fn = fn
+        self.args = args
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.done = False
+        self.abandoned = False
+
+
+class _DaemonThreadPool:
+    """
+    Fixed-size pool of daemon threads whose stuck workers can be abandoned.
+
+    abandon() hands a running task's thread over to the task: a replacement
+    worker is started and the old thread exits once the task returns.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._queue: "queue.SimpleQueue[Optional[_Task]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads = 0
+        self._seq = 0
+        for _ in range(max_workers):
+            self._spawn()
+
+    def _spawn(self) -> None:
+        self._threads += 1
+        self._seq += 1
+        threading.Thread(target=self._work, name=f"io3-capability-{self._seq}", daemon=True).start()
+
+    def _work(self) -> None:
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            if task.future.set_running_or_notify_cancel():
+                try:
+                    task.future.set_result(task.fn(*task.args))
+                except BaseException as exc:
+                    task.future.set_exception(exc)
+            with self._lock:
+                task.done = True
+                if task.abandoned:
+                    self._threads -= 1
+                    return
+
+    def submit(self, fn, *args) -> _Task:
+        task = _Task(fn, args)
+        self._queue.put(task)
+        return task
+
+    def abandon(self, task: _Task) -> None:
+        if task.future.cancel():
+            return  # still queued: never runs
+        with self._lock:
+            if task.done or task.abandoned:
+                return
+            task.abandoned = True
+            self._spawn()
+
+    def thread_count(self) -> int:
+        with self._lock:
+            return self._threads
+
+    def shutdown(self) -> None:
+        with self._lock:
+            n = self._threads
+        for _ in range(n):
+            self._queue.put(None)
+
+
+class CapabilityExecutor:
+    """
+    Process-wide capability runner honouring CapabilityBounds.timeout_ms.
+
+    Each call runs on the thread pool or the process sandbox, chosen by
+    CapabilitySpec.isolation, else by the executor kind. run() raises
+    concurrent.futures.TimeoutError when the deadline passes (the engine maps
+    it to CAPABILITY_TIMEOUT) and ValueError ('CAPABILITY_BUSY' /
+    'CAPABILITY_WORKER_LOST') for executor failures. Exceptions raised by the
+    capability itself propagate unchanged.
+    """
+
+    def __init__(self, settings: CapabilityExecutorSettings) -> None:
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._abandoned = 0  # timed-out thread calls still running
+        self._closed = False
+        self._threads: Optional[_DaemonThreadPool] = None
+        self._sandbox: Optional[ProcessSandbox] = None
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # -- pools ---------------------------------------------------------------
+
+    def _thread_pool(self) -> _DaemonThreadPool:
+        with self._lock:
+            if self._closed:
+                raise ValueError("CAPABILITY_BUSY: capability executor is closed")
+            if self._threads is None:
+                self._threads = _DaemonThreadPool(self.settings.max_workers)
+            return self._threads
+
+    def sandbox(self) -> ProcessSandbox:
+        """The process sandbox, starting its workers on first use."""
+        with self._lock:
+            if self._closed:
+                raise ValueError("CAPABILITY_BUSY: capability executor is closed")
+            if self._sandbox is None:
+                self._sandbox = ProcessSandbox(
+                    self.settings.process_workers,
+                    shm_threshold_bytes=self.settings.shm_threshold_bytes,
+                )
+            return self._sandbox
+
+    def _run_thread(self, cap: Any, ctx: Any, payload: Mapping[str, Any], timeout_s: float):
+        threads = self._thread_pool()
+        submitted = time.monotonic_ns()
+        task = threads.submit(_timed_invoke, cap, ctx, payload)
+        try:
+            res, start, end = task.future.result(timeout=timeout_s)
+        except concurrent.futures.TimeoutError:
+            threads.abandon(task)
+            with self._lock:
+                self._abandoned += 1
+            task.future.add_done_callback(self._abandoned_done)
+            raise
+        return res, submitted, start, end
+
+    def _abandoned_done(self, _future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._abandoned -= 1
+
+    def isolation_for(self, cap: Any) -> str:
+        return getattr(cap.spec, "isolation", None) or self.settings.kind
+
+    # -- invocation ----------------------------------------------------------
+
+    def run(
+        self,
+        cap: Any,
+        ctx: Any,
+        payload: Mapping[str, Any],
+        *,
+        timeout_s: float,
+    ) -> Tuple[Any, CapabilityTiming]:
+        cid = cap.spec.capability_id
+        limit = self.settings.max_workers + self.settings.queue_size
+        with self._lock:
+            pending = self._pending + self._abandoned
+            if pending >= limit:
+                self._entry(cid)["busy"] += 1
+                raise ValueError(f"CAPABILITY_BUSY: {pending} invocations pending (limit {limit})")
+            self._pending += 1
+
+        try:
+            if self.isolation_for(cap) == EXECUTOR_PROCESS:
+                res, submitted, start, end = self.sandbox().run(cap, ctx, payload, timeout_s=timeout_s)
+            else:
+                res, submitted, start, end = self._run_thread(cap, ctx, payload, timeout_s)
+        except concurrent.futures.TimeoutError:
+            self._count(cid, "timeouts")
+            raise
+        except BaseException:
+            self._count(cid, "errors")
+            raise
+        finally:
+            self._release()
+
+        timing = CapabilityTiming(
+            queue_wait_ms=max(0, start - submitted) // 1_000_000,
+            exec_ms=max(0, end - start) // 1_000_000,
+        )
+        self._record(cid, timing)
+        return res, timing
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    # -- counters ------------------------------------------------------------
+
+    def _entry(self, cid: str) -> Dict[str, int]:
+        entry = self._stats.get(cid)
+        if entry is None:
+            entry = self._stats[cid] = {
+                "calls": 0, "errors": 0, "timeouts": 0, "busy": 0,
+                "queue_wait_ms_total": 0, "queue_wait_ms_max": 0,
+                "exec_ms_total": 0, "exec_ms_max": 0,
+            }
+        return entry
+
+    def _count(self, cid: str, key: str) -> None:
+        with self._lock:
+            self._entry(cid)[key] += 1
+
+    def _record(self, cid: str, timing: CapabilityTiming) -> None:
+        with self._lock:
+            e = self._entry(cid)
+            e["calls"] += 1
+            e["queue_wait_ms_total"] += timing.queue_wait_ms
+            e["queue_wait_ms_max"] = max(e["queue_wait_ms_max"], timing.queue_wait_ms)
+            e["exec_ms_total"] += timing.exec_ms
+            e["exec_ms_max"] = max(e["exec_ms_max"], timing.exec_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        """Content-safe executor and per-capability counters."""
+        with self._lock:
+            return {
+                "kind": self.settings.kind,
+                "max_workers": self.settings.max_workers,
+                "pending": self._pending,
+                "abandoned": self._abandoned,
+                "process_workers_killed": self._sandbox.killed if self._sandbox else 0,
+                "capabilities": {cid: dict(e) for cid, e in self._stats.items()},
+            }
+
+    def close(self) -> None:
+        """Stop accepting work and release the pools (running work is not waited for)."""
+        with self._lock:
+            self._closed = True
+            threads, self._threads = self._threads, None
+            sandbox, self._sandbox = self._sandbox, None
+        if threads is not None:
+            threads.shutdown()
+        if sandbox is not None:
+            sandbox.close()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide executor
+# ---------------------------------------------------------------------------
+
+_executor_lock = threading.Lock()
+_executor: Optional[CapabilityExecutor] = None
+
+
+def get_capability_executor(settings: Optional[CapabilityExecutorSettings] = None) -> CapabilityExecutor:
+    """
+    Return the shared executor for *settings* (default settings when None).
+
+    A call with different settings replaces the executor; the old one stops
+    accepting work, and invocations already running on it finish normally.
+    """
+    global _executor
+    settings = settings or CapabilityExecutorSettings()
+    with _executor_lock:
+        old = _executor
+        if old is not None and old.settings == settings:
+            return old
+        _executor = CapabilityExecutor(settings)
+        current = _executor
+    if old is not None:
+        old.close()
+    return current
+
+
+def shutdown_capability_executor() -> None:
+    """Close and forget the shared executor (shutdown / test isolation)."""
+    global _executor
+    with _executor_lock:
+        old, _executor = _executor, None
+    if old is not None:
+        old.close()
+
+
+atexit.register(shutdown_capability_executor)
@@ -0,0 +1,220 @@
+"""
+Process-isolated capability execution (CapabilitySpec.isolation = "process").
+
+A thread-run capability that overruns CapabilityBounds.timeout_ms can only be
+abandoned: it keeps running, burning a core and holding the GIL the API
+server needs. A ProcessSandbox runs such capabilities in worker processes:
+
+- workers are started ahead of use (forkserver where available, else spawn)
+  and then reused, so a call pays neither interpreter start-up nor imports;
+- a call waits for an idle worker, sends (capability, context, payload) over
+  the worker's pipe and waits for the result until the deadline;
+- on timeout the worker gets SIGKILL and a replacement is started at once;
+  a worker that dies mid-call is replaced and the call fails with
+  CAPABILITY_WORKER_LOST;
+- the payload is pickled once, before a worker is taken. Below
+  shm_threshold_bytes the pickled bytes go through the worker's pipe; at or
+  above it they are copied into a multiprocessing.shared_memory block, the
+  worker unpickles straight from the shared buffer and the parent unlinks
+  the block after the call.
+
+Capabilities, the context and results must be picklable. The deadline covers
+the wait for an idle worker as well as execution (same as the thread path).
+"""
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, List, Mapping, Optional, Tuple
+
+
+class _ShmPayload:
+    """Reference to a pickled payload in a shared memory block."""
+    __slots__ = ("name", "size")
+
+    def __init__(self, name: str, size: int) -> None:
+        self.name = name
+        self.size = size
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    buf = shm.buf
+    if buf is None:  # only after close()
+        raise ValueError("CAPABILITY_WORKER_LOST: shared memory block is closed")
+    return buf
+
+
+def _load_payload(ref: Any) -> Mapping[str, Any]:
+    if not isinstance(ref, _ShmPayload):
+        return pickle.loads(ref)
+    shm = shared_memory.SharedMemory(name=ref.name)
+    try:
+        with _buffer(shm)[:ref.size] as view:
+            return pickle.loads(view)
+    finally:
+        shm.close()
+
+
+def _worker_main(conn) -> None:
+    """Worker loop: one (cap, ctx, payload) request at a time until None or EOF."""
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            return
+        if msg is None:
+            return
+        cap, ctx, ref = msg
+        start = time.monotonic_ns()
+        try:
+            res = cap.invoke(ctx, _load_payload(ref))
+            reply: Tuple[Any, ...] = ("ok", res, start, time.monotonic_ns())
+        except BaseException as exc:
+            reply = ("err", exc)
+        try:
+            conn.send(reply)
+        except Exception as exc:  # unpicklable result or exception
+            conn.send(("err", RuntimeError(f"CAPABILITY_RESULT_UNPICKLABLE: {type(exc).__name__}")))
+
+
+def _mp_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class _Worker:
+    __slots__ = ("process", "conn")
+
+    def __init__(self, ctx) -> None:
+        parent, child = ctx.Pipe(duplex=True)
+        self.conn = parent
+        self.process = ctx.Process(target=_worker_main, args=(child,), name="io3-capability-sandbox", daemon=True)
+        self.process.start()
+        child.close()
+
+    def kill(self) -> None:
+        try:
+            self.process.kill()  # SIGKILL
+            self.process.join(1.0)
+        except Exception:
+            pass
+        self.conn.close()
+
+
+class ProcessSandbox:
+    """Fixed set of pre-started worker processes for isolated capabilities."""
+
+    def __init__(self, workers: int, *, shm_threshold_bytes: int = 65_536) -> None:
+        self.workers = workers
+        self.shm_threshold_bytes = shm_threshold_bytes
+        self._ctx = _mp_context()
+        self._lock = threading.Lock()
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._all: List[_Worker] = []
+        self._closed = False
+        self.killed = 0
+        self.lost = 0
+        self.shm_transfers = 0
+        for _ in range(workers):
+            self._add_worker()
+
+    def _add_worker(self) -> None:
+        worker = _Worker(self._ctx)
+        with self._lock:
+            if self._closed:
+                worker.kill()
+                return
+            self._all.append(worker)
+        self._idle.put(worker)
+
+    def _retire(self, worker: _Worker) -> None:
+        with self._lock:
+            if worker in self._all:
+                self._all.remove(worker)
+        worker.kill()
+        self._add_worker()
+
+    def _encode(self, payload: Mapping[str, Any]) -> Tuple[Any, Optional[shared_memory.SharedMemory]]:
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) < self.shm_threshold_bytes:
+            return data, None
+        shm = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            _buffer(shm)[:len(data)] = data
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        self.shm_transfers += 1
+        return _ShmPayload(shm.name, len(data)), shm
+
+    def run(
+        self,
+        cap: Any,
+        ctx: Any,
+        payload: Mapping[str, Any],
+        *,
+        timeout_s: float,
+    ) -> Tuple[Any, int, int, int]:
+        """
+        Run *cap* in a worker; returns (result, queued_ns, start_ns, end_ns).
+
+        Raises TimeoutError past the deadline (the worker is killed when it
+        was already running the call), ValueError('CAPABILITY_WORKER_LOST')
+        when the worker died, or the capability's own exception.
+        """
+        if self._closed:
+            raise ValueError("CAPABILITY_BUSY: capability sandbox is closed")
+        queued = time.monotonic_ns()
+        deadline = time.monotonic() + timeout_s
+        ref, shm = self._encode(payload)  # before taking a worker: a failure here loses none
+        try:
+            try:
+                worker = self._idle.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise TimeoutError("no idle capability worker before the deadline") from None
+            try:
+                worker.conn.send((cap, ctx, ref))
+                ready = worker.conn.poll(max(0.0, deadline - time.monotonic()))
+                reply = worker.conn.recv() if ready else None
+            except (EOFError, OSError) as e:
+                self.lost += 1
+                self._retire(worker)
+                raise ValueError("CAPABILITY_WORKER_LOST: capability worker process terminated") from e
+            except Exception:
+                self._retire(worker)  # e.g. unpicklable request: worker state unknown
+                raise
+            if reply is None:
+                self.killed += 1
+                self._retire(worker)
+                raise TimeoutError("capability exceeded its deadline")
+            self._idle.put(worker)
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        if reply[0] == "err":
+            raise reply[1]
+        _, res, start, end = reply
+        return res, queued, start, end
+
+    def pids(self) -> List[int]:
+        with self._lock:
+            return [w.process.pid for w in self._all]
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers, self._all = self._all, []
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except Exception:
+                pass
+            worker.process.join(0.2)
+            worker.kill()
@@ -0,0 +1,139 @@
+"""
+Opt-in challenger pre-warm for audited runs (ADR-008 / ADR-009).
+
+With audit=True the challenger starts cold: Ollama loads the challenger model
+only when the audit request arrives, after the executor draft is complete.
+When enabled, the engine starts a background pre-warm as soon as the
+executor route is resolved, overlapping executor generation:
+
+1. the challenger route is resolved and its system prompt assembled — it
+   does not depend on the draft, so the audit pass only formats the draft in;
+2. the provider's preload() asks Ollama to load the challenger model
+   (/api/generate without a prompt, optional keep_alive).
+
+The pre-warm is not an audit pass. The ADR-009 bounds (one audit, one
+revision) and the challenger fail-open policy are unchanged; a failed or
+unfinished pre-warm only means the audit runs as it would have anyway.
+
+Configuration (runtime.yaml; absent block = disabled)::
+
+    challenger_prewarm:
+      enabled: true
+      keep_alive: 10m      # optional; forwarded to Ollama's keep_alive
+
+Content policy: the assembled system prompt stays in memory. Only the
+pre-warm status and duration are recorded (challenger_audit trace step).
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Union
+
+PREWARM_PENDING = "pending"
+PREWARM_READY = "ready"
+PREWARM_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ChallengerPrewarmSettings:
+    """Parsed ``challenger_prewarm`` block from runtime.yaml."""
+    keep_alive: Optional[Union[str, int]] = None
+
+
+def load_challenger_prewarm_settings(runtime_config: Dict[str, Any]) -> Optional[ChallengerPrewarmSettings]:
+    """
+    Load ChallengerPrewarmSettings from a runtime config dict.
+
+    Returns None when the block is absent, false, or has enabled: false.
+    ``challenger_prewarm: true`` enables it with defaults.
+
+    Raises:
+        ValueError('CHALLENGER_PREWARM_INVALID: ...') on a malformed block.
+    """
+    raw = (runtime_config or {}).get("challenger_prewarm")
+    if raw is None or raw is False:
+        return None
+    if raw is True:
+        return ChallengerPrewarmSettings()
+    if not isinstance(raw, dict):
+        raise ValueError("CHALLENGER_PREWARM_INVALID: challenger_prewarm must be a mapping or boolean")
+
+    enabled = raw.get("enabled", True)
+    if not isinstance(enabled, bool):
+        raise ValueError("CHALLENGER_PREWARM_INVALID: enabled must be a boolean")
+    if not enabled:
+        return None
+
+    keep_alive = raw.get("keep_alive")
+    if keep_alive is not None:
+        valid_str = isinstance(keep_alive, str) and keep_alive.strip()
+        valid_int = isinstance(keep_alive, int) and not isinstance(keep_alive, bool)
+        if not (valid_str or valid_int):
+            raise ValueError(
+                "CHALLENGER_PREWARM_INVALID: keep_alive must be a duration string or seconds"
+            )
+    return ChallengerPrewarmSettings(keep_alive=keep_alive)
+
+
+class ChallengerPrewarm:
+    """
+    Background pre-warm for one audited run.
+
+    start() runs prepare() (challenger system prompt assembly) and then
+    preload() on a daemon thread. system_prompt becomes available as soon as
+    prepare() returns, independently of how long the model load takes. A
+    preload returning an awaitable (async providers) is run on a private
+    event loop in the same thread. Never raises to the caller.
+    """
+
+    def __init__(self, model: str) -> None:
+        self.model = model
+        self.status = PREWARM_PENDING
+        self.system_prompt: Optional[str] = None
+        self.elapsed_ms: Optional[int] = None
+        self._done = threading.Event()
+        self._t0 = time.perf_counter()
+
+    def start(
+        self,
+        *,
+        prepare: Callable[[], str],
+        preload: Optional[Callable[[], Any]] = None,
+    ) -> "ChallengerPrewarm":
+        threading.Thread(
+            target=self._run,
+            args=(prepare, preload),
+            name="io3-challenger-prewarm",
+            daemon=True,
+        ).start()
+        return self
+
+    def _run(self, prepare: Callable[[], str], preload: Optional[Callable[[], Any]]) -> None:
+        try:
+            self.system_prompt = prepare()
+            if preload is not None:
+                result = preload()
+                if inspect.isawaitable(result):
+                    asyncio.run(_await(result))
+            self.status = PREWARM_READY
+        except Exception:
+            self.status = PREWARM_FAILED  # audit falls back to a cold start
+        finally:
+            self.elapsed_ms = int((time.perf_counter() - self._t0) * 1000)
+            self._done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the pre-warm finished; False on timeout."""
+        return self._done.wait(timeout)
+
+    def trace_meta(self) -> Dict[str, Any]:
+        """Content-safe summary for the challenger_audit trace step."""
+        return {"prewarm": self.status, "prewarm_ms": self.elapsed_ms}
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
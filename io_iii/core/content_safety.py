@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import Any, Set
+import time
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 
 DEFAULT_FORBIDDEN_KEYS: Set[str] = {
@@ -23,6 +23,57 @@ DEFAULT_FORBIDDEN_KEYS: Set[str] = {
 METADATA_FORBIDDEN_KEYS: Set[str] = set(DEFAULT_FORBIDDEN_KEYS) | {"output"}
 
 
+# Leaf types that can never hold a key; skipped without being pushed.
+_SCALAR_TYPES = (str, int, float, bool, type(None), bytes)
+
+
+def _raise_first(d: Dict[Any, Any], forbidden: AbstractSet[str]) -> None:
+    for k in d:
+        if isinstance(k, str) and k in forbidden:
+            raise ValueError(f"forbidden key present in structure: {k}")
+
+
+def _scan(obj: Any, forbidden: AbstractSet[str], clean: Optional[Dict[int, Any]]) -> Tuple[int, int, List[Any]]:
+    """
+    Single pass over *obj*. Returns (containers_visited, containers_skipped, visited).
+
+    Each dict is checked with one set-disjointness test against its key view
+    (done in C); only when that fails are the keys walked to name the
+    offender. Scalar values are never pushed. Containers whose id is in
+    *clean* (already validated by the same scanner) are skipped entirely.
+    """
+    stack: List[Any] = [obj]
+    visited: List[Any] = []
+    skipped = 0
+    while stack:
+        cur = stack.pop()
+
+        if isinstance(cur, dict):
+            if clean is not None and id(cur) in clean:
+                skipped += 1
+                continue
+            if not forbidden.isdisjoint(cur):
+                _raise_first(cur, forbidden)
+            visited.append(cur)
+            for v in cur.values():
+                if not isinstance(v, _SCALAR_TYPES):
+                    stack.append(v)
+            continue
+
+        if isinstance(cur, (list, tuple, set)):
+            if clean is not None and id(cur) in clean:
+                skipped += 1
+                continue
+            visited.append(cur)
+            for v in cur:
+                if not isinstance(v, _SCALAR_TYPES):
+                    stack.append(v)
+            continue
+
+        # Ignore scalars / unknown types
+    return len(visited), skipped, visited
+
+
 def assert_no_forbidden_keys(obj: Any, forbidden: Set[str] | None = None) -> None:
     """Raise ValueError if any forbidden key appears anywhere in a nested structure.
 
@@ -33,19 +84,66 @@ def assert_no_forbidden_keys(obj: Any, forbidden: Set[str] | None = None) -> Non
     if forbidden is None:
         forbidden = DEFAULT_FORBIDDEN_KEYS
 
-    stack: list[Any] = [obj]
+    # Memo-free variant of _scan (the common, hot case).
+    stack: List[Any] = [obj]
+    push = stack.append
     while stack:
         cur = stack.pop()
-
         if isinstance(cur, dict):
-            for k, v in cur.items():
-                if isinstance(k, str) and k in forbidden:
-                    raise ValueError(f"forbidden key present in structure: {k}")
-                stack.append(v)
-            continue
+            if not forbidden.isdisjoint(cur):
+                _raise_first(cur, forbidden)
+            for v in cur.values():
+                if not isinstance(v, _SCALAR_TYPES):
+                    push(v)
+        elif isinstance(cur, (list, tuple, set)):
+            for v in cur:
+                if not isinstance(v, _SCALAR_TYPES):
+                    push(v)
+        # Ignore scalars / unknown types
 
-        if isinstance(cur, (list, tuple, set)):
-            stack.extend(list(cur))
-            continue
 
-        # Ignore scalars / unknown types
+class ContentScanner:
+    """
+    assert_no_forbidden_keys with a memo of structures it has already passed.
+
+    Meant to live for one engine run: the trace dict, capability meta and
+    observability event metas are each validated once, and a later scan of
+    an enclosing structure skips any container it has seen (by identity).
+    Only use it for structures that are not mutated after validation.
+
+    stats() reports the cost of the guard for the run: scans performed,
+    containers walked, containers skipped via the memo, and time spent.
+    """
+
+    def __init__(self, forbidden: Set[str] | None = None) -> None:
+        self.forbidden: FrozenSet[str] = frozenset(
+            DEFAULT_FORBIDDEN_KEYS if forbidden is None else forbidden
+        )
+        # id -> object; holding the object keeps its id from being reused.
+        self._clean: Dict[int, Any] = {}
+        self.scans = 0
+        self.containers = 0
+        self.skipped = 0
+        self.elapsed_ns = 0
+
+    def assert_clean(self, obj: Any) -> None:
+        """Same contract as assert_no_forbidden_keys; raises ValueError on a forbidden key."""
+        t0 = time.perf_counter_ns()
+        try:
+            walked, skipped, visited = _scan(obj, self.forbidden, self._clean)
+        finally:
+            self.scans += 1
+            self.elapsed_ns += time.perf_counter_ns() - t0
+        self.containers += walked
+        self.skipped += skipped
+        for c in visited:
+            self._clean[id(c)] = c
+
+    def stats(self) -> Dict[str, int]:
+        """Content-safe counters (ints only)."""
+        return {
+            "scans": self.scans,
+            "containers": self.containers,
+            "skipped": self.skipped,
+            "scan_us": self.elapsed_ns // 1000,
+        }
@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 from io_iii.core.session_state import SessionState
@@ -126,7 +127,49 @@ def _build_system_prompt(
     6) Memory context (omitted when empty) — ADR-022 §5
     7) Runtime attribution (always present, non-configurable)
     """
-    identity = load_identity()
+    boundaries_section = _format_boundaries_section(session_state=session_state, route_metadata=route_metadata)
+
+    prefix = _static_prefix(
+        _block_key(load_identity()),
+        _block_key(load_user_profile()),
+        persona_contract,
+        boundaries_section,
+        session_state.mode,
+        bool(session_state.audit.audit_enabled),
+    )
+
+    sections = [prefix]
+    if injected_memory:
+        sections.append(_format_memory_section(injected_memory).strip())
+
+    # Stable join with explicit separators; attribution is always last.
+    return "\n".join(sections).strip() + "\n" + _RUNTIME_ATTRIBUTION.strip() + "\n"
+
+
+def _block_key(block: Mapping[str, Any]) -> str:
+    """Hashable cache key for a persona/profile block; keeps YAML key order."""
+    return json.dumps(block, ensure_ascii=False, default=str)
+
+
+@lru_cache(maxsize=256)
+def _static_prefix(
+    identity_json: str,
+    user_json: str,
+    persona_contract: str,
+    boundaries_section: str,
+    mode: str,
+    audit_enabled: bool,
+) -> str:
+    """
+    Sections 1–5 of the system prompt, joined.
+
+    Everything here is a pure function of its (hashable) arguments, so the
+    rendered text is memoised and assembly only appends the dynamic parts
+    (memory, attribution). Identity and profile arrive as JSON (see
+    _block_key) so that an edited persona.yaml / user_profile.yaml produces
+    a new key.
+    """
+    identity = json.loads(identity_json)
     _name = (identity.get("name") or "IO-III").strip()
     _desc = (identity.get("description") or "").strip()
     _style = (identity.get("style") or "").strip()
@@ -150,19 +193,17 @@ def _build_system_prompt(
         f"{persona_contract.strip()}\n"
     )
 
-    boundaries_section = _format_boundaries_section(session_state=session_state, route_metadata=route_metadata)
-
     envelope_section = (
         "=== Execution Envelope ===\n"
-        f"mode: {session_state.mode}\n"
-        f"audit_enabled: {bool(session_state.audit.audit_enabled)}\n"
+        f"mode: {mode}\n"
+        f"audit_enabled: {audit_enabled}\n"
         f"max_audit_passes: 1\n"
         f"max_revision_passes: 1\n"
     )
 
     sections = [header.strip(), persona_section.strip()]
 
-    user = load_user_profile()
+    user = json.loads(user_json)
     _u_name     = (user.get("name") or "").strip()
     _u_role     = (user.get("role") or "").strip()
     _u_expertise = [e.strip() for e in (user.get("expertise") or []) if str(e).strip()]
@@ -183,15 +224,7 @@ def _build_system_prompt(
         sections.append(user_section.strip())
 
     sections += [boundaries_section.strip(), envelope_section.strip()]
-
-    if injected_memory is None:
-        injected_memory = []
-
-    if injected_memory:
-        sections.append(_format_memory_section(injected_memory).strip())
-
-    # Stable join with explicit separators; attribution is always last.
-    return "\n".join(sections).strip() + "\n" + _RUNTIME_ATTRIBUTION.strip() + "\n"
+    return "\n".join(sections)
 
 
 def _format_boundaries_section(*, session_state: SessionState, route_metadata: Mapping[str, Any]) -> str:
@@ -15,8 +15,12 @@ class RuntimeDependencies:
     - dependencies are explicit
     - no dynamic loading
     - defaults are deterministic
+
+    async_provider_factory is consulted by engine.run_async only; when None,
+    run_async falls back to ollama_provider_factory (run in a worker thread).
     """
     ollama_provider_factory: Callable[[Any], Any]
     challenger_fn: Optional[Callable[[Any, str, str], dict]] = None
     capability_registry: CapabilityRegistry = default_registry()
+    async_provider_factory: Optional[Callable[[Any], Any]] = None
     
\ No newline at end of file
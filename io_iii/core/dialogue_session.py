@@ -17,10 +17,12 @@ from __future__ import annotations
 
 import datetime
 import json
+import sqlite3
 import uuid
+from collections.abc import MutableSequence
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import io_iii.core.orchestrator as _orchestrator
 from io_iii.core.dependencies import RuntimeDependencies
@@ -35,6 +37,7 @@ from io_iii.core.session_mode import (
     StewardGate,
     StewardThresholds,
 )
+from io_iii.core.session_index import get_session_index, index_session as _index_session
 from io_iii.core.session_state import SessionState
 from io_iii.core.task_spec import TaskSpec
 
@@ -43,7 +46,9 @@ from io_iii.core.task_spec import TaskSpec
 # Constants
 # ---------------------------------------------------------------------------
 
-DIALOGUE_SESSION_SCHEMA_VERSION: str = "v1"
+DIALOGUE_SESSION_SCHEMA_VERSION: str = "v2"
+DIALOGUE_SESSION_SCHEMA_V1: str = "v1"
+"""Single-document format (inline turns); still readable, migrated on save."""
 DEFAULT_SESSION_STORAGE: Path = Path(".io_iii/sessions")
 
 SESSION_MAX_TURNS: int = 50
@@ -139,7 +144,7 @@ class DialogueSession:
     turn_count: int
     max_turns: int
     status: str
-    turns: List[TurnRecord] = field(default_factory=list)
+    turns: MutableSequence[TurnRecord] = field(default_factory=list)
     created_at: str = field(default_factory=_utcnow_iso)
     updated_at: str = field(default_factory=_utcnow_iso)
 
@@ -236,6 +241,7 @@ def run_turn(
     session_memory: Optional[List[MemoryRecord]] = None,
     memory_context: Optional[SessionMemoryContext] = None,
     file_ref: Optional[str] = None,
+    on_output_delta: Optional[Callable[[str], None]] = None,
 ) -> DialogueTurnResult:
     """
     Execute one bounded turn of the dialogue session loop (Phase 8 M8.2).
@@ -265,6 +271,8 @@ def run_turn(
                           Never written automatically (ADR-022 §7).
         memory_context:   content-safe context record from load_session_memory() (M8.6).
                           Threaded through to DialogueTurnResult unchanged.
+        on_output_delta:  optional callback receiving output text deltas as the
+                          engine produces them (content-plane; never stored).
 
     Returns:
         DialogueTurnResult with updated session, optional PauseState, and
@@ -346,6 +354,7 @@ def run_turn(
         cfg=cfg,
         deps=deps,
         audit=audit,
+        on_output_delta=on_output_delta,
     )
 
     turn_latency_ms = (_time.monotonic_ns() - turn_start_ns) // 1_000_000
@@ -392,29 +401,158 @@ def run_turn(
 # ---------------------------------------------------------------------------
 # Session persistence
 # ---------------------------------------------------------------------------
+#
+# On-disk format v2 (append-only turn journal):
+#
+#   <session_id>.session.json   small header, written once (creation / v1
+#                               migration): schema_version, session_id,
+#                               created_at, journal file name
+#   <session_id>.turns.jsonl    one compact JSON record per line:
+#                                 {"kind": "turn", <TurnRecord fields>}
+#                                 {"kind": "state", <mutable session fields>,
+#                                  "turns": N, "records": M}
+#
+# A save appends the turns added since the last save plus one state record,
+# so per-save I/O no longer grows with the session. The last complete state
+# record is the commit point: turn records after it (a torn append) are
+# ignored on load and dropped by the next compaction. Compaction rewrites the
+# journal (turn records + one state record) and atomically replaces it; it
+# runs when superseded state records outnumber the turns by more than
+# SESSION_JOURNAL_COMPACT_SLACK, when the tail is unreadable, or on the first
+# save of a v1 session. v1 files (one JSON document with inline turns) are
+# still read and are migrated by their next save.
+
+SESSION_JOURNAL_COMPACT_SLACK: int = 32
+"""Superseded state records tolerated beyond the turn count before compaction."""
+
+_JOURNAL_TAIL_BYTES = 4096
+_STATE_FIELDS = ("session_mode", "turn_count", "max_turns", "status", "updated_at")
+_TURN_FIELDS = (
+    "turn_index", "run_id", "status", "persona_mode",
+    "latency_ms", "error_code", "memory_keys_loaded",
+)
+
+
+class _JournalTurns(MutableSequence[TurnRecord]):
+    """
+    TurnRecord sequence of a v2 session, replayed from the journal on first read.
+
+    len() and append() work without touching the journal, so a load → turn →
+    save cycle never re-reads earlier turns. Every other operation replays
+    the journal once and then works on the loaded list. Copies and pickles
+    are plain lists.
+    """
+
+    def __init__(self, count: int, loader: Callable[[], List[TurnRecord]]) -> None:
+        self._count = count
+        self._loader: Optional[Callable[[], List[TurnRecord]]] = loader
+        self._turns: List[TurnRecord] = []  # only the appended turns until replayed
+
+    def _loaded(self) -> List[TurnRecord]:
+        if self._loader is not None:
+            replayed = self._loader()
+            self._loader = None
+            self._turns = replayed + self._turns
+        return self._turns
+
+    def _unloaded(self) -> Optional[Tuple[int, List[TurnRecord]]]:
+        """(persisted count, turns appended since load) while not yet replayed."""
+        if self._loader is None:
+            return None
+        return self._count, list(self._turns)
+
+    def __len__(self) -> int:
+        if self._loader is not None:
+            return self._count + len(self._turns)
+        return len(self._turns)
+
+    def append(self, value: TurnRecord) -> None:
+        self._turns.append(value)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._loaded()[index]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._loaded()[index] = value
+
+    def __delitem__(self, index: Any) -> None:
+        del self._loaded()[index]
+
+    def insert(self, index: int, value: TurnRecord) -> None:
+        self._loaded().insert(index, value)
+
+    def __iter__(self) -> Iterator[TurnRecord]:
+        return iter(self._loaded())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _JournalTurns):
+            other = other._loaded()
+        return self._loaded() == other
+
+    def __repr__(self) -> str:
+        return repr(self._loaded())
+
+    def copy(self) -> List[TurnRecord]:
+        return list(self._loaded())
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return list, (list(self._loaded()),)
+
 
 def save_session(
     session: DialogueSession,
     storage_root: Path | str = DEFAULT_SESSION_STORAGE,
 ) -> Path:
     """
-    Persist a DialogueSession to disk as JSON (Phase 8 M8.2).
+    Persist a DialogueSession to disk (Phase 8 M8.2; journal format v2).
 
-    File: <storage_root>/<session_id>.session.json
+    Files: <storage_root>/<session_id>.session.json (header) and
+           <storage_root>/<session_id>.turns.jsonl (turn journal)
 
     Content policy: no prompt, output, or memory values are written.
     All fields are structural identifiers and control-plane metadata.
 
     Returns:
-        Path to the written file.
+        Path to the session header file.
 
     Raises:
         ValueError('SESSION_PERSIST_FAILED: ...') on write failure.
     """
-    root = Path(storage_root)
-    root.mkdir(parents=True, exist_ok=True)
-    path = root / f"{session.session_id}.session.json"
+    return _write_session_data(_serialise_session(session), storage_root)
+
+
+def _session_file(storage_root: Path | str, session_id: str) -> Path:
+    """On-disk location of a session record (v1 document or v2 header)."""
+    return Path(storage_root) / f"{session_id}.session.json"
+
+
+def _journal_file(storage_root: Path | str, session_id: str) -> Path:
+    """On-disk location of a v2 session's turn journal."""
+    return Path(storage_root) / f"{session_id}.turns.jsonl"
+
 
+def _turn_dict(t: TurnRecord) -> Dict[str, Any]:
+    return {
+        "turn_index": t.turn_index,
+        "run_id": t.run_id,
+        "status": t.status,
+        "persona_mode": t.persona_mode,
+        "latency_ms": t.latency_ms,
+        "error_code": t.error_code,
+        "memory_keys_loaded": t.memory_keys_loaded,
+    }
+
+
+def _serialise_session(session: DialogueSession) -> Dict[str, Any]:
+    """
+    Content-safe session document; a snapshot, not a view.
+
+    For a lazily loaded session whose journal has not been replayed,
+    ``turns`` holds only the turns appended since load and ``turns_offset``
+    the number already persisted before them.
+    """
+    unloaded = session.turns._unloaded() if isinstance(session.turns, _JournalTurns) else None
+    offset, turns = unloaded if unloaded is not None else (0, session.turns)
     data: Dict[str, Any] = {
         "schema_version": DIALOGUE_SESSION_SCHEMA_VERSION,
         "session_id": session.session_id,
@@ -424,29 +562,152 @@ def save_session(
         "status": session.status,
         "created_at": session.created_at,
         "updated_at": session.updated_at,
-        "turns": [
-            {
-                "turn_index": t.turn_index,
-                "run_id": t.run_id,
-                "status": t.status,
-                "persona_mode": t.persona_mode,
-                "latency_ms": t.latency_ms,
-                "error_code": t.error_code,
-                "memory_keys_loaded": t.memory_keys_loaded,
-            }
-            for t in session.turns
-        ],
+        "turns": [_turn_dict(t) for t in turns],
     }
+    if offset:
+        data["turns_offset"] = offset
+    return data
+
+
+def _dump_line(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
 
+
+def _state_record(data: Dict[str, Any], turns: int, records: int) -> Dict[str, Any]:
+    state: Dict[str, Any] = {"kind": "state"}
+    state.update((k, data[k]) for k in _STATE_FIELDS)
+    state["turns"] = turns
+    state["records"] = records
+    return state
+
+
+def _parse_state(line: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict) or record.get("kind") != "state":
+        return None
+    return record
+
+
+def _journal_tail(path: Path) -> Optional[Dict[str, Any]]:
+    """Last state record when the journal ends with one; else None."""
+    try:
+        with open(path, "rb") as fh:
+            size = fh.seek(0, 2)
+            fh.seek(max(0, size - _JOURNAL_TAIL_BYTES))
+            chunk = fh.read()
+    except OSError:
+        return None
+    if not chunk.endswith(b"\n"):
+        return None
+    return _parse_state(chunk.rstrip(b"\n").rsplit(b"\n", 1)[-1])
+
+
+def _scan_journal(path: Path) -> Tuple[Optional[Dict[str, Any]], List[bytes]]:
+    """
+    Full replay: (last complete state record, turn lines it commits).
+
+    Raises OSError when the journal cannot be read.
+    """
+    state: Optional[Dict[str, Any]] = None
+    turn_lines: List[bytes] = []
+    committed = 0
+    with open(path, "rb") as fh:
+        for line in fh:
+            if not line.endswith(b"\n"):
+                break  # torn append
+            if line.startswith(b'{"kind":"turn"'):
+                turn_lines.append(line)
+                continue
+            record = _parse_state(line)
+            if record is not None:
+                state = record
+                committed = len(turn_lines)
+    return state, turn_lines[:committed]
+
+
+def _read_header(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _replace_file(path: Path, text: str) -> None:
     tmp = path.with_suffix(".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
+
+def _write_session_data(data: Dict[str, Any], storage_root: Path | str) -> Path:
+    """Append (or compact) a session document into its journal; raises SESSION_PERSIST_FAILED."""
+    root = Path(storage_root)
+    sid = data["session_id"]
+    path = _session_file(root, sid)
+    journal = _journal_file(root, sid)
+    offset = data.get("turns_offset", 0)
+    turns = data["turns"]
+    total = offset + len(turns)
+
     try:
-        tmp.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        root.mkdir(parents=True, exist_ok=True)
+        header = _read_header(path)
+        migrated = (
+            header is not None
+            and header.get("schema_version") == DIALOGUE_SESSION_SCHEMA_VERSION
+            and header.get("session_id") == sid
         )
-        tmp.replace(path)
+        tail = _journal_tail(journal) if migrated else None
+
+        if tail is not None and isinstance(tail.get("turns"), int) and tail["turns"] > total:
+            # The journal already commits more turns than this snapshot holds:
+            # it is stale, and compacting from it would drop the newer turns.
+            raise ValueError(
+                f"SESSION_PERSIST_FAILED: session_id={sid!r} snapshot has {total} turns "
+                f"but the journal already commits {tail['turns']}"
+            )
+        if tail is not None and isinstance(tail.get("turns"), int) and isinstance(tail.get("records"), int) \
+                and offset <= tail["turns"]:
+            new = turns[tail["turns"] - offset:]
+            records = tail["records"] + len(new) + 1
+            if records <= 2 * total + SESSION_JOURNAL_COMPACT_SLACK:
+                lines = [_dump_line({"kind": "turn", **t}) for t in new]
+                lines.append(_dump_line(_state_record(data, total, records)))
+                with open(journal, "a", encoding="utf-8") as fh:
+                    fh.write("".join(lines))
+                _index_session(data, root)
+                return path
+
+        # Compaction: rewrite the journal from the snapshot.
+        prefix: List[str] = []
+        if offset:
+            try:
+                _, persisted = _scan_journal(journal) if migrated else (None, [])
+            except OSError:
+                persisted = []
+            if len(persisted) < offset:
+                raise ValueError(
+                    f"SESSION_PERSIST_FAILED: journal for session_id={sid!r} no longer "
+                    f"holds the {offset} turns this session was loaded with"
+                )
+            prefix = [line.decode("utf-8") for line in persisted[:offset]]
+        lines = prefix + [_dump_line({"kind": "turn", **t}) for t in turns]
+        lines.append(_dump_line(_state_record(data, total, total + 1)))
+        _replace_file(journal, "".join(lines))
+        if not migrated:
+            _replace_file(path, json.dumps({
+                "schema_version": DIALOGUE_SESSION_SCHEMA_VERSION,
+                "session_id": sid,
+                "created_at": data["created_at"],
+                "journal": journal.name,
+            }, indent=2, ensure_ascii=False))
     except OSError as e:
         raise ValueError(f"SESSION_PERSIST_FAILED: {e}") from e
 
+    _index_session(data, root)
     return path
 
 
@@ -457,12 +718,16 @@ def load_session(
     """
     Load a DialogueSession from disk (Phase 8 M8.2).
 
+    v2 sessions are restored from the header and the journal's last state
+    record; turn records are replayed on first access to ``session.turns``.
+    v1 documents are read in full.
+
     Raises:
         ValueError('SESSION_NOT_FOUND: ...')  if no file for session_id
         ValueError('SESSION_SCHEMA_INVALID: ...') on parse or validation failure
+            (for v2, also when the turns are first accessed)
     """
-    root = Path(storage_root)
-    path = root / f"{session_id}.session.json"
+    path = _session_file(storage_root, session_id)
 
     if not path.is_file():
         raise ValueError(
@@ -476,7 +741,47 @@ def load_session(
             f"SESSION_SCHEMA_INVALID: could not read session file: {e}"
         ) from e
 
-    return _deserialise_session(data)
+    if not (isinstance(data, dict) and data.get("schema_version") == DIALOGUE_SESSION_SCHEMA_VERSION
+            and "turns" not in data):
+        return _deserialise_session(data)
+
+    journal = Path(storage_root) / str(data.get("journal") or _journal_file(storage_root, session_id).name)
+    state = _journal_tail(journal)
+    if state is None:
+        try:
+            state, _ = _scan_journal(journal)
+        except OSError as e:
+            raise ValueError(
+                f"SESSION_SCHEMA_INVALID: could not read session journal: {e}"
+            ) from e
+    if state is None or not isinstance(state.get("turns"), int):
+        raise ValueError("SESSION_SCHEMA_INVALID: session journal has no committed state record")
+
+    document = {k: state.get(k) for k in _STATE_FIELDS}
+    document.update(
+        schema_version=DIALOGUE_SESSION_SCHEMA_VERSION,
+        session_id=data.get("session_id"),
+        created_at=data.get("created_at"),
+        turns=[],
+    )
+    session = _deserialise_session(document)
+    count = state["turns"]
+    session.turns = _JournalTurns(count=count, loader=lambda: _replay_turns(journal, count))
+    return session
+
+
+def _replay_turns(journal: Path, count: int) -> List[TurnRecord]:
+    """Parse the first *count* committed turn records of a journal."""
+    try:
+        _, lines = _scan_journal(journal)
+        records = [json.loads(line) for line in lines[:count]]
+    except (OSError, ValueError) as e:
+        raise ValueError(f"SESSION_SCHEMA_INVALID: could not replay session journal: {e}") from e
+    if len(records) < count:
+        raise ValueError(
+            f"SESSION_SCHEMA_INVALID: session journal holds {len(records)} of {count} committed turns"
+        )
+    return [_turn_from_dict(i, t) for i, t in enumerate(records)]
 
 
 def list_sessions(
@@ -485,15 +790,19 @@ def list_sessions(
     """
     Return sorted list of session IDs found in storage_root.
 
+    Served from the session index (built from the session files on first
+    use and reconciled with them on every call); see query_sessions for
+    filtered, sorted and paginated listings. Falls back to the file names
+    when the index cannot be opened (e.g. a read-only storage root).
     Returns empty list if storage_root does not exist.
     """
     root = Path(storage_root)
     if not root.is_dir():
         return []
-    return sorted(
-        p.stem.replace(".session", "")
-        for p in root.glob("*.session.json")
-    )
+    try:
+        return get_session_index(root).session_ids()
+    except (sqlite3.Error, OSError):
+        return sorted(p.name[: -len(".session.json")] for p in root.glob("*.session.json"))
 
 
 # ---------------------------------------------------------------------------
@@ -548,10 +857,11 @@ def _deserialise_session(data: Any) -> DialogueSession:
             f"SESSION_SCHEMA_INVALID: missing required fields: {sorted(missing)}"
         )
 
-    if data["schema_version"] != DIALOGUE_SESSION_SCHEMA_VERSION:
+    if data["schema_version"] not in (DIALOGUE_SESSION_SCHEMA_VERSION, DIALOGUE_SESSION_SCHEMA_V1):
         raise ValueError(
             f"SESSION_SCHEMA_INVALID: schema_version must be "
-            f"'{DIALOGUE_SESSION_SCHEMA_VERSION}', got {data['schema_version']!r}"
+            f"'{DIALOGUE_SESSION_SCHEMA_VERSION}' or '{DIALOGUE_SESSION_SCHEMA_V1}', "
+            f"got {data['schema_version']!r}"
         )
 
     try:
@@ -569,19 +879,7 @@ def _deserialise_session(data: Any) -> DialogueSession:
     if not isinstance(data["turns"], list):
         raise ValueError("SESSION_SCHEMA_INVALID: turns must be a list")
 
-    turns: List[TurnRecord] = []
-    for i, t in enumerate(data["turns"]):
-        if not isinstance(t, dict):
-            raise ValueError(f"SESSION_SCHEMA_INVALID: turn[{i}] must be an object")
-        turns.append(TurnRecord(
-            turn_index=t.get("turn_index", i),
-            run_id=t.get("run_id", ""),
-            status=t.get("status", "ok"),
-            persona_mode=t.get("persona_mode", "executor"),
-            latency_ms=t.get("latency_ms"),
-            error_code=t.get("error_code"),
-            memory_keys_loaded=t.get("memory_keys_loaded", 0),
-        ))
+    turns = [_turn_from_dict(i, t) for i, t in enumerate(data["turns"])]
 
     return DialogueSession(
         session_id=data["session_id"],
@@ -593,3 +891,18 @@ def _deserialise_session(data: Any) -> DialogueSession:
         created_at=data["created_at"],
         updated_at=data["updated_at"],
     )
+
+
+def _turn_from_dict(i: int, t: Any) -> TurnRecord:
+    """Validate and reconstruct the TurnRecord at position *i*."""
+    if not isinstance(t, dict):
+        raise ValueError(f"SESSION_SCHEMA_INVALID: turn[{i}] must be an object")
+    return TurnRecord(
+        turn_index=t.get("turn_index", i),
+        run_id=t.get("run_id", ""),
+        status=t.get("status", "ok"),
+        persona_mode=t.get("persona_mode", "executor"),
+        latency_ms=t.get("latency_ms"),
+        error_code=t.get("error_code"),
+        memory_keys_loaded=t.get("memory_keys_loaded", 0),
+    )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 import time
 import concurrent.futures
 from dataclasses import dataclass, replace as dataclasses_replace
-from typing import Any, Dict, Optional, Tuple, Mapping
+from typing import Any, Awaitable, Callable, Dict, Generator, Iterator, List, Optional, Tuple, Mapping
 
 from io_iii.core.context_assembly import assemble_context
 from io_iii.core.session_state import (
@@ -14,6 +16,7 @@ from io_iii.core.session_state import (
     MAX_REVISION_PASSES,
 )
 
+from io_iii.providers.async_ollama_provider import AsyncOllamaProvider
 from io_iii.providers.null_provider import NullProvider
 from io_iii.providers.ollama_provider import OllamaProvider
 from io_iii.routing import resolve_route
@@ -24,9 +27,24 @@ from io_iii.persona_contract import (
 )
 
 from io_iii.core.capabilities import CapabilityContext, CapabilityRegistry
-from io_iii.core.content_safety import assert_no_forbidden_keys
+from io_iii.core.capability_executor import (
+    CapabilityExecutor,
+    get_capability_executor,
+    load_capability_executor_settings,
+)
+from io_iii.core.challenger_prewarm import (
+    ChallengerPrewarm,
+    ChallengerPrewarmSettings,
+    load_challenger_prewarm_settings,
+)
+from io_iii.core.content_safety import ContentScanner
 from io_iii.core.preflight import check_context_limit, _DEFAULT_CONTEXT_LIMIT_CHARS, estimate_chars
 from io_iii.core.telemetry import ExecutionMetrics
+from io_iii.core.response_cache import (
+    get_response_cache,
+    load_response_cache_settings,
+    response_cache_key,
+)
 
 from io_iii.core.execution_trace import TraceRecorder
 from io_iii.core.engine_observability import EngineEventKind, EngineObservabilityLog
@@ -64,19 +82,111 @@ class ExecutionResult:
     prompt_hash: Optional[str]
 
 
-def _run_challenger(
-    cfg,
-    user_prompt: str,
-    draft_text: str,
-    *,
-    session_state: Optional[SessionState] = None,
-    ollama_provider_factory,
-) -> dict:
+def _pool_counters(provider: Any) -> Optional[Tuple[int, int]]:
     """
-    Challenger pass (ADR-008).
+    Snapshot (hits, misses) from a provider's keep-alive pool for the calling thread.
 
-    Fail-open policy:
-    - If challenger is unavailable or returns invalid JSON, auto-pass.
+    Returns None for providers without a pooled transport (test doubles, stubs).
+    """
+    fn = getattr(provider, "pool_counters", None)
+    if fn is None:
+        return None
+    try:
+        return fn()
+    except Exception:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Blocking-call suspension (shared body for run / run_async)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class _Suspend:
+    """
+    One blocking operation requested by the engine body.
+
+    The engine body is a generator that yields _Suspend for every provider,
+    challenger or capability call and receives the result back. run() executes
+    `sync` inline; run_async() awaits `coro` when the callee is natively async
+    and otherwise runs `sync` in a worker thread so the event loop never blocks.
+    """
+    sync: Callable[[], Any]
+    coro: Optional[Callable[[], Awaitable[Any]]] = None
+
+    async def run_async(self) -> Any:
+        if self.coro is not None:
+            return await self.coro()
+        return await asyncio.to_thread(self.sync)
+
+
+_EngineBody = Generator[_Suspend, Any, Any]
+
+
+def _async_only(what: str) -> Callable[[], Any]:
+    def _fail() -> Any:
+        raise TypeError(f"ASYNC_PROVIDER_REQUIRES_RUN_ASYNC: {what} is async; use engine.run_async")
+    return _fail
+
+
+def _is_async_callable(fn: Any) -> bool:
+    return inspect.iscoroutinefunction(fn)
+
+
+def _generate_call(provider: Any, *, model: str, prompt: str) -> _Suspend:
+    """_Suspend for provider.generate(), honouring AsyncProvider implementations."""
+    if _is_async_callable(getattr(provider, "generate", None)):
+        return _Suspend(
+            sync=_async_only("provider.generate"),
+            coro=lambda: provider.generate(model=model, prompt=prompt),
+        )
+    return _Suspend(sync=lambda: provider.generate(model=model, prompt=prompt))
+
+
+def _drive_sync(body: _EngineBody) -> Any:
+    """Run an engine body to completion, executing each suspension inline."""
+    send: Callable[[Any], _Suspend] = body.send
+    value: Any = None
+    while True:
+        try:
+            op = send(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value, send = op.sync(), body.send
+        except Exception as exc:
+            value, send = exc, body.throw
+
+
+async def _drive_async(body: _EngineBody) -> Any:
+    """Run an engine body to completion on the event loop, awaiting each suspension."""
+    send: Callable[[Any], _Suspend] = body.send
+    value: Any = None
+    while True:
+        try:
+            op = send(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value, send = await op.run_async(), body.send
+        except Exception as exc:
+            value, send = exc, body.throw
+
+
+_CHALLENGER_AUTOPASS: Dict[str, Any] = {
+    "verdict": "pass",
+    "issues": [],
+    "high_risk_claims": [],
+    "suggested_fixes": [],
+}
+
+
+def _challenger_route(cfg) -> Optional[Tuple[Any, str]]:
+    """
+    Resolve the challenger route (ADR-008).
+
+    Returns (selection, model), or None when no ollama challenger route is
+    available (caller auto-passes).
     """
     from io_iii.routing import _parse_target
 
@@ -91,32 +201,25 @@ def _run_challenger(
     # from blocking execution when the challenger cannot run. This preserves bounded
     # deterministic execution and availability over strict challenger enforcement.
     if selection.selected_provider != "ollama" or not selection.selected_target:
-        return {
-            "verdict": "pass",
-            "issues": [],
-            "high_risk_claims": [],
-            "suggested_fixes": [],
-        }
+        return None
 
     _, model = _parse_target(selection.selected_target)
-    provider = ollama_provider_factory(cfg.providers)
+    return selection, model
 
-    challenger_prompt = (
-        "Audit the executor draft below for policy/compliance risk, factual risk, contradictions, "
-        "or missing verification steps.\n\n"
-        "You MUST NOT rewrite the draft.\n"
-        "You MUST NOT introduce new facts.\n"
-        "Respond in strict JSON with keys:\n"
-        "{\n"
-        "  \"verdict\": \"pass\"|\"needs_work\",\n"
-        "  \"issues\": [],\n"
-        "  \"high_risk_claims\": [],\n"
-        "  \"suggested_fixes\": []\n"
-        "}\n\n"
-        f"USER_PROMPT:\n{user_prompt}\n\n"
-        f"EXECUTOR_DRAFT:\n{draft_text}\n"
-    )
 
+def _challenger_system_prompt(
+    cfg,
+    selection: Any,
+    model: str,
+    *,
+    session_state: Optional[SessionState],
+) -> str:
+    """
+    Assemble the challenger system prompt (ADR-010).
+
+    Depends only on the route and session state, not on the draft, so the
+    challenger pre-warm can build it while the executor is still generating.
+    """
     if session_state is None:
         session_state = SessionState(
             request_id="challenger-audit",
@@ -148,7 +251,7 @@ def _run_challenger(
 
     assembled = assemble_context(
         session_state=session_state,
-        user_prompt=challenger_prompt,
+        user_prompt="",
         persona_contract=CHALLENGER_PERSONA_CONTRACT,
         route_metadata={
             "selected_provider": selection.selected_provider,
@@ -157,10 +260,79 @@ def _run_challenger(
             "route_id": "challenger",
         },
     )
-    audit_prompt = f"{assembled.system_prompt}\n\nUser:\n{assembled.user_prompt}\n\nIO-III Challenger:"
+    return assembled.system_prompt
 
-    raw = provider.generate(model=model, prompt=audit_prompt).strip()
 
+def _challenger_request(
+    cfg,
+    user_prompt: str,
+    draft_text: str,
+    *,
+    session_state: Optional[SessionState],
+    system_prompt: Optional[str] = None,
+) -> Optional[Tuple[str, str]]:
+    """
+    Resolve the challenger route and assemble the audit prompt (ADR-008).
+
+    Returns (model, audit_prompt), or None when no ollama challenger route is
+    available (caller auto-passes). *system_prompt* is a challenger system
+    prompt already assembled by the pre-warm; when None it is built here.
+    """
+    route = _challenger_route(cfg)
+    if route is None:
+        return None
+    selection, model = route
+
+    challenger_prompt = (
+        "Audit the executor draft below for policy/compliance risk, factual risk, contradictions, "
+        "or missing verification steps.\n\n"
+        "You MUST NOT rewrite the draft.\n"
+        "You MUST NOT introduce new facts.\n"
+        "Respond in strict JSON with keys:\n"
+        "{\n"
+        "  \"verdict\": \"pass\"|\"needs_work\",\n"
+        "  \"issues\": [],\n"
+        "  \"high_risk_claims\": [],\n"
+        "  \"suggested_fixes\": []\n"
+        "}\n\n"
+        f"USER_PROMPT:\n{user_prompt}\n\n"
+        f"EXECUTOR_DRAFT:\n{draft_text}\n"
+    )
+
+    if system_prompt is None:
+        system_prompt = _challenger_system_prompt(cfg, selection, model, session_state=session_state)
+    audit_prompt = f"{system_prompt}\n\nUser:\n{challenger_prompt}\n\nIO-III Challenger:"
+    return model, audit_prompt
+
+
+def _start_challenger_prewarm(
+    cfg,
+    *,
+    session_state: SessionState,
+    provider_factory,
+    settings: ChallengerPrewarmSettings,
+) -> Optional[ChallengerPrewarm]:
+    """
+    Start the opt-in challenger pre-warm; None when no ollama challenger route exists.
+
+    Never raises: a routing problem is left for the audit pass to surface.
+    """
+    try:
+        route = _challenger_route(cfg)
+    except Exception:
+        return None
+    if route is None:
+        return None
+    selection, model = route
+    preload = getattr(provider_factory(cfg.providers), "preload", None)
+    return ChallengerPrewarm(model).start(
+        prepare=lambda: _challenger_system_prompt(cfg, selection, model, session_state=session_state),
+        preload=(lambda: preload(model=model, keep_alive=settings.keep_alive)) if callable(preload) else None,
+    )
+
+
+def _parse_challenger_output(raw: str) -> dict:
+    """Normalise challenger output; fail-open to auto-pass on any parse problem."""
     try:
         parsed = json.loads(raw)
         # Minimal normalization: ensure required keys exist
@@ -173,12 +345,60 @@ def _run_challenger(
         return parsed
     except Exception:
         # Never block execution
-        return {
-            "verdict": "pass",
-            "issues": [],
-            "high_risk_claims": [],
-            "suggested_fixes": [],
-        }
+        return dict(_CHALLENGER_AUTOPASS)
+
+
+def _run_challenger(
+    cfg,
+    user_prompt: str,
+    draft_text: str,
+    *,
+    session_state: Optional[SessionState] = None,
+    ollama_provider_factory,
+    system_prompt: Optional[str] = None,
+) -> dict:
+    """
+    Challenger pass (ADR-008).
+
+    Fail-open policy:
+    - If challenger is unavailable or returns invalid JSON, auto-pass.
+    """
+    request = _challenger_request(
+        cfg, user_prompt, draft_text, session_state=session_state, system_prompt=system_prompt,
+    )
+    if request is None:
+        return dict(_CHALLENGER_AUTOPASS)
+
+    model, audit_prompt = request
+    provider = ollama_provider_factory(cfg.providers)
+    raw = provider.generate(model=model, prompt=audit_prompt).strip()
+    return _parse_challenger_output(raw)
+
+
+async def _run_challenger_async(
+    cfg,
+    user_prompt: str,
+    draft_text: str,
+    *,
+    session_state: Optional[SessionState] = None,
+    ollama_provider_factory,
+    system_prompt: Optional[str] = None,
+) -> dict:
+    """
+    asyncio variant of _run_challenger (same fail-open policy).
+
+    Awaits AsyncProvider.generate(); a blocking provider is run in a worker thread.
+    """
+    request = _challenger_request(
+        cfg, user_prompt, draft_text, session_state=session_state, system_prompt=system_prompt,
+    )
+    if request is None:
+        return dict(_CHALLENGER_AUTOPASS)
+
+    model, audit_prompt = request
+    provider = ollama_provider_factory(cfg.providers)
+    raw = await _generate_call(provider, model=model, prompt=audit_prompt).run_async()
+    return _parse_challenger_output(raw.strip())
 
 
 def _safe_json_len(obj: Any) -> int:
@@ -233,6 +453,7 @@ def _invoke_capability_once(
     capability_id: str,
     payload: Mapping[str, Any],
     ctx: CapabilityContext,
+    executor: Optional[CapabilityExecutor] = None,
 ) -> Dict[str, Any]:
     """
     Single explicit capability invocation surface (Phase 3 M3.6).
@@ -241,6 +462,7 @@ def _invoke_capability_once(
     - single call max
     - bounded payload/output size checks
     - no recursion (capability cannot access registry from ctx)
+    - runs on the shared capability executor (runtime.yaml capability_executor)
     """
     cap = registry.get(capability_id)
     spec = cap.spec
@@ -258,20 +480,21 @@ def _invoke_capability_once(
     # Time the invocation (content-safe; structural observability only)
     t0 = time.perf_counter_ns()
 
-    # Enforce timeout_ms deterministically (Phase 3 M3.15).
-    # Note: thread-based timeout cannot forcibly kill arbitrary Python code,
-    # but it does bound the control-plane waiting time and yields a stable error.
+    # Enforce timeout_ms deterministically (Phase 3 M3.15) on the shared
+    # capability executor. The thread executor cannot kill arbitrary Python
+    # code, but it bounds the control-plane waiting time and yields a stable
+    # error; the process executor kills the worker.
+    if executor is None:
+        executor = get_capability_executor(
+            load_capability_executor_settings(getattr(ctx.cfg, "runtime", None))
+        )
     timeout_s = max(0.001, float(spec.bounds.timeout_ms) / 1000.0)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
-        fut = ex.submit(cap.invoke, ctx, payload)
-        try:
-            res = fut.result(timeout=timeout_s)
-        except concurrent.futures.TimeoutError as e:
-            # Best-effort cancellation; capability code may still run to completion.
-            fut.cancel()
-            raise ValueError(
-                f"CAPABILITY_TIMEOUT: exceeded timeout_ms={spec.bounds.timeout_ms}"
-            ) from e
+    try:
+        res, timing = executor.run(cap, ctx, payload, timeout_s=timeout_s)
+    except concurrent.futures.TimeoutError as e:
+        raise ValueError(
+            f"CAPABILITY_TIMEOUT: exceeded timeout_ms={spec.bounds.timeout_ms}"
+        ) from e
 
     duration_ms = int((time.perf_counter_ns() - t0) / 1_000_000)
 
@@ -288,6 +511,8 @@ def _invoke_capability_once(
         "ok": bool(res.ok),
         "error_code": res.error_code,
         "duration_ms": duration_ms,
+        "queue_wait_ms": timing.queue_wait_ms,
+        "exec_ms": timing.exec_ms,
         "output": res.output,
     }
 
@@ -303,16 +528,26 @@ def _do_challenger_pass(
     rid: str,
     tsid: Optional[str],
     audit_passes: int,
-) -> Dict[str, Any]:
+    step_meta: Optional[Dict[str, Any]] = None,
+) -> Generator[_Suspend, Any, Dict[str, Any]]:
     """
     Execute one bounded challenger audit pass (ADR-008).
 
-    Records a trace step and emits CHALLENGER_AUDIT_COMPLETE.
+    Records a trace step (extended with *step_meta*) and emits
+    CHALLENGER_AUDIT_COMPLETE.
     Bound enforcement (audit_passes limit) is the caller's responsibility.
     Returns the parsed audit_result dict.
     """
-    with trace.step("challenger_audit", meta={"enabled": True}):
-        audit_result = challenger_fn(cfg, user_prompt, text)
+    if _is_async_callable(challenger_fn):
+        call = _Suspend(
+            sync=_async_only("challenger_fn"),
+            coro=lambda: challenger_fn(cfg, user_prompt, text),
+        )
+    else:
+        call = _Suspend(sync=lambda: challenger_fn(cfg, user_prompt, text))
+
+    with trace.step("challenger_audit", meta={"enabled": True, **(step_meta or {})}):
+        audit_result = yield call
 
     obs.emit(
         EngineEventKind.CHALLENGER_AUDIT_COMPLETE,
@@ -335,7 +570,7 @@ def _do_revision(
     rid: str,
     tsid: Optional[str],
     revision_passes: int,
-) -> str:
+) -> Generator[_Suspend, Any, str]:
     """
     Execute one bounded revision inference pass (ADR-009).
 
@@ -355,7 +590,7 @@ def _do_revision(
     )
 
     with trace.step("revision_inference", meta={"provider": "ollama", "model": model}):
-        revised = provider.generate(model=model, prompt=revision_prompt).strip()
+        revised = (yield _generate_call(provider, model=model, prompt=revision_prompt)).strip()
 
     obs.emit(
         EngineEventKind.REVISION_COMPLETE,
@@ -366,6 +601,55 @@ def _do_revision(
     return revised
 
 
+def _safe_deliver(on_output_delta: Optional[Callable[[str], None]], chunk: str) -> bool:
+    """
+    Deliver one output delta to the caller; return False if the callback failed
+    (or there is none).
+
+    Delta delivery is best-effort: a broken consumer (e.g. a disconnected SSE
+    client) must not fail the governed run.
+    """
+    if on_output_delta is None:
+        return False
+    try:
+        on_output_delta(chunk)
+        return True
+    except Exception:
+        return False
+
+
+def _consume_stream(
+    stream: Iterator[str],
+    on_output_delta: Optional[Callable[[str], None]],
+) -> Tuple[str, Optional[int], Optional[int], int]:
+    """
+    Drain a provider generate_stream() iterator.
+
+    Chunks are forwarded to on_output_delta as they arrive when a callback
+    is given (None = buffer only). Returns (text, input_tokens, output_tokens,
+    chunk_count); token counts come from the generator's return value when
+    the provider reports them.
+    """
+    parts: List[str] = []
+    totals: Any = None
+    forwarding = on_output_delta is not None
+    while True:
+        try:
+            chunk = next(stream)
+        except StopIteration as stop:
+            totals = stop.value
+            break
+        parts.append(chunk)
+        if forwarding:
+            forwarding = _safe_deliver(on_output_delta, chunk)
+
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    if isinstance(totals, tuple) and len(totals) == 2:
+        input_tokens, output_tokens = totals
+    return "".join(parts), input_tokens, output_tokens, len(parts)
+
+
 def run(
     *,
     cfg,
@@ -377,10 +661,89 @@ def run(
     ollama_provider_factory=None,
     capability_id: Optional[str] = None,
     capability_payload: Optional[Mapping[str, Any]] = None,
+    on_output_delta: Optional[Callable[[str], None]] = None,
 ) -> Tuple[SessionState, ExecutionResult]:
     """
     Deterministic execution engine (Phase 2 extraction).
 
+    Blocking entry point; see _run_body for the full contract.
+    """
+    return _drive_sync(
+        _run_body(
+            cfg=cfg,
+            session_state=session_state,
+            user_prompt=user_prompt,
+            audit=audit,
+            deps=deps,
+            challenger_fn=challenger_fn,
+            ollama_provider_factory=ollama_provider_factory,
+            capability_id=capability_id,
+            capability_payload=capability_payload,
+            on_output_delta=on_output_delta,
+            async_mode=False,
+        )
+    )
+
+
+async def run_async(
+    *,
+    cfg,
+    session_state: SessionState,
+    user_prompt: str,
+    audit: bool,
+    deps=None,
+    challenger_fn=None,
+    ollama_provider_factory=None,
+    capability_id: Optional[str] = None,
+    capability_payload: Optional[Mapping[str, Any]] = None,
+    on_output_delta: Optional[Callable[[str], None]] = None,
+) -> Tuple[SessionState, ExecutionResult]:
+    """
+    asyncio entry point with the same contract as run().
+
+    Provider, challenger and revision calls are awaited on the running event
+    loop when the provider implements AsyncProvider (default factory:
+    AsyncOllamaProvider.from_config, or deps.async_provider_factory). Blocking
+    providers, challenger callables and capabilities run in a worker thread.
+    Many concurrent runs can therefore share one loop without a thread each.
+    """
+    return await _drive_async(
+        _run_body(
+            cfg=cfg,
+            session_state=session_state,
+            user_prompt=user_prompt,
+            audit=audit,
+            deps=deps,
+            challenger_fn=challenger_fn,
+            ollama_provider_factory=ollama_provider_factory,
+            capability_id=capability_id,
+            capability_payload=capability_payload,
+            on_output_delta=on_output_delta,
+            async_mode=True,
+        )
+    )
+
+
+def _run_body(
+    *,
+    cfg,
+    session_state: SessionState,
+    user_prompt: str,
+    audit: bool,
+    deps,
+    challenger_fn,
+    ollama_provider_factory,
+    capability_id: Optional[str],
+    capability_payload: Optional[Mapping[str, Any]],
+    on_output_delta: Optional[Callable[[str], None]],
+    async_mode: bool,
+) -> Generator[_Suspend, Any, Tuple[SessionState, ExecutionResult]]:
+    """
+    Engine body shared by run() and run_async().
+
+    Yields a _Suspend for every blocking call and receives its result; the
+    driver decides whether the call runs inline or is awaited.
+
     Integrations:
     - ADR-010 Context Assembly (assemble_context)
     - ADR-009 bounded audit/revision limits
@@ -390,6 +753,18 @@ def run(
     - Audit toggle is explicit ('audit') and mirrored into SessionState.audit for traceability.
     - Capability invocation is explicit-only and bounded (Phase 3 M3.6).
 
+    Streaming (opt-in):
+    - When 'on_output_delta' is given and the provider implements generate_stream(),
+      the executor draft is consumed incrementally.
+    - audit=False: chunks are forwarded to on_output_delta as they arrive.
+    - audit=True: chunks are buffered; the final post-audit text is delivered as a
+      single delta once the ADR-009 gate has completed. Unaudited drafts never leave
+      the engine on an audited run.
+    - Providers without a blocking generate_stream() (e.g. AsyncOllamaProvider) and
+      response-cache hits deliver the final text as a single delta the same way, so
+      a caller that passed on_output_delta always receives the output.
+    - Deltas are content: they go to the caller only, never into meta/trace/events.
+
     Failure contract (Phase 4 M4.6):
     - On any exception, the execution trace always reaches terminal state ('failed').
     - A RUN_FAILED lifecycle event is always emitted on the failure path.
@@ -398,11 +773,15 @@ def run(
     """
     # Variables declared before try so they are accessible in the except handler.
     capability_meta: Optional[Dict[str, Any]] = None
+    _prewarm: Optional[ChallengerPrewarm] = None
     trace = TraceRecorder(trace_id=session_state.request_id)
 
     # M4.5: Engine observability log — created alongside trace; engine-internal.
     # Stable run identifiers cached before any _replace() rebind (write-once on SessionState).
-    _obs = EngineObservabilityLog()
+    # The content-safety scanner is shared by every guard in the run so structures
+    # validated once (event metas, trace, capability meta) are not walked again.
+    _scanner = ContentScanner()
+    _obs = EngineObservabilityLog(scanner=_scanner)
     _rid: str = session_state.request_id
     _tsid: Optional[str] = session_state.task_spec_id
 
@@ -430,6 +809,8 @@ def run(
             if not isinstance(deps, RuntimeDependencies):
                 raise TypeError("deps must be an instance of io_iii.core.dependencies.RuntimeDependencies")
 
+            if ollama_provider_factory is None and async_mode:
+                ollama_provider_factory = deps.async_provider_factory
             if ollama_provider_factory is None:
                 ollama_provider_factory = deps.ollama_provider_factory
             if challenger_fn is None and deps.challenger_fn is not None:
@@ -447,14 +828,18 @@ def run(
                 }
                 with trace.step("capability_execution", meta=cap_trace_meta):
                     try:
-                        capability_meta = _invoke_capability_once(
-                            registry=deps.capability_registry,
-                            capability_id=capability_id,
-                            payload=payload,
-                            ctx=ctx,
+                        capability_meta = yield _Suspend(
+                            sync=lambda: _invoke_capability_once(
+                                registry=deps.capability_registry,
+                                capability_id=capability_id,
+                                payload=payload,
+                                ctx=ctx,
+                            )
                         )
                         cap_trace_meta["success"] = bool(capability_meta.get("ok"))
                         cap_trace_meta["error_code"] = capability_meta.get("error_code")
+                        cap_trace_meta["queue_wait_ms"] = capability_meta.get("queue_wait_ms")
+                        cap_trace_meta["exec_ms"] = capability_meta.get("exec_ms")
                     except Exception as e:
                         cap_trace_meta["success"] = False
                         cap_trace_meta["error_code"] = _capability_error_code_from_exc(e)
@@ -464,10 +849,25 @@ def run(
         _phase = "setup"
 
         if ollama_provider_factory is None:
-            ollama_provider_factory = OllamaProvider.from_config
+            ollama_provider_factory = (
+                AsyncOllamaProvider.from_config if async_mode else OllamaProvider.from_config
+            )
 
         # Allow dependency injection for tests (keeps CLI monkeypatch compatibility)
         # Default challenger binds the provider factory explicitly to avoid scope leakage.
+        # It reuses the challenger system prompt assembled by the pre-warm, if any.
+        _default_challenger = challenger_fn is None
+        if challenger_fn is None and async_mode:
+            async def challenger_fn(cfg_, prompt_, draft_):
+                return await _run_challenger_async(
+                    cfg_,
+                    prompt_,
+                    draft_,
+                    session_state=session_state,
+                    ollama_provider_factory=ollama_provider_factory,
+                    system_prompt=_prewarm.system_prompt if _prewarm is not None else None,
+                )
+
         if challenger_fn is None:
             def challenger_fn(cfg_, prompt_, draft_):
                 # Backwards-compatibility: some tests monkeypatch _run_challenger with a
@@ -479,6 +879,7 @@ def run(
                         draft_,
                         session_state=session_state,
                         ollama_provider_factory=ollama_provider_factory,
+                        system_prompt=_prewarm.system_prompt if _prewarm is not None else None,
                     )
                 except TypeError:
                     return _run_challenger(cfg_, prompt_, draft_)
@@ -525,12 +926,13 @@ def run(
             # M4.3: explicit lifecycle terminal state before serialisation.
             trace.complete()
             trace_dict = trace.trace.to_dict()
-            assert_no_forbidden_keys(trace_dict)
+            _scanner.assert_clean(trace_dict)
             meta["trace"] = trace_dict
 
             if capability_meta is not None:
-                assert_no_forbidden_keys(capability_meta)
+                _scanner.assert_clean(capability_meta)
                 meta["capability"] = capability_meta
+            trace_dict["content_scan"] = _scanner.stats()
 
             # Events 6–7: output_emitted → engine_run_complete (null path)
             _obs.emit(
@@ -568,6 +970,18 @@ def run(
         _, model = _parse_target(session_state.route.selected_target)
         provider = ollama_provider_factory(cfg.providers)
 
+        # Opt-in challenger pre-warm (runtime.yaml `challenger_prewarm`): load the
+        # challenger model and assemble its system prompt while the executor generates.
+        if audit and _default_challenger:
+            _prewarm_settings = load_challenger_prewarm_settings(getattr(cfg, "runtime", {}) or {})
+            if _prewarm_settings is not None:
+                _prewarm = _start_challenger_prewarm(
+                    cfg,
+                    session_state=session_state,
+                    provider_factory=ollama_provider_factory,
+                    settings=_prewarm_settings,
+                )
+
         with trace.step(
             "context_assembly",
             meta={
@@ -610,21 +1024,79 @@ def run(
         # false precision: 1 token ≈ 4 chars is an approximation, not a fact.
         _heuristic_char_count = estimate_chars(final_prompt)
 
+        # Pool counters are thread-local; executor, challenger and revision calls in
+        # this run all land on the same host pool from this thread.
+        # run_async may execute blocking calls on worker threads, so per-thread
+        # attribution is only meaningful for the synchronous driver.
+        _pool_before = None if async_mode else _pool_counters(provider)
+
         _phase = "provider"
-        with trace.step(
-            "provider_inference",
-            meta={"provider": "ollama", "model": model},
-        ):
+        _streaming = (
+            on_output_delta is not None
+            and hasattr(provider, "generate_stream")
+            and not inspect.isasyncgenfunction(provider.generate_stream)
+        )
+        _streamed_live = False
+        # Opt-in response cache (runtime.yaml `response_cache`): the draft for an
+        # identical (prompt_hash, model, provider options) is reused without a call.
+        _cache_settings = load_response_cache_settings(getattr(cfg, "runtime", {}) or {})
+        _cache = (
+            get_response_cache(_cache_settings)
+            if _cache_settings is not None and _cache_settings.enabled_for(session_state.mode)
+            else None
+        )
+        _cache_key = (
+            response_cache_key(prompt_hash=assembled.prompt_hash, model=model, provider=provider)
+            if _cache is not None
+            else None
+        )
+        _cached = _cache.get(_cache_key) if _cache is not None and _cache_key is not None else None
+        _cache_hit: Optional[bool] = None if _cache is None else _cached is not None
+
+        _inference_meta: Dict[str, Any] = {"provider": "ollama", "model": model}
+        if _cache_hit is not None:
+            _inference_meta["cache_hit"] = _cache_hit
+        with trace.step("provider_inference", meta=_inference_meta):
+            if _cached is not None:
+                # Token counts recorded with the entry describe the cached draft.
+                text = _cached.text
+                _provider_input_tokens = _cached.input_tokens
+                _provider_output_tokens = _cached.output_tokens
+            # Streaming path: forward chunks live only when no audit gate applies.
+            elif _streaming:
+                text, _provider_input_tokens, _provider_output_tokens, _chunks = yield _Suspend(
+                    sync=lambda: _consume_stream(
+                        provider.generate_stream(model=model, prompt=final_prompt),
+                        None if audit else on_output_delta,
+                    )
+                )
+                _inference_meta["streamed"] = True
+                _inference_meta["stream_chunks"] = _chunks
+                _streamed_live = not audit
             # Use generate_with_metrics() when available (OllamaProvider M5.2);
             # fall back to generate() for any provider that only implements the protocol.
-            if hasattr(provider, "generate_with_metrics"):
-                text, _provider_input_tokens, _provider_output_tokens = (
-                    provider.generate_with_metrics(model=model, prompt=final_prompt)
+            elif hasattr(provider, "generate_with_metrics"):
+                _gwm = provider.generate_with_metrics
+                text, _provider_input_tokens, _provider_output_tokens = yield (
+                    _Suspend(
+                        sync=_async_only("provider.generate_with_metrics"),
+                        coro=lambda: _gwm(model=model, prompt=final_prompt),
+                    )
+                    if _is_async_callable(_gwm)
+                    else _Suspend(sync=lambda: _gwm(model=model, prompt=final_prompt))
                 )
             else:
-                text = provider.generate(model=model, prompt=final_prompt)
-            text = text.strip()
-            _call_count += 1
+                text = yield _generate_call(provider, model=model, prompt=final_prompt)
+            if _cached is None:
+                text = text.strip()
+                _call_count += 1
+                if _cache is not None and _cache_key is not None:
+                    _cache.put(
+                        _cache_key,
+                        text,
+                        input_tokens=_provider_input_tokens,
+                        output_tokens=_provider_output_tokens,
+                    )
 
         # Event 3: provider_execution_complete (ollama path)
         _obs.emit(
@@ -653,7 +1125,7 @@ def run(
             audit_passes += 1
 
             _phase = "audit"
-            audit_result = _do_challenger_pass(
+            audit_result = yield from _do_challenger_pass(
                 cfg=cfg,
                 user_prompt=user_prompt,
                 text=text,
@@ -663,6 +1135,7 @@ def run(
                 rid=_rid,
                 tsid=_tsid,
                 audit_passes=audit_passes,
+                step_meta=_prewarm.trace_meta() if _prewarm is not None else None,
             )
             audit_meta["audit_used"] = True
             audit_meta["audit_verdict"] = audit_result.get("verdict")
@@ -676,7 +1149,7 @@ def run(
                 revision_passes += 1
 
                 _phase = "revision"
-                text = _do_revision(
+                text = yield from _do_revision(
                     user_prompt=user_prompt,
                     text=text,
                     audit_result=audit_result,
@@ -690,10 +1163,15 @@ def run(
                 )
                 audit_meta["revised"] = True
 
+        # Text not already forwarded chunk by chunk (audited run, cache hit, or a
+        # provider without generate_stream) is released as one post-gate delta.
+        if not _streamed_live:
+            _safe_deliver(on_output_delta, text)
+
         # M4.3: explicit lifecycle terminal state before serialisation.
         trace.complete()
         trace_dict = trace.trace.to_dict()
-        assert_no_forbidden_keys(trace_dict)
+        _scanner.assert_clean(trace_dict)
 
         # M5.2: build ExecutionMetrics (ADR-021 §3).
         # Provider-confirmed input_tokens takes precedence over heuristic char estimate.
@@ -703,12 +1181,21 @@ def run(
             else _heuristic_char_count
         )
         _exec_latency_ms = max(0, int(time.time() * 1000) - session_state.started_at_ms)
+        _pool_after = _pool_counters(provider)
+        _pool_hits: Optional[int] = None
+        _pool_misses: Optional[int] = None
+        if _pool_before is not None and _pool_after is not None:
+            _pool_hits = _pool_after[0] - _pool_before[0]
+            _pool_misses = _pool_after[1] - _pool_before[1]
         _telemetry = ExecutionMetrics(
             call_count=_call_count,
             input_tokens=_final_input_tokens,
             output_tokens=_provider_output_tokens,
             latency_ms=_exec_latency_ms,
             model_used=model,
+            pool_hits=_pool_hits,
+            pool_misses=_pool_misses,
+            cache_hit=_cache_hit,
         )
 
         meta = {
@@ -717,8 +1204,9 @@ def run(
             "telemetry": _telemetry.to_dict(),
         }
         if capability_meta is not None:
-            assert_no_forbidden_keys(capability_meta)
+            _scanner.assert_clean(capability_meta)
             meta["capability"] = capability_meta
+        trace_dict["content_scan"] = _scanner.stats()
 
         # Events 6–7: output_emitted → engine_run_complete (ollama path)
         _obs.emit(
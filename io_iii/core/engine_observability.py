@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from io_iii.core.content_safety import assert_no_forbidden_keys
+from io_iii.core.content_safety import ContentScanner, assert_no_forbidden_keys
 
 
 # ---------------------------------------------------------------------------
@@ -99,8 +99,10 @@ class EngineObservabilityLog:
       - to_list() returns a JSON-safe list; safe to attach to meta directly.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, scanner: Optional[ContentScanner] = None) -> None:
         self._events: List[EngineEvent] = []
+        # Shared per-run scanner (engine-supplied); falls back to the plain guard.
+        self._scanner = scanner
 
     @property
     def event_count(self) -> int:
@@ -128,7 +130,10 @@ class EngineObservabilityLog:
             )
         safe_meta: Dict[str, Any] = meta if meta is not None else {}
         # Fail-fast content-leak guard — checked at emit time, not only at serialization.
-        assert_no_forbidden_keys(safe_meta)
+        if self._scanner is not None:
+            self._scanner.assert_clean(safe_meta)
+        else:
+            assert_no_forbidden_keys(safe_meta)
         self._events.append(
             EngineEvent(
                 kind=kind.value,
@@ -1,17 +1,67 @@
 """
-io_iii.core.file_store — Session-scoped in-memory file store (ADR-033 §5).
+io_iii.core.file_store — Session-scoped file store (ADR-033 §5).
 
-Storage is dict-backed and does not survive server restart.
-A reloaded session may carry a file_ref that no longer resolves;
-callers must handle FileRefNotFound and surface FILE_REF_EXPIRED.
+Holds extracted upload text per session, addressed by a UUID file_ref.
+Access is thread-safe (the FastAPI upload and turn paths run concurrently)
+and memory is bounded:
+
+- max_bytes            total UTF-8 bytes resident in memory
+- session_quota_bytes  resident bytes per session
+- ttl_seconds          entries unused for longer are dropped
+
+When a budget is exceeded the least recently used entries are evicted
+(the session's own entries for a quota overflow). A single file larger
+than either limit is rejected with FILE_STORE_QUOTA_EXCEEDED.
+
+Deduplication: identical extracted texts are held once, as a refcounted
+blob keyed by SHA-256; each file_ref is a reference to it. max_bytes
+counts unique resident bytes, while session_quota_bytes charges every
+session for what it references. Uploads are also indexed by a source key
+(extension + SHA-256 of the raw bytes, see source_key()), so re-uploading
+a document whose text is still cached skips extraction (cached_text()).
+
+Spill-to-disk (``spill_dir``; proposed in the ADR-033 §10 amendment and
+off until it is accepted): every stored file is also written to a local
+content-addressed cache:
+
+    <spill_dir>/blobs/<sha256>                         extracted text (UTF-8)
+    <spill_dir>/refs/<session key>/<file_ref>.json     filename, digest, size
+
+A file_ref evicted from memory, or issued before a server restart, is
+reloaded from the cache on resolve instead of surfacing FILE_REF_EXPIRED.
+Identical texts share one blob. delete(session_id) removes the session's
+refs and every blob no longer referenced; refs unused for ttl_seconds are
+swept periodically. The session key is a hash of the session_id, so
+client-supplied IDs never form paths.
+
+Without spill_dir an evicted or pre-restart file_ref raises FileRefNotFound
+and callers surface FILE_REF_EXPIRED, as before. ADR-029 §3 and ADR-033 §5
+keep file content in memory only, so load_file_store_settings rejects
+spill_dir (FILE_STORE_CONFIG_INVALID) until that amendment is accepted.
+
+Configuration (runtime.yaml; every key optional, bounds apply by default)::
+
+    file_store:
+      max_bytes: 67108864
+      session_quota_bytes: 16777216
+      ttl_seconds: 86400
+
+Content policy (ADR-029 §4 / ADR-033 §3): extracted text is never logged
+and, while spill_dir is off, never written to disk.
 """
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
 import uuid
-from typing import Dict, Tuple
-
-# { session_id: { file_ref: (filename, content) } }
-_store: Dict[str, Dict[str, Tuple[str, str]]] = {}
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class FileRefNotFound(Exception):
@@ -33,13 +83,464 @@ class FileRefExpiredError(RuntimeError):
     )
 
 
-def store(session_id: str, content: str, filename: str) -> str:
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class FileStoreSettings:
+    """Parsed ``file_store`` block from runtime.yaml."""
+    max_bytes: int = 64 * 1024 * 1024
+    session_quota_bytes: int = 16 * 1024 * 1024
+    ttl_seconds: float = 86_400.0
+    spill_dir: Optional[str] = None
+
+
+def load_file_store_settings(runtime_config: Optional[Dict[str, Any]]) -> FileStoreSettings:
+    """
+    Load FileStoreSettings from a runtime config dict (defaults when absent).
+
+    Raises:
+        ValueError('FILE_STORE_CONFIG_INVALID: ...') on a malformed block.
+    """
+    raw = (runtime_config or {}).get("file_store")
+    if raw is None:
+        return FileStoreSettings()
+    if not isinstance(raw, dict):
+        raise ValueError("FILE_STORE_CONFIG_INVALID: file_store must be a mapping")
+
+    defaults = FileStoreSettings()
+    values: Dict[str, Any] = {}
+    for key in ("max_bytes", "session_quota_bytes"):
+        value = raw.get(key, getattr(defaults, key))
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValueError(f"FILE_STORE_CONFIG_INVALID: {key} must be an integer >= 1")
+        values[key] = value
+
+    ttl = raw.get("ttl_seconds", defaults.ttl_seconds)
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+        raise ValueError("FILE_STORE_CONFIG_INVALID: ttl_seconds must be a number > 0")
+
+    if raw.get("spill_dir") is not None:
+        # Persistent file content needs the ADR-033 §10 amendment (proposed).
+        raise ValueError(
+            "FILE_STORE_CONFIG_INVALID: spill_dir is not available until the ADR-033 "
+            "spill cache amendment is accepted"
+        )
+
+    return FileStoreSettings(ttl_seconds=float(ttl), **values)
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+_SWEEP_INTERVAL_SECONDS = 300.0
+_BLOB_GRACE_SECONDS = 60.0  # never sweep a blob younger than this (store in progress)
+
+
+_SOURCE_INDEX_MAX = 4096  # remembered upload → text digest mappings (digests only)
+
+
+class _Blob:
+    __slots__ = ("content", "size", "refs")
+
+    def __init__(self, content: str, size: int) -> None:
+        self.content = content
+        self.size = size
+        self.refs = 0
+
+
+class _Entry:
+    __slots__ = ("filename", "digest", "size", "last_used")
+
+    def __init__(self, filename: str, digest: str, size: int, last_used: float) -> None:
+        self.filename = filename
+        self.digest = digest
+        self.size = size
+        self.last_used = last_used
+
+
+def _session_key(session_id: str) -> str:
+    return hashlib.sha256(session_id.encode("utf-8")).hexdigest()[:32]
+
+
+def source_key(filename: str, data: bytes) -> str:
+    """Extraction cache key for an upload: extension plus SHA-256 of the raw bytes."""
+    return f"{Path(filename).suffix.lower()}:{hashlib.sha256(data).hexdigest()}"
+
+
+def _valid_ref(file_ref: str) -> bool:
+    try:
+        return str(uuid.UUID(file_ref)) == file_ref
+    except (ValueError, TypeError, AttributeError):
+        return False
+
+
+class FileStore:
+    """Bounded, thread-safe file store with an optional on-disk spill cache."""
+
+    def __init__(self, settings: Optional[FileStoreSettings] = None) -> None:
+        self.settings = settings or FileStoreSettings()
+        self._lock = threading.Lock()
+        self._lru: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._sessions: Dict[str, "OrderedDict[str, _Entry]"] = {}
+        self._session_bytes: Dict[str, int] = {}
+        self._blobs: Dict[str, _Blob] = {}
+        self._sources: "OrderedDict[str, str]" = OrderedDict()
+        self._total = 0
+        self._last_sweep = time.monotonic()
+        self.evictions = 0
+        self.expired = 0
+        self.spill_hits = 0
+        self.dedup_hits = 0
+        self.extraction_hits = 0
+
+    # -- memory tier (lock held) ---------------------------------------------
+
+    def _drop(self, key: Tuple[str, str]) -> _Entry:
+        sid, ref = key
+        entry = self._lru.pop(key)
+        files = self._sessions[sid]
+        del files[ref]
+        self._session_bytes[sid] -= entry.size
+        if not files:
+            del self._sessions[sid]
+            del self._session_bytes[sid]
+        blob = self._blobs[entry.digest]
+        blob.refs -= 1
+        if not blob.refs:
+            del self._blobs[entry.digest]
+            self._total -= blob.size
+        return entry
+
+    def _expire(self, now: float) -> None:
+        horizon = now - self.settings.ttl_seconds
+        while self._lru:
+            key, entry = next(iter(self._lru.items()))
+            if entry.last_used >= horizon:
+                break
+            self._drop(key)
+            self.expired += 1
+
+    def _admit(self, sid: str, ref: str, entry: _Entry, content: str) -> List[Tuple[str, str]]:
+        """Insert *entry* and enforce the budgets; returns the evicted keys."""
+        self._expire(entry.last_used)
+        blob = self._blobs.get(entry.digest)
+        if blob is None:
+            blob = self._blobs[entry.digest] = _Blob(content, entry.size)
+            self._total += entry.size
+        else:
+            self.dedup_hits += 1
+        blob.refs += 1
+        self._lru[(sid, ref)] = entry
+        self._sessions.setdefault(sid, OrderedDict())[ref] = entry
+        self._session_bytes[sid] = self._session_bytes.get(sid, 0) + entry.size
+
+        evicted = []
+        files = self._sessions[sid]
+        while self._session_bytes[sid] > self.settings.session_quota_bytes:
+            oldest = next(iter(files))
+            evicted.append((sid, oldest))
+            self._drop((sid, oldest))
+        while self._total > self.settings.max_bytes:
+            key = next(iter(self._lru))
+            evicted.append(key)
+            self._drop(key)
+        self.evictions += len(evicted)
+        return evicted
+
+    def _enforce(self) -> None:
+        while self._sessions:
+            over = [sid for sid, n in self._session_bytes.items() if n > self.settings.session_quota_bytes]
+            if not over and self._total <= self.settings.max_bytes:
+                return
+            if over:
+                self._drop((over[0], next(iter(self._sessions[over[0]]))))
+            else:
+                self._drop(next(iter(self._lru)))
+            self.evictions += 1
+
+    # -- public API ----------------------------------------------------------
+
+    def store(self, session_id: str, content: str, filename: str, *, source: Optional[str] = None) -> str:
+        """
+        Store extracted text for a session. Returns a UUID file_ref.
+
+        *source* (from source_key()) records which upload the text was
+        extracted from, so cached_text() can skip a repeat extraction.
+
+        Raises:
+            ValueError('FILE_STORE_QUOTA_EXCEEDED: ...') when the text alone
+            exceeds the session quota or the total budget.
+        """
+        data = content.encode("utf-8")
+        size = len(data)
+        settings = self.settings
+        limit = min(settings.session_quota_bytes, settings.max_bytes)
+        if size > limit:
+            raise ValueError(f"FILE_STORE_QUOTA_EXCEEDED: file is {size} bytes; limit is {limit}")
+
+        ref = str(uuid.uuid4())
+        digest = hashlib.sha256(data).hexdigest()
+        if settings.spill_dir:
+            self._spill(Path(settings.spill_dir), session_id, ref, filename, digest, data)
+        with self._lock:
+            evicted = self._admit(session_id, ref, _Entry(filename, digest, size, time.monotonic()), content)
+            if source is not None:
+                self._sources[source] = digest
+                self._sources.move_to_end(source)
+                while len(self._sources) > _SOURCE_INDEX_MAX:
+                    self._sources.popitem(last=False)
+        self._after_evict(evicted)
+        self._maybe_sweep()
+        return ref
+
+    def cached_text(self, source: str) -> Optional[str]:
+        """
+        Return the text previously extracted from the upload *source*
+        (a source_key()), or None when it is no longer cached.
+        """
+        with self._lock:
+            digest = self._sources.get(source)
+            if digest is None:
+                return None
+            blob = self._blobs.get(digest)
+            if blob is not None:
+                self._sources.move_to_end(source)
+                self.extraction_hits += 1
+                return blob.content
+        if self.settings.spill_dir:
+            try:
+                content = (Path(self.settings.spill_dir) / "blobs" / digest).read_bytes().decode("utf-8")
+            except (OSError, ValueError):
+                content = None
+            if content is not None:
+                with self._lock:
+                    self.extraction_hits += 1
+                return content
+        with self._lock:
+            if self._sources.get(source) == digest:
+                del self._sources[source]
+        return None
+
+    def resolve(self, session_id: str, file_ref: str) -> Tuple[str, str]:
+        """
+        Return (filename, content) for the given file_ref.
+        Raises FileRefNotFound if absent (and not in the spill cache).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            files = self._sessions.get(session_id)
+            entry = files.get(file_ref) if files is not None else None
+            if entry is not None:
+                entry.last_used = now
+                self._lru.move_to_end((session_id, file_ref))
+                self._sessions[session_id].move_to_end(file_ref)
+                return entry.filename, self._blobs[entry.digest].content
+
+        loaded = self._load_spilled(session_id, file_ref)
+        if loaded is None:
+            raise FileRefNotFound(file_ref)
+        filename, content, digest = loaded
+        size = len(content.encode("utf-8"))
+        with self._lock:
+            self.spill_hits += 1
+            if (session_id, file_ref) not in self._lru and size <= min(
+                self.settings.session_quota_bytes, self.settings.max_bytes
+            ):
+                evicted = self._admit(
+                    session_id, file_ref, _Entry(filename, digest, size, time.monotonic()), content,
+                )
+            else:
+                evicted = []
+        self._after_evict(evicted)
+        return filename, content
+
+    def delete(self, session_id: str) -> None:
+        """Delete all files for a session (memory and spill cache). No-op if none."""
+        with self._lock:
+            for ref in list(self._sessions.get(session_id, ())):
+                self._drop((session_id, ref))
+        if self.settings.spill_dir:
+            root = Path(self.settings.spill_dir)
+            ref_dir = root / "refs" / _session_key(session_id)
+            digests = set()
+            for path in ref_dir.glob("*.json"):
+                try:
+                    digests.add(json.loads(path.read_text(encoding="utf-8"))["digest"])
+                except (OSError, ValueError, KeyError, TypeError):
+                    continue
+            shutil.rmtree(ref_dir, ignore_errors=True)
+            if digests:
+                self._gc_blobs(root, only=digests)
+
+    def reconfigure(self, settings: FileStoreSettings) -> None:
+        """Apply new settings; evicts as needed to fit the new budgets."""
+        with self._lock:
+            self.settings = settings
+            self._expire(time.monotonic())
+            self._enforce()
+
+    def stats(self) -> Dict[str, Any]:
+        """Content-safe counters."""
+        with self._lock:
+            return {
+                "files": len(self._lru),
+                "blobs": len(self._blobs),
+                "sessions": len(self._sessions),
+                "resident_bytes": self._total,
+                "max_bytes": self.settings.max_bytes,
+                "evictions": self.evictions,
+                "expired": self.expired,
+                "spill_hits": self.spill_hits,
+                "dedup_hits": self.dedup_hits,
+                "extraction_hits": self.extraction_hits,
+                "spill": bool(self.settings.spill_dir),
+            }
+
+    # -- spill cache ---------------------------------------------------------
+
+    def _spill(self, root: Path, sid: str, ref: str, filename: str, digest: str, data: bytes) -> None:
+        blob = root / "blobs" / digest
+        ref_dir = root / "refs" / _session_key(sid)
+        try:
+            ref_dir.mkdir(parents=True, exist_ok=True)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            if blob.exists():
+                os.utime(blob)  # keep a shared blob out of the sweep's grace window
+            else:
+                tmp = blob.with_name(f"{digest}.{ref}.tmp")
+                tmp.write_bytes(data)
+                tmp.replace(blob)
+            meta = {"session_id": sid, "filename": filename, "digest": digest, "size": len(data)}
+            tmp = ref_dir / f"{ref}.tmp"
+            tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(ref_dir / f"{ref}.json")
+        except OSError:
+            pass  # spill is best-effort: the file is still served from memory
+
+    def _ref_path(self, sid: str, ref: str) -> Optional[Path]:
+        if not self.settings.spill_dir or not _valid_ref(ref):
+            return None
+        return Path(self.settings.spill_dir) / "refs" / _session_key(sid) / f"{ref}.json"
+
+    def _load_spilled(self, sid: str, ref: str) -> Optional[Tuple[str, str, str]]:
+        spill_dir = self.settings.spill_dir
+        path = self._ref_path(sid, ref)
+        if spill_dir is None or path is None:
+            return None
+        try:
+            meta = json.loads(path.read_text(encoding="utf-8"))
+            if meta.get("session_id") != sid:
+                return None
+            digest = meta["digest"]
+            content = (Path(spill_dir) / "blobs" / digest).read_bytes().decode("utf-8")
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return meta.get("filename", "upload"), content, digest
+
+    def _after_evict(self, evicted: List[Tuple[str, str]]) -> None:
+        # Budget evictions are recent files: refresh their refs so the
+        # on-disk TTL counts from last use, not from upload.
+        for sid, ref in evicted:
+            path = self._ref_path(sid, ref)
+            if path is not None:
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+
+    def _maybe_sweep(self) -> None:
+        if not self.settings.spill_dir:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep < min(_SWEEP_INTERVAL_SECONDS, self.settings.ttl_seconds):
+                return
+            self._last_sweep = now
+        self.sweep()
+
+    def sweep(self) -> None:
+        """Drop spilled refs unused for ttl_seconds and unreferenced blobs."""
+        if not self.settings.spill_dir:
+            return
+        root = Path(self.settings.spill_dir)
+        horizon = time.time() - self.settings.ttl_seconds
+        refs = root / "refs"
+        if refs.is_dir():
+            for session_dir in refs.iterdir():
+                for path in session_dir.glob("*.json"):
+                    try:
+                        if path.stat().st_mtime < horizon:
+                            path.unlink()
+                    except OSError:
+                        pass
+                try:
+                    session_dir.rmdir()  # only succeeds when empty
+                except OSError:
+                    pass
+        self._gc_blobs(root, grace_seconds=_BLOB_GRACE_SECONDS)
+
+    def _gc_blobs(self, root: Path, *, grace_seconds: float = 0.0, only: Optional[set] = None) -> None:
+        """Remove blobs no ref points to (restricted to *only* when given)."""
+        blobs = root / "blobs"
+        if not blobs.is_dir():
+            return
+        live = set()
+        for path in (root / "refs").glob("*/*.json"):
+            try:
+                live.add(json.loads(path.read_text(encoding="utf-8"))["digest"])
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        cutoff = time.time() - grace_seconds
+        candidates = (blobs / d for d in only) if only is not None else blobs.iterdir()
+        for blob in candidates:
+            if blob.name in live or blob.name.endswith(".tmp"):
+                continue
+            try:
+                if blob.stat().st_mtime < cutoff:
+                    blob.unlink()
+            except OSError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Process-wide store
+# ---------------------------------------------------------------------------
+
+_default = FileStore()
+_default_lock = threading.Lock()
+
+
+def get_file_store() -> FileStore:
+    """Return the process-wide file store."""
+    return _default
+
+
+def configure_file_store(runtime_config: Optional[Dict[str, Any]]) -> FileStore:
+    """
+    Apply the runtime.yaml ``file_store`` block to the process-wide store.
+
+    Cheap when the settings are unchanged; raises FILE_STORE_CONFIG_INVALID.
+    """
+    settings = load_file_store_settings(runtime_config)
+    with _default_lock:
+        if _default.settings != settings:
+            _default.reconfigure(settings)
+    return _default
+
+
+def store(session_id: str, content: str, filename: str, *, source: Optional[str] = None) -> str:
     """Store extracted text for a session. Returns a UUID file_ref."""
-    if session_id not in _store:
-        _store[session_id] = {}
-    ref = str(uuid.uuid4())
-    _store[session_id][ref] = (filename, content)
-    return ref
+    return _default.store(session_id, content, filename, source=source)
+
+
+def cached_text(source: str) -> Optional[str]:
+    """Return cached extracted text for an upload source key, or None."""
+    return _default.cached_text(source)
 
 
 def resolve(session_id: str, file_ref: str) -> Tuple[str, str]:
@@ -47,13 +548,9 @@ def resolve(session_id: str, file_ref: str) -> Tuple[str, str]:
     Return (filename, content) for the given file_ref.
     Raises FileRefNotFound if absent.
     """
-    session_files = _store.get(session_id, {})
-    entry = session_files.get(file_ref)
-    if entry is None:
-        raise FileRefNotFound(file_ref)
-    return entry  # (filename, content)
+    return _default.resolve(session_id, file_ref)
 
 
 def delete(session_id: str) -> None:
     """Delete all files for a session. No-op if session has no files."""
-    _store.pop(session_id, None)
+    _default.delete(session_id)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Mapping, Optional, Tuple
+from typing import Any, Callable, Mapping, Optional, Tuple
 
 from io_iii.core.dependencies import RuntimeDependencies
 from io_iii.core.engine import ExecutionResult
 from io_iii.core.engine import run as _engine_run
+from io_iii.core.engine import run_async as _engine_run_async
 from io_iii.core.session_state import (
     AuditGateState,
     RouteInfo,
@@ -26,6 +27,7 @@ def run(
     audit: bool = False,
     capability_payload: Optional[Mapping[str, Any]] = None,
     request_id: Optional[str] = None,
+    on_output_delta: Optional[Callable[[str], None]] = None,
 ) -> Tuple[SessionState, ExecutionResult]:
     """
     Bounded single-run orchestration layer (Phase 4 M4.2 / ADR-012).
@@ -36,6 +38,8 @@ def run(
     - One optional challenger pass via audit=True (ADR-009 bounds enforced by engine).
     - At most one declared capability (Phase 4 M4.2 single-run constraint).
     - No recursion, no planner logic, no output-driven branching, no loops.
+    - on_output_delta (optional) is passed through to the engine unchanged;
+      streaming and audit buffering rules are engine concerns.
 
     This is a coordination layer only. It does not:
     - load config
@@ -51,6 +55,76 @@ def run(
         TypeError: if task_spec or deps are not the expected types.
         ValueError: if task_spec.capabilities declares more than one capability.
     """
+    state, capability_id = _prepare(task_spec=task_spec, cfg=cfg, deps=deps, audit=audit, request_id=request_id)
+
+    # Single delegated engine execution — exactly once, no retry, no loop.
+    state2, result = _engine_run(
+        cfg=cfg,
+        session_state=state,
+        user_prompt=task_spec.prompt,
+        audit=bool(audit),
+        deps=deps,
+        capability_id=capability_id,
+        capability_payload=capability_payload if capability_id else None,
+        on_output_delta=on_output_delta,
+    )
+
+    # Defensive invariant guard (SessionState v0) — post-execution.
+    validate_session_state(state2)
+
+    return state2, result
+
+
+async def run_async(
+    *,
+    task_spec: TaskSpec,
+    cfg,
+    deps: RuntimeDependencies,
+    audit: bool = False,
+    capability_payload: Optional[Mapping[str, Any]] = None,
+    request_id: Optional[str] = None,
+    on_output_delta: Optional[Callable[[str], None]] = None,
+) -> Tuple[SessionState, ExecutionResult]:
+    """
+    asyncio variant of run() with the identical ADR-012 contract.
+
+    Route resolution and SessionState construction are unchanged; the single
+    delegated execution goes through engine.run_async so the caller's event
+    loop is never blocked on provider I/O.
+    """
+    state, capability_id = _prepare(task_spec=task_spec, cfg=cfg, deps=deps, audit=audit, request_id=request_id)
+
+    # Single delegated engine execution — exactly once, no retry, no loop.
+    state2, result = await _engine_run_async(
+        cfg=cfg,
+        session_state=state,
+        user_prompt=task_spec.prompt,
+        audit=bool(audit),
+        deps=deps,
+        capability_id=capability_id,
+        capability_payload=capability_payload if capability_id else None,
+        on_output_delta=on_output_delta,
+    )
+
+    # Defensive invariant guard (SessionState v0) — post-execution.
+    validate_session_state(state2)
+
+    return state2, result
+
+
+def _prepare(
+    *,
+    task_spec: TaskSpec,
+    cfg,
+    deps: RuntimeDependencies,
+    audit: bool,
+    request_id: Optional[str],
+) -> Tuple[SessionState, Optional[str]]:
+    """
+    Validate inputs, resolve the route and build the pre-execution SessionState.
+
+    Shared by run() and run_async(). Returns (session_state, capability_id).
+    """
     if not isinstance(task_spec, TaskSpec):
         raise TypeError(
             f"task_spec must be an instance of TaskSpec, got {type(task_spec).__name__}"
@@ -116,18 +190,4 @@ def run(
         task_spec.capabilities[0] if task_spec.capabilities else None
     )
 
-    # Single delegated engine execution — exactly once, no retry, no loop.
-    state2, result = _engine_run(
-        cfg=cfg,
-        session_state=state,
-        user_prompt=task_spec.prompt,
-        audit=bool(audit),
-        deps=deps,
-        capability_id=capability_id,
-        capability_payload=capability_payload if capability_id else None,
-    )
-
-    # Defensive invariant guard (SessionState v0) — post-execution.
-    validate_session_state(state2)
-
-    return state2, result
+    return state, capability_id
@@ -0,0 +1,337 @@
+# io_iii/core/response_cache.py
+"""
+Opt-in completion cache for the executor draft.
+
+Context assembly is deterministic and AssembledContext.prompt_hash is a
+sha256 over the canonical messages, so two runs with the same prompt hash,
+model and provider options would send Ollama byte-identical requests.
+When enabled for a mode, the engine looks the draft up here before calling
+the provider and stores it afterwards. The audit / revision passes are not
+cached; they still run on the (possibly cached) draft.
+
+Tiers:
+- memory — LRU bounded by the UTF-8 size of the cached text (max_bytes)
+- disk   — optional; one JSON file per key under disk_dir, written
+           atomically. Survives restarts and is shared across processes.
+
+Entries older than ttl_seconds are treated as absent in both tiers.
+
+Configuration (runtime.yaml; absent block = cache disabled)::
+
+    response_cache:
+      modes: [executor]       # modes for which the cache is consulted
+      max_bytes: 16777216     # memory tier budget (default 16 MiB)
+      ttl_seconds: 3600       # entry lifetime (default 1 h; 0 = no expiry)
+      disk_dir: ./architecture/runtime/cache/responses   # optional
+
+Content policy: cache entries hold model output. Nothing in this module
+logs keys or values; operators enabling disk_dir accept that completions
+are persisted there (compare the ADR-026 content_release gate).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+_DEFAULT_MAX_BYTES: int = 16 * 1024 * 1024
+_DEFAULT_TTL_SECONDS: float = 3600.0
+_DISK_SCHEMA: str = "io-iii-response-cache-v1"
+
+
+@dataclass(frozen=True)
+class ResponseCacheSettings:
+    """Parsed ``response_cache`` block from runtime.yaml."""
+    modes: Tuple[str, ...]
+    max_bytes: int = _DEFAULT_MAX_BYTES
+    ttl_seconds: float = _DEFAULT_TTL_SECONDS
+    disk_dir: Optional[str] = None
+
+    def enabled_for(self, mode: str) -> bool:
+        return mode in self.modes
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """One cached executor draft with the provider-confirmed token counts."""
+    text: str
+    input_tokens: Optional[int]
+    output_tokens: Optional[int]
+    stored_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.text.encode("utf-8"))
+
+
+def load_response_cache_settings(runtime_config: Dict[str, Any]) -> Optional[ResponseCacheSettings]:
+    """
+    Load ResponseCacheSettings from a runtime config dict.
+
+    Returns None when the ``response_cache`` key is absent or lists no modes
+    (cache disabled — the default).
+
+    Raises:
+        ValueError('RESPONSE_CACHE_INVALID: ...') if declared values have
+        incorrect types.
+    """
+    raw = (runtime_config or {}).get("response_cache")
+    if not raw:
+        return None
+    if not isinstance(raw, dict):
+        raise ValueError("RESPONSE_CACHE_INVALID: response_cache must be a mapping")
+
+    modes = raw.get("modes") or []
+    if not isinstance(modes, list) or not all(isinstance(m, str) for m in modes):
+        raise ValueError("RESPONSE_CACHE_INVALID: modes must be a list of strings")
+    if not modes:
+        return None
+
+    max_bytes = raw.get("max_bytes", _DEFAULT_MAX_BYTES)
+    if not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes <= 0:
+        raise ValueError("RESPONSE_CACHE_INVALID: max_bytes must be a positive integer")
+
+    ttl = raw.get("ttl_seconds", _DEFAULT_TTL_SECONDS)
+    if not isinstance(ttl, (int, float)) or isinstance(ttl, bool) or ttl < 0:
+        raise ValueError("RESPONSE_CACHE_INVALID: ttl_seconds must be a non-negative number")
+
+    disk_dir = raw.get("disk_dir")
+    if disk_dir is not None and (not isinstance(disk_dir, str) or not disk_dir.strip()):
+        raise ValueError("RESPONSE_CACHE_INVALID: disk_dir must be a non-empty string")
+
+    return ResponseCacheSettings(
+        modes=tuple(modes),
+        max_bytes=max_bytes,
+        ttl_seconds=float(ttl),
+        disk_dir=disk_dir,
+    )
+
+
+def response_cache_key(*, prompt_hash: str, model: str, provider: Any) -> str:
+    """
+    Stable cache key for one executor call.
+
+    Combines the assembly prompt_hash, the resolved model and the provider
+    options that change the completion: provider name, host, and an optional
+    ``options`` mapping (e.g. sampling parameters) when the provider has one.
+    """
+    material = {
+        "prompt_hash": prompt_hash,
+        "model": model,
+        "provider": getattr(provider, "name", type(provider).__name__),
+        "host": getattr(provider, "host", None),
+        "options": getattr(provider, "options", None),
+    }
+    payload = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier LRU response cache. Thread-safe.
+
+    Counters (hits / misses / evictions) are process-lifetime totals.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        disk_dir: Optional[str | Path] = None,
+    ) -> None:
+        self.max_bytes = int(max_bytes)
+        self.ttl_seconds = float(ttl_seconds)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the live entry for *key* (memory first, then disk), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._expired(entry):
+                    self._drop(key)
+                    entry = None
+                else:
+                    self._entries.move_to_end(key)
+        if entry is None:
+            entry = self._disk_get(key)
+            if entry is not None:
+                with self._lock:
+                    self._insert(key, entry)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: str,
+        text: str,
+        *,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+    ) -> None:
+        """Store a completion in the memory tier and, when configured, on disk."""
+        entry = CachedResponse(
+            text=text,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            stored_at=time.time(),
+        )
+        with self._lock:
+            self._insert(key, entry)
+        self._disk_put(key, entry)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        """Drop the memory tier (the disk tier is left in place)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # ------------------------------------------------------------------
+    # Memory tier (caller holds _lock)
+    # ------------------------------------------------------------------
+
+    def _expired(self, entry: CachedResponse) -> bool:
+        return self.ttl_seconds > 0 and time.time() - entry.stored_at > self.ttl_seconds
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _insert(self, key: str, entry: CachedResponse) -> None:
+        self._drop(key)
+        if entry.size > self.max_bytes:
+            return  # larger than the whole budget: disk tier only
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes:
+            old_key, _ = next(iter(self._entries.items()))
+            self._drop(old_key)
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _disk_get(self, key: str) -> Optional[CachedResponse]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("schema") != _DISK_SCHEMA:
+                return None
+            entry = CachedResponse(
+                text=str(data["text"]),
+                input_tokens=data.get("input_tokens"),
+                output_tokens=data.get("output_tokens"),
+                stored_at=float(data["stored_at"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if self._expired(entry):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def _disk_put(self, key: str, entry: CachedResponse) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        data = {
+            "schema": _DISK_SCHEMA,
+            "text": entry.text,
+            "input_tokens": entry.input_tokens,
+            "output_tokens": entry.output_tokens,
+            "stored_at": entry.stored_at,
+        }
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            # The disk tier is best-effort; a failed write only costs a future miss.
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registry (one cache per disk_dir)
+# ---------------------------------------------------------------------------
+
+_caches_lock = threading.Lock()
+_caches: Dict[str, ResponseCache] = {}
+
+
+def get_response_cache(settings: ResponseCacheSettings) -> ResponseCache:
+    """
+    Return the shared cache for *settings*, creating it on first use.
+
+    Caches are keyed by disk_dir so that every run using the same on-disk
+    tier also shares one memory tier. A later call with different limits
+    (e.g. after a runtime.yaml reload) updates them in place.
+    """
+    key = os.path.abspath(settings.disk_dir) if settings.disk_dir else ""
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ResponseCache(
+                max_bytes=settings.max_bytes,
+                ttl_seconds=settings.ttl_seconds,
+                disk_dir=settings.disk_dir,
+            )
+            _caches[key] = cache
+        else:
+            cache.max_bytes = settings.max_bytes
+            cache.ttl_seconds = settings.ttl_seconds
+        return cache
+
+
+def clear_response_caches() -> None:
+    """Forget every registered cache (tests / shutdown). Disk tiers are kept."""
+    with _caches_lock:
+        _caches.clear()
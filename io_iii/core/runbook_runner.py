@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import functools
+import threading
 import time as _time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from io_iii.core.dependencies import RuntimeDependencies
 from io_iii.core.engine import ExecutionResult
@@ -178,6 +181,7 @@ def run(
     cfg: Any,
     deps: RuntimeDependencies,
     audit: bool = False,
+    max_parallel: int = 1,
 ) -> RunbookResult:
     """
     Execute a Runbook by delegating each step through orchestrator.run() (ADR-014).
@@ -213,11 +217,23 @@ def run(
         → runbook_step_failed  (step K)
         → runbook_terminated
 
+    Parallel mode (opt-in, max_parallel > 1):
+    - Steps of a plain Runbook have no data flow between them, so up to
+      max_parallel steps are dispatched concurrently on a bounded thread pool.
+    - Lifecycle events are emitted in declared order once each step has
+      resolved, so the projection has the same shape as a sequential run.
+    - Fail-fast: when step K fails, steps after K that have not started are
+      cancelled; steps before K still run. The first failure in declared order
+      is reported and outcomes of steps after it are discarded.
+    - Steps after K that were already running when K failed cannot be
+      interrupted; their results are discarded.
+
     Args:
-        runbook  — the Runbook to execute; must be a Runbook instance
-        cfg      — runtime config (same contract as orchestrator.run)
-        deps     — RuntimeDependencies (same contract as orchestrator.run)
-        audit    — whether to enable the challenger audit pass per step
+        runbook      — the Runbook to execute; must be a Runbook instance
+        cfg          — runtime config (same contract as orchestrator.run)
+        deps         — RuntimeDependencies (same contract as orchestrator.run)
+        audit        — whether to enable the challenger audit pass per step
+        max_parallel — worker pool width; 1 (default) runs steps sequentially
 
     Returns:
         RunbookResult with per-step outcomes, termination metadata, and
@@ -226,6 +242,7 @@ def run(
     Raises:
         TypeError: if runbook is not a Runbook instance.
         TypeError: if deps is not a RuntimeDependencies instance.
+        ValueError: RUNBOOK_PARALLEL_INVALID if max_parallel is not a positive integer.
     """
     if not isinstance(runbook, Runbook):
         raise TypeError(
@@ -237,6 +254,16 @@ def run(
             f"deps must be a RuntimeDependencies instance, got {type(deps).__name__}"
         )
 
+    if not isinstance(max_parallel, int) or isinstance(max_parallel, bool) or max_parallel < 1:
+        raise ValueError(
+            f"RUNBOOK_PARALLEL_INVALID: max_parallel must be a positive integer, got {max_parallel!r}"
+        )
+
+    if max_parallel > 1 and len(runbook.steps) > 1:
+        return _run_parallel(
+            runbook=runbook, cfg=cfg, deps=deps, audit=audit, max_parallel=max_parallel,
+        )
+
     steps_total = len(runbook.steps)
     projection = RunbookMetadataProjection(runbook_id=runbook.runbook_id)
     runbook_start_ns = _time.monotonic_ns()
@@ -377,6 +404,197 @@ def run(
     )
 
 
+# ---------------------------------------------------------------------------
+# Parallel step dispatch (opt-in)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class _StepRun:
+    """Resolved result of one step executed on a worker thread."""
+
+    state: Optional[SessionState]
+    result: Optional[ExecutionResult]
+    failure: Optional[RuntimeFailure]
+    success: bool
+    duration_ms: int
+
+
+def _run_step(*, task_spec: Any, cfg: Any, deps: RuntimeDependencies, audit: bool) -> _StepRun:
+    """Run one step through orchestrator.run(); never raises (failure is captured)."""
+    step_start_ns = _time.monotonic_ns()
+    try:
+        state, result = _orchestrator.run(
+            task_spec=task_spec,
+            cfg=cfg,
+            deps=deps,
+            audit=audit,
+        )
+    except Exception as exc:
+        return _StepRun(
+            state=None,
+            result=None,
+            failure=getattr(exc, "runtime_failure", None),
+            success=False,
+            duration_ms=_elapsed_ms(step_start_ns),
+        )
+    return _StepRun(
+        state=state,
+        result=result,
+        failure=None,
+        success=True,
+        duration_ms=_elapsed_ms(step_start_ns),
+    )
+
+
+def _run_parallel(
+    *,
+    runbook: Runbook,
+    cfg: Any,
+    deps: RuntimeDependencies,
+    audit: bool,
+    max_parallel: int,
+) -> RunbookResult:
+    """
+    Parallel counterpart of run() (see its docstring for the contract).
+
+    Steps are submitted to a pool of max_parallel workers. A done-callback
+    cancels not-yet-started steps after the lowest failed index seen so far.
+    The main thread then resolves futures in declared order and emits the
+    same lifecycle events the sequential loop would.
+    """
+    steps_total = len(runbook.steps)
+    projection = RunbookMetadataProjection(runbook_id=runbook.runbook_id)
+    runbook_start_ns = _time.monotonic_ns()
+
+    projection.events.append(RunbookLifecycleEvent(
+        event="runbook_started",
+        runbook_id=runbook.runbook_id,
+        steps_total=steps_total,
+    ))
+
+    futures: List[Future] = []
+    lock = threading.Lock()
+    first_failed: Dict[str, int] = {"index": steps_total}
+
+    def _on_done(index: int, fut: Future) -> None:
+        if fut.cancelled() or fut.result().success:
+            return
+        with lock:
+            if index >= first_failed["index"]:
+                return
+            first_failed["index"] = index
+            pending = futures[index + 1:]
+        for later in pending:
+            later.cancel()
+
+    outcomes: List[RunbookStepOutcome] = []
+    failed: Optional[Tuple[int, _StepRun]] = None
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_parallel, steps_total),
+        thread_name_prefix="io3-runbook",
+    ) as pool:
+        for task_spec in runbook.steps:
+            futures.append(pool.submit(
+                _run_step, task_spec=task_spec, cfg=cfg, deps=deps, audit=audit,
+            ))
+        # Callbacks are attached once the full future list exists; a step that
+        # already finished runs its callback immediately.
+        for i, fut in enumerate(futures):
+            fut.add_done_callback(functools.partial(_on_done, i))
+
+        for i, (task_spec, fut) in enumerate(zip(runbook.steps, futures)):
+            # A step is only cancelled once an earlier step has failed, so the
+            # loop always stops at that failure before reaching it.
+            step = fut.result()
+
+            projection.events.append(RunbookLifecycleEvent(
+                event="runbook_step_started",
+                runbook_id=runbook.runbook_id,
+                steps_total=steps_total,
+                task_spec_id=task_spec.task_spec_id,
+                step_index=i,
+            ))
+
+            outcomes.append(RunbookStepOutcome(
+                step_index=i,
+                task_spec_id=task_spec.task_spec_id,
+                state=step.state,
+                result=step.result,
+                success=step.success,
+                failure=step.failure,
+            ))
+
+            if not step.success:
+                failed = (i, step)
+                for later in futures[i + 1:]:
+                    later.cancel()
+                break
+
+            projection.events.append(RunbookLifecycleEvent(
+                event="runbook_step_completed",
+                runbook_id=runbook.runbook_id,
+                steps_total=steps_total,
+                task_spec_id=task_spec.task_spec_id,
+                step_index=i,
+                request_id=step.state.request_id,
+                duration_ms=step.duration_ms,
+            ))
+
+    if failed is not None:
+        i, step = failed
+        failure = step.failure
+        task_spec = runbook.steps[i]
+
+        projection.events.append(RunbookLifecycleEvent(
+            event="runbook_step_failed",
+            runbook_id=runbook.runbook_id,
+            steps_total=steps_total,
+            task_spec_id=task_spec.task_spec_id,
+            step_index=i,
+            request_id=failure.request_id if failure is not None else None,
+            terminated_early=True,
+            failed_step_index=i,
+            duration_ms=step.duration_ms,
+            failure_kind=failure.kind.value if failure is not None else None,
+            failure_code=failure.code if failure is not None else None,
+        ))
+        projection.events.append(RunbookLifecycleEvent(
+            event="runbook_terminated",
+            runbook_id=runbook.runbook_id,
+            steps_total=steps_total,
+            terminated_early=True,
+            failed_step_index=i,
+            total_duration_ms=_elapsed_ms(runbook_start_ns),
+            failure_kind=failure.kind.value if failure is not None else None,
+            failure_code=failure.code if failure is not None else None,
+        ))
+        return RunbookResult(
+            runbook_id=runbook.runbook_id,
+            step_outcomes=outcomes,
+            steps_completed=i,
+            failed_step_index=i,
+            terminated_early=True,
+            metadata=projection,
+        )
+
+    projection.events.append(RunbookLifecycleEvent(
+        event="runbook_completed",
+        runbook_id=runbook.runbook_id,
+        steps_total=steps_total,
+        terminated_early=False,
+        total_duration_ms=_elapsed_ms(runbook_start_ns),
+    ))
+    return RunbookResult(
+        runbook_id=runbook.runbook_id,
+        step_outcomes=outcomes,
+        steps_completed=steps_total,
+        failed_step_index=None,
+        terminated_early=False,
+        metadata=projection,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Conditional branch support (Phase 8 M8.5)
 # ---------------------------------------------------------------------------
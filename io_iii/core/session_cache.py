@@ -0,0 +1,461 @@
+"""
+io_iii.core.session_cache — Hot DialogueSession cache for the API process.
+
+Every session request used to pay load_session (read, parse and validate the
+whole session file) and save_session (json.dumps(indent=2) plus an atomic
+rewrite), often more than once per turn on the error and pause branches.
+The HTTP API is a long-lived process and the only writer of its session
+store, so it can keep live DialogueSession objects in memory instead:
+
+- get() serves the cached object. A clean entry is revalidated with a
+  stat() of the session header and journal and reloaded only when another
+  process changed them.
+- save() takes a content-safe snapshot of the session (the session
+  document, built in memory) and persists it according to the durability
+  mode; a write appends only the turns added since the last write:
+
+    sync          write the snapshot before save() returns (default)
+    write_behind  queue the snapshot; a background thread writes the latest
+                  snapshot per session every flush_interval_seconds, so
+                  several saves between flushes cost one write. A crash can
+                  lose at most one interval of session updates.
+
+- hold(session_id) serialises work on one session (a turn mutates the
+  shared object); different sessions proceed in parallel. Per-session
+  locks are reference-counted and dropped once nobody holds or waits for
+  them, so unknown session ids leave nothing behind.
+- At most max_sessions are kept (LRU); a pending snapshot is written before
+  its entry is evicted. close() / interpreter exit flush everything.
+  evict(session_id) does the same for one session on demand (session gc).
+- Snapshots of one session reach disk in save order (pop and write happen
+  under one I/O lock), and a failed write keeps its snapshot pending.
+
+Configuration (runtime.yaml; absent block = no cache, direct file I/O)::
+
+    session_cache:
+      enabled: true
+      durability: write_behind     # sync | write_behind
+      flush_interval_seconds: 1.0
+      max_sessions: 256
+
+The CLI and the API resolve the cache through load_session_cached /
+save_session_cached / hold_session, which fall back to plain
+load_session / save_session when the block is absent.
+
+Content policy (ADR-003): cached objects and snapshots are the same
+structural records that are persisted; no prompt or output content.
+"""
+from __future__ import annotations
+
+import atexit
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from io_iii.core.dialogue_session import (
+    DialogueSession,
+    _journal_file,
+    _serialise_session,
+    _session_file,
+    _write_session_data,
+    load_session,
+    save_session,
+)
+
+DURABILITY_SYNC = "sync"
+DURABILITY_WRITE_BEHIND = "write_behind"
+_DURABILITY_MODES = (DURABILITY_SYNC, DURABILITY_WRITE_BEHIND)
+
+
+@dataclass(frozen=True)
+class SessionCacheSettings:
+    """Parsed ``session_cache`` block from runtime.yaml."""
+    durability: str = DURABILITY_SYNC
+    flush_interval_seconds: float = 1.0
+    max_sessions: int = 256
+
+
+def load_session_cache_settings(runtime_config: Optional[Dict[str, Any]]) -> Optional[SessionCacheSettings]:
+    """
+    Load SessionCacheSettings from a runtime config dict.
+
+    Returns None when the block is absent, false, or has enabled: false.
+    ``session_cache: true`` enables it with defaults.
+
+    Raises:
+        ValueError('SESSION_CACHE_CONFIG_INVALID: ...') on a malformed block.
+    """
+    raw = (runtime_config or {}).get("session_cache")
+    if raw is None or raw is False:
+        return None
+    if raw is True:
+        return SessionCacheSettings()
+    if not isinstance(raw, dict):
+        raise ValueError("SESSION_CACHE_CONFIG_INVALID: session_cache must be a mapping or boolean")
+
+    enabled = raw.get("enabled", True)
+    if not isinstance(enabled, bool):
+        raise ValueError("SESSION_CACHE_CONFIG_INVALID: enabled must be a boolean")
+    if not enabled:
+        return None
+
+    defaults = SessionCacheSettings()
+    durability = raw.get("durability", defaults.durability)
+    if durability not in _DURABILITY_MODES:
+        raise ValueError(
+            f"SESSION_CACHE_CONFIG_INVALID: durability must be one of {list(_DURABILITY_MODES)}"
+        )
+
+    interval = raw.get("flush_interval_seconds", defaults.flush_interval_seconds)
+    if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0:
+        raise ValueError("SESSION_CACHE_CONFIG_INVALID: flush_interval_seconds must be a number > 0")
+
+    max_sessions = raw.get("max_sessions", defaults.max_sessions)
+    if isinstance(max_sessions, bool) or not isinstance(max_sessions, int) or max_sessions < 1:
+        raise ValueError("SESSION_CACHE_CONFIG_INVALID: max_sessions must be an integer >= 1")
+
+    return SessionCacheSettings(
+        durability=durability,
+        flush_interval_seconds=float(interval),
+        max_sessions=max_sessions,
+    )
+
+
+def _file_sig(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _store_sig(storage_root: Path, session_id: str) -> Tuple[Any, Any]:
+    return (
+        _file_sig(_session_file(storage_root, session_id)),
+        _file_sig(_journal_file(storage_root, session_id)),
+    )
+
+
+class SessionCache:
+    """Live DialogueSession objects for one storage root."""
+
+    def __init__(self, storage_root: Path | str, settings: SessionCacheSettings) -> None:
+        self.storage_root = Path(storage_root)
+        self.settings = settings
+        self._lock = threading.Lock()
+        # session_id -> (session, store signature after our last load/write)
+        self._entries: "OrderedDict[str, Tuple[DialogueSession, Any]]" = OrderedDict()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._session_locks: Dict[str, List[Any]] = {}  # session_id -> [rlock, users]
+        self._io_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.writes = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    # -- locking -------------------------------------------------------------
+
+    @contextmanager
+    def hold(self, session_id: str) -> Iterator[None]:
+        """Hold the per-session re-entrant lock across load → turn → save."""
+        with self._lock:
+            entry = self._session_locks.get(session_id)
+            if entry is None:
+                entry = self._session_locks[session_id] = [threading.RLock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._session_locks[session_id]
+
+    # -- read path -----------------------------------------------------------
+
+    def get(self, session_id: str) -> DialogueSession:
+        """
+        Return the live session, loading it on a miss.
+
+        Raises the same ValueError codes as load_session.
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None:
+                session, sig = entry
+                if session_id in self._pending or _store_sig(self.storage_root, session_id) == sig:
+                    self._entries.move_to_end(session_id)
+                    self.hits += 1
+                    return session
+                self.reloads += 1
+            else:
+                self.misses += 1
+
+        session = load_session(session_id, self.storage_root)
+        self._insert(session, _store_sig(self.storage_root, session_id))
+        return session
+
+    def _insert(self, session: DialogueSession, sig: Any) -> None:
+        with self._lock:
+            self._entries[session.session_id] = (session, sig)
+            self._entries.move_to_end(session.session_id)
+            excess = len(self._entries) - self.settings.max_sessions
+            victims = list(self._entries)[:excess] if excess > 0 else []
+        for sid in victims:
+            self._evict(sid)
+
+    def _evict(self, session_id: str) -> None:
+        """
+        Write the pending snapshot of *session_id*, then drop its entry.
+
+        If the write fails the entry and its snapshot stay cached and the
+        flusher retries; the cache may exceed max_sessions until then.
+        """
+        with self._io_lock:
+            try:
+                self._write_pending(session_id)
+            except ValueError:
+                return
+            with self._lock:
+                if (
+                    len(self._entries) > self.settings.max_sessions
+                    and session_id not in self._pending
+                    and self._entries.pop(session_id, None) is not None
+                ):
+                    self.evictions += 1
+
+    # -- write path ----------------------------------------------------------
+
+    def save(self, session: DialogueSession) -> Path:
+        """Persist *session* per the durability mode; returns its file path."""
+        data = _serialise_session(session)
+        sid = session.session_id
+        with self._lock:
+            entry = self._entries.get(sid)
+            sig = entry[1] if entry is not None else None
+            if self.settings.durability == DURABILITY_WRITE_BEHIND:
+                if sid in self._pending:
+                    self.coalesced += 1
+                self._pending[sid] = data
+        self._insert(session, sig)
+        if self.settings.durability == DURABILITY_SYNC:
+            return self._write(data)
+        self._ensure_flusher()
+        return _session_file(self.storage_root, sid)
+
+    def _write(self, data: Dict[str, Any]) -> Path:
+        with self._io_lock:
+            return self._persist(data)
+
+    def _persist(self, data: Dict[str, Any]) -> Path:
+        # Caller holds _io_lock.
+        sid = data["session_id"]
+        path = _write_session_data(data, self.storage_root)
+        sig = _store_sig(self.storage_root, sid)
+        with self._lock:
+            self.writes += 1
+            entry = self._entries.get(sid)
+            if entry is not None and sid not in self._pending:
+                self._entries[sid] = (entry[0], sig)
+        return path
+
+    def _write_pending(self, session_id: str) -> bool:
+        """
+        Pop and write the pending snapshot of *session_id* (caller holds _io_lock).
+
+        Popping and writing under the one I/O lock keeps snapshots of a
+        session on disk in save order: an older snapshot can never land
+        after a newer one. On failure the snapshot is put back unless a
+        newer save has queued another, and the error propagates.
+        """
+        with self._lock:
+            data = self._pending.pop(session_id, None)
+        if data is None:
+            return False
+        try:
+            self._persist(data)
+        except ValueError:
+            with self._lock:
+                self._pending.setdefault(session_id, data)
+            raise
+        return True
+
+    def evict(self, session_id: str) -> None:
+        """
+        Write the pending snapshot of *session_id* and drop it from the cache.
+
+        Used before the session files are moved or deleted (``session gc``);
+        call it while holding hold(session_id). Raises SESSION_PERSIST_FAILED
+        (the entry and snapshot are then kept).
+        """
+        with self._io_lock:
+            self._write_pending(session_id)
+            with self._lock:
+                self._entries.pop(session_id, None)
+
+    def flush(self) -> int:
+        """
+        Write every pending snapshot now; returns the number written.
+
+        A failed write keeps its snapshot pending; the first
+        SESSION_PERSIST_FAILED is raised once the other sessions are written.
+        """
+        with self._lock:
+            session_ids = list(self._pending)
+        written = 0
+        failure: Optional[ValueError] = None
+        for sid in session_ids:
+            try:
+                with self._io_lock:
+                    if self._write_pending(sid):
+                        written += 1
+            except ValueError as exc:
+                failure = failure or exc
+        if failure is not None:
+            raise failure
+        return written
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is None and not self._stop.is_set():
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="io3-session-flush", daemon=True,
+                )
+                self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.settings.flush_interval_seconds):
+            try:
+                self.flush()
+            except ValueError:
+                pass  # SESSION_PERSIST_FAILED: snapshot kept, retried next interval
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Content-safe counters."""
+        with self._lock:
+            return {
+                "durability": self.settings.durability,
+                "sessions": len(self._entries),
+                "pending": len(self._pending),
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "writes": self.writes,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+            }
+
+    def close(self) -> None:
+        """Stop the flusher and write everything still pending."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join(2.0)
+        self.flush()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide caches (one per storage root)
+# ---------------------------------------------------------------------------
+
+_caches_lock = threading.Lock()
+_caches: Dict[str, SessionCache] = {}
+
+
+def get_session_cache(storage_root: Path | str, settings: SessionCacheSettings) -> SessionCache:
+    """
+    Return the shared cache for *storage_root*, creating it on first use.
+
+    A call with different settings flushes and replaces the cache.
+    """
+    key = str(Path(storage_root).resolve())
+    with _caches_lock:
+        old = _caches.get(key)
+        if old is not None and old.settings == settings:
+            return old
+        cache = _caches[key] = SessionCache(storage_root, settings)
+    if old is not None:
+        old.close()
+    return cache
+
+
+def session_cache_for(
+    runtime_config: Optional[Dict[str, Any]],
+    storage_root: Path | str,
+) -> Optional[SessionCache]:
+    """
+    The cache for *storage_root* under *runtime_config*, or None when disabled.
+
+    Disabling the block flushes and drops an existing cache for that root.
+    """
+    settings = load_session_cache_settings(runtime_config)
+    if settings is not None:
+        return get_session_cache(storage_root, settings)
+    key = str(Path(storage_root).resolve())
+    with _caches_lock:
+        old = _caches.pop(key, None)
+    if old is not None:
+        old.close()
+    return None
+
+
+def close_session_caches() -> None:
+    """Flush and forget every cache (shutdown / test isolation)."""
+    with _caches_lock:
+        caches = list(_caches.values())
+        _caches.clear()
+    for cache in caches:
+        cache.close()
+
+
+atexit.register(close_session_caches)
+
+
+def load_session_cached(
+    session_id: str,
+    storage_root: Path | str,
+    runtime_config: Optional[Dict[str, Any]],
+) -> DialogueSession:
+    """load_session through the cache when ``session_cache`` is enabled."""
+    cache = session_cache_for(runtime_config, storage_root)
+    if cache is None:
+        return load_session(session_id, storage_root)
+    return cache.get(session_id)
+
+
+def save_session_cached(
+    session: DialogueSession,
+    storage_root: Path | str,
+    runtime_config: Optional[Dict[str, Any]],
+) -> Path:
+    """save_session through the cache when ``session_cache`` is enabled."""
+    cache = session_cache_for(runtime_config, storage_root)
+    if cache is None:
+        return save_session(session, storage_root)
+    return cache.save(session)
+
+
+@contextmanager
+def hold_session(
+    session_id: str,
+    storage_root: Path | str,
+    runtime_config: Optional[Dict[str, Any]],
+) -> Iterator[None]:
+    """Hold the cache's per-session lock (no-op when the cache is disabled)."""
+    cache = session_cache_for(runtime_config, storage_root)
+    if cache is None:
+        yield
+        return
+    with cache.hold(session_id):
+        yield
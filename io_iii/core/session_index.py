@@ -0,0 +1,424 @@
+"""
+io_iii.core.session_index — SQLite catalogue of stored dialogue sessions.
+
+Listing sessions used to glob ``*.session.json`` and parse every file. The
+index keeps one row per session in ``<storage_root>/sessions.index.db``:
+
+    session_id, status, session_mode, turn_count, max_turns,
+    created_at, updated_at
+
+- save_session upserts the row in its own transaction after the session
+  files are written; the files stay the source of truth.
+- A missing (or half-built) index is rebuilt from the session files on
+  first use, so existing stores and stores written by older versions are
+  picked up. rebuild() does the same on demand (``session list --reindex``).
+- query() serves filtered (status, mode, updated_before), sorted and
+  paginated listings from indexed columns.
+- archive_closed_sessions() moves closed sessions into
+  ``<storage_root>/archive/`` and drops their rows in one transaction
+  (``session gc``).
+
+If an index write fails the index file is discarded and rebuilt on next
+use; the save itself is unaffected.
+
+Content policy (ADR-003): rows hold the same structural fields as
+session_status_summary; no prompt or output content.
+
+Concurrency: one connection per storage root, shared across threads behind
+a lock, WAL mode (same pattern as memory.store.SQLiteBackend). Several
+processes may write the same index; SQLite serialises the transactions.
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+SESSION_INDEX_FILENAME = "sessions.index.db"
+_HEADER_SUFFIX = ".session.json"
+SESSION_ARCHIVE_DIRNAME = "archive"
+
+SESSION_INDEX_COLUMNS: Tuple[str, ...] = (
+    "session_id", "status", "session_mode", "turn_count", "max_turns",
+    "created_at", "updated_at",
+)
+SESSION_SORT_KEYS: Tuple[str, ...] = (
+    "session_id", "status", "session_mode", "turn_count", "created_at", "updated_at",
+)
+SESSION_QUERY_MAX_LIMIT = 1000
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id   TEXT PRIMARY KEY,
+        status       TEXT NOT NULL,
+        session_mode TEXT NOT NULL,
+        turn_count   INTEGER NOT NULL,
+        max_turns    INTEGER NOT NULL,
+        created_at   TEXT NOT NULL,
+        updated_at   TEXT NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS sessions_status_updated ON sessions (status, updated_at)",
+    "CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated_at)",
+    "CREATE INDEX IF NOT EXISTS sessions_created ON sessions (created_at)",
+    "CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO sessions "
+    "(session_id, status, session_mode, turn_count, max_turns, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+@dataclass(frozen=True)
+class SessionPage:
+    """One page of query() results; rows are content-safe summary dicts."""
+    sessions: List[Dict[str, Any]]
+    total: int
+    limit: int
+    offset: int
+
+
+def _row(data: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(data[c] for c in SESSION_INDEX_COLUMNS)
+
+
+class SessionIndex:
+    """Session catalogue for one storage root."""
+
+    def __init__(self, storage_root: Path | str) -> None:
+        self.storage_root = Path(storage_root)
+        self.path = self.storage_root / SESSION_INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # -- connection ----------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.storage_root.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                for stmt in _SCHEMA:
+                    conn.execute(stmt)
+                built = conn.execute("SELECT 1 FROM index_meta WHERE key = 'built'").fetchone()
+                if built is None:
+                    self._rebuild(conn)
+            except BaseException:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def discard(self) -> None:
+        """Drop the index file (and WAL); the next use rebuilds it."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.unlink(f"{self.path}{suffix}")
+                except OSError:
+                    pass
+
+    def _transaction(self, conn: sqlite3.Connection, fn) -> None:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            fn(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # -- writes --------------------------------------------------------------
+
+    def record(self, data: Dict[str, Any]) -> None:
+        """Upsert the row for a serialised session (one transaction)."""
+        with self._lock:
+            conn = self._connection()
+            self._transaction(conn, lambda c: c.execute(_UPSERT, _row(data)))
+
+    def remove(self, session_ids: Iterable[str]) -> None:
+        rows = [(sid,) for sid in session_ids]
+        with self._lock:
+            conn = self._connection()
+            self._transaction(conn, lambda c: c.executemany("DELETE FROM sessions WHERE session_id = ?", rows))
+
+    def rebuild(self) -> int:
+        """Re-read every session file in the storage root; returns the row count."""
+        with self._lock:
+            return self._rebuild(self._connection())
+
+    def _headers(self) -> List[str]:
+        return sorted(p.name[: -len(_HEADER_SUFFIX)] for p in self.storage_root.glob(f"*{_HEADER_SUFFIX}"))
+
+    def _load_rows(self, session_ids: Iterable[str]) -> List[Tuple[Any, ...]]:
+        from io_iii.core.dialogue_session import load_session, session_status_summary
+
+        rows = []
+        for sid in session_ids:
+            try:
+                rows.append(_row(session_status_summary(load_session(sid, self.storage_root))))
+            except ValueError:
+                continue  # unreadable session files stay out of the catalogue
+        return rows
+
+    def _rebuild(self, conn: sqlite3.Connection) -> int:
+        rows = self._load_rows(self._headers())
+
+        def _fill(c: sqlite3.Connection) -> None:
+            c.execute("DELETE FROM sessions")
+            c.executemany(_UPSERT, rows)
+            c.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES ('built', '1')")
+
+        self._transaction(conn, _fill)
+        return len(rows)
+
+    # -- reads ---------------------------------------------------------------
+
+    def query(
+        self,
+        *,
+        status: Union[None, str, Sequence[str]] = None,
+        session_mode: Optional[str] = None,
+        updated_before: Optional[str] = None,
+        order_by: str = "updated_at",
+        descending: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> SessionPage:
+        """
+        Filtered, sorted page of sessions.
+
+        Raises:
+            ValueError('SESSION_QUERY_INVALID: ...') on an unknown sort key
+            or an out-of-range limit / offset.
+        """
+        if order_by not in SESSION_SORT_KEYS:
+            raise ValueError(f"SESSION_QUERY_INVALID: order_by must be one of {list(SESSION_SORT_KEYS)}")
+        if isinstance(limit, bool) or not isinstance(limit, int) or not 1 <= limit <= SESSION_QUERY_MAX_LIMIT:
+            raise ValueError(f"SESSION_QUERY_INVALID: limit must be an integer in 1..{SESSION_QUERY_MAX_LIMIT}")
+        if isinstance(offset, bool) or not isinstance(offset, int) or offset < 0:
+            raise ValueError("SESSION_QUERY_INVALID: offset must be an integer >= 0")
+
+        where: List[str] = []
+        params: List[Any] = []
+        if status is not None:
+            statuses = [status] if isinstance(status, str) else list(status)
+            where.append(f"status IN ({','.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if session_mode is not None:
+            where.append("session_mode = ?")
+            params.append(session_mode)
+        if updated_before is not None:
+            where.append("updated_at < ?")
+            params.append(updated_before)
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        direction = "DESC" if descending else "ASC"
+        tiebreak = "" if order_by == "session_id" else f", session_id {direction}"
+
+        with self._lock:
+            conn = self._connection()
+            total = conn.execute(f"SELECT COUNT(*) FROM sessions{clause}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {', '.join(SESSION_INDEX_COLUMNS)} FROM sessions{clause} "
+                f"ORDER BY {order_by} {direction}{tiebreak} LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+        sessions = []
+        for row in rows:
+            item = dict(zip(SESSION_INDEX_COLUMNS, row))
+            item["turns_remaining"] = max(0, item["max_turns"] - item["turn_count"])
+            sessions.append(item)
+        return SessionPage(sessions=sessions, total=total, limit=limit, offset=offset)
+
+    def session_ids(self) -> List[str]:
+        """
+        Sorted IDs of the indexed sessions, reconciled with the session files.
+
+        Rows whose header file is gone (deleted outside the app) are dropped
+        and headers the index has not seen (copied in) are added, so a
+        listing never waits for a rebuild. Only the new headers are parsed.
+        """
+        on_disk = set(self._headers())
+        with self._lock:
+            conn = self._connection()
+            indexed = {sid for (sid,) in conn.execute("SELECT session_id FROM sessions")}
+            stale = [
+                (sid,) for sid in indexed - on_disk
+                if not (self.storage_root / f"{sid}{_HEADER_SUFFIX}").exists()  # not saved meanwhile
+            ]
+            added = self._load_rows(sorted(on_disk - indexed))
+
+            def _sync(c: sqlite3.Connection) -> None:
+                c.executemany("DELETE FROM sessions WHERE session_id = ?", stale)
+                c.executemany(_UPSERT, added)
+
+            if stale or added:
+                self._transaction(conn, _sync)
+        return sorted((indexed - {sid for (sid,) in stale}) | {row[0] for row in added})
+
+
+# ---------------------------------------------------------------------------
+# Process-wide indexes (one per storage root)
+# ---------------------------------------------------------------------------
+
+_MAX_OPEN_INDEXES = 16
+
+_indexes_lock = threading.Lock()
+_indexes: "OrderedDict[str, SessionIndex]" = OrderedDict()
+
+
+def get_session_index(storage_root: Path | str) -> SessionIndex:
+    """
+    Return the shared index for *storage_root*, creating it on first use.
+
+    At most _MAX_OPEN_INDEXES connections stay open; the least recently
+    used index is closed (it reconnects if still referenced).
+    """
+    key = str(Path(storage_root).resolve())
+    evicted: List[SessionIndex] = []
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = SessionIndex(storage_root)
+        _indexes.move_to_end(key)
+        while len(_indexes) > _MAX_OPEN_INDEXES:
+            evicted.append(_indexes.popitem(last=False)[1])
+    for old in evicted:
+        old.close()
+    return index
+
+
+def close_session_indexes() -> None:
+    """Close every index connection (shutdown / test isolation)."""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+        _indexes.clear()
+    for index in indexes:
+        index.close()
+
+
+atexit.register(close_session_indexes)
+
+
+def index_session(data: Dict[str, Any], storage_root: Path | str) -> None:
+    """
+    Record a serialised session in the index of *storage_root*.
+
+    Never raises: a failed index write discards the index so that the next
+    use rebuilds it from the session files.
+    """
+    index = get_session_index(storage_root)
+    try:
+        index.record(data)
+    except sqlite3.Error:
+        index.discard()
+
+
+def query_sessions(storage_root: Path | str, **filters: Any) -> SessionPage:
+    """SessionIndex.query for *storage_root*; an absent root yields an empty page."""
+    if not Path(storage_root).is_dir():
+        return SessionPage(sessions=[], total=0, limit=filters.get("limit", 50), offset=filters.get("offset", 0))
+    return get_session_index(storage_root).query(**filters)
+
+
+def archive_closed_sessions(
+    storage_root: Path | str,
+    *,
+    updated_before: Optional[str] = None,
+    limit: Optional[int] = None,
+    dry_run: bool = False,
+    runtime_config: Optional[Dict[str, Any]] = None,
+) -> List[str]:
+    """
+    Move closed sessions into ``<storage_root>/archive/`` (``session gc``).
+
+    Selects closed sessions from the index (optionally last updated before
+    *updated_before*, an ISO 8601 UTC timestamp; at most *limit*), moves
+    their header and journal files, then removes their rows in one
+    transaction. Returns the archived session IDs, oldest first.
+
+    When *runtime_config* enables the session cache, each session is moved
+    under the cache's per-session lock, after its pending write-behind
+    snapshot is written and its entry evicted, so no cached write can land
+    after the move. A session that is no longer closed by then is skipped.
+    The lock is per process: another process serving the same store is
+    not excluded.
+
+    Raises:
+        ValueError('SESSION_GC_FAILED: ...') when a file cannot be moved or a
+        pending snapshot cannot be written; sessions moved before the failure
+        are still removed from the index.
+    """
+    from io_iii.core.dialogue_session import (
+        SESSION_STATUS_CLOSED,
+        _journal_file,
+        _session_file,
+        load_session,
+    )
+    from io_iii.core.session_cache import session_cache_for
+
+    root = Path(storage_root)
+    if not root.is_dir():
+        return []
+    index = get_session_index(root)
+
+    selected: List[str] = []
+    offset = 0
+    while limit is None or len(selected) < limit:
+        page = index.query(
+            status=SESSION_STATUS_CLOSED, updated_before=updated_before,
+            order_by="updated_at", descending=False,
+            limit=SESSION_QUERY_MAX_LIMIT, offset=offset,
+        )
+        selected.extend(row["session_id"] for row in page.sessions)
+        offset += len(page.sessions)
+        if offset >= page.total or not page.sessions:
+            break
+    if limit is not None:
+        selected = selected[:limit]
+    if dry_run or not selected:
+        return selected
+
+    cache = session_cache_for(runtime_config, root) if runtime_config is not None else None
+    archive = root / SESSION_ARCHIVE_DIRNAME
+    archived: List[str] = []
+    try:
+        archive.mkdir(exist_ok=True)
+        for sid in selected:
+            with cache.hold(sid) if cache is not None else nullcontext():
+                if cache is not None:
+                    cache.evict(sid)
+                    try:
+                        if load_session(sid, root).status != SESSION_STATUS_CLOSED:
+                            continue
+                    except ValueError:
+                        continue
+                for src in (_journal_file(root, sid), _session_file(root, sid)):
+                    if src.exists():
+                        os.replace(src, archive / src.name)
+            archived.append(sid)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"SESSION_GC_FAILED: {e}") from e
+    finally:
+        if archived:
+            index.remove(archived)
+    return archived
@@ -20,19 +20,39 @@ class ExecutionMetrics:
         output_tokens   token count of provider response; None if unavailable
         latency_ms      total execution duration in milliseconds
         model_used      resolved model identifier from routing; None for null route
+        pool_hits       provider calls served on a reused keep-alive connection;
+                        None when the provider does not use the connection pool
+        pool_misses     provider calls that opened a new connection; None when
+                        the provider does not use the connection pool
+        cache_hit       True when the executor draft was served from the
+                        response cache (no provider call); None when the
+                        response cache is not enabled for the run's mode
     """
     call_count: int
     input_tokens: int
     output_tokens: Optional[int]
     latency_ms: int
     model_used: Optional[str]
+    pool_hits: Optional[int] = None
+    pool_misses: Optional[int] = None
+    cache_hit: Optional[bool] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Content-safe projection for metadata.jsonl (ADR-003)."""
-        return {
+        """Content-safe projection for metadata.jsonl (ADR-003).
+
+        Pool counters are included only when the run used the pooled transport;
+        cache_hit only when the response cache was enabled for the run.
+        """
+        d: Dict[str, Any] = {
             "call_count": self.call_count,
             "input_tokens": self.input_tokens,
             "output_tokens": self.output_tokens,
             "latency_ms": self.latency_ms,
             "model_used": self.model_used,
         }
+        if self.pool_hits is not None or self.pool_misses is not None:
+            d["pool_hits"] = self.pool_hits
+            d["pool_misses"] = self.pool_misses
+        if self.cache_hit is not None:
+            d["cache_hit"] = self.cache_hit
+        return d
@@ -3,20 +3,32 @@ io_iii.memory — Phase 6 governed memory subsystem (ADR-022).
 
 Public surface:
     MemoryRecord      — atomic, scoped, versioned memory record       (M6.1)
-    MemoryStore       — local file-backed store; deterministic lookup  (M6.1)
+    MemoryStore       — local store; deterministic lookup              (M6.1)
+    DirectoryBackend / SQLiteBackend — MemoryStore storage backends
     MemoryPack        — named, versioned collection of record keys     (M6.2)
     PackLoader        — loads and resolves packs from config           (M6.2)
     RetrievalPolicy   — evaluates route / capability / sensitivity     (M6.3)
     load_retrieval_policy — load policy from config file              (M6.3)
     NULL_POLICY       — safe-default when no policy file is present   (M6.3)
 """
-from io_iii.memory.store import MemoryRecord, MemoryStore
+from io_iii.memory.store import (
+    DirectoryBackend,
+    MemoryBackend,
+    MemoryRecord,
+    MemoryStore,
+    SQLiteBackend,
+    migrate_directory_store,
+)
 from io_iii.memory.packs import MemoryPack, PackLoader
 from io_iii.memory.policy import RetrievalPolicy, NULL_POLICY, load_retrieval_policy
 
 __all__ = [
     "MemoryRecord",
     "MemoryStore",
+    "MemoryBackend",
+    "DirectoryBackend",
+    "SQLiteBackend",
+    "migrate_directory_store",
     "MemoryPack",
     "PackLoader",
     "RetrievalPolicy",
@@ -20,12 +20,16 @@ content-safe and may be logged or persisted.
 """
 from __future__ import annotations
 
+import os
+import threading
+import time
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from io_iii.memory.packs import PackLoader
-from io_iii.memory.policy import RetrievalPolicy
-from io_iii.memory.store import MemoryRecord, MemoryStore
+from io_iii.memory.policy import RetrievalPolicy, load_retrieval_policy
+from io_iii.memory.store import MemoryRecord, MemoryStore, get_backend, store_generation
 
 
 # ---------------------------------------------------------------------------
@@ -151,3 +155,103 @@ def load_session_memory(
     )
 
     return filtered, ctx
+
+
+# ---------------------------------------------------------------------------
+# Resolved-pack cache (steady-state turns do no memory I/O)
+# ---------------------------------------------------------------------------
+#
+# Keyed by (config_dir, pack_id, route). An entry is reused while:
+#   - memory_packs.yaml and memory_retrieval_policy.yaml are unchanged (stat),
+#   - no in-process MemoryStore.put touched the storage root (store_generation),
+#   - the backend change stamp is unchanged (catches writes by other processes).
+# Entries whose stamps are younger than _RACY_WINDOW_NS are not stored, so a
+# second write inside the same timestamp tick cannot be missed.
+
+_RACY_WINDOW_NS = 2_000_000_000
+
+_cache_lock = threading.Lock()
+_cache: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _store_stamp(storage_root: str, scope: Optional[str]) -> Tuple[Any, ...]:
+    change = get_backend(storage_root).change_stamp(scope) if scope else None
+    return store_generation(storage_root), change
+
+
+def _newest_mtime_ns(stamp: Any) -> int:
+    """Largest mtime_ns in a nested stamp (leaf stats are int tuples, mtime first)."""
+    if not isinstance(stamp, tuple):
+        return 0
+    if stamp and all(isinstance(v, int) for v in stamp) and len(stamp) > 1:
+        return stamp[0]
+    return max((_newest_mtime_ns(part) for part in stamp), default=0)
+
+
+def load_session_memory_cached(
+    *,
+    config_dir: Path,
+    pack_id: str = SESSION_CONTINUITY_PACK_ID,
+    route: str = "executor",
+) -> Tuple[List[MemoryRecord], Optional[SessionMemoryContext]]:
+    """
+    load_session_memory() for the config in *config_dir*, cached in-process.
+
+    Builds PackLoader, RetrievalPolicy and MemoryStore only on a miss. Same
+    return contract as load_session_memory(); the records list is a fresh
+    copy on every call.
+    """
+    config_dir = Path(config_dir)
+    packs_path = config_dir / "memory_packs.yaml"
+    policy_path = config_dir / "memory_retrieval_policy.yaml"
+    key = (os.path.abspath(config_dir), pack_id, route)
+    cfg_stamp = (_file_stamp(packs_path), _file_stamp(policy_path))
+
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry is not None and entry["cfg_stamp"] == cfg_stamp:
+        if _store_stamp(entry["storage_root"], entry["scope"]) == entry["store_stamp"]:
+            return list(entry["records"]), entry["context"]
+
+    snapshot_ns = time.time_ns()
+    pack_loader = PackLoader(packs_path)
+    policy = load_retrieval_policy(policy_path)
+    storage_root = pack_loader.storage_root
+    pack = pack_loader.get(pack_id)
+    scope = pack.scope if pack is not None else None
+    store_stamp = _store_stamp(storage_root, scope)
+
+    records, context = load_session_memory(
+        pack_id=pack_id,
+        pack_loader=pack_loader,
+        store=MemoryStore(storage_root),
+        policy=policy,
+        route=route,
+    )
+
+    newest = max(_newest_mtime_ns(cfg_stamp), _newest_mtime_ns(store_stamp))
+    if snapshot_ns - newest >= _RACY_WINDOW_NS:
+        with _cache_lock:
+            _cache[key] = {
+                "cfg_stamp": cfg_stamp,
+                "store_stamp": store_stamp,
+                "storage_root": storage_root,
+                "scope": scope,
+                "records": tuple(records),
+                "context": context,
+            }
+    return records, context
+
+
+def clear_session_memory_cache() -> None:
+    """Drop every cached resolved pack."""
+    with _cache_lock:
+        _cache.clear()
@@ -3,7 +3,10 @@ io_iii.memory.store — Phase 6 M6.1 memory store (ADR-022 §2).
 
 Provides:
     MemoryRecord  — atomic, scoped, versioned memory record
-    MemoryStore   — local file-backed store; deterministic key lookup only
+    MemoryStore   — local store; deterministic key lookup only
+    MemoryBackend — storage contract (DirectoryBackend, SQLiteBackend)
+    get_backend   — shared backend per storage root (one SQLite connection)
+    migrate_directory_store — copy a directory-layout store into SQLite
 
 Content policy (ADR-003, ADR-022 §6):
     MemoryRecord.value is CONTENT-PLANE and must never appear in any log field.
@@ -12,12 +15,17 @@ Content policy (ADR-003, ADR-022 §6):
 """
 from __future__ import annotations
 
+import atexit
 import dataclasses
 import json
+import os
 import re
+import sqlite3
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional, Protocol, Sequence, Tuple, runtime_checkable
 
 # ---------------------------------------------------------------------------
 # Sensitivity tiers (ADR-022 §2.1)
@@ -130,19 +138,373 @@ class MemoryRecord:
         return f"{self.scope}/{self.key}"
 
 
+# ---------------------------------------------------------------------------
+# Storage backends
+# ---------------------------------------------------------------------------
+
+def _record_from_json(text: str) -> MemoryRecord:
+    return MemoryRecord(**json.loads(text))
+
+
+@runtime_checkable
+class MemoryBackend(Protocol):
+    """
+    Storage contract behind MemoryStore.
+
+    Implementations must make put / put_many atomic per call, return
+    list_by_scope in record file-name order (key + ".json", the original
+    directory layout order), and never log record values.
+
+    change_stamp(scope) returns a cheap, comparable value that changes
+    whenever records in *scope* may have changed, including writes by other
+    processes. Read-side caches (session continuity) compare it to decide
+    whether to re-read the store.
+    """
+
+    def get(self, scope: str, key: str) -> Optional[MemoryRecord]: ...
+
+    def get_many(self, scope: str, keys: Sequence[str]) -> Dict[str, MemoryRecord]: ...
+
+    def put(self, record: MemoryRecord) -> None: ...
+
+    def put_many(self, records: Iterable[MemoryRecord]) -> None: ...
+
+    def list_by_scope(self, scope: str) -> list[MemoryRecord]: ...
+
+    def exists(self, scope: str, key: str) -> bool: ...
+
+    def change_stamp(self, scope: str) -> Any: ...
+
+
+class DirectoryBackend:
+    """
+    One pretty-printed JSON file per record (the original M6.1 layout).
+
+    Layout: <root>/<scope>/<key>.json. Writes are atomic via temp file +
+    rename (POSIX atomic on the same filesystem).
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def _record_path(self, scope: str, key: str) -> Path:
+        return self.root / scope / f"{key}.json"
+
+    @staticmethod
+    def _serialise(record: MemoryRecord) -> str:
+        return json.dumps(dataclasses.asdict(record), ensure_ascii=False, indent=2)
+
+    def get(self, scope: str, key: str) -> Optional[MemoryRecord]:
+        path = self._record_path(scope, key)
+        if not path.is_file():
+            return None
+        return _record_from_json(path.read_text(encoding="utf-8"))
+
+    def get_many(self, scope: str, keys: Sequence[str]) -> Dict[str, MemoryRecord]:
+        found: Dict[str, MemoryRecord] = {}
+        for key in dict.fromkeys(keys):
+            record = self.get(scope, key)
+            if record is not None:
+                found[key] = record
+        return found
+
+    def put(self, record: MemoryRecord) -> None:
+        path = self._record_path(record.scope, record.key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(self._serialise(record), encoding="utf-8")
+        tmp.replace(path)  # POSIX-atomic rename
+
+    def put_many(self, records: Iterable[MemoryRecord]) -> None:
+        # Atomic per record only; the directory layout has no multi-file transaction.
+        for record in records:
+            self.put(record)
+
+    def list_by_scope(self, scope: str) -> list[MemoryRecord]:
+        scope_dir = self.root / scope
+        if not scope_dir.is_dir():
+            return []
+        return [
+            _record_from_json(p.read_text(encoding="utf-8"))
+            for p in sorted(scope_dir.glob("*.json"))
+        ]
+
+    def exists(self, scope: str, key: str) -> bool:
+        return self._record_path(scope, key).is_file()
+
+    def change_stamp(self, scope: str) -> Optional[Tuple[int, int]]:
+        """
+        Cheap out-of-process change indicator for *scope*.
+
+        Every put renames into the scope directory, which updates its mtime.
+        """
+        try:
+            st = os.stat(self.root / scope)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_ino
+
+    def scopes(self) -> list[str]:
+        """Return every scope directory name, sorted (used by migration)."""
+        if not self.root.is_dir():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+
+_SQLITE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+# Stay below SQLITE_MAX_VARIABLE_NUMBER on older builds (default 999).
+_SQLITE_IN_CHUNK = 500
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory_records (
+    scope  TEXT NOT NULL,
+    key    TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (scope, key)
+) WITHOUT ROWID
+"""
+
+
+class SQLiteBackend:
+    """
+    Single-file SQLite store in WAL mode.
+
+    Records are stored as compact JSON (same fields as the directory layout)
+    keyed by (scope, key). The primary key doubles as the scope index, so
+    list_by_scope is an index scan (sorted by key || '.json' to keep the
+    directory layout's order) and list_by_keys is one IN query per
+    500 keys. Every write is a transaction, which keeps put atomic; WAL lets
+    readers proceed while a write is in progress.
+
+    One connection per backend instance, shared across threads behind a lock.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SQLITE_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, scope: str, key: str) -> Optional[MemoryRecord]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT record FROM memory_records WHERE scope = ? AND key = ?",
+                (scope, key),
+            ).fetchone()
+        return _record_from_json(row[0]) if row else None
+
+    def get_many(self, scope: str, keys: Sequence[str]) -> Dict[str, MemoryRecord]:
+        unique = list(dict.fromkeys(keys))
+        rows: list = []
+        with self._lock:
+            conn = self._connection()
+            for i in range(0, len(unique), _SQLITE_IN_CHUNK):
+                chunk = unique[i:i + _SQLITE_IN_CHUNK]
+                rows.extend(conn.execute(
+                    "SELECT key, record FROM memory_records "
+                    f"WHERE scope = ? AND key IN ({','.join('?' * len(chunk))})",
+                    (scope, *chunk),
+                ).fetchall())
+        return {key: _record_from_json(text) for key, text in rows}
+
+    def put(self, record: MemoryRecord) -> None:
+        self.put_many((record,))
+
+    def put_many(self, records: Iterable[MemoryRecord]) -> None:
+        rows = [
+            (r.scope, r.key, json.dumps(dataclasses.asdict(r), ensure_ascii=False))
+            for r in records
+        ]
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO memory_records (scope, key, record) VALUES (?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def list_by_scope(self, scope: str) -> list[MemoryRecord]:
+        with self._lock:
+            rows = self._connection().execute(
+                # File-name order, as DirectoryBackend lists records:
+                # "a-b.json" sorts before "a.json".
+                "SELECT record FROM memory_records WHERE scope = ? "
+                "ORDER BY key || '.json'",
+                (scope,),
+            ).fetchall()
+        return [_record_from_json(text) for (text,) in rows]
+
+    def change_stamp(self, scope: str) -> Tuple[Optional[Tuple[int, int]], ...]:
+        """
+        Cheap out-of-process change indicator (database + WAL file stats).
+
+        Not scope-specific: any committed write changes the WAL file.
+        """
+        stamps: list[Optional[Tuple[int, int]]] = []
+        for path in (self.path, self.path.with_name(self.path.name + "-wal")):
+            try:
+                st = os.stat(path)
+            except OSError:
+                stamps.append(None)
+                continue
+            stamps.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamps)
+
+    def exists(self, scope: str, key: str) -> bool:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT 1 FROM memory_records WHERE scope = ? AND key = ?",
+                (scope, key),
+            ).fetchone()
+        return row is not None
+
+
+# In-process write counter per storage root. MemoryStore.put bumps it so
+# read-side caches (session continuity) can invalidate without touching disk.
+_generation_lock = threading.Lock()
+_write_generations: Dict[str, int] = {}
+
+
+def store_generation(storage_root: str | Path) -> int:
+    """Return the in-process write generation for *storage_root*."""
+    with _generation_lock:
+        return _write_generations.get(os.path.abspath(storage_root), 0)
+
+
+def _bump_generation(storage_root: str | Path) -> None:
+    key = os.path.abspath(storage_root)
+    with _generation_lock:
+        _write_generations[key] = _write_generations.get(key, 0) + 1
+
+
+def open_backend(storage_root: str | Path) -> MemoryBackend:
+    """
+    Select a backend from the configured storage_root.
+
+    A path ending in .db / .sqlite / .sqlite3 selects SQLiteBackend;
+    anything else is a DirectoryBackend root (the default layout).
+    """
+    path = Path(storage_root)
+    if path.suffix.lower() in _SQLITE_SUFFIXES:
+        return SQLiteBackend(path)
+    return DirectoryBackend(path)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide backends (one per SQLite path)
+# ---------------------------------------------------------------------------
+
+_MAX_OPEN_BACKENDS = 16
+
+_backends_lock = threading.Lock()
+_backends: "OrderedDict[str, SQLiteBackend]" = OrderedDict()
+
+
+def get_backend(storage_root: str | Path) -> MemoryBackend:
+    """
+    Return the shared backend for *storage_root*.
+
+    SQLite stores share one backend (and so one connection) per database
+    file; at most _MAX_OPEN_BACKENDS stay open and the least recently used
+    is closed (it reconnects if still referenced). Directory backends hold
+    no resources and are created per call.
+    """
+    backend = open_backend(storage_root)
+    if not isinstance(backend, SQLiteBackend):
+        return backend
+    key = str(backend.path.resolve())
+    evicted: list[SQLiteBackend] = []
+    with _backends_lock:
+        shared = _backends.get(key)
+        if shared is None:
+            shared = _backends[key] = backend
+        _backends.move_to_end(key)
+        while len(_backends) > _MAX_OPEN_BACKENDS:
+            evicted.append(_backends.popitem(last=False)[1])
+    for old in evicted:
+        old.close()
+    return shared
+
+
+def close_backends() -> None:
+    """Close every shared SQLite connection (shutdown / test isolation)."""
+    with _backends_lock:
+        backends = list(_backends.values())
+        _backends.clear()
+    for backend in backends:
+        backend.close()
+
+
+atexit.register(close_backends)
+
+
+def migrate_directory_store(source_root: str | Path, dest_path: str | Path) -> int:
+    """
+    Copy every record from a directory-layout store into a SQLite store.
+
+    Each scope is written in one transaction. Existing destination records
+    with the same (scope, key) are replaced, so re-running is safe. The
+    source is left untouched. Returns the number of records copied.
+
+    Raises:
+        ValueError: 'MEMORY_MIGRATE_FAILED: ...' if the source is missing or
+            a record file is invalid (nothing from that scope is written).
+    """
+    source = DirectoryBackend(source_root)
+    if not source.root.is_dir():
+        raise ValueError(f"MEMORY_MIGRATE_FAILED: source store not found: {source.root}")
+    dest = SQLiteBackend(dest_path)
+    copied = 0
+    try:
+        for scope in source.scopes():
+            try:
+                records = source.list_by_scope(scope)
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"MEMORY_MIGRATE_FAILED: invalid record in scope '{scope}'") from e
+            dest.put_many(records)
+            copied += len(records)
+    finally:
+        dest.close()
+    return copied
+
+
 # ---------------------------------------------------------------------------
 # MemoryStore (ADR-022 §2.2 / §2.3)
 # ---------------------------------------------------------------------------
 
 class MemoryStore:
     """
-    Local file-backed memory store (ADR-022 §2.2).
+    Local memory store (ADR-022 §2.2).
 
-    Storage layout:
-        <storage_root>/<scope>/<key>.json  — one JSON file per record
+    Storage is pluggable (see open_backend); stores on the same SQLite file
+    share one backend (get_backend), so constructing a MemoryStore per call
+    is cheap:
+        <storage_root>/<scope>/<key>.json  — DirectoryBackend (default)
+        <storage_root>.db                  — SQLiteBackend (WAL, single file)
 
     Properties:
-        - Atomic writes via temp file + rename (POSIX atomic on same filesystem)
+        - Atomic writes (temp file + rename, or one SQLite transaction)
         - Deterministic lookup by key; no search or ranking
         - Scope isolation: list operations are strictly scoped
         - Storage root is configurable; no hardcoded paths permitted
@@ -152,22 +514,13 @@ class MemoryStore:
         content-safe log projections (use MemoryRecord.to_log_safe()).
     """
 
-    def __init__(self, storage_root: str | Path) -> None:
+    def __init__(self, storage_root: str | Path, *, backend: Optional[MemoryBackend] = None) -> None:
         self._root = Path(storage_root)
+        self._backend = backend if backend is not None else get_backend(self._root)
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
-    def _record_path(self, scope: str, key: str) -> Path:
-        return self._root / scope / f"{key}.json"
-
-    def _deserialise(self, path: Path) -> MemoryRecord:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return MemoryRecord(**data)
-
-    def _serialise(self, record: MemoryRecord) -> str:
-        return json.dumps(dataclasses.asdict(record), ensure_ascii=False, indent=2)
+    @property
+    def backend(self) -> MemoryBackend:
+        return self._backend
 
     # ------------------------------------------------------------------
     # Public API
@@ -179,38 +532,25 @@ class MemoryStore:
 
         Lookup is deterministic from (scope, key). No search or ranking.
         """
-        path = self._record_path(scope, key)
-        if not path.is_file():
-            return None
-        return self._deserialise(path)
+        return self._backend.get(scope, key)
 
     def put(self, record: MemoryRecord) -> None:
         """
-        Write a record to the store (atomic: temp file + rename).
+        Write a record to the store (atomic).
 
         Callers are responsible for version management (M6.6 write contract).
-        Creates parent directories as needed.
+        Creates parent directories as needed. Bumps store_generation().
         """
-        path = self._record_path(record.scope, record.key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = path.with_suffix(".tmp")
-        tmp.write_text(self._serialise(record), encoding="utf-8")
-        tmp.replace(path)  # POSIX-atomic rename
+        self._backend.put(record)
+        _bump_generation(self._root)
 
     def list_by_scope(self, scope: str) -> list[MemoryRecord]:
         """
         Return all records in scope, sorted by key (deterministic ordering).
 
-        Returns an empty list if the scope directory does not exist.
+        Returns an empty list if the scope does not exist.
         """
-        scope_dir = self._root / scope
-        if not scope_dir.is_dir():
-            return []
-        records = [
-            self._deserialise(p)
-            for p in sorted(scope_dir.glob("*.json"))
-        ]
-        return records
+        return self._backend.list_by_scope(scope)
 
     def list_by_keys(self, scope: str, keys: list[str]) -> list[MemoryRecord]:
         """
@@ -218,17 +558,14 @@ class MemoryStore:
 
         Missing keys are skipped silently (no error). This matches the
         M6.4 injection contract: overflow records are dropped without failure.
+        Keys are fetched in one batch (a single query on SQLite).
         """
-        result = []
-        for key in keys:
-            record = self.get(scope, key)
-            if record is not None:
-                result.append(record)
-        return result
+        found = self._backend.get_many(scope, keys)
+        return [found[key] for key in keys if key in found]
 
     def exists(self, scope: str, key: str) -> bool:
         """Return True if a record exists for (scope, key)."""
-        return self._record_path(scope, key).is_file()
+        return self._backend.exists(scope, key)
 
     @staticmethod
     def record_identifier(scope: str, key: str) -> str:
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import IO, Any, Dict, Optional, Tuple
 
 from io_iii.core.content_safety import assert_no_forbidden_keys, METADATA_FORBIDDEN_KEYS
 
@@ -41,25 +45,246 @@ def make_request_id() -> str:
     return f"{time.time_ns()}-{os.getpid()}"
 
 
-_ROTATION_MAX_ENTRIES = 200
-_ROTATION_MAX_BYTES = 100_000
+# ---------------------------------------------------------------------------
+# Writer (persistent handle, size-based segment rotation)
+# ---------------------------------------------------------------------------
+#
+# Optional keys under logging.metadata in logging.yaml (all default as shown):
+#
+#   logging:
+#     metadata:
+#       max_bytes: 1000000           # roll metadata.jsonl once it would exceed this
+#       max_segments: 5              # rolled segments kept: metadata.jsonl.1 (newest) .. .5
+#       buffering: line              # line = each record reaches the OS on write;
+#                                    # interval = block-buffered, flushed by a background thread
+#       flush_interval_seconds: 1.0  # flush / fsync period for the interval policies
+#       fsync: never                 # never | interval | always
+#
+# Rotation only renames files, so the cost of a write does not depend on the
+# size of the log. Size is taken from fstat on the open handle, so several
+# processes appending to the same file still roll it at roughly max_bytes.
 
+_DEFAULT_MAX_BYTES = 1_000_000
+_DEFAULT_MAX_SEGMENTS = 5
+_DEFAULT_FLUSH_INTERVAL_S = 1.0
+_BUFFERING_POLICIES = ("line", "interval")
+_FSYNC_POLICIES = ("never", "interval", "always")
 
-def _rotate_if_needed(path: Path) -> None:
-    """Drop oldest entries when the log exceeds 200 entries or 100 KB."""
-    if not path.exists():
-        return
-    if path.stat().st_size <= _ROTATION_MAX_BYTES:
-        raw = path.read_bytes()
-        lines = [l for l in raw.splitlines() if l.strip()]
-        if len(lines) <= _ROTATION_MAX_ENTRIES:
-            return
-        keep = lines[-_ROTATION_MAX_ENTRIES:]
-    else:
-        raw = path.read_bytes()
-        lines = [l for l in raw.splitlines() if l.strip()]
-        keep = lines[-_ROTATION_MAX_ENTRIES:]
-    path.write_bytes(b"\n".join(keep) + b"\n")
+# Open writers retained per process (one per log path); the least recently
+# used is closed beyond this.
+_MAX_OPEN_WRITERS = 16
+
+
+@dataclass(frozen=True)
+class MetadataLogSettings:
+    """Parsed rotation / durability knobs from logging.metadata."""
+    max_bytes: int = _DEFAULT_MAX_BYTES
+    max_segments: int = _DEFAULT_MAX_SEGMENTS
+    buffering: str = "line"
+    flush_interval_seconds: float = _DEFAULT_FLUSH_INTERVAL_S
+    fsync: str = "never"
+
+
+def load_metadata_log_settings(logging_cfg: Dict[str, Any]) -> MetadataLogSettings:
+    """
+    Read rotation / buffering / fsync settings from logging.metadata.
+
+    Raises:
+        ValueError('METADATA_LOG_CONFIG_INVALID: ...') on a malformed value.
+    """
+    raw = _get_nested(logging_cfg, "logging", "metadata", default={})
+    if not isinstance(raw, dict):
+        raise ValueError("METADATA_LOG_CONFIG_INVALID: logging.metadata must be a mapping")
+
+    values: Dict[str, Any] = {}
+    for name in ("max_bytes", "max_segments"):
+        if name in raw:
+            v = raw[name]
+            if not isinstance(v, int) or isinstance(v, bool) or v < 1:
+                raise ValueError(f"METADATA_LOG_CONFIG_INVALID: {name} must be a positive integer")
+            values[name] = v
+    if "flush_interval_seconds" in raw:
+        v = raw["flush_interval_seconds"]
+        if not isinstance(v, (int, float)) or isinstance(v, bool) or v <= 0:
+            raise ValueError("METADATA_LOG_CONFIG_INVALID: flush_interval_seconds must be a positive number")
+        values["flush_interval_seconds"] = float(v)
+    for name, allowed in (("buffering", _BUFFERING_POLICIES), ("fsync", _FSYNC_POLICIES)):
+        if name in raw:
+            if raw[name] not in allowed:
+                raise ValueError(
+                    f"METADATA_LOG_CONFIG_INVALID: {name} must be one of {', '.join(allowed)}"
+                )
+            values[name] = raw[name]
+    return MetadataLogSettings(**values)
+
+
+class MetadataLogWriter:
+    """
+    Append-only JSONL writer holding one open handle to *path*.
+
+    Thread-safe. With buffering=interval or fsync=interval a daemon thread
+    flushes (and optionally fsyncs) every flush_interval_seconds.
+    """
+
+    def __init__(self, path: Path, settings: MetadataLogSettings) -> None:
+        self.path = path
+        self.settings = settings
+        self.rotations = 0
+        self._lock = threading.Lock()
+        self._fh: Optional[IO[bytes]] = None
+        self._unflushed = 0
+        self._dirty = False
+        self._closed = False
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if settings.buffering == "interval" or settings.fsync == "interval":
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="io3-metadata-flush", daemon=True,
+            )
+            self._flusher.start()
+
+    # ------------------------------------------------------------------
+
+    def _open_locked(self) -> IO[bytes]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "ab", buffering=-1 if self.settings.buffering == "interval" else 0)
+        self._unflushed = 0
+        return self._fh
+
+    def _handle_locked(self) -> Tuple[IO[bytes], int]:
+        """
+        Return (handle, current size), reopening first if the file was
+        removed or rotated (renamed away) by another process.
+        """
+        fh = self._fh
+        if fh is not None:
+            current = os.fstat(fh.fileno())
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                st = None
+            if st is not None and (st.st_ino, st.st_dev) == (current.st_ino, current.st_dev):
+                return fh, current.st_size + self._unflushed
+            self._close_handle_locked()
+        fh = self._open_locked()
+        return fh, os.fstat(fh.fileno()).st_size
+
+    def _close_handle_locked(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
+                self._unflushed = 0
+
+    def _rotate_locked(self) -> None:
+        """metadata.jsonl -> .1 -> .2 ... ; the oldest segment beyond max_segments is removed."""
+        self._close_handle_locked()
+        n = self.settings.max_segments
+        oldest = self.path.with_name(f"{self.path.name}.{n}")
+        if oldest.exists():
+            oldest.unlink()
+        for i in range(n - 1, 0, -1):
+            seg = self.path.with_name(f"{self.path.name}.{i}")
+            if seg.exists():
+                os.replace(seg, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.path.exists():
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        self.rotations += 1
+
+    def write_line(self, line: bytes) -> None:
+        """Append one newline-terminated record, rotating first if it would overflow."""
+        with self._lock:
+            if self._closed:
+                # Replaced by get_writer while a caller still held it.
+                with open(self.path, "ab") as f:
+                    f.write(line)
+                return
+            fh, size = self._handle_locked()
+            if size and size + len(line) > self.settings.max_bytes:
+                self._rotate_locked()
+                fh = self._open_locked()
+            fh.write(line)
+            if self.settings.buffering == "interval":
+                self._unflushed += len(line)
+            if self.settings.fsync == "always":
+                fh.flush()
+                os.fsync(fh.fileno())
+                self._unflushed = 0
+            else:
+                self._dirty = True
+
+    def flush(self, *, fsync: bool = False) -> None:
+        """Push buffered records to the OS (and to disk when *fsync*)."""
+        with self._lock:
+            fh = self._fh
+            if fh is None:
+                return
+            fh.flush()
+            self._unflushed = 0
+            if fsync and self._dirty:
+                os.fsync(fh.fileno())
+                self._dirty = False
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.settings.flush_interval_seconds):
+            try:
+                self.flush(fsync=self.settings.fsync == "interval")
+            except (OSError, ValueError):
+                pass  # next write reopens the handle
+
+    def close(self) -> None:
+        """Flush and close the handle and stop the flush thread."""
+        self._stop.set()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+                if self.settings.fsync != "never":
+                    os.fsync(self._fh.fileno())
+            self._close_handle_locked()
+            self._closed = True
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=1.0)
+
+
+_writers_lock = threading.Lock()
+_writers: "OrderedDict[str, MetadataLogWriter]" = OrderedDict()
+
+
+def get_writer(path: Path, settings: MetadataLogSettings) -> MetadataLogWriter:
+    """
+    Return the process-wide writer for *path*, creating it on first use.
+
+    A changed settings value replaces the writer (the old one is closed).
+    """
+    key = os.path.abspath(path)
+    stale = []
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is not None and writer.settings != settings:
+            stale.append(_writers.pop(key))
+            writer = None
+        if writer is None:
+            writer = MetadataLogWriter(path, settings)
+            _writers[key] = writer
+        _writers.move_to_end(key)
+        while len(_writers) > _MAX_OPEN_WRITERS:
+            stale.append(_writers.popitem(last=False)[1])
+    for old in stale:
+        old.close()
+    return writer
+
+
+def close_writers() -> None:
+    """Flush and close every open writer (process exit / test isolation)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(close_writers)
 
 
 def append_metadata(logging_cfg: Dict[str, Any], record: Dict[str, Any]) -> Optional[Path]:
@@ -75,9 +300,7 @@ def append_metadata(logging_cfg: Dict[str, Any], record: Dict[str, Any]) -> Opti
         return None
 
     path = metadata_log_path(logging_cfg)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    _rotate_if_needed(path)
+    settings = load_metadata_log_settings(logging_cfg)
 
     payload = dict(record)
 
@@ -96,7 +319,7 @@ def append_metadata(logging_cfg: Dict[str, Any], record: Dict[str, Any]) -> Opti
     # This scans nested dict/list structures as well.
     assert_no_forbidden_keys(payload, forbidden=METADATA_FORBIDDEN_KEYS)
 
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+    line = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+    get_writer(path, settings).write_line(line)
 
     return path
\ No newline at end of file
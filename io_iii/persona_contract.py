@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import copy
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import yaml
 
@@ -28,6 +32,55 @@ _USER_PROFILE_DEFAULTS: Dict[str, Any] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# mtime-validated block cache
+# ---------------------------------------------------------------------------
+#
+# Context assembly loads identity and user profile on every executor,
+# challenger and revision pass. Parsed blocks are cached per file and
+# revalidated with a stat(); YAML is re-read only when the file changes.
+# Files modified within _RACY_WINDOW_NS are not cached (a rewrite inside the
+# same timestamp tick would otherwise go unnoticed).
+
+_RACY_WINDOW_NS = 2_000_000_000
+
+_block_lock = threading.Lock()
+_block_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+
+def _load_block(path: Path, key: str, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Return defaults merged with the *key* mapping in *path*. Never raises."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return copy.deepcopy(defaults)
+    fp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cache_key = (str(path), key)
+
+    with _block_lock:
+        entry = _block_cache.get(cache_key)
+    if entry is not None and entry[0] == fp:
+        return copy.deepcopy(entry[1])
+
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        block = {**defaults, **(data.get(key) or {})}
+    except Exception:
+        return copy.deepcopy(defaults)
+
+    if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+        with _block_lock:
+            _block_cache[cache_key] = (fp, block)
+    return copy.deepcopy(block)
+
+
+def clear_persona_cache() -> None:
+    """Drop cached identity / user profile blocks."""
+    with _block_lock:
+        _block_cache.clear()
+
+
 def load_user_profile() -> Dict[str, Any]:
     """
     Load the user profile block from user_profile.yaml.
@@ -36,13 +89,7 @@ def load_user_profile() -> Dict[str, Any]:
     Falls back to _USER_PROFILE_DEFAULTS on any read or parse failure.
     Never raises.
     """
-    path = _CONFIG_DIR / "user_profile.yaml"
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        return {**_USER_PROFILE_DEFAULTS, **(data.get("user") or {})}
-    except Exception:
-        return dict(_USER_PROFILE_DEFAULTS)
+    return _load_block(_CONFIG_DIR / "user_profile.yaml", "user", _USER_PROFILE_DEFAULTS)
 
 
 def load_identity() -> Dict[str, Any]:
@@ -53,13 +100,7 @@ def load_identity() -> Dict[str, Any]:
     Falls back to _IDENTITY_DEFAULTS on any read or parse failure so the
     system prompt is always well-formed. Never raises.
     """
-    path = _CONFIG_DIR / "persona.yaml"
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        return {**_IDENTITY_DEFAULTS, **(data.get("identity") or {})}
-    except Exception:
-        return dict(_IDENTITY_DEFAULTS)
+    return _load_block(_CONFIG_DIR / "persona.yaml", "identity", _IDENTITY_DEFAULTS)
 
 EXECUTOR_PERSONA_CONTRACT = (
     "IO-III Persona Contract (Executor)\n"
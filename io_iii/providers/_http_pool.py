@@ -0,0 +1,282 @@
+# io_iii/providers/_http_pool.py
+"""
+Shared HTTP/1.1 keep-alive connection pool for local providers.
+
+One HostConnectionPool exists per provider base URL and is shared by every
+provider instance that targets it (executor, challenger and revision passes
+all reuse the same sockets). Idle connections are kept up to ``pool_size``
+per host; connections beyond that are closed on release.
+
+Counters:
+- hits   — request served on an idle, already-connected socket
+- misses — request that had to open a new connection
+
+Counters are kept both globally (pool_stats) and per calling thread
+(HostConnectionPool.counters) so the engine can attribute hits/misses to a
+single synchronous run without interference from concurrent runs.
+
+Content policy: this module moves bytes only; it never logs request or
+response bodies.
+"""
+from __future__ import annotations
+
+import http.client
+import threading
+import urllib.parse
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Type
+
+# Errors that indicate a reused keep-alive socket was closed by the server while idle.
+_STALE_CONNECTION_ERRORS: Tuple[Type[BaseException], ...] = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+class HostConnectionPool:
+    """
+    Keep-alive connection pool for a single scheme://host:port.
+
+    Thread-safe. Does not bound concurrency: when no idle connection is
+    available a new one is opened (a miss); pool_size bounds how many idle
+    connections are retained for reuse.
+    """
+
+    def __init__(self, base_url: str, *, pool_size: int) -> None:
+        parsed = urllib.parse.urlsplit(base_url)
+        self.base_url = base_url
+        self.scheme = parsed.scheme or "http"
+        self.hostname = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port
+        self.base_path = parsed.path.rstrip("/")
+        self.pool_size = max(1, int(pool_size))
+
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Connection lifecycle
+    # ------------------------------------------------------------------
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.hostname, self.port, timeout=timeout)
+        return http.client.HTTPConnection(self.hostname, self.port, timeout=timeout)
+
+    def _record(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if hit:
+            self._local.hits = getattr(self._local, "hits", 0) + 1
+        else:
+            self._local.misses = getattr(self._local, "misses", 0) + 1
+
+    def _acquire(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused). Pops the most recently used idle connection."""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            self._record(hit=False)
+            return self._new_connection(timeout), False
+
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        self._record(hit=True)
+        return conn, True
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection held by this pool."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Request surface
+    # ------------------------------------------------------------------
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Optional[bytes],
+        headers: Optional[Mapping[str, str]],
+        timeout: float,
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Send one request and return (connection, response) with headers read.
+
+        A reused connection that turns out to be stale is retried exactly once
+        on a fresh connection. Any other failure closes the connection and
+        propagates.
+        """
+        conn, reused = self._acquire(timeout)
+        while True:
+            try:
+                conn.request(method, f"{self.base_path}{path}", body=body, headers=dict(headers or {}))
+                return conn, conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                self._record(hit=False)
+                conn, reused = self._new_connection(timeout), False
+            except BaseException:
+                conn.close()
+                raise
+
+    def _finish(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse) -> None:
+        """Return a fully-read connection to the pool, or close it if the server asked."""
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float,
+    ) -> Tuple[int, str, bytes]:
+        """
+        Perform one request and return (status, reason, body_bytes).
+
+        The response body is always fully read so the connection can be
+        returned to the pool.
+        """
+        conn, resp = self._send(method, path, body=body, headers=headers, timeout=timeout)
+        try:
+            data = resp.read()
+        except BaseException:
+            conn.close()
+            raise
+        self._finish(conn, resp)
+        return resp.status, resp.reason, data
+
+    def stream_lines(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float,
+    ) -> Tuple[int, str, Iterator[bytes]]:
+        """
+        Perform one request and return (status, reason, line_iterator).
+
+        Intended for newline-delimited streaming bodies; lines are yielded as
+        they arrive. For a non-2xx status the body is drained immediately and
+        the iterator is empty. Otherwise the connection is returned to the
+        pool only when the body has been read to the end; a consumer that
+        stops early (or fails) closes it instead.
+        """
+        conn, resp = self._send(method, path, body=body, headers=headers, timeout=timeout)
+        if not 200 <= resp.status < 300:
+            try:
+                resp.read()
+            except BaseException:
+                conn.close()
+                raise
+            self._finish(conn, resp)
+            return resp.status, resp.reason, iter(())
+
+        def _lines() -> Iterator[bytes]:
+            completed = False
+            try:
+                while True:
+                    line = resp.readline()
+                    if not line:
+                        break
+                    yield line
+                # readline() does not mark a length-delimited response as
+                # complete; a final read() does, so the socket can be reused.
+                resp.read()
+                completed = True
+            finally:
+                if completed:
+                    self._finish(conn, resp)
+                else:
+                    conn.close()
+
+        return resp.status, resp.reason, _lines()
+
+    # ------------------------------------------------------------------
+    # Counters
+    # ------------------------------------------------------------------
+
+    def counters(self) -> Tuple[int, int]:
+        """Return (hits, misses) recorded by the calling thread."""
+        return getattr(self._local, "hits", 0), getattr(self._local, "misses", 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Content-safe snapshot of global pool counters."""
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "idle": len(self._idle),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registry (one pool per base URL)
+# ---------------------------------------------------------------------------
+
+_pools_lock = threading.Lock()
+_pools: Dict[str, HostConnectionPool] = {}
+
+
+def get_pool(base_url: str, *, pool_size: int) -> HostConnectionPool:
+    """
+    Return the shared pool for *base_url*, creating it on first use.
+
+    A later call with a different pool_size (e.g. after a config change)
+    updates the retained-idle bound in place.
+    """
+    key = base_url.rstrip("/")
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = HostConnectionPool(key, pool_size=pool_size)
+            _pools[key] = pool
+        else:
+            pool.pool_size = max(1, int(pool_size))
+        return pool
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Return counters for every registered pool keyed by base URL."""
+    with _pools_lock:
+        pools = list(_pools.items())
+    return {key: pool.stats() for key, pool in pools}
+
+
+def close_all() -> None:
+    """Close and forget every registered pool (shutdown / test isolation)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
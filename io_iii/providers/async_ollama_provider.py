@@ -0,0 +1,169 @@
+# io_iii/providers/async_ollama_provider.py
+"""
+asyncio Ollama client for engine.run_async (AsyncProvider contract).
+
+Built directly on asyncio streams (no aiohttp / httpx dependency). Each call
+opens one HTTP/1.1 connection with ``Connection: close``; asyncio sockets are
+bound to the event loop that created them, so no cross-loop pooling is
+attempted. Concurrency is bounded by the event loop, not by worker threads.
+
+Content policy: request and response bodies are never logged.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+import urllib.parse
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from io_iii.providers.ollama_provider import (
+    _GENERATE_TIMEOUT_S,
+    OllamaProvider,
+    parse_generate_body,
+)
+from io_iii.providers.provider_contract import ProviderError
+
+
+class _HTTPStatusError(Exception):
+    """Non-2xx status from the server (mapped to ProviderError by the caller)."""
+
+    def __init__(self, status: int, reason: str) -> None:
+        super().__init__(f"HTTP Error {status}: {reason}")
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    parts: List[bytes] = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise ConnectionError("connection closed inside chunked body")
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            # Trailer section ends with an empty line.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(parts)
+        parts.append(await reader.readexactly(size))
+        await reader.readexactly(2)  # CRLF after each chunk
+
+
+async def _post(url: str, data: bytes) -> bytes:
+    """POST *data* to *url* and return the response body; raises on non-2xx."""
+    parts = urllib.parse.urlsplit(url)
+    https = parts.scheme == "https"
+    host = parts.hostname or "127.0.0.1"
+    port = parts.port or (443 if https else 80)
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+
+    reader, writer = await asyncio.open_connection(
+        host, port, ssl=ssl.create_default_context() if https else None
+    )
+    try:
+        head = (
+            f"POST {target} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        ).encode("latin-1")
+        writer.write(head + data)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed before response")
+        fields = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        status = int(fields[1])
+        reason = fields[2] if len(fields) > 2 else ""
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            body = await _read_chunked(reader)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+    if not 200 <= status < 300:
+        raise _HTTPStatusError(status, reason)
+    return body
+
+
+@dataclass(frozen=True)
+class AsyncOllamaProvider:
+    """
+    Non-blocking Ollama provider for IO-III (AsyncProvider contract).
+
+    Mirrors OllamaProvider: same host resolution, /no_think prefix rule,
+    response-shape validation and ProviderError codes. Non-streaming only.
+    """
+    name: str = "ollama"
+    host: str = "http://127.0.0.1:11434"
+    timeout_s: float = _GENERATE_TIMEOUT_S
+
+    @classmethod
+    def from_config(cls, providers_cfg: Dict[str, Any]) -> "AsyncOllamaProvider":
+        return cls(host=OllamaProvider.from_config(providers_cfg).host)
+
+    async def _post_json(self, url: str, payload: Dict[str, Any]) -> str:
+        data = json.dumps(payload).encode("utf-8")
+        try:
+            raw = await asyncio.wait_for(_post(url, data), timeout=self.timeout_s)
+        except asyncio.TimeoutError as e:
+            raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: timed out") from e
+        except Exception as e:
+            raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: {e}") from e
+        return raw.decode("utf-8")
+
+    async def generate_with_metrics(
+        self, *, model: str, prompt: str
+    ) -> Tuple[str, Optional[int], Optional[int]]:
+        """
+        Generate a completion and return (text, input_tokens, output_tokens).
+
+        Token counts come from Ollama's prompt_eval_count / eval_count (M5.2);
+        None where absent. Raises ProviderError on failure.
+        """
+        url = f"{self.host}/api/generate"
+
+        if not model.endswith("-think"):
+            prompt = f"/no_think\n{prompt}"
+        payload: Dict[str, Any] = {"model": model, "prompt": prompt, "stream": False}
+        body = await self._post_json(url, payload)
+        return parse_generate_body(url, body)
+
+    async def preload(self, *, model: str, keep_alive: Optional[Union[str, int]] = None) -> None:
+        """Load *model* without generating (see OllamaProvider.preload)."""
+        payload: Dict[str, Any] = {"model": model, "stream": False}
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        await self._post_json(f"{self.host}/api/generate", payload)
+
+    async def generate(self, *, model: str, prompt: str) -> str:
+        """
+        Generate a completion via Ollama /api/generate.
+
+        Contract:
+        - returns a string (may be empty, never None)
+        - raises ProviderError on failure
+        """
+        text, _, _ = await self.generate_with_metrics(model=model, prompt=prompt)
+        return text
@@ -3,12 +3,55 @@ from __future__ import annotations
 
 import json
 import os
+import urllib.parse
 import urllib.request
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Generator, Iterator, Optional, Tuple, Union
 
+from io_iii.providers._http_pool import HostConnectionPool, get_pool
 from io_iii.providers.provider_contract import ProviderError
 
+_GENERATE_TIMEOUT_S = 180
+
+
+def parse_generate_body(url: str, body: str) -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    Parse a non-streaming /api/generate response body.
+
+    Returns (text, input_tokens, output_tokens). Shared by the blocking and
+    asyncio Ollama clients so both enforce the same response-shape contract.
+
+    Raises ProviderError (PROVIDER_OLLAMA_BAD_JSON / PROVIDER_OLLAMA_BAD_SHAPE).
+    """
+    try:
+        obj = json.loads(body)
+    except Exception as e:
+        raise ProviderError("PROVIDER_OLLAMA_BAD_JSON", f"Invalid JSON from {url}: {e}") from e
+
+    if not isinstance(obj, dict) or "response" not in obj:
+        keys = list(obj.keys()) if isinstance(obj, dict) else []
+        raise ProviderError(
+            "PROVIDER_OLLAMA_BAD_SHAPE",
+            f"Unexpected Ollama response shape: keys={keys}",
+        )
+
+    resp_text = obj.get("response")
+    if not isinstance(resp_text, str):
+        raise ProviderError(
+            "PROVIDER_OLLAMA_BAD_SHAPE",
+            f"Expected 'response' to be str, got {type(resp_text).__name__}",
+        )
+
+    # ADR-021 §3.3: surface Ollama's native token counts where present.
+    # prompt_eval_count = tokens consumed processing the input prompt.
+    # eval_count        = tokens generated in the output response.
+    raw_input = obj.get("prompt_eval_count")
+    raw_output = obj.get("eval_count")
+    input_tokens: Optional[int] = int(raw_input) if isinstance(raw_input, int) else None
+    output_tokens: Optional[int] = int(raw_output) if isinstance(raw_output, int) else None
+
+    return resp_text, input_tokens, output_tokens
+
 
 @dataclass(frozen=True)
 class OllamaProvider:
@@ -16,11 +59,15 @@ class OllamaProvider:
     Minimal Ollama provider for IO-III (deterministic, sequential).
     Uses Ollama HTTP API at OLLAMA_HOST or default 127.0.0.1:11434.
 
-    - Non-streaming for deterministic handling (stream=False)
+    - Non-streaming for deterministic handling (stream=False); the opt-in
+      generate_stream() path uses stream=True and yields NDJSON chunks
     - Uses /api/generate (stable, simple response shape)
+    - pool_size > 0 sends inference calls through the shared HTTP/1.1
+      keep-alive pool for this host; 0 opens a one-shot urllib connection
     """
     name: str = "ollama"
     host: str = "http://127.0.0.1:11434"
+    pool_size: int = 0
 
     @classmethod
     def from_config(cls, providers_cfg: Dict[str, Any]) -> "OllamaProvider":
@@ -28,7 +75,98 @@ class OllamaProvider:
         providers = (providers_cfg or {}).get("providers", {}) if isinstance(providers_cfg, dict) else {}
         cfg = (providers or {}).get("ollama", {}) if isinstance(providers, dict) else {}
         host = os.environ.get("OLLAMA_HOST") or cfg.get("base_url") or "http://127.0.0.1:11434"
-        return cls(host=host)
+        try:
+            pool_size = max(0, int(cfg.get("pool_size", 0) or 0))
+        except (TypeError, ValueError):
+            pool_size = 0
+        return cls(host=host, pool_size=pool_size)
+
+    def _pool(self) -> Optional[HostConnectionPool]:
+        """Shared keep-alive pool for this host, or None when pooling is disabled."""
+        if self.pool_size <= 0:
+            return None
+        return get_pool(self.host, pool_size=self.pool_size)
+
+    def pool_counters(self) -> Optional[Tuple[int, int]]:
+        """
+        Return (hits, misses) recorded by the calling thread on this host's pool.
+
+        None when pooling is disabled. The engine diffs two snapshots to
+        attribute pool usage to a single run (ExecutionMetrics).
+        """
+        pool = self._pool()
+        return pool.counters() if pool is not None else None
+
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> str:
+        """
+        POST a JSON payload to *url* and return the decoded response body.
+
+        Raises ProviderError("PROVIDER_OLLAMA_FAILED") on transport failure or
+        a non-2xx status (message mirrors urllib's "HTTP Error <code>" form so
+        the CLI model-not-found hint keeps working).
+        """
+        data = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        pool = self._pool()
+
+        if pool is None:
+            req = urllib.request.Request(url, data=data, headers=headers, method="POST")
+            try:
+                with urllib.request.urlopen(req, timeout=_GENERATE_TIMEOUT_S) as resp:
+                    return resp.read().decode("utf-8")
+            except Exception as e:
+                raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: {e}") from e
+
+        path = urllib.parse.urlsplit(url).path[len(pool.base_path):]
+        try:
+            status, reason, raw = pool.request(
+                "POST", path, body=data, headers=headers, timeout=_GENERATE_TIMEOUT_S
+            )
+        except Exception as e:
+            raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: {e}") from e
+        if not 200 <= status < 300:
+            raise ProviderError(
+                "PROVIDER_OLLAMA_FAILED", f"Error calling {url}: HTTP Error {status}: {reason}"
+            )
+        return raw.decode("utf-8")
+
+    def _post_stream(self, url: str, payload: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        POST a JSON payload to *url* and yield the streamed response body line by line.
+
+        Error mapping matches _post_json(); transport failures mid-stream are
+        raised as ProviderError("PROVIDER_OLLAMA_FAILED") as well.
+        """
+        data = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        pool = self._pool()
+
+        if pool is None:
+            req = urllib.request.Request(url, data=data, headers=headers, method="POST")
+            try:
+                with urllib.request.urlopen(req, timeout=_GENERATE_TIMEOUT_S) as resp:
+                    for line in resp:
+                        yield line
+            except Exception as e:
+                raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: {e}") from e
+            return
+
+        path = urllib.parse.urlsplit(url).path[len(pool.base_path):]
+        try:
+            status, reason, lines = pool.stream_lines(
+                "POST", path, body=data, headers=headers, timeout=_GENERATE_TIMEOUT_S
+            )
+        except Exception as e:
+            raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: {e}") from e
+        if not 200 <= status < 300:
+            raise ProviderError(
+                "PROVIDER_OLLAMA_FAILED", f"Error calling {url}: HTTP Error {status}: {reason}"
+            )
+        try:
+            for line in lines:
+                yield line
+        except Exception as e:
+            raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: {e}") from e
 
     def check_reachable(self, *, timeout_ms: int = 1000) -> None:
         """
@@ -48,6 +186,19 @@ class OllamaProvider:
         except Exception as e:
             raise RuntimeError(f"PROVIDER_UNAVAILABLE: ollama — {e}") from e
 
+    def preload(self, *, model: str, keep_alive: Optional[Union[str, int]] = None) -> None:
+        """
+        Ask Ollama to load *model* into memory without generating (challenger pre-warm).
+
+        An /api/generate request without a prompt only loads the model;
+        keep_alive, when given, controls how long it stays resident.
+        Raises ProviderError on failure.
+        """
+        payload: Dict[str, Any] = {"model": model, "stream": False}
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        self._post_json(f"{self.host}/api/generate", payload)
+
     def generate(self, *, model: str, prompt: str) -> str:
         """
         Generate a completion via Ollama /api/generate.
@@ -62,39 +213,8 @@ class OllamaProvider:
             prompt = f"/no_think\n{prompt}"
         # Keep implementation minimal and deterministic (no streaming).
         payload: Dict[str, Any] = {"model": model, "prompt": prompt, "stream": False}
-
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-
-        try:
-            with urllib.request.urlopen(req, timeout=180) as resp:
-                body = resp.read().decode("utf-8")
-        except Exception as e:
-            raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: {e}") from e
-
-        try:
-            obj = json.loads(body)
-        except Exception as e:
-            raise ProviderError("PROVIDER_OLLAMA_BAD_JSON", f"Invalid JSON from {url}: {e}") from e
-
-        if "response" not in obj:
-            raise ProviderError(
-                "PROVIDER_OLLAMA_BAD_SHAPE",
-                f"Unexpected Ollama response shape: keys={list(obj.keys())}",
-            )
-
-        resp_text = obj.get("response")
-        if not isinstance(resp_text, str):
-            raise ProviderError(
-                "PROVIDER_OLLAMA_BAD_SHAPE",
-                f"Expected 'response' to be str, got {type(resp_text).__name__}",
-            )
-
+        body = self._post_json(url, payload)
+        resp_text, _, _ = parse_generate_body(url, body)
         return resp_text
 
     def generate_with_metrics(
@@ -122,44 +242,67 @@ class OllamaProvider:
         if not model.endswith("-think"):
             prompt = f"/no_think\n{prompt}"
         payload: Dict[str, Any] = {"model": model, "prompt": prompt, "stream": False}
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        body = self._post_json(url, payload)
+        return parse_generate_body(url, body)
 
-        try:
-            with urllib.request.urlopen(req, timeout=180) as resp:
-                body = resp.read().decode("utf-8")
-        except Exception as e:
-            raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: {e}") from e
+    def generate_stream(
+        self, *, model: str, prompt: str
+    ) -> Generator[str, None, Tuple[Optional[int], Optional[int]]]:
+        """
+        Stream a completion via Ollama /api/generate with stream=True.
 
-        try:
-            obj = json.loads(body)
-        except Exception as e:
-            raise ProviderError("PROVIDER_OLLAMA_BAD_JSON", f"Invalid JSON from {url}: {e}") from e
+        Yields non-empty 'response' chunks as Ollama emits them. The generator
+        returns (input_tokens, output_tokens) taken from the final done=true
+        line (None where absent), matching generate_with_metrics().
 
-        if "response" not in obj:
-            raise ProviderError(
-                "PROVIDER_OLLAMA_BAD_SHAPE",
-                f"Unexpected Ollama response shape: keys={list(obj.keys())}",
-            )
+        Contract:
+        - concatenated chunks equal the non-streaming completion text
+        - raises ProviderError on failure, including an in-band 'error' line
+          or a stream that ends without done=true
+        """
+        url = f"{self.host}/api/generate"
 
-        resp_text = obj.get("response")
-        if not isinstance(resp_text, str):
-            raise ProviderError(
-                "PROVIDER_OLLAMA_BAD_SHAPE",
-                f"Expected 'response' to be str, got {type(resp_text).__name__}",
-            )
+        if not model.endswith("-think"):
+            prompt = f"/no_think\n{prompt}"
+        payload: Dict[str, Any] = {"model": model, "prompt": prompt, "stream": True}
+
+        totals: Optional[Tuple[Optional[int], Optional[int]]] = None
+        # Read to end-of-body even after done=true so a pooled connection
+        # can be returned for reuse.
+        for raw in self._post_stream(url, payload):
+            raw = raw.strip()
+            if not raw or totals is not None:
+                continue
+            try:
+                obj = json.loads(raw.decode("utf-8"))
+            except Exception as e:
+                raise ProviderError("PROVIDER_OLLAMA_BAD_JSON", f"Invalid JSON from {url}: {e}") from e
+
+            if not isinstance(obj, dict):
+                raise ProviderError(
+                    "PROVIDER_OLLAMA_BAD_SHAPE",
+                    f"Expected stream object, got {type(obj).__name__}",
+                )
+            if "error" in obj:
+                raise ProviderError("PROVIDER_OLLAMA_FAILED", f"Error calling {url}: stream error")
+
+            chunk = obj.get("response", "")
+            if not isinstance(chunk, str):
+                raise ProviderError(
+                    "PROVIDER_OLLAMA_BAD_SHAPE",
+                    f"Expected 'response' to be str, got {type(chunk).__name__}",
+                )
+            if chunk:
+                yield chunk
 
-        # ADR-021 §3.3: surface Ollama's native token counts where present.
-        # prompt_eval_count = tokens consumed processing the input prompt.
-        # eval_count        = tokens generated in the output response.
-        raw_input = obj.get("prompt_eval_count")
-        raw_output = obj.get("eval_count")
-        input_tokens: Optional[int] = int(raw_input) if isinstance(raw_input, int) else None
-        output_tokens: Optional[int] = int(raw_output) if isinstance(raw_output, int) else None
+            if obj.get("done") is True:
+                raw_input = obj.get("prompt_eval_count")
+                raw_output = obj.get("eval_count")
+                totals = (
+                    int(raw_input) if isinstance(raw_input, int) else None,
+                    int(raw_output) if isinstance(raw_output, int) else None,
+                )
 
-        return resp_text, input_tokens, output_tokens
\ No newline at end of file
+        if totals is None:
+            raise ProviderError("PROVIDER_OLLAMA_BAD_SHAPE", f"Stream from {url} ended without done=true")
+        return totals
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional, Protocol, runtime_checkable
+from typing import Any, Dict, Iterator, Mapping, Optional, Protocol, runtime_checkable
 
 
 @dataclass(frozen=True)
@@ -59,4 +59,53 @@ class Provider(Protocol):
         for NullProvider style routes.
         """
         ...
-        
\ No newline at end of file
+        
+
+@runtime_checkable
+class StreamingProvider(Protocol):
+    """
+    Optional incremental-output extension to the Provider contract.
+
+    generate_stream() yields completion text chunks in order; their
+    concatenation equals what generate() would have returned. The generator
+    may return (input_tokens, output_tokens) as its StopIteration value when
+    the backend reports native token counts (either element may be None).
+
+    Chunks are content; providers must not log them. The engine decides
+    whether chunks are forwarded live or buffered (audit gate, ADR-009).
+    """
+
+    name: str
+
+    def generate_stream(self, *, model: str, prompt: str) -> Iterator[str]:
+        """
+        Yield completion text chunks.
+
+        Must raise ProviderError on failure (before or during iteration).
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncProvider(Protocol):
+    """
+    asyncio variant of the Provider contract.
+
+    Same semantics as Provider.generate(), but as a coroutine so that many
+    concurrent runs can share one event loop (engine.run_async). Providers
+    may additionally implement `async generate_with_metrics()` returning
+    (text, input_tokens, output_tokens); the engine prefers it when present.
+
+    Must raise ProviderError on failure.
+    """
+
+    name: str
+
+    async def generate(self, *, model: str, prompt: str) -> str:
+        """
+        Generate a completion.
+
+        Must return a string (may be empty but should not be None).
+        Must raise ProviderError on failure.
+        """
+        ...
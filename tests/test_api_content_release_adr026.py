@@ -30,6 +30,7 @@ from fastapi.testclient import TestClient
 
 from io_iii.api.app import app, _strip_content, _extract_response, _content_release_enabled
 from io_iii.api import _bus as bus
+from io_iii.cli import CommandResult
 
 
 client = TestClient(app, raise_server_exceptions=True)
@@ -41,15 +42,13 @@ client = TestClient(app, raise_server_exceptions=True)
 
 def _cmd_ok(payload: dict):
     def _cmd(args):
-        print(json.dumps(payload))
-        return 0
+        return CommandResult(exit_code=0, payload=payload)
     return _cmd
 
 
 def _cmd_err(payload: dict):
     def _cmd(args):
-        print(json.dumps(payload))
-        return 1
+        return CommandResult(exit_code=1, payload=payload)
     return _cmd
 
 
@@ -150,7 +149,7 @@ class TestRunGateOff:
     def test_response_field_absent(self):
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=False):
-            mock_cli.return_value.cmd_run = _cmd_ok(_RUN_PAYLOAD)
+            mock_cli.return_value.execute_run = _cmd_ok(_RUN_PAYLOAD)
             resp = client.post("/run", json={"mode": "work"})
         assert resp.status_code == 200
         body = resp.json()
@@ -159,14 +158,14 @@ class TestRunGateOff:
     def test_message_stripped(self):
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=False):
-            mock_cli.return_value.cmd_run = _cmd_ok(_RUN_PAYLOAD)
+            mock_cli.return_value.execute_run = _cmd_ok(_RUN_PAYLOAD)
             resp = client.post("/run", json={"mode": "work"})
         assert "message" not in resp.json()
 
     def test_prompt_still_stripped(self):
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=False):
-            mock_cli.return_value.cmd_run = _cmd_ok(_RUN_PAYLOAD)
+            mock_cli.return_value.execute_run = _cmd_ok(_RUN_PAYLOAD)
             resp = client.post("/run", json={"mode": "work"})
         assert "prompt" not in resp.json()
 
@@ -181,7 +180,7 @@ class TestRunGateOn:
     def test_response_field_present(self):
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=True):
-            mock_cli.return_value.cmd_run = _cmd_ok(_RUN_PAYLOAD)
+            mock_cli.return_value.execute_run = _cmd_ok(_RUN_PAYLOAD)
             resp = client.post("/run", json={"mode": "work"})
         assert resp.status_code == 200
         assert resp.json()["response"] == "Paris is the capital of France."
@@ -190,28 +189,28 @@ class TestRunGateOn:
         """response is under the new key; the raw message key is still stripped."""
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=True):
-            mock_cli.return_value.cmd_run = _cmd_ok(_RUN_PAYLOAD)
+            mock_cli.return_value.execute_run = _cmd_ok(_RUN_PAYLOAD)
             resp = client.post("/run", json={"mode": "work"})
         assert "message" not in resp.json()
 
     def test_prompt_still_stripped_when_gate_open(self):
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=True):
-            mock_cli.return_value.cmd_run = _cmd_ok(_RUN_PAYLOAD)
+            mock_cli.return_value.execute_run = _cmd_ok(_RUN_PAYLOAD)
             resp = client.post("/run", json={"mode": "work"})
         assert "prompt" not in resp.json()
 
     def test_persona_content_still_stripped_when_gate_open(self):
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=True):
-            mock_cli.return_value.cmd_run = _cmd_ok(_RUN_PAYLOAD)
+            mock_cli.return_value.execute_run = _cmd_ok(_RUN_PAYLOAD)
             resp = client.post("/run", json={"mode": "work"})
         assert "persona_content" not in resp.json()
 
     def test_structural_fields_preserved(self):
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=True):
-            mock_cli.return_value.cmd_run = _cmd_ok(_RUN_PAYLOAD)
+            mock_cli.return_value.execute_run = _cmd_ok(_RUN_PAYLOAD)
             resp = client.post("/run", json={"mode": "work"})
         body = resp.json()
         assert body["status"] == "ok"
@@ -228,7 +227,7 @@ class TestTurnGateOff:
     def _mock_turn(self, client_req):
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=False):
-            mock_cli.return_value.cmd_session_continue = _cmd_ok(_TURN_PAYLOAD)
+            mock_cli.return_value.execute_session_continue = _cmd_ok(_TURN_PAYLOAD)
             return client.post("/session/ses-adr026/turn", json=client_req)
 
     def test_response_absent(self):
@@ -257,8 +256,8 @@ class TestTurnGateOn:
         p = payload or _TURN_PAYLOAD
         with patch("io_iii.api.app._cli") as mock_cli, \
              patch("io_iii.api.app._content_release_enabled", return_value=True):
-            mock_cli.return_value.cmd_session_continue = _cmd_ok(p)
-            mock_cli.return_value.cmd_session_status = _cmd_ok(_STATUS_PAYLOAD)
+            mock_cli.return_value.execute_session_continue = _cmd_ok(p)
+            mock_cli.return_value.execute_session_status = _cmd_ok(_STATUS_PAYLOAD)
             return client.post("/session/ses-adr026/turn", json=client_req)
 
     def test_response_present(self):
@@ -307,9 +306,8 @@ class TestSSEContentSafety:
         }
 
         with patch("io_iii.api.app._cli") as mock_cli, \
-             patch("io_iii.api.app._SSE_POLL_INTERVAL", 0), \
              patch("io_iii.api.app._content_release_enabled", return_value=True):
-            mock_cli.return_value.cmd_session_status = _cmd_ok(status_payload)
+            mock_cli.return_value.execute_session_status = _cmd_ok(status_payload)
             resp = client.get(f"/session/{sid}/stream")
 
         assert resp.status_code == 200
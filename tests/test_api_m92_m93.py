@@ -127,14 +127,15 @@ class TestSSEEventTaxonomy:
         from io_iii.api._sse import _SSE_SESSION_EVENTS
         assert isinstance(_SSE_SESSION_EVENTS, frozenset)
 
-    def test_taxonomy_has_exactly_five_events(self):
+    def test_taxonomy_has_exactly_six_events(self):
         from io_iii.api._sse import _SSE_SESSION_EVENTS
-        assert len(_SSE_SESSION_EVENTS) == 5
+        assert len(_SSE_SESSION_EVENTS) == 6
 
     def test_required_events_present(self):
         from io_iii.api._sse import _SSE_SESSION_EVENTS
         required = {
             "turn_started",
+            "turn_output_delta",
             "turn_output",
             "turn_completed",
             "steward_gate_triggered",
@@ -380,70 +381,81 @@ class TestWebhookEventTaxonomy:
 # M9.3 — WebhookDispatcher.dispatch
 # ---------------------------------------------------------------------------
 
+def _dispatch_and_capture(d, event, payload, error=None):
+    """Dispatch through the shared delivery worker and return the captured POSTs."""
+    from io_iii.api import _webhooks
+
+    calls = []
+
+    def fake_post(url, data, headers, timeout):
+        calls.append({"url": url, "data": data, "headers": headers, "timeout": timeout})
+        if error is not None:
+            raise error
+        return 200
+
+    with patch("io_iii.api._webhooks._post", side_effect=fake_post):
+        d.dispatch(event, payload)
+        if error is None:
+            assert _webhooks.shared_delivery_worker().flush(timeout=5)
+    return calls
+
+
 class TestWebhookDispatch:
+    @pytest.fixture(autouse=True)
+    def _fresh_worker(self):
+        from io_iii.api import _webhooks
+        _webhooks.shutdown_delivery_worker()
+        yield
+        _webhooks.shutdown_delivery_worker()
+
     def test_unknown_event_is_no_op(self):
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({"unknown_event": {"url": "http://localhost:9999/hook"}})
         # Must not raise; just silently skip unknown events
-        d.dispatch("unknown_event", {"x": 1})
+        assert _dispatch_and_capture(d, "unknown_event", {"x": 1}) == []
 
     def test_absent_event_config_is_no_op(self):
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({})
         d.dispatch("session_complete", {"session_id": "abc"})  # no-op, no raise
 
-    def test_dispatch_calls_urlopen(self):
+    def test_dispatch_posts_once(self):
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({"session_complete": {"url": "http://localhost:9999/hook"}})
-        with patch("io_iii.api._webhooks.urllib.request.urlopen") as mock_open:
-            d.dispatch("session_complete", {"session_id": "abc"})
-        mock_open.assert_called_once()
+        calls = _dispatch_and_capture(d, "session_complete", {"session_id": "abc"})
+        assert len(calls) == 1
+        assert calls[0]["url"] == "http://localhost:9999/hook"
 
     def test_dispatch_sends_json_body(self):
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({"session_complete": {"url": "http://localhost:9999/hook"}})
-        sent_data = {}
-        def capture_request(req, timeout=None):
-            sent_data["data"] = req.data
-            return MagicMock()
-        with patch("io_iii.api._webhooks.urllib.request.urlopen", side_effect=capture_request):
-            d.dispatch("session_complete", {"session_id": "xyz", "turn_count": 3})
-        body = json.loads(sent_data["data"].decode("utf-8"))
+        calls = _dispatch_and_capture(d, "session_complete", {"session_id": "xyz", "turn_count": 3})
+        body = json.loads(calls[0]["data"].decode("utf-8"))
         assert body["session_id"] == "xyz"
+        assert calls[0]["headers"]["Content-Type"] == "application/json"
 
     def test_dispatch_uses_x_io3_event_header(self):
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({"session_complete": {"url": "http://localhost:9999/hook"}})
-        captured = {}
-        def capture_request(req, timeout=None):
-            captured["headers"] = req.headers
-            return MagicMock()
-        with patch("io_iii.api._webhooks.urllib.request.urlopen", side_effect=capture_request):
-            d.dispatch("session_complete", {"session_id": "abc"})
-        # Headers dict keys are lowercased by urllib
-        assert "x-io3-event" in {k.lower() for k in captured["headers"]}
+        calls = _dispatch_and_capture(d, "session_complete", {"session_id": "abc"})
+        assert calls[0]["headers"]["X-Io3-Event"] == "session_complete"
 
     def test_delivery_failure_is_silent(self):
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({"session_complete": {"url": "http://localhost:9999/hook"}})
-        with patch("io_iii.api._webhooks.urllib.request.urlopen",
-                   side_effect=Exception("connection refused")):
-            d.dispatch("session_complete", {"session_id": "abc"})
+        _dispatch_and_capture(
+            d, "session_complete", {"session_id": "abc"}, error=Exception("connection refused"),
+        )
         # Must not raise — best-effort delivery (ADR-025 §6)
 
     def test_dispatch_payload_is_content_safe(self):
         """Webhook payload must not contain model output or prompt text (ADR-025 §6)."""
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({"session_complete": {"url": "http://localhost:9999/hook"}})
-        sent_data = {}
-        def capture_request(req, timeout=None):
-            sent_data["data"] = req.data
-            return MagicMock()
         # Payload must be content-safe — pass only structural metadata
         payload = {"session_id": "abc", "turn_count": 5}
-        with patch("io_iii.api._webhooks.urllib.request.urlopen", side_effect=capture_request):
-            d.dispatch("session_complete", payload)
-        body = json.loads(sent_data["data"].decode())
+        calls = _dispatch_and_capture(d, "session_complete", payload)
+        body = json.loads(calls[0]["data"].decode())
         # Structural fields only
         assert "session_id" in body
         assert "turn_count" in body
@@ -451,49 +463,34 @@ class TestWebhookDispatch:
     def test_missing_url_is_no_op(self):
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({"session_complete": {}})  # no url key
-        with patch("io_iii.api._webhooks.urllib.request.urlopen") as mock_open:
-            d.dispatch("session_complete", {"session_id": "abc"})
-        mock_open.assert_not_called()
+        assert _dispatch_and_capture(d, "session_complete", {"session_id": "abc"}) == []
 
     def test_dispatch_uses_configured_timeout(self):
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({
             "session_complete": {"url": "http://localhost:9999/hook", "timeout_seconds": 10}
         })
-        captured = {}
-        def capture_request(req, timeout=None):
-            captured["timeout"] = timeout
-            return MagicMock()
-        with patch("io_iii.api._webhooks.urllib.request.urlopen", side_effect=capture_request):
-            d.dispatch("session_complete", {"session_id": "abc"})
-        assert captured["timeout"] == 10
+        calls = _dispatch_and_capture(d, "session_complete", {"session_id": "abc"})
+        assert calls[0]["timeout"] == 10
 
     def test_default_timeout_is_five(self):
         from io_iii.api._webhooks import WebhookDispatcher
         d = WebhookDispatcher({"session_complete": {"url": "http://localhost:9999/hook"}})
-        captured = {}
-        def capture_request(req, timeout=None):
-            captured["timeout"] = timeout
-            return MagicMock()
-        with patch("io_iii.api._webhooks.urllib.request.urlopen", side_effect=capture_request):
-            d.dispatch("session_complete", {"session_id": "abc"})
-        assert captured["timeout"] == 5
+        calls = _dispatch_and_capture(d, "session_complete", {"session_id": "abc"})
+        assert calls[0]["timeout"] == 5
 
     def test_runbook_complete_dispatches(self):
         from io_iii.api._webhooks import WebhookDispatcher, WEBHOOK_RUNBOOK_COMPLETE
         d = WebhookDispatcher({"runbook_complete": {"url": "http://localhost:9999/hook"}})
-        with patch("io_iii.api._webhooks.urllib.request.urlopen") as mock_open:
-            d.dispatch(WEBHOOK_RUNBOOK_COMPLETE, {"runbook_id": "rb-1"})
-        mock_open.assert_called_once()
+        assert len(_dispatch_and_capture(d, WEBHOOK_RUNBOOK_COMPLETE, {"runbook_id": "rb-1"})) == 1
 
     def test_steward_gate_triggered_dispatches(self):
         from io_iii.api._webhooks import WebhookDispatcher, WEBHOOK_STEWARD_GATE_TRIGGERED
         d = WebhookDispatcher({
             "steward_gate_triggered": {"url": "http://localhost:9999/hook"}
         })
-        with patch("io_iii.api._webhooks.urllib.request.urlopen") as mock_open:
-            d.dispatch(WEBHOOK_STEWARD_GATE_TRIGGERED, {
-                "session_id": "abc",
-                "threshold_key": "step_count",
-            })
-        mock_open.assert_called_once()
+        calls = _dispatch_and_capture(d, WEBHOOK_STEWARD_GATE_TRIGGERED, {
+            "session_id": "abc",
+            "threshold_key": "step_count",
+        })
+        assert len(calls) == 1
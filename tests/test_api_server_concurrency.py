@@ -0,0 +1,190 @@
+"""
+test_api_server_concurrency.py — bounded worker-pool serving mode for api/server.py.
+
+Verifies:
+  - a slow request does not block other clients (requests overlap)
+  - requests beyond max_in_flight get 503 SERVER_BUSY with Retry-After
+  - a slow client cannot hold the accept thread past the reject deadline
+  - turns on the same session are serialised; different sessions overlap
+  - SessionLocks drops per-session locks once unused
+  - resolve_server_limits precedence and validation
+"""
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+import types
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import io_iii.api.server as server_mod
+from io_iii.api._webhooks import WebhookDispatcher
+from io_iii.api.server import BoundedThreadingHTTPServer, SessionLocks, resolve_server_limits
+
+
+class _Tracker:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, *args, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            self.release.wait(5)
+            time.sleep(self.delay)
+            return 200, {"status": "ok"}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def _start(*, workers=4, max_in_flight=8):
+        handler = server_mod._make_handler(types.SimpleNamespace(runtime={}), WebhookDispatcher({}))
+        srv = BoundedThreadingHTTPServer(
+            ("127.0.0.1", 0), handler, workers=workers, max_in_flight=max_in_flight,
+        )
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servers.append(srv)
+        return f"http://127.0.0.1:{srv.server_address[1]}", srv
+
+    yield _start
+    for srv in servers:
+        srv.shutdown()
+        srv.server_close()
+
+
+def _post(url: str, body: dict = None):
+    req = urllib.request.Request(
+        url, data=json.dumps(body or {}).encode(), method="POST",
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            return resp.status, json.loads(resp.read()), resp.headers
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read()), e.headers
+
+
+def test_slow_request_does_not_block_others(serve, monkeypatch):
+    tracker = _Tracker(delay=0.2)
+    monkeypatch.setattr(server_mod, "handle_run", tracker)
+    base, _ = serve(workers=4)
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(4) as ex:
+        results = list(ex.map(lambda _: _post(base + "/run"), range(4)))
+    elapsed = time.perf_counter() - t0
+    assert all(status == 200 for status, _, _ in results)
+    assert tracker.peak > 1
+    assert elapsed < 0.6  # 4 × 200 ms sequentially would be 0.8 s
+
+
+def test_backpressure_returns_503(serve, monkeypatch):
+    tracker = _Tracker()
+    tracker.release.clear()
+    monkeypatch.setattr(server_mod, "handle_run", tracker)
+    base, srv = serve(workers=1, max_in_flight=1)
+
+    with ThreadPoolExecutor(1) as ex:
+        first = ex.submit(_post, base + "/run")
+        deadline = time.time() + 5
+        while tracker.active == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        status, body, headers = _post(base + "/run", {"prompt": "x" * 1000})
+        tracker.release.set()
+        assert first.result()[0] == 200
+
+    assert status == 503
+    assert body == {"status": "error", "error_code": "SERVER_BUSY"}
+    assert headers["Retry-After"] == "1"
+    assert srv.rejected == 1
+
+
+def test_reject_busy_bounded_for_slow_client():
+    server_side, client = socket.socketpair()
+    stop = threading.Event()
+
+    def trickle():
+        client.sendall(b"POST /run HTTP/1.1\r\nContent-Length: 1048576\r\n\r\n")
+        while not stop.is_set():
+            try:
+                client.sendall(b"x")
+            except OSError:
+                return
+            time.sleep(0.01)
+
+    t = threading.Thread(target=trickle, daemon=True)
+    t.start()
+    try:
+        t0 = time.monotonic()
+        server_mod._reject_busy(server_side)
+        elapsed = time.monotonic() - t0
+        client.settimeout(2)
+        reply = client.recv(4096)
+    finally:
+        stop.set()
+        server_side.close()
+        client.close()
+        t.join(timeout=2)
+
+    assert elapsed < server_mod._REJECT_DRAIN_S + 0.3
+    assert reply.startswith(b"HTTP/1.1 503 ")
+    assert b"SERVER_BUSY" in reply
+
+
+def test_same_session_turns_are_serialised(serve, monkeypatch):
+    tracker = _Tracker(delay=0.05)
+    monkeypatch.setattr(server_mod, "handle_session_turn", tracker)
+    base, _ = serve(workers=4)
+    with ThreadPoolExecutor(4) as ex:
+        list(ex.map(lambda _: _post(base + "/session/s1/turn"), range(4)))
+    assert tracker.peak == 1
+
+
+def test_different_sessions_overlap(serve, monkeypatch):
+    tracker = _Tracker(delay=0.1)
+    monkeypatch.setattr(server_mod, "handle_session_turn", tracker)
+    base, _ = serve(workers=4)
+    with ThreadPoolExecutor(4) as ex:
+        list(ex.map(lambda i: _post(base + f"/session/s{i}/turn"), range(4)))
+    assert tracker.peak > 1
+
+
+def test_session_locks_are_dropped_when_unused():
+    locks = SessionLocks()
+    with locks.hold("a"):
+        with locks.hold("b"):
+            assert len(locks) == 2
+    assert len(locks) == 0
+
+
+def test_resolve_server_limits():
+    assert resolve_server_limits({}) == (8, 32)
+    assert resolve_server_limits({"api_server": {"workers": 2, "max_in_flight": 4}}) == (2, 4)
+    assert resolve_server_limits({"api_server": {"workers": 2}}, workers=16) == (16, 32)
+    assert resolve_server_limits({}, workers=64) == (64, 64)
+
+
+@pytest.mark.parametrize("runtime,kw", [
+    ({"api_server": []}, {}),
+    ({"api_server": {"workers": 0}}, {}),
+    ({}, {"max_in_flight": 0}),
+    ({}, {"workers": 4, "max_in_flight": 2}),
+])
+def test_resolve_server_limits_invalid(runtime, kw):
+    with pytest.raises(ValueError, match="API_SERVER_CONFIG_INVALID"):
+        resolve_server_limits(runtime, **kw)
@@ -7,12 +7,12 @@ Governing ADR: ADR-025 — API-as-Transport-Adapter Contract.
 
 Coverage:
   M9.1 — HTTP API routes:
-    - POST /run → cmd_run (transport-adapter pattern)
-    - POST /runbook → cmd_runbook
-    - POST /session/start → cmd_session_start
-    - POST /session/{id}/turn → cmd_session_continue
-    - GET  /session/{id}/state → cmd_session_status
-    - DELETE /session/{id} → cmd_session_close
+    - POST /run → execute_run (transport-adapter pattern)
+    - POST /runbook → execute_runbook
+    - POST /session/start → execute_session_start
+    - POST /session/{id}/turn → execute_session_continue
+    - GET  /session/{id}/state → execute_session_status
+    - DELETE /session/{id} → execute_session_close
     - GET  /health → liveness probe (no exec)
 
   M9.2 — SSE event stream:
@@ -25,7 +25,7 @@ Coverage:
     - 'logging_policy' stripped
 
   Transport-adapter rule (ADR-025 §1):
-    - Every route captures stdout from the corresponding cmd_* function
+    - Every route calls the corresponding execute_* service function
     - No new execution semantics introduced in the API layer
 
   M9.4 — --output json flag:
@@ -38,7 +38,6 @@ Coverage:
 """
 from __future__ import annotations
 
-import json
 from argparse import Namespace
 from unittest.mock import MagicMock, patch
 
@@ -47,6 +46,7 @@ from fastapi.testclient import TestClient
 
 from io_iii.api.app import app, _strip_content
 from io_iii.api import _bus as bus
+from io_iii.cli import CommandResult
 
 
 # ---------------------------------------------------------------------------
@@ -61,18 +61,16 @@ client = TestClient(app, raise_server_exceptions=True)
 # ---------------------------------------------------------------------------
 
 def _make_cmd_ok(payload: dict):
-    """Return a function that prints JSON and returns 0 (simulates cmd_*)."""
+    """Return a function that returns an exit-0 CommandResult (simulates execute_*)."""
     def _cmd(args):
-        print(json.dumps(payload))
-        return 0
+        return CommandResult(exit_code=0, payload=payload)
     return _cmd
 
 
 def _make_cmd_err(payload: dict):
-    """Return a function that prints JSON and returns 1 (simulates cmd_* error)."""
+    """Return a function that returns an exit-1 CommandResult (simulates execute_* error)."""
     def _cmd(args):
-        print(json.dumps(payload))
-        return 1
+        return CommandResult(exit_code=1, payload=payload)
     return _cmd
 
 
@@ -90,7 +88,7 @@ class TestRunRoute:
             "message": "CONTENT_UNSAFE_SHOULD_BE_STRIPPED",
         }
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_run = _make_cmd_ok(payload)
+            m.return_value.execute_run = _make_cmd_ok(payload)
             resp = client.post("/run", json={"mode": "executor"})
         assert resp.status_code == 200
         body = resp.json()
@@ -102,7 +100,7 @@ class TestRunRoute:
         """POST /run returns 422 when cmd_run exits with code 1."""
         err_payload = {"status": "error", "error_code": "PROVIDER_UNAVAILABLE"}
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_run = _make_cmd_err(err_payload)
+            m.return_value.execute_run = _make_cmd_err(err_payload)
             resp = client.post("/run", json={"mode": "executor"})
         assert resp.status_code == 422
         body = resp.json()
@@ -113,10 +111,9 @@ class TestRunRoute:
         received = {}
         def _cmd(args):
             received["mode"] = args.mode
-            print(json.dumps({"status": "ok"}))
-            return 0
+            return CommandResult(exit_code=0, payload={"status": "ok"})
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_run = _cmd
+            m.return_value.execute_run = _cmd
             client.post("/run", json={"mode": "research"})
         assert received["mode"] == "research"
 
@@ -125,10 +122,9 @@ class TestRunRoute:
         received = {}
         def _cmd(args):
             received.update(vars(args))
-            print(json.dumps({"status": "ok"}))
-            return 0
+            return CommandResult(exit_code=0, payload={"status": "ok"})
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_run = _cmd
+            m.return_value.execute_run = _cmd
             client.post("/run", json={
                 "mode": "executor",
                 "audit": True,
@@ -152,7 +148,7 @@ class TestRunbookRoute:
             "steps_completed": 2,
         }
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_runbook = _make_cmd_ok(payload)
+            m.return_value.execute_runbook = _make_cmd_ok(payload)
             resp = client.post("/runbook", json={"json_file": "/tmp/fake.json"})
         assert resp.status_code == 200
         assert resp.json()["runbook_id"] == "rb-001"
@@ -161,10 +157,9 @@ class TestRunbookRoute:
         received = {}
         def _cmd(args):
             received["json_file"] = args.json_file
-            print(json.dumps({"status": "ok"}))
-            return 0
+            return CommandResult(exit_code=0, payload={"status": "ok"})
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_runbook = _cmd
+            m.return_value.execute_runbook = _cmd
             client.post("/runbook", json={"json_file": "/path/to/rb.json"})
         assert received["json_file"] == "/path/to/rb.json"
 
@@ -175,7 +170,7 @@ class TestRunbookRoute:
         with patch("io_iii.api.app._cli") as m, \
              patch("io_iii.api.app.webhooks.dispatch") as mock_dispatch, \
              patch("io_iii.api.app._runtime_cfg", return_value={"webhook_url": "http://hook"}):
-            m.return_value.cmd_runbook = _make_cmd_ok(payload)
+            m.return_value.execute_runbook = _make_cmd_ok(payload)
             mock_dispatch.side_effect = lambda url, evt, pl: dispatched.append((evt, pl))
             client.post("/runbook", json={"json_file": "/f.json"})
         assert any(e == "RUNBOOK_COMPLETE" for e, _ in dispatched)
@@ -195,7 +190,7 @@ class TestSessionStartRoute:
             "max_turns": 20,
         }
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_start = _make_cmd_ok(payload)
+            m.return_value.execute_session_start = _make_cmd_ok(payload)
             resp = client.post("/session/start", json={"mode": "work"})
         assert resp.status_code == 200
         body = resp.json()
@@ -206,7 +201,7 @@ class TestSessionStartRoute:
         sid = "ses-bus-test"
         payload = {"session_id": sid, "status": "active", "turn_count": 0, "session_mode": "work"}
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_start = _make_cmd_ok(payload)
+            m.return_value.execute_session_start = _make_cmd_ok(payload)
             client.post("/session/start", json={"mode": "work"})
         events = bus.get_events_since(sid, 0)
         assert len(events) >= 1
@@ -214,7 +209,7 @@ class TestSessionStartRoute:
 
     def test_start_error(self):
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_start = _make_cmd_err({"status": "error"})
+            m.return_value.execute_session_start = _make_cmd_err({"status": "error"})
             resp = client.post("/session/start", json={"mode": "bad"})
         assert resp.status_code == 422
 
@@ -234,7 +229,7 @@ class TestSessionTurnRoute:
             "latency_ms": 55,
         }
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_continue = _make_cmd_ok(payload)
+            m.return_value.execute_session_continue = _make_cmd_ok(payload)
             resp = client.post("/session/ses-t/turn", json={"prompt": "hello"})
         assert resp.status_code == 200
         body = resp.json()
@@ -250,7 +245,7 @@ class TestSessionTurnRoute:
         # Clear any prior events for this session
         bus.clear(sid)
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_continue = _make_cmd_ok(payload)
+            m.return_value.execute_session_continue = _make_cmd_ok(payload)
             client.post(f"/session/{sid}/turn", json={"prompt": "p"})
         events = bus.get_events_since(sid, 0)
         event_types = [e["event"] for e in events]
@@ -267,7 +262,7 @@ class TestSessionTurnRoute:
             "pause": {"threshold_key": "step_count", "step_index": 0, "steps_total": 1},
         }
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_continue = _make_cmd_ok(payload)
+            m.return_value.execute_session_continue = _make_cmd_ok(payload)
             client.post(f"/session/{sid}/turn", json={"prompt": "p"})
         events = bus.get_events_since(sid, 0)
         event_types = [e["event"] for e in events]
@@ -285,7 +280,7 @@ class TestSessionTurnRoute:
         with patch("io_iii.api.app._cli") as m, \
              patch("io_iii.api.app.webhooks.dispatch") as mock_d, \
              patch("io_iii.api.app._runtime_cfg", return_value={"webhook_url": "http://hook"}):
-            m.return_value.cmd_session_continue = _make_cmd_ok(payload)
+            m.return_value.execute_session_continue = _make_cmd_ok(payload)
             mock_d.side_effect = lambda url, evt, pl: dispatched.append(evt)
             client.post(f"/session/{sid}/turn", json={"prompt": "last"})
         assert "SESSION_COMPLETE" in dispatched
@@ -294,10 +289,9 @@ class TestSessionTurnRoute:
         received = {}
         def _cmd(args):
             received["session_id"] = args.session_id
-            print(json.dumps({"status": "ok", "session_status": "active"}))
-            return 0
+            return CommandResult(exit_code=0, payload={"status": "ok", "session_status": "active"})
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_continue = _cmd
+            m.return_value.execute_session_continue = _cmd
             client.post("/session/MY-SES-ID/turn", json={"prompt": "x"})
         assert received["session_id"] == "MY-SES-ID"
 
@@ -315,14 +309,14 @@ class TestSessionStateRoute:
             "max_turns": 20,
         }
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_status = _make_cmd_ok(payload)
+            m.return_value.execute_session_status = _make_cmd_ok(payload)
             resp = client.get("/session/ses-s/state")
         assert resp.status_code == 200
         assert resp.json()["session_id"] == "ses-s"
 
     def test_state_not_found(self):
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_status = _make_cmd_err(
+            m.return_value.execute_session_status = _make_cmd_err(
                 {"status": "error", "error_code": "SESSION_NOT_FOUND"}
             )
             resp = client.get("/session/no-such/state")
@@ -337,7 +331,7 @@ class TestSessionCloseRoute:
     def test_close_ok(self):
         payload = {"session_id": "ses-cl", "status": "closed", "turn_count": 2}
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_close = _make_cmd_ok(payload)
+            m.return_value.execute_session_close = _make_cmd_ok(payload)
             resp = client.delete("/session/ses-cl")
         assert resp.status_code == 200
         assert resp.json()["status"] == "closed"
@@ -347,7 +341,7 @@ class TestSessionCloseRoute:
         bus.clear(sid)
         payload = {"session_id": sid, "status": "closed", "turn_count": 1}
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_session_close = _make_cmd_ok(payload)
+            m.return_value.execute_session_close = _make_cmd_ok(payload)
             client.delete(f"/session/{sid}")
         events = bus.get_events_since(sid, 0)
         assert any(e["event"] == "session_closed" for e in events)
@@ -360,7 +354,7 @@ class TestSessionCloseRoute:
         with patch("io_iii.api.app._cli") as m, \
              patch("io_iii.api.app.webhooks.dispatch") as mock_d, \
              patch("io_iii.api.app._runtime_cfg", return_value={"webhook_url": "http://hook"}):
-            m.return_value.cmd_session_close = _make_cmd_ok(payload)
+            m.return_value.execute_session_close = _make_cmd_ok(payload)
             mock_d.side_effect = lambda url, evt, pl: dispatched.append(evt)
             client.delete(f"/session/{sid}")
         assert "SESSION_COMPLETE" in dispatched
@@ -381,7 +375,7 @@ class TestHealthRoute:
     def test_health_no_exec(self):
         """Health endpoint must not call any CLI command."""
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_run = MagicMock(side_effect=Exception("must not run"))
+            m.return_value.execute_run = MagicMock(side_effect=Exception("must not run"))
             resp = client.get("/health")
         assert resp.status_code == 200
 
@@ -402,7 +396,7 @@ class TestSSEStream:
     def _run_sse(self, sid, state_payload, extra_events=None):
         """
         Shared helper: set up bus, run SSE request, return raw bytes.
-        Patches _SSE_POLL_INTERVAL to 0 so the first sleep is instant.
+        The close sentinel is queued first, so the stream ends without waiting.
         """
         bus.clear(sid)
         if extra_events:
@@ -410,9 +404,8 @@ class TestSSEStream:
                 bus.publish(sid, evt_type, evt_data)
         bus.close_stream(sid)
 
-        with patch("io_iii.api.app._cli") as m, \
-             patch("io_iii.api.app._SSE_POLL_INTERVAL", 0):
-            m.return_value.cmd_session_status = _make_cmd_ok(state_payload)
+        with patch("io_iii.api.app._cli") as m:
+            m.return_value.execute_session_status = _make_cmd_ok(state_payload)
             with client.stream("GET", f"/session/{sid}/stream") as resp:
                 return resp, b"".join(resp.iter_raw())
 
@@ -548,7 +541,7 @@ class TestContentSafety:
             "message": "top-level message",
         }
         with patch("io_iii.api.app._cli") as m:
-            m.return_value.cmd_run = _make_cmd_ok(payload)
+            m.return_value.execute_run = _make_cmd_ok(payload)
             resp = client.post("/run", json={"mode": "executor"})
         body = resp.json()
         assert "message" not in body
@@ -701,3 +694,68 @@ class TestCLIServeCommand:
         args = mock_serve.call_args[0][0]
         assert args.host == "0.0.0.0"
         assert args.port == 8080
+
+
+# ===========================================================================
+# 14. Service layer — structured results, no stdout capture
+# ===========================================================================
+
+class TestServiceLayer:
+    def test_stray_stdout_does_not_affect_response(self, capsys):
+        """Payload comes from the CommandResult, not from anything printed."""
+        def _cmd(args):
+            print("unrelated noise")
+            return CommandResult(exit_code=0, payload={"status": "ok", "session_id": "ses-n"})
+        with patch("io_iii.api.app._cli") as m:
+            m.return_value.execute_session_status = _cmd
+            resp = client.get("/session/ses-n/state")
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "ok", "session_id": "ses-n"}
+
+    def test_stderr_only_failure_surfaces_error_code(self):
+        """A failure with no payload returns its code; stderr text is never returned."""
+        def _cmd(args):
+            return CommandResult(
+                exit_code=1,
+                error_code="SESSION_NOT_FOUND",
+                stderr="SESSION_NOT_FOUND: secret detail",
+            )
+        with patch("io_iii.api.app._cli") as m:
+            m.return_value.execute_session_status = _cmd
+            resp = client.get("/session/nope/state")
+        assert resp.status_code == 422
+        assert resp.json() == {"status": "error", "error_code": "SESSION_NOT_FOUND"}
+
+    def test_exception_surfaces_type_name_only(self):
+        with patch("io_iii.api.app._cli") as m:
+            m.return_value.execute_run = MagicMock(side_effect=KeyError("secret"))
+            resp = client.post("/run", json={"mode": "executor"})
+        assert resp.status_code == 422
+        assert resp.json() == {"status": "error", "error_code": "KeyError"}
+
+    def test_concurrent_requests_get_their_own_payloads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _cmd(args):
+            print(f"noise {args.session_id}")
+            return CommandResult(exit_code=0, payload={"session_id": args.session_id})
+
+        with patch("io_iii.api.app._cli") as m:
+            m.return_value.execute_session_status = _cmd
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                resps = list(pool.map(
+                    lambda i: client.get(f"/session/ses-{i}/state"), range(32)
+                ))
+        assert [r.json()["session_id"] for r in resps] == [f"ses-{i}" for i in range(32)]
+
+    def test_cmd_wrapper_renders_service_result(self, capsys):
+        """cmd_session_status prints the same payload execute_session_status returns."""
+        import io_iii.cli as cli_mod
+        args = Namespace(session_id=None, config_dir=None)
+        res = cli_mod.execute_session_status(args)
+        assert res.exit_code == 1
+        assert res.error_code == "SESSION_ID_REQUIRED"
+        assert cli_mod.cmd_session_status(args) == 1
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "SESSION_ID_REQUIRED" in captured.err
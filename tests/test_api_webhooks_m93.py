@@ -6,7 +6,7 @@ Phase 9 M9.3 — Webhook dispatch.
 Governing ADR: ADR-025 §6 — Webhook Dispatch.
 
 Coverage:
-  - dispatch() fires a daemon thread per call (non-blocking)
+  - dispatch() queues on the shared bounded delivery worker (non-blocking)
   - dispatch() no-ops when url is None or empty
   - get_webhook_url() extracts webhook_url from runtime config
   - Content-safe payloads: event type + structural metadata only
@@ -20,7 +20,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from io_iii.api._webhooks import dispatch, get_webhook_url, _fire
+from io_iii.api._webhooks import (
+    DeliverySettings,
+    _fire,
+    dispatch,
+    get_webhook_url,
+    shared_delivery_worker,
+    shutdown_delivery_worker,
+)
 
 
 # ===========================================================================
@@ -63,39 +70,42 @@ class TestDispatchNoop:
 
 
 # ===========================================================================
-# 3. dispatch() — thread spawning
+# 3. dispatch() — shared bounded delivery worker
 # ===========================================================================
 
-class TestDispatchThread:
-    def test_spawns_daemon_thread(self):
-        """dispatch() spawns exactly one daemon Thread."""
-        threads = []
-        real_thread = threading.Thread
-
-        def capture_thread(**kwargs):
-            t = real_thread(**kwargs)
-            t.daemon = True
-            threads.append(t)
-            return t
-
-        with patch("io_iii.api._webhooks.threading.Thread", side_effect=capture_thread):
-            dispatch("http://localhost/hook", "SESSION_COMPLETE", {"session_id": "s"})
-
-        assert len(threads) == 1
-        assert threads[0].daemon is True
+class TestDispatchWorker:
+    @pytest.fixture(autouse=True)
+    def _fresh_worker(self):
+        shutdown_delivery_worker()
+        yield
+        shutdown_delivery_worker()
+
+    def test_uses_fixed_worker_threads(self):
+        """dispatch() queues on the shared worker instead of a thread per call."""
+        with patch("io_iii.api._webhooks._post", return_value=200):
+            for i in range(20):
+                dispatch("http://localhost/hook", "SESSION_COMPLETE", {"session_id": f"s{i}"})
+            worker = shared_delivery_worker()
+            assert worker.flush(timeout=5)
+        stats = worker.stats()
+        assert stats["workers"] == DeliverySettings().workers
+        assert stats["delivered"] == 20
 
     def test_non_blocking(self):
         """dispatch() returns immediately without waiting for HTTP call."""
         called = threading.Event()
 
-        def slow_fire(url, body):
+        def slow_post(url, data, headers, timeout):
             called.wait(timeout=5)  # would block if awaited
+            return 200
 
-        with patch("io_iii.api._webhooks._fire", side_effect=slow_fire):
+        with patch("io_iii.api._webhooks._post", side_effect=slow_post):
             dispatch("http://localhost/hook", "SESSION_COMPLETE", {"session_id": "s"})
-        # If dispatch() waited for _fire(), this line would be reached only after
-        # the event is set. Since it's fire-and-forget, we reach here immediately.
-        called.set()  # unblock the thread so it can clean up
+            # If dispatch() waited for the POST, this line would be reached only
+            # after the event is set. Since it's fire-and-forget, we reach here
+            # immediately.
+            called.set()  # unblock the worker so it can clean up
+            assert shared_delivery_worker().flush(timeout=5)
 
 
 # ===========================================================================
@@ -144,22 +154,20 @@ class TestWebhookContentSafety:
         import json
         sent_body = {}
 
-        def capture_fire(url, body):
-            sent_body.update(body)
-
-        with patch("io_iii.api._webhooks._fire", side_effect=capture_fire):
-            # Run synchronously by patching Thread to run immediately
-            with patch("io_iii.api._webhooks.threading.Thread") as mock_t:
-                def run_now(**kwargs):
-                    t = MagicMock()
-                    t.start = lambda: kwargs["target"](*kwargs.get("args", ()))
-                    t.daemon = True
-                    return t
-                mock_t.side_effect = run_now
+        def capture_post(url, data, headers, timeout):
+            sent_body.update(json.loads(data))
+            return 200
+
+        shutdown_delivery_worker()
+        try:
+            with patch("io_iii.api._webhooks._post", side_effect=capture_post):
                 dispatch("http://hook", "SESSION_COMPLETE", {
                     "session_id": "ses-x",
                     "session_status": "closed",
                 })
+                assert shared_delivery_worker().flush(timeout=5)
+        finally:
+            shutdown_delivery_worker()
 
         assert sent_body.get("event") == "SESSION_COMPLETE"
         assert sent_body.get("session_id") == "ses-x"
@@ -0,0 +1,317 @@
+"""
+test_async_engine.py — AsyncProvider contract and asyncio engine entry points.
+
+Verifies:
+  - AsyncOllamaProvider speaks HTTP/1.1 over asyncio streams
+    (Content-Length and chunked bodies, token counts, error mapping)
+  - engine.run_async matches engine.run for the same provider behaviour
+  - many concurrent run_async calls share one loop without extra threads
+  - blocking providers still work under run_async (worker thread)
+  - engine.run rejects an async-only provider with a typed error
+  - audited run_async awaits an async challenger and the revision pass
+  - orchestrator.run_async prefers deps.async_provider_factory
+  - orchestrator.run_async forwards a capability (null route)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import io_iii.core.engine as engine
+import io_iii.core.orchestrator as orchestrator
+from io_iii.capabilities.builtins import builtin_registry
+from io_iii.core.dependencies import RuntimeDependencies
+from io_iii.core.task_spec import TaskSpec
+from io_iii.providers.async_ollama_provider import AsyncOllamaProvider
+from io_iii.providers.provider_contract import AsyncProvider, ProviderError
+
+# ---------------------------------------------------------------------------
+# Local HTTP server fixture
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.payloads.append(json.loads(self.rfile.read(length)))
+        body = self.server.body
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        if self.server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            half = len(body) // 2
+            for part in (body[:half], body[half:]):
+                self.wfile.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.daemon_threads = True
+    srv.payloads = []
+    srv.status = 200
+    srv.chunked = False
+    srv.body = json.dumps({"response": "async ok", "prompt_eval_count": 5, "eval_count": 2}).encode()
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _host(srv) -> str:
+    return f"http://127.0.0.1:{srv.server_address[1]}"
+
+
+# ---------------------------------------------------------------------------
+# AsyncOllamaProvider
+# ---------------------------------------------------------------------------
+
+def test_async_ollama_provider_satisfies_protocol():
+    assert isinstance(AsyncOllamaProvider(), AsyncProvider)
+
+
+def test_async_provider_from_config_uses_same_host_resolution(monkeypatch):
+    monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    p = AsyncOllamaProvider.from_config({"providers": {"ollama": {"base_url": "http://h:1"}}})
+    assert p.host == "http://h:1"
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_async_generate_with_metrics(server, chunked):
+    server.chunked = chunked
+    p = AsyncOllamaProvider(host=_host(server))
+    assert asyncio.run(p.generate_with_metrics(model="m", prompt="x")) == ("async ok", 5, 2)
+    assert server.payloads[0]["stream"] is False
+    assert server.payloads[0]["prompt"] == "/no_think\nx"
+
+
+def test_async_non_2xx_raises_provider_error(server):
+    server.status = 404
+    p = AsyncOllamaProvider(host=_host(server))
+    with pytest.raises(ProviderError) as exc_info:
+        asyncio.run(p.generate(model="m", prompt="x"))
+    assert exc_info.value.code == "PROVIDER_OLLAMA_FAILED"
+    assert "HTTP Error 404" in exc_info.value.detail
+
+
+def test_async_bad_json_raises_provider_error(server):
+    server.body = b"not json"
+    p = AsyncOllamaProvider(host=_host(server))
+    with pytest.raises(ProviderError) as exc_info:
+        asyncio.run(p.generate(model="m", prompt="x"))
+    assert exc_info.value.code == "PROVIDER_OLLAMA_BAD_JSON"
+
+
+def test_async_connection_refused_raises_provider_error():
+    p = AsyncOllamaProvider(host="http://127.0.0.1:9")
+    with pytest.raises(ProviderError):
+        asyncio.run(p.generate(model="m", prompt="x"))
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class _FakeAsyncProvider:
+    name = "ollama"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def generate(self, *, model, prompt):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return " revised "
+
+    async def generate_with_metrics(self, *, model, prompt):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return " draft ", 4, 1
+
+
+class _FakeSyncProvider:
+    name = "ollama"
+
+    def generate(self, *, model, prompt):
+        return " sync draft "
+
+
+def _state(rid="t-async"):
+    from io_iii.core.session_state import AuditGateState, RouteInfo, SessionState
+    return SessionState(
+        request_id=rid,
+        started_at_ms=int(time.time() * 1000),
+        mode="executor",
+        config_dir="./architecture/runtime/config",
+        route=RouteInfo(
+            mode="executor",
+            primary_target="ollama:llama3.2",
+            secondary_target=None,
+            selected_target="ollama:llama3.2",
+            selected_provider="ollama",
+            fallback_used=False,
+            fallback_reason=None,
+        ),
+        audit=AuditGateState(audit_enabled=False),
+        status="ok",
+        provider="ollama",
+        model="llama3.2",
+        route_id="executor",
+        persona_contract_version="v1.0",
+        logging_policy={"content": "disabled"},
+    )
+
+
+def _cfg():
+    return types.SimpleNamespace(providers={}, logging={}, routing={"routing_table": {}}, runtime={})
+
+
+def test_run_async_uses_async_provider():
+    provider = _FakeAsyncProvider()
+    state, result = asyncio.run(engine.run_async(
+        cfg=_cfg(), session_state=_state(), user_prompt="hi", audit=False,
+        ollama_provider_factory=lambda _: provider,
+    ))
+    assert result.message == "draft"
+    assert state.status == "ok"
+    assert result.meta["telemetry"]["input_tokens"] == 4
+    assert result.meta["trace"]["status"] == "completed"
+
+
+def test_run_async_multiplexes_concurrent_runs_on_one_loop():
+    provider = _FakeAsyncProvider(delay=0.05)
+
+    async def _many():
+        return await asyncio.gather(*(
+            engine.run_async(
+                cfg=_cfg(), session_state=_state(f"t-{i}"), user_prompt="hi", audit=False,
+                ollama_provider_factory=lambda _: provider,
+            )
+            for i in range(100)
+        ))
+
+    threads_before = threading.active_count()
+    t0 = time.perf_counter()
+    results = asyncio.run(_many())
+    elapsed = time.perf_counter() - t0
+
+    assert len(results) == 100
+    assert all(r.message == "draft" for _, r in results)
+    assert threading.active_count() <= threads_before
+    # 100 × 50 ms sequentially would be 5 s; concurrent runs overlap.
+    assert elapsed < 2.5
+
+
+def test_run_async_accepts_blocking_provider():
+    _, result = asyncio.run(engine.run_async(
+        cfg=_cfg(), session_state=_state(), user_prompt="hi", audit=False,
+        ollama_provider_factory=lambda _: _FakeSyncProvider(),
+    ))
+    assert result.message == "sync draft"
+
+
+def test_sync_run_rejects_async_provider():
+    with pytest.raises(TypeError, match="ASYNC_PROVIDER_REQUIRES_RUN_ASYNC"):
+        engine.run(
+            cfg=_cfg(), session_state=_state(), user_prompt="hi", audit=False,
+            ollama_provider_factory=lambda _: _FakeAsyncProvider(),
+        )
+
+
+def test_run_async_audit_awaits_challenger_and_revision():
+    provider = _FakeAsyncProvider()
+    seen = []
+
+    async def challenger(_cfg, _prompt, draft):
+        seen.append(draft)
+        return {"verdict": "needs_work", "issues": [], "high_risk_claims": [], "suggested_fixes": []}
+
+    state, result = asyncio.run(engine.run_async(
+        cfg=_cfg(), session_state=_state(), user_prompt="hi", audit=True,
+        challenger_fn=challenger, ollama_provider_factory=lambda _: provider,
+    ))
+    assert seen == ["draft"]
+    assert result.message == "revised"
+    assert result.audit_meta == {"audit_used": True, "audit_verdict": "needs_work", "revised": True}
+    assert state.audit.revision_passes == 1
+    assert provider.calls == 2
+
+
+def test_run_async_failure_reaches_terminal_trace_state():
+    class _Failing:
+        name = "ollama"
+
+        async def generate(self, *, model, prompt):
+            raise ProviderError("PROVIDER_OLLAMA_FAILED", "boom")
+
+    with pytest.raises(ProviderError) as exc_info:
+        asyncio.run(engine.run_async(
+            cfg=_cfg(), session_state=_state(), user_prompt="hi", audit=False,
+            ollama_provider_factory=lambda _: _Failing(),
+        ))
+    assert exc_info.value.runtime_failure is not None
+
+
+# ---------------------------------------------------------------------------
+# Orchestrator
+# ---------------------------------------------------------------------------
+
+def _routing_cfg(ollama_enabled: bool = True) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        config_dir=".",
+        providers={} if ollama_enabled else {"providers": {"ollama": {"enabled": False}}},
+        routing={
+            "routing_table": {
+                "rules": {"boundaries": {}},
+                "modes": {"executor": {"primary": "local:test-model", "secondary": "local:fallback-model"}},
+            }
+        },
+        logging={"schema": "test"},
+        runtime={},
+    )
+
+
+def test_orchestrator_run_async_prefers_async_provider_factory():
+    provider = _FakeAsyncProvider()
+    deps = RuntimeDependencies(
+        ollama_provider_factory=lambda _: pytest.fail("sync factory must not be used"),
+        capability_registry=builtin_registry(),
+        async_provider_factory=lambda _: provider,
+    )
+    spec = TaskSpec.create(mode="executor", prompt="hi")
+    state, result = asyncio.run(orchestrator.run_async(task_spec=spec, cfg=_routing_cfg(), deps=deps))
+    assert result.message == "draft"
+    assert state.task_spec_id == spec.task_spec_id
+
+
+def test_orchestrator_run_async_forwards_capability_on_null_route():
+    deps = RuntimeDependencies(
+        ollama_provider_factory=lambda _: None,
+        capability_registry=builtin_registry(),
+    )
+    spec = TaskSpec.create(mode="executor", prompt="hi", capabilities=["cap.echo_json"])
+    state, result = asyncio.run(orchestrator.run_async(
+        task_spec=spec, cfg=_routing_cfg(ollama_enabled=False), deps=deps,
+        capability_payload={"k": "v"},
+    ))
+    assert result.provider == "null"
+    assert result.meta["capability"]["capability_id"] == "cap.echo_json"
+    assert result.meta["capability"]["ok"] is True
@@ -0,0 +1,138 @@
+"""
+test_bus_push.py — push-based session event bus (api/_bus.py).
+
+Verifies:
+  - a blocked thread subscriber wakes within milliseconds of publish
+  - an awaiting coroutine subscriber wakes within milliseconds (no polling)
+  - wait / wait_async return False on timeout when idle
+  - drain() yields the shared event objects (no per-subscriber copies)
+    and advances the cursor
+  - several subscribers each see every event
+  - subscriber_count tracks open subscriptions
+  - clear() with live subscribers resets their cursor
+  - the SSE endpoint delivers an event published after connect
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from io_iii.api import _bus as bus
+
+
+@pytest.fixture
+def sid(request):
+    name = f"push-{request.node.name}"
+    bus.clear(name)
+    yield name
+    bus.clear(name)
+
+
+def test_thread_subscriber_wakes_on_publish(sid):
+    woke = {}
+    with bus.subscribe(sid) as sub:
+        def _waiter():
+            assert sub.wait(timeout=5)
+            woke["at"] = time.perf_counter()
+
+        t = threading.Thread(target=_waiter)
+        t.start()
+        time.sleep(0.05)
+        sent = time.perf_counter()
+        bus.publish(sid, "turn_started", {})
+        t.join(5)
+    assert woke["at"] - sent < 0.05
+
+
+def test_async_subscriber_wakes_on_publish(sid):
+    async def _main():
+        with bus.subscribe(sid) as sub:
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, bus.publish, sid, "turn_started", {})
+            t0 = time.perf_counter()
+            assert await sub.wait_async(timeout=5)
+            return time.perf_counter() - t0
+
+    assert asyncio.run(_main()) < 0.5
+
+
+def test_async_wake_from_other_thread(sid):
+    async def _main():
+        with bus.subscribe(sid) as sub:
+            threading.Timer(0.05, bus.publish, args=(sid, "turn_completed", {})).start()
+            assert await sub.wait_async(timeout=5)
+            return [e["event"] for e in sub.drain()]
+
+    assert asyncio.run(_main()) == ["turn_completed"]
+
+
+def test_wait_timeouts(sid):
+    with bus.subscribe(sid) as sub:
+        assert sub.wait(timeout=0.01) is False
+        assert asyncio.run(sub.wait_async(timeout=0.01)) is False
+
+
+def test_drain_shares_event_objects_and_advances(sid):
+    bus.publish(sid, "a", {})
+    bus.publish(sid, "b", {})
+    with bus.subscribe(sid) as one, bus.subscribe(sid) as two:
+        first = list(one.drain())
+        second = list(two.drain())
+        assert [e["event"] for e in first] == ["a", "b"]
+        assert all(x is y for x, y in zip(first, second))
+        assert one.cursor == 2
+        assert list(one.drain()) == []
+        bus.publish(sid, "c", {})
+        assert [e["event"] for e in one.drain()] == ["c"]
+
+
+def test_subscriber_count(sid):
+    before = bus.subscriber_count()
+    with bus.subscribe(sid):
+        with bus.subscribe(sid):
+            assert bus.subscriber_count(sid) == 2
+            assert bus.subscriber_count() == before + 2
+    assert bus.subscriber_count(sid) == 0
+
+
+def test_clear_resets_live_subscribers(sid):
+    bus.publish(sid, "old", {})
+    with bus.subscribe(sid) as sub:
+        list(sub.drain())
+        bus.clear(sid)
+        bus.publish(sid, "new", {})
+        assert [e["event"] for e in sub.drain()] == ["new"]
+
+
+def test_sse_endpoint_receives_event_published_after_connect(sid):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from unittest.mock import MagicMock, patch
+
+    from fastapi.testclient import TestClient
+
+    from io_iii.api.app import app
+    from io_iii.cli import CommandResult
+
+    def _publish_later():
+        deadline = time.time() + 5
+        while bus.subscriber_count(sid) == 0 and time.time() < deadline:
+            time.sleep(0.005)
+        bus.publish(sid, "turn_completed", {"turn_index": 0})
+        bus.close_stream(sid)
+
+    with patch("io_iii.api.app._cli") as m:
+        m.return_value.execute_session_status = MagicMock(
+            return_value=CommandResult(0, payload={"session_id": sid, "status": "active"})
+        )
+        threading.Thread(target=_publish_later).start()
+        t0 = time.perf_counter()
+        with TestClient(app).stream("GET", f"/session/{sid}/stream") as resp:
+            body = b"".join(resp.iter_raw())
+        elapsed = time.perf_counter() - t0
+
+    assert b"event: turn_completed" in body
+    assert elapsed < 1.0
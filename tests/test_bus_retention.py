@@ -0,0 +1,148 @@
+"""
+test_bus_retention.py — bounded, TTL-evicting storage for the SSE event bus.
+
+Verifies:
+  - per-session ring buffer honours max_events and max_bytes
+  - sequence cursors stay absolute after trimming (get_events_since)
+  - a slow subscriber receives one events_dropped event with the missed count
+  - idle sessions are evicted after ttl_seconds; subscribed sessions are kept
+  - max_sessions evicts the least recently active session first
+  - transient events reach attached subscribers in order, are never stored
+    or replayed, and overflow into events_dropped
+  - configure / configure_from_runtime validation
+"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from io_iii.api import _bus as bus
+
+
+@pytest.fixture(autouse=True)
+def _limits():
+    with bus._lock:
+        saved = dict(bus._channels)
+        bus._channels.clear()
+    yield
+    bus.configure(**vars(bus.BusLimits()))
+    with bus._lock:
+        bus._channels.clear()
+        bus._channels.update(saved)
+
+
+def _publish(sid, n, payload=None):
+    for i in range(n):
+        bus.publish(sid, "ev", payload if payload is not None else {"i": i})
+
+
+def test_ring_buffer_max_events():
+    bus.configure(max_events=3)
+    _publish("s", 5)
+    events = bus.get_events_since("s", 0)
+    assert [e["data"]["i"] for e in events] == [2, 3, 4]
+    assert bus.get_events_since("s", 4) == events[-1:]  # cursors stay absolute
+    assert bus.stats()["events_trimmed"] >= 2
+
+
+def test_ring_buffer_max_bytes():
+    bus.configure(max_bytes=400)
+    _publish("s", 20, {"pad": "x" * 50})
+    stats = bus.stats()
+    assert stats["bytes"] <= 400
+    assert 0 < stats["events"] < 20
+
+
+def test_oversized_single_event_is_kept():
+    bus.configure(max_bytes=10)
+    _publish("s", 1, {"pad": "x" * 100})
+    assert len(bus.get_events_since("s", 0)) == 1
+
+
+def test_slow_subscriber_told_about_drops():
+    bus.configure(max_events=2)
+    with bus.subscribe("s") as sub:
+        _publish("s", 5)
+        drained = list(sub.drain())
+    assert drained[0] == {"event": bus.EVENTS_DROPPED_EVENT, "data": {"dropped": 3}, "ts": drained[0]["ts"]}
+    assert [e["data"]["i"] for e in drained[1:]] == [3, 4]
+    assert sub.dropped == 3
+
+
+def test_ttl_evicts_idle_sessions(monkeypatch):
+    bus.configure(ttl_seconds=10)
+    _publish("idle", 1)
+    with bus.subscribe("watched"):
+        _publish("watched", 1)
+        real = time.monotonic
+        monkeypatch.setattr(time, "monotonic", lambda: real() + 11)
+        bus.evict_idle()
+        assert bus.get_events_since("idle", 0) == []
+        assert len(bus.get_events_since("watched", 0)) == 1  # has a subscriber
+
+
+def test_max_sessions_evicts_least_recently_active():
+    bus.configure(max_sessions=2)
+    _publish("a", 1)
+    _publish("b", 1)
+    _publish("a", 1)  # a is now most recent
+    _publish("c", 1)
+    assert bus.get_events_since("b", 0) == []
+    assert len(bus.get_events_since("a", 0)) == 2
+    assert bus.stats()["sessions"] == 2
+
+
+def test_configure_from_runtime():
+    limits = bus.configure_from_runtime({"event_bus": {"max_events": 5, "ttl_seconds": 0}})
+    assert (limits.max_events, limits.ttl_seconds) == (5, 0.0)
+    assert limits.max_sessions == bus.BusLimits().max_sessions
+    assert bus.configure_from_runtime({}) == bus.BusLimits()
+
+
+@pytest.mark.parametrize("kw", [
+    {"max_events": 0},
+    {"max_bytes": -1},
+    {"max_sessions": 1.5},
+    {"ttl_seconds": -1},
+    {"ttl_seconds": "soon"},
+])
+def test_configure_invalid(kw):
+    with pytest.raises(ValueError, match="EVENT_BUS_CONFIG_INVALID"):
+        bus.configure(**kw)
+
+
+def test_runtime_block_must_be_mapping():
+    with pytest.raises(ValueError, match="EVENT_BUS_CONFIG_INVALID"):
+        bus.configure_from_runtime({"event_bus": [1]})
+
+
+def test_transient_events_are_live_only():
+    assert bus.publish_transient("t", "turn_output_delta", {"delta": "lost"}) == 0
+    with bus.subscribe("t") as sub:
+        bus.publish("t", "turn_started", {})
+        assert bus.publish_transient("t", "turn_output_delta", {"delta": "a"}) == 1
+        bus.publish_transient("t", "turn_output_delta", {"delta": "b"})
+        bus.publish("t", "turn_completed", {})
+        assert sub.wait(timeout=0)
+        events = [(e["event"], e["data"].get("delta")) for e in sub.drain()]
+    assert events == [
+        ("turn_started", None),
+        ("turn_output_delta", "a"),
+        ("turn_output_delta", "b"),
+        ("turn_completed", None),
+    ]
+    assert [e["event"] for e in bus.get_events_since("t", 0)] == ["turn_started", "turn_completed"]
+    assert bus.stats()["events"] == 2
+    with bus.subscribe("t") as late:
+        assert [e["event"] for e in late.drain()] == ["turn_started", "turn_completed"]
+
+
+def test_transient_overflow_reports_dropped():
+    bus.configure(max_events=2)
+    with bus.subscribe("t") as sub:
+        for i in range(5):
+            bus.publish_transient("t", "turn_output_delta", {"delta": str(i)})
+        events = list(sub.drain())
+    assert events[0]["event"] == bus.EVENTS_DROPPED_EVENT and events[0]["data"] == {"dropped": 3}
+    assert [e["data"]["delta"] for e in events[1:]] == ["3", "4"]
@@ -0,0 +1,238 @@
+"""
+test_capability_executor.py — shared, bounded capability executor.
+
+Verifies:
+  - invocations reuse a fixed set of worker threads (no thread per call)
+  - a timed-out thread capability is abandoned and replaced; the caller does not wait
+  - admission beyond max_workers + queue_size fails fast with CAPABILITY_BUSY
+  - abandoned (timed-out, still running) thread calls hold their slot until they return
+  - the process executor kills a runaway capability on timeout and recovers
+  - per-capability queue wait / exec time land in stats, capability meta and trace
+  - settings validation and shared-executor lifecycle
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+import time
+import types
+
+import pytest
+
+import io_iii.core.engine as engine
+from io_iii.core import capability_executor as ce
+from io_iii.core.capabilities import (
+    CapabilityBounds,
+    CapabilityCategory,
+    CapabilityContext,
+    CapabilityRegistry,
+    CapabilityResult,
+    CapabilitySpec,
+)
+from io_iii.core.capability_executor import (
+    CapabilityExecutor,
+    CapabilityExecutorSettings,
+    get_capability_executor,
+    load_capability_executor_settings,
+)
+
+
+class SleepCapability:
+    """Picklable test capability: sleeps payload['s'] seconds, reports its thread."""
+
+    def __init__(self, cid="test.sleep", timeout_ms=2_000):
+        self.cid = cid
+        self.timeout_ms = timeout_ms
+
+    @property
+    def spec(self) -> CapabilitySpec:
+        return CapabilitySpec(
+            capability_id=self.cid,
+            version="v0",
+            category=CapabilityCategory.COMPUTATION,
+            description="Test-only sleeper.",
+            bounds=CapabilityBounds(timeout_ms=self.timeout_ms),
+        )
+
+    def invoke(self, ctx, payload):
+        time.sleep(payload.get("s", 0))
+        return CapabilityResult(ok=True, output={"thread": threading.current_thread().name})
+
+
+class SpinCapability(SleepCapability):
+    """Busy-loops forever (only a process kill stops it)."""
+
+    def invoke(self, ctx, payload):
+        while True:
+            pass
+
+
+_CTX = CapabilityContext(cfg=None, session_state=None)
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_executor():
+    ce.shutdown_capability_executor()
+    yield
+    ce.shutdown_capability_executor()
+
+
+def test_threads_are_reused():
+    ex = CapabilityExecutor(CapabilityExecutorSettings(max_workers=2))
+    before = threading.active_count()
+    names = {ex.run(SleepCapability(), _CTX, {}, timeout_s=1)[0].output["thread"] for _ in range(20)}
+    assert len(names) <= 2
+    assert threading.active_count() - before <= 2
+    ex.close()
+
+
+def test_timed_out_thread_is_abandoned_and_replaced():
+    ex = CapabilityExecutor(CapabilityExecutorSettings(max_workers=1))
+    t0 = time.perf_counter()
+    with pytest.raises(concurrent.futures.TimeoutError):
+        ex.run(SleepCapability(), _CTX, {"s": 0.5}, timeout_s=0.05)
+    assert time.perf_counter() - t0 < 0.4  # caller did not wait for the runaway call
+    res, _ = ex.run(SleepCapability(), _CTX, {}, timeout_s=0.3)  # replacement worker serves this
+    assert res.ok
+    assert ex.stats()["capabilities"]["test.sleep"]["timeouts"] == 1
+    time.sleep(0.6)
+    assert ex._threads.thread_count() == 1  # abandoned thread exited after finishing
+    ex.close()
+
+
+def test_admission_is_bounded():
+    ex = CapabilityExecutor(CapabilityExecutorSettings(max_workers=1, queue_size=0))
+    blocker = threading.Thread(target=lambda: ex.run(SleepCapability(), _CTX, {"s": 0.3}, timeout_s=1))
+    blocker.start()
+    time.sleep(0.05)
+    with pytest.raises(ValueError, match="CAPABILITY_BUSY"):
+        ex.run(SleepCapability(), _CTX, {}, timeout_s=1)
+    blocker.join()
+    assert ex.run(SleepCapability(), _CTX, {}, timeout_s=1)[0].ok
+    assert ex.stats()["capabilities"]["test.sleep"]["busy"] == 1
+    ex.close()
+
+
+def test_abandoned_threads_count_against_admission():
+    ex = CapabilityExecutor(CapabilityExecutorSettings(max_workers=1, queue_size=1))
+    for _ in range(2):
+        with pytest.raises(concurrent.futures.TimeoutError):
+            ex.run(SleepCapability(), _CTX, {"s": 0.4}, timeout_s=0.02)
+    assert ex.stats()["abandoned"] == 2
+    with pytest.raises(ValueError, match="CAPABILITY_BUSY"):
+        ex.run(SleepCapability(), _CTX, {}, timeout_s=1)
+    assert ex._threads.thread_count() <= 3  # max_workers + one replacement per held slot
+    time.sleep(0.6)
+    assert ex.stats()["abandoned"] == 0
+    assert ex.run(SleepCapability(), _CTX, {}, timeout_s=1)[0].ok
+    assert ex._threads.thread_count() == 1
+    ex.close()
+
+
+def test_queue_wait_and_exec_time_are_reported():
+    ex = CapabilityExecutor(CapabilityExecutorSettings(max_workers=1))
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(ex.run(SleepCapability(), _CTX, {"s": 0.1}, timeout_s=2)[1]))
+        for _ in range(2)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(t.exec_ms >= 90 for t in results)
+    assert max(t.queue_wait_ms for t in results) >= 80  # second call queued behind the first
+    stats = ex.stats()["capabilities"]["test.sleep"]
+    assert stats["calls"] == 2 and stats["exec_ms_max"] >= 90
+    ex.close()
+
+
+def test_process_executor_kills_runaway_capability():
+    ex = CapabilityExecutor(CapabilityExecutorSettings(kind="process", process_workers=1))
+    assert ex.run(SleepCapability(), _CTX, {}, timeout_s=30)[0].ok  # worker start-up
+    procs = list(ex.sandbox()._all)
+    with pytest.raises(concurrent.futures.TimeoutError):
+        ex.run(SpinCapability(), _CTX, {}, timeout_s=0.2)
+    for w in procs:
+        w.process.join(5)
+        assert not w.process.is_alive()
+    assert ex.stats()["process_workers_killed"] == 1
+    assert ex.run(SleepCapability(), _CTX, {}, timeout_s=30)[0].ok  # replacement worker
+    ex.close()
+
+
+def _run_engine(cap, runtime=None, seconds=0.02):
+    from io_iii.core.dependencies import RuntimeDependencies
+    from io_iii.core.session_state import AuditGateState, RouteInfo, SessionState
+
+    state = SessionState(
+        request_id="cap",
+        started_at_ms=0,
+        mode="executor",
+        config_dir="./architecture/runtime/config",
+        route=RouteInfo(
+            mode="executor", primary_target="null", secondary_target=None,
+            selected_target="null", selected_provider="null",
+            fallback_used=False, fallback_reason=None,
+        ),
+        audit=AuditGateState(audit_enabled=False),
+        status="ok",
+        provider="null",
+        model=None,
+        route_id="executor",
+        persona_contract_version="v1.0",
+        logging_policy={"content": "disabled"},
+    )
+    cfg = types.SimpleNamespace(
+        providers={}, routing={"routing_table": {}}, logging={}, config_dir=".", runtime=runtime or {},
+    )
+    deps = RuntimeDependencies(
+        ollama_provider_factory=None, challenger_fn=None, capability_registry=CapabilityRegistry([cap]),
+    )
+    return engine.run(
+        cfg=cfg, session_state=state, user_prompt="x", audit=False, deps=deps,
+        capability_id=cap.spec.capability_id, capability_payload={"s": seconds},
+    )
+
+
+def test_engine_reports_timing_and_uses_shared_executor():
+    _, res = _run_engine(SleepCapability(), {"capability_executor": {"max_workers": 3}})
+    cap = res.meta["capability"]
+    assert cap["exec_ms"] >= 15 and cap["queue_wait_ms"] >= 0
+    step = next(s for s in res.meta["trace"]["steps"] if s["stage"] == "capability_execution")
+    assert step["meta"]["exec_ms"] == cap["exec_ms"]
+    shared = get_capability_executor(CapabilityExecutorSettings(max_workers=3))
+    assert shared.stats()["capabilities"]["test.sleep"]["calls"] == 1
+
+
+def test_engine_timeout_still_maps_to_capability_timeout():
+    with pytest.raises(ValueError, match="CAPABILITY_TIMEOUT: exceeded timeout_ms=20"):
+        _run_engine(SleepCapability(timeout_ms=20), {"capability_executor": {"max_workers": 1}}, seconds=0.3)
+
+
+def test_shared_executor_lifecycle():
+    first = get_capability_executor()
+    assert get_capability_executor(CapabilityExecutorSettings()) is first
+    second = get_capability_executor(CapabilityExecutorSettings(max_workers=2))
+    assert second is not first
+    with pytest.raises(ValueError, match="CAPABILITY_BUSY"):
+        first.run(SleepCapability(), _CTX, {}, timeout_s=1)  # retired
+
+
+def test_load_settings():
+    assert load_capability_executor_settings(None) == CapabilityExecutorSettings()
+    assert load_capability_executor_settings(
+        {"capability_executor": {"kind": "process", "max_workers": 2, "queue_size": 0}}
+    ) == CapabilityExecutorSettings(kind="process", max_workers=2, queue_size=0)
+
+
+@pytest.mark.parametrize("block", [
+    True,
+    {"kind": "fiber"},
+    {"max_workers": 0},
+    {"max_workers": True},
+    {"queue_size": -1},
+])
+def test_load_settings_invalid(block):
+    with pytest.raises(ValueError, match="CAPABILITY_EXECUTOR_INVALID"):
+        load_capability_executor_settings({"capability_executor": block})
@@ -0,0 +1,203 @@
+"""
+test_capability_sandbox.py — process-isolated capability execution.
+
+Verifies:
+  - CapabilitySpec.isolation="process" runs in a pre-started worker process,
+    even when the executor default is thread
+  - workers are reused across calls
+  - a runaway capability is SIGKILLed on timeout and its worker replaced
+  - a worker that dies mid-call yields CAPABILITY_WORKER_LOST and is replaced
+  - payloads above shm_threshold_bytes travel via shared memory (block unlinked)
+  - a payload that fails to encode (or to get a block) never costs a worker
+  - capability exceptions propagate; engine error codes are unchanged
+  - registry rejects unknown isolation values
+"""
+from __future__ import annotations
+
+import datetime
+import os
+import pickle
+import types
+from multiprocessing import shared_memory
+
+import pytest
+
+import io_iii.core.engine as engine
+from io_iii.core.capabilities import (
+    CapabilityBounds,
+    CapabilityCategory,
+    CapabilityContext,
+    CapabilityRegistry,
+    CapabilityResult,
+    CapabilitySpec,
+)
+from io_iii.core.capability_executor import CapabilityExecutor, CapabilityExecutorSettings
+from io_iii.core.capability_sandbox import ProcessSandbox
+
+
+class PidCapability:
+    """Reports the worker pid and payload size; behaviour selected by payload['do']."""
+
+    def __init__(self, isolation="process", timeout_ms=30_000):
+        self.isolation = isolation
+        self.timeout_ms = timeout_ms
+
+    @property
+    def spec(self) -> CapabilitySpec:
+        return CapabilitySpec(
+            capability_id="test.pid",
+            version="v0",
+            category=CapabilityCategory.COMPUTATION,
+            description="Test-only sandbox probe.",
+            bounds=CapabilityBounds(timeout_ms=self.timeout_ms, max_input_chars=10_000_000),
+            isolation=self.isolation,
+        )
+
+    def invoke(self, ctx, payload):
+        action = payload.get("do")
+        if action == "spin":
+            while True:
+                pass
+        if action == "exit":
+            os._exit(3)
+        if action == "raise":
+            raise ValueError("CAPABILITY_TEST_FAILURE: boom")
+        return CapabilityResult(ok=True, output={"pid": os.getpid(), "n": len(payload.get("blob", ""))})
+
+
+_CTX = CapabilityContext(cfg=None, session_state=None)
+
+
+@pytest.fixture
+def sandbox():
+    sb = ProcessSandbox(1, shm_threshold_bytes=1_000)
+    yield sb
+    sb.close()
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    with open(f"/proc/{pid}/stat") as fh:
+        return fh.read().split()[2] != "Z"
+
+
+def test_process_isolation_selected_per_spec():
+    ex = CapabilityExecutor(CapabilityExecutorSettings(kind="thread", process_workers=1))
+    sandboxed = ex.run(PidCapability("process"), _CTX, {}, timeout_s=30)[0].output["pid"]
+    inline = ex.run(PidCapability("thread"), _CTX, {}, timeout_s=30)[0].output["pid"]
+    assert inline == os.getpid()
+    assert sandboxed != os.getpid() and sandboxed in ex.sandbox().pids()
+    ex.close()
+
+
+def test_workers_are_prestarted_and_reused(sandbox):
+    pids = sandbox.pids()
+    assert len(pids) == 1
+    seen = {sandbox.run(PidCapability(), _CTX, {}, timeout_s=30)[0].output["pid"] for _ in range(5)}
+    assert seen == set(pids)
+
+
+def test_timeout_sigkills_and_replaces_worker(sandbox):
+    sandbox.run(PidCapability(), _CTX, {}, timeout_s=30)
+    (old,) = sandbox.pids()
+    with pytest.raises(TimeoutError):
+        sandbox.run(PidCapability(), _CTX, {"do": "spin"}, timeout_s=0.3)
+    assert not _alive(old)
+    assert sandbox.killed == 1
+    (new,) = sandbox.pids()
+    assert new != old
+    assert sandbox.run(PidCapability(), _CTX, {}, timeout_s=30)[0].output["pid"] == new
+
+
+def test_worker_death_is_reported_and_replaced(sandbox):
+    with pytest.raises(ValueError, match="CAPABILITY_WORKER_LOST"):
+        sandbox.run(PidCapability(), _CTX, {"do": "exit"}, timeout_s=30)
+    assert sandbox.lost == 1
+    assert sandbox.run(PidCapability(), _CTX, {}, timeout_s=30)[0].ok
+
+
+def test_large_payload_via_shared_memory(sandbox, monkeypatch):
+    created = []
+    real = shared_memory.SharedMemory
+
+    def _track(*a, **k):
+        shm = real(*a, **k)
+        created.append(shm.name)
+        return shm
+
+    monkeypatch.setattr("io_iii.core.capability_sandbox.shared_memory.SharedMemory", _track)
+    res, *_ = sandbox.run(PidCapability(), _CTX, {"blob": "é" * 50_000}, timeout_s=30)
+    assert res.output["n"] == 50_000
+    assert sandbox.shm_transfers == 1
+    sandbox.run(PidCapability(), _CTX, {"blob": "x"}, timeout_s=30)  # small: through the pipe
+    assert sandbox.shm_transfers == 1
+    with pytest.raises(FileNotFoundError):
+        real(name=created[0])  # unlinked after the call
+
+
+def test_payload_encoding_failure_keeps_the_worker(sandbox, monkeypatch):
+    res, *_ = sandbox.run(PidCapability(), _CTX, {"when": datetime.date(2026, 1, 1)}, timeout_s=30)
+    assert res.ok  # any picklable payload, not only JSON
+    with pytest.raises((AttributeError, pickle.PicklingError)):
+        sandbox.run(PidCapability(), _CTX, {"fn": lambda: None}, timeout_s=30)  # unpicklable
+
+    def _no_shm(*a, **k):
+        raise OSError("no shared memory")
+
+    monkeypatch.setattr("io_iii.core.capability_sandbox.shared_memory.SharedMemory", _no_shm)
+    with pytest.raises(OSError):
+        sandbox.run(PidCapability(), _CTX, {"blob": "x" * 5_000}, timeout_s=30)
+    assert sandbox.run(PidCapability(), _CTX, {}, timeout_s=1)[0].ok  # worker was not lost
+    assert len(sandbox.pids()) == 1
+
+
+def test_capability_exception_propagates(sandbox):
+    with pytest.raises(ValueError, match="CAPABILITY_TEST_FAILURE"):
+        sandbox.run(PidCapability(), _CTX, {"do": "raise"}, timeout_s=30)
+    assert sandbox.run(PidCapability(), _CTX, {}, timeout_s=30)[0].ok  # worker survives
+
+
+def test_engine_timeout_kills_sandboxed_capability():
+    from io_iii.core import capability_executor as ce
+    from io_iii.core.dependencies import RuntimeDependencies
+    from io_iii.core.session_state import AuditGateState, RouteInfo, SessionState
+
+    ce.shutdown_capability_executor()
+    state = SessionState(
+        request_id="sb", started_at_ms=0, mode="executor",
+        config_dir="./architecture/runtime/config",
+        route=RouteInfo(
+            mode="executor", primary_target="null", secondary_target=None,
+            selected_target="null", selected_provider="null",
+            fallback_used=False, fallback_reason=None,
+        ),
+        audit=AuditGateState(audit_enabled=False), status="ok", provider="null", model=None,
+        route_id="executor", persona_contract_version="v1.0", logging_policy={"content": "disabled"},
+    )
+    cfg = types.SimpleNamespace(
+        providers={}, routing={"routing_table": {}}, logging={}, config_dir=".",
+        runtime={"capability_executor": {"process_workers": 1}},
+    )
+    deps = RuntimeDependencies(
+        ollama_provider_factory=None, challenger_fn=None,
+        capability_registry=CapabilityRegistry([PidCapability(timeout_ms=3_000)]),
+    )
+    try:
+        executor = ce.get_capability_executor(ce.CapabilityExecutorSettings(process_workers=1))
+        executor.sandbox()  # pre-start outside the measured call
+        with pytest.raises(ValueError, match="CAPABILITY_TIMEOUT"):
+            engine.run(
+                cfg=cfg, session_state=state, user_prompt="x", audit=False, deps=deps,
+                capability_id="test.pid", capability_payload={"do": "spin"},
+            )
+        assert executor.sandbox().killed == 1
+    finally:
+        ce.shutdown_capability_executor()
+
+
+def test_registry_rejects_unknown_isolation():
+    with pytest.raises(ValueError, match="CAPABILITY_ISOLATION_INVALID"):
+        CapabilityRegistry([PidCapability(isolation="container")])
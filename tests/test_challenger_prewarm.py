@@ -0,0 +1,189 @@
+"""
+test_challenger_prewarm.py — opt-in challenger pre-warm for audited engine runs.
+
+Verifies:
+  - the challenger model is preloaded while the executor is still generating
+  - the audit prompt is byte-identical with and without the pre-warm
+  - the pre-warm status lands on the challenger_audit trace step
+  - still exactly one audit call (ADR-009); a failed preload stays fail-open
+  - disabled by default; skipped when a challenger_fn is injected
+  - OllamaProvider.preload payload; settings validation
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+import types
+
+import pytest
+
+import io_iii.core.engine as engine
+from io_iii.core.challenger_prewarm import (
+    ChallengerPrewarmSettings,
+    load_challenger_prewarm_settings,
+)
+from io_iii.core.session_state import AuditGateState, RouteInfo, SessionState
+from io_iii.providers.ollama_provider import OllamaProvider
+
+
+class _Provider:
+    """Executor via generate_with_metrics, challenger via generate, preload recorded."""
+
+    def __init__(self, *, exec_delay=0.15, preload_error=None):
+        self.events = []
+        self.audit_prompts = []
+        self.preloads = []
+        self.exec_delay = exec_delay
+        self.preload_error = preload_error
+        self.lock = threading.Lock()
+
+    def _log(self, name):
+        with self.lock:
+            self.events.append(name)
+
+    def generate_with_metrics(self, *, model, prompt):
+        self._log("exec_start")
+        time.sleep(self.exec_delay)
+        self._log("exec_end")
+        return "draft", 3, 1
+
+    def generate(self, *, model, prompt):
+        self._log("audit")
+        self.audit_prompts.append((model, prompt))
+        return json.dumps({"verdict": "pass"})
+
+    def preload(self, *, model, keep_alive=None):
+        self._log("preload")
+        self.preloads.append((model, keep_alive))
+        if self.preload_error:
+            raise self.preload_error
+
+
+def _state():
+    return SessionState(
+        request_id="pw",
+        started_at_ms=int(time.time() * 1000),
+        mode="executor",
+        config_dir="./architecture/runtime/config",
+        route=RouteInfo(
+            mode="executor",
+            primary_target="ollama:exec-model",
+            secondary_target=None,
+            selected_target="ollama:exec-model",
+            selected_provider="ollama",
+            fallback_used=False,
+            fallback_reason=None,
+        ),
+        audit=AuditGateState(audit_enabled=True),
+        status="ok",
+        provider="ollama",
+        model="exec-model",
+        route_id="executor",
+        persona_contract_version="v1.0",
+        logging_policy={"content": "disabled"},
+    )
+
+
+def _cfg(prewarm=None):
+    runtime = {} if prewarm is None else {"challenger_prewarm": prewarm}
+    return types.SimpleNamespace(
+        config_dir=".",
+        providers={},
+        logging={},
+        routing={"routing_table": {
+            "rules": {"boundaries": {}},
+            "modes": {
+                "executor": {"primary": "local:exec-model", "secondary": "local:exec-model"},
+                "challenger": {"primary": "local:chal-model", "secondary": "local:chal-model"},
+            },
+        }},
+        runtime=runtime,
+    )
+
+
+def _run(provider, cfg, **kw):
+    return engine.run(
+        cfg=cfg, session_state=_state(), user_prompt="hi", audit=True,
+        ollama_provider_factory=lambda _: provider, **kw,
+    )
+
+
+def _audit_step(result):
+    return next(s for s in result.meta["trace"]["steps"] if s["stage"] == "challenger_audit")
+
+
+def test_preload_overlaps_executor_generation():
+    provider = _Provider()
+    _, result = _run(provider, _cfg({"enabled": True, "keep_alive": "10m"}))
+    assert provider.preloads == [("chal-model", "10m")]
+    assert provider.events.index("preload") < provider.events.index("exec_end")
+    assert _audit_step(result)["meta"]["prewarm"] == "ready"
+    assert provider.events.count("audit") == 1
+    assert result.audit_meta == {"audit_used": True, "audit_verdict": "pass", "revised": False}
+
+
+def test_audit_prompt_unchanged_by_prewarm():
+    cold, warm = _Provider(exec_delay=0.0), _Provider()
+    _run(cold, _cfg())
+    _run(warm, _cfg(True))
+    assert warm.audit_prompts == cold.audit_prompts
+    assert warm.audit_prompts[0][0] == "chal-model"
+
+
+def test_disabled_by_default():
+    provider = _Provider(exec_delay=0.0)
+    _, result = _run(provider, _cfg())
+    assert provider.preloads == []
+    assert "prewarm" not in _audit_step(result)["meta"]
+
+
+def test_failed_preload_is_fail_open():
+    provider = _Provider(preload_error=RuntimeError("load failed"))
+    _, result = _run(provider, _cfg(True))
+    assert _audit_step(result)["meta"]["prewarm"] == "failed"
+    assert provider.events.count("audit") == 1
+    assert result.audit_meta["audit_verdict"] == "pass"
+
+
+def test_injected_challenger_skips_prewarm():
+    provider = _Provider(exec_delay=0.0)
+    _run(provider, _cfg(True), challenger_fn=lambda *_: {"verdict": "pass"})
+    assert provider.preloads == []
+
+
+def test_no_prewarm_without_audit():
+    provider = _Provider(exec_delay=0.0)
+    engine.run(
+        cfg=_cfg(True), session_state=_state(), user_prompt="hi", audit=False,
+        ollama_provider_factory=lambda _: provider,
+    )
+    assert provider.preloads == []
+
+
+def test_ollama_preload_payload(monkeypatch):
+    sent = []
+    provider = OllamaProvider(host="http://ollama:11434")
+    monkeypatch.setattr(OllamaProvider, "_post_json", lambda self, url, payload: sent.append((url, payload)) or "{}")
+    provider.preload(model="m", keep_alive="5m")
+    provider.preload(model="m")
+    assert sent == [
+        ("http://ollama:11434/api/generate", {"model": "m", "stream": False, "keep_alive": "5m"}),
+        ("http://ollama:11434/api/generate", {"model": "m", "stream": False}),
+    ]
+
+
+def test_load_settings():
+    assert load_challenger_prewarm_settings({}) is None
+    assert load_challenger_prewarm_settings({"challenger_prewarm": False}) is None
+    assert load_challenger_prewarm_settings({"challenger_prewarm": {"enabled": False}}) is None
+    assert load_challenger_prewarm_settings({"challenger_prewarm": True}) == ChallengerPrewarmSettings()
+    assert load_challenger_prewarm_settings(
+        {"challenger_prewarm": {"keep_alive": 300}}
+    ) == ChallengerPrewarmSettings(keep_alive=300)
+
+
+@pytest.mark.parametrize("block", ["yes", [1], {"enabled": "true"}, {"keep_alive": ""}, {"keep_alive": True}])
+def test_load_settings_invalid(block):
+    with pytest.raises(ValueError, match="CHALLENGER_PREWARM_INVALID"):
+        load_challenger_prewarm_settings({"challenger_prewarm": block})
@@ -0,0 +1,130 @@
+"""
+test_config_cache.py — process-wide cached, hot-reloadable IO3Config.
+
+Verifies:
+  - repeated loads of an unchanged config dir parse YAML once
+  - editing a file (in place or via atomic rename) swaps in a new config
+  - config_generation bumps only when content changes
+  - racy entries (files modified inside the timestamp window) are re-checked
+  - missing required files still raise FileNotFoundError and are not cached
+  - the stdlib server handler re-resolves an IO3Config per request
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import io_iii.config as config_mod
+from io_iii.config import clear_config_cache, load_io3_config
+
+
+def _write_config(d: Path, *, runtime: str = "content_release: false\n") -> None:
+    (d / "providers.yaml").write_text("providers: {}\n", encoding="utf-8")
+    (d / "logging.yaml").write_text("logging: {}\n", encoding="utf-8")
+    (d / "routing_table.yaml").write_text("routing_table: {}\n", encoding="utf-8")
+    (d / "runtime.yaml").write_text(runtime, encoding="utf-8")
+
+
+def _age(d: Path, seconds: int = 60) -> None:
+    """Backdate every config file so the cache entry is not racy."""
+    past = os.stat(d / "providers.yaml").st_mtime - seconds
+    for name in config_mod._CONFIG_FILES:
+        p = d / name
+        if p.exists():
+            os.utime(p, (past, past))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    calls = {"n": 0}
+    real = config_mod._parse_io3_config
+
+    def _counting(cfg_dir):
+        calls["n"] += 1
+        return real(cfg_dir)
+
+    monkeypatch.setattr(config_mod, "_parse_io3_config", _counting)
+    return calls
+
+
+def test_unchanged_dir_is_parsed_once(tmp_path, parse_count):
+    _write_config(tmp_path)
+    _age(tmp_path)
+    a = load_io3_config(tmp_path)
+    b = load_io3_config(tmp_path)
+    assert a is b
+    assert parse_count["n"] == 1
+    assert a.runtime == {"content_release": False}
+
+
+def test_edit_in_place_is_picked_up(tmp_path):
+    _write_config(tmp_path)
+    _age(tmp_path)
+    before = load_io3_config(tmp_path)
+    (tmp_path / "runtime.yaml").write_text("content_release: true\n", encoding="utf-8")
+    after = load_io3_config(tmp_path)
+    assert after.runtime == {"content_release": True}
+    assert after.config_generation > before.config_generation
+    assert before.runtime == {"content_release": False}  # old snapshot untouched
+
+
+def test_atomic_rename_is_picked_up(tmp_path):
+    _write_config(tmp_path)
+    _age(tmp_path)
+    load_io3_config(tmp_path)
+    tmp = tmp_path / "runtime.yaml.tmp"
+    tmp.write_text("content_release: true\n", encoding="utf-8")
+    os.replace(tmp, tmp_path / "runtime.yaml")
+    assert load_io3_config(tmp_path).runtime == {"content_release": True}
+
+
+def test_touch_without_change_keeps_generation(tmp_path):
+    _write_config(tmp_path)
+    _age(tmp_path)
+    gen = load_io3_config(tmp_path).config_generation
+    os.utime(tmp_path / "runtime.yaml")
+    assert load_io3_config(tmp_path).config_generation == gen
+
+
+def test_racy_entry_is_revalidated(tmp_path, parse_count):
+    _write_config(tmp_path)  # just written → inside the racy window
+    load_io3_config(tmp_path)
+    load_io3_config(tmp_path)
+    assert parse_count["n"] == 2
+
+
+def test_missing_required_file_raises_and_is_not_cached(tmp_path):
+    _write_config(tmp_path)
+    (tmp_path / "logging.yaml").unlink()
+    with pytest.raises(FileNotFoundError):
+        load_io3_config(tmp_path)
+    (tmp_path / "logging.yaml").write_text("logging: {}\n", encoding="utf-8")
+    assert load_io3_config(tmp_path).logging == {"logging": {}}
+
+
+def test_optional_runtime_yaml_absent(tmp_path):
+    _write_config(tmp_path)
+    (tmp_path / "runtime.yaml").unlink()
+    assert load_io3_config(tmp_path).runtime == {}
+
+
+def test_server_handler_reloads_io3_config(tmp_path):
+    from io_iii.api._webhooks import WebhookDispatcher
+    from io_iii.api.server import _make_handler
+
+    _write_config(tmp_path)
+    _age(tmp_path)
+    cls = _make_handler(load_io3_config(tmp_path), WebhookDispatcher({}))
+    handler = cls.__new__(cls)
+    assert handler._cfg.runtime == {"content_release": False}
+    (tmp_path / "runtime.yaml").write_text("content_release: true\n", encoding="utf-8")
+    assert handler._cfg.runtime == {"content_release": True}
@@ -0,0 +1,113 @@
+"""
+test_content_scanner.py — single-pass content-safety guard and per-run scanner.
+
+Verifies:
+  - assert_no_forbidden_keys still finds keys at any depth (dict / list / tuple / set)
+  - non-string keys and scalar leaves are ignored
+  - ContentScanner skips containers it has already validated
+  - a failed scan leaves nothing in the memo (the structure fails again)
+  - stats() is content-safe and counts scans / containers / skips
+  - an engine run reports the guard's cost in meta["trace"]["content_scan"]
+"""
+from __future__ import annotations
+
+import time
+import types
+
+import pytest
+
+from io_iii.core.content_safety import (
+    METADATA_FORBIDDEN_KEYS,
+    ContentScanner,
+    assert_no_forbidden_keys,
+)
+
+
+@pytest.mark.parametrize("obj", [
+    {"prompt": 1},
+    {"a": {"b": [{"c": ({"completion": "x"},)}]}},
+    [1, "two", {"nested": {"draft": None}}],
+    ({"ok": True}, {"revision": 2}),
+])
+def test_finds_forbidden_keys_at_any_depth(obj):
+    with pytest.raises(ValueError, match="forbidden key present in structure"):
+        assert_no_forbidden_keys(obj)
+
+
+def test_error_names_the_key():
+    with pytest.raises(ValueError, match="output"):
+        assert_no_forbidden_keys({"a": 1, "output": 2}, forbidden=METADATA_FORBIDDEN_KEYS)
+
+
+def test_clean_structures_pass():
+    assert_no_forbidden_keys({1: "prompt", "values": ["prompt", "content"], "n": None, "b": b"x"})
+    assert_no_forbidden_keys("prompt")
+    assert_no_forbidden_keys(None)
+
+
+def test_scanner_skips_validated_containers():
+    scanner = ContentScanner()
+    trace = {"steps": [{"stage": "s", "meta": {"provider": "null"}} for _ in range(10)]}
+    scanner.assert_clean(trace)
+    walked = scanner.containers
+    scanner.assert_clean({"trace": trace, "telemetry": {"call_count": 1}})
+    assert scanner.skipped == 1
+    assert scanner.containers == walked + 2  # only the outer dict and telemetry
+
+
+def test_failed_scan_is_not_memoised():
+    scanner = ContentScanner()
+    bad = {"inner": {"content": "x"}}
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            scanner.assert_clean(bad)
+    assert scanner.skipped == 0
+
+
+def test_scanner_uses_its_own_forbidden_set():
+    scanner = ContentScanner(METADATA_FORBIDDEN_KEYS)
+    with pytest.raises(ValueError, match="output"):
+        scanner.assert_clean({"output": 1})
+    ContentScanner().assert_clean({"output": 1})
+
+
+def test_stats_are_content_safe():
+    scanner = ContentScanner()
+    scanner.assert_clean({"a": [1, 2]})
+    stats = scanner.stats()
+    assert stats["scans"] == 1 and stats["containers"] == 2
+    assert all(isinstance(v, int) for v in stats.values())
+    assert_no_forbidden_keys(stats)
+
+
+def test_engine_reports_scan_cost_in_trace():
+    import io_iii.core.engine as engine
+    from io_iii.core.session_state import AuditGateState, RouteInfo, SessionState
+
+    state = SessionState(
+        request_id="scan",
+        started_at_ms=int(time.time() * 1000),
+        mode="executor",
+        config_dir="./architecture/runtime/config",
+        route=RouteInfo(
+            mode="executor",
+            primary_target="null",
+            secondary_target=None,
+            selected_target="null",
+            selected_provider="null",
+            fallback_used=False,
+            fallback_reason=None,
+        ),
+        audit=AuditGateState(audit_enabled=False),
+        status="ok",
+        provider="null",
+        model=None,
+        route_id="executor",
+        persona_contract_version="v1.0",
+        logging_policy={"content": "disabled"},
+    )
+    cfg = types.SimpleNamespace(providers={}, logging={}, routing={"routing_table": {}}, runtime={})
+    _, result = engine.run(cfg=cfg, session_state=state, user_prompt="hi", audit=False)
+    scan = result.meta["trace"]["content_scan"]
+    assert scan["scans"] >= 3  # event metas + the trace itself
+    assert scan["containers"] > 0 and scan["scan_us"] >= 0
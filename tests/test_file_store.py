@@ -0,0 +1,287 @@
+"""
+test_file_store.py — bounded session file store with spill-to-disk.
+
+Verifies:
+  - the total byte budget evicts the least recently used file (resolve refreshes)
+  - a session quota overflow evicts that session's own oldest file only
+  - a file larger than the limits is rejected with FILE_STORE_QUOTA_EXCEEDED
+  - entries unused for ttl_seconds expire
+  - with spill_dir (settings built directly), evicted and pre-restart refs resolve from disk
+  - identical texts share one blob; delete() removes refs and orphaned blobs
+  - in memory, identical texts are one refcounted blob (max_bytes counts it once)
+  - cached_text() serves a known upload source until its blob is gone
+  - POST /upload extracts identical bytes once across sessions
+  - refs from another session or malformed refs never resolve
+  - sweep() drops expired refs and their blobs
+  - concurrent store/resolve keeps the accounting consistent
+  - settings validation (spill_dir rejected pending ADR-033 §10); configure_file_store();
+    POST /upload quota → 422
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from io_iii.core import file_store
+from io_iii.core.file_store import (
+    FileRefNotFound,
+    FileStore,
+    FileStoreSettings,
+    load_file_store_settings,
+)
+
+
+def _store(tmp_path=None, **kw) -> FileStore:
+    spill = str(tmp_path / "cache") if tmp_path is not None else None
+    return FileStore(FileStoreSettings(spill_dir=spill, **kw))
+
+
+def test_total_budget_evicts_lru():
+    fs = _store(max_bytes=10, session_quota_bytes=10)
+    a = fs.store("s1", "aaaa", "a.txt")
+    b = fs.store("s2", "bbbb", "b.txt")
+    fs.resolve("s1", a)  # a is now most recent
+    fs.store("s3", "cccc", "c.txt")
+
+    assert fs.resolve("s1", a) == ("a.txt", "aaaa")
+    with pytest.raises(FileRefNotFound):
+        fs.resolve("s2", b)
+    stats = fs.stats()
+    assert stats["resident_bytes"] == 8 and stats["evictions"] == 1
+
+
+def test_session_quota_evicts_own_files():
+    fs = _store(max_bytes=100, session_quota_bytes=6)
+    other = fs.store("s2", "zzzz", "z.txt")
+    first = fs.store("s1", "1111", "1.txt")
+    second = fs.store("s1", "2222", "2.txt")
+
+    with pytest.raises(FileRefNotFound):
+        fs.resolve("s1", first)
+    assert fs.resolve("s1", second)[1] == "2222"
+    assert fs.resolve("s2", other)[1] == "zzzz"
+
+
+def test_oversized_file_rejected():
+    fs = _store(max_bytes=100, session_quota_bytes=4)
+    with pytest.raises(ValueError, match="FILE_STORE_QUOTA_EXCEEDED"):
+        fs.store("s1", "ééé", "big.txt")  # 6 UTF-8 bytes
+    assert fs.stats()["files"] == 0
+
+
+def test_ttl_expiry():
+    fs = _store(ttl_seconds=0.05)
+    ref = fs.store("s1", "short lived", "a.txt")
+    time.sleep(0.1)
+    with pytest.raises(FileRefNotFound):
+        fs.resolve("s1", ref)
+    assert fs.stats()["expired"] == 1
+
+
+def test_spill_serves_evicted_and_restarted_refs(tmp_path):
+    fs = _store(tmp_path, max_bytes=8, session_quota_bytes=8)
+    a = fs.store("s1", "aaaa", "a.txt")
+    fs.store("s1", "bbbb", "b.txt")
+    fs.store("s1", "cccc", "c.txt")  # evicts a from memory
+
+    assert fs.resolve("s1", a) == ("a.txt", "aaaa")
+    assert fs.stats()["spill_hits"] == 1
+
+    restarted = _store(tmp_path)
+    assert restarted.resolve("s1", a) == ("a.txt", "aaaa")
+    assert restarted.resolve("s1", a) == ("a.txt", "aaaa")  # now resident again
+    assert restarted.stats()["spill_hits"] == 1
+
+
+def test_identical_text_shares_blob_and_delete_cleans_up(tmp_path):
+    fs = _store(tmp_path)
+    fs.store("s1", "same text", "a.txt")
+    kept = fs.store("s2", "same text", "b.txt")
+    fs.store("s1", "only s1", "c.txt")
+    blobs = tmp_path / "cache" / "blobs"
+    assert len(list(blobs.iterdir())) == 2
+
+    fs.delete("s1")
+    assert len(list(blobs.iterdir())) == 1  # shared blob survives
+    assert _store(tmp_path).resolve("s2", kept) == ("b.txt", "same text")
+
+    fs.delete("s2")
+    assert list(blobs.iterdir()) == []
+
+
+def test_memory_blobs_are_shared_and_refcounted():
+    fs = _store(max_bytes=10, session_quota_bytes=10)
+    refs = [fs.store(f"s{i}", "shared!", "spec.txt") for i in range(5)]
+    stats = fs.stats()
+    assert (stats["files"], stats["blobs"], stats["resident_bytes"]) == (5, 1, 7)
+    assert stats["dedup_hits"] == 4 and stats["evictions"] == 0
+
+    for i in range(4):
+        fs.delete(f"s{i}")
+    assert fs.stats()["blobs"] == 1 and fs.resolve("s4", refs[4])[1] == "shared!"
+    fs.delete("s4")
+    assert (fs.stats()["blobs"], fs.stats()["resident_bytes"]) == (0, 0)
+
+
+def test_cached_text_by_source(tmp_path):
+    key = file_store.source_key("Spec.PDF", b"%PDF raw bytes")
+    assert key == file_store.source_key("other.pdf", b"%PDF raw bytes")
+    assert key != file_store.source_key("spec.txt", b"%PDF raw bytes")
+
+    fs = _store()
+    assert fs.cached_text(key) is None
+    fs.store("s1", "extracted", "spec.pdf", source=key)
+    assert fs.cached_text(key) == "extracted"
+    fs.delete("s1")
+    assert fs.cached_text(key) is None
+
+    spilled = _store(tmp_path)
+    spilled.store("s1", "extracted", "spec.pdf", source=key)
+    spilled.reconfigure(FileStoreSettings(spill_dir=spilled.settings.spill_dir, max_bytes=1))
+    assert spilled.stats()["blobs"] == 0
+    assert spilled.cached_text(key) == "extracted"  # still on disk
+    assert spilled.stats()["extraction_hits"] == 1
+
+
+def test_foreign_or_malformed_refs_do_not_resolve(tmp_path):
+    fs = _store(tmp_path)
+    ref = fs.store("s1", "secret", "a.txt")
+    restarted = _store(tmp_path)
+    for sid, bad in (("s2", ref), ("s1", "../../etc/passwd"), ("../s1", ref), ("s1", ref.upper())):
+        with pytest.raises(FileRefNotFound):
+            restarted.resolve(sid, bad)
+
+
+def test_sweep_drops_expired_refs(tmp_path):
+    fs = _store(tmp_path, ttl_seconds=60)
+    stale = fs.store("s1", "old", "old.txt")
+    fresh = fs.store("s2", "new", "new.txt")
+    cache = tmp_path / "cache"
+    past = time.time() - 3600
+    for path in [*cache.glob(f"refs/*/{stale}.json"), *cache.glob("blobs/*")]:
+        os.utime(path, (past, past))
+
+    fs.sweep()
+    restarted = _store(tmp_path, ttl_seconds=60)
+    with pytest.raises(FileRefNotFound):
+        restarted.resolve("s1", stale)
+    assert restarted.resolve("s2", fresh)[1] == "new"
+    assert len(list((cache / "blobs").iterdir())) == 1
+
+
+def test_concurrent_store_and_resolve():
+    fs = _store(max_bytes=400, session_quota_bytes=100)
+    errors = []
+
+    def _worker(n):
+        sid = f"s{n % 4}"
+        for i in range(200):
+            ref = fs.store(sid, f"{n:02d}-{i:04d}", "f.txt")
+            try:
+                fs.resolve(sid, ref)
+            except FileRefNotFound:
+                pass  # evicted by a concurrent writer: allowed
+            except Exception as exc:  # pragma: no cover - failure path
+                errors.append(exc)
+
+    threads = [threading.Thread(target=_worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    stats = fs.stats()
+    assert stats["resident_bytes"] <= 400
+    assert stats["resident_bytes"] == sum(b.size for b in fs._blobs.values())
+    assert sum(b.refs for b in fs._blobs.values()) == len(fs._lru)
+    assert all(n <= 100 for n in fs._session_bytes.values())
+
+
+def test_load_settings():
+    assert load_file_store_settings(None) == FileStoreSettings()
+    assert load_file_store_settings(
+        {"file_store": {"max_bytes": 10, "session_quota_bytes": 5, "ttl_seconds": 1}}
+    ) == FileStoreSettings(max_bytes=10, session_quota_bytes=5, ttl_seconds=1.0)
+
+
+@pytest.mark.parametrize("block", [
+    "yes",
+    {"max_bytes": 0},
+    {"session_quota_bytes": True},
+    {"ttl_seconds": -1},
+    {"spill_dir": ""},
+    {"spill_dir": ".io_iii/file_cache"},  # off until the ADR-033 amendment is accepted
+])
+def test_load_settings_invalid(block):
+    with pytest.raises(ValueError, match="FILE_STORE_CONFIG_INVALID"):
+        load_file_store_settings({"file_store": block})
+
+
+def test_configure_reapplies_bounds():
+    fs = file_store.get_file_store()
+    original = fs.settings
+    try:
+        sid = "configure-test"
+        ref = file_store.store(sid, "abcdef", "a.txt")
+        assert file_store.configure_file_store({"file_store": {"max_bytes": 4}}) is fs
+        with pytest.raises(FileRefNotFound):
+            file_store.resolve(sid, ref)
+    finally:
+        fs.reconfigure(original)
+
+
+def test_upload_quota_overflow_returns_422():
+    from fastapi.testclient import TestClient
+
+    from io_iii.api.app import app
+
+    fs = file_store.get_file_store()
+    original = fs.settings
+    try:
+        with patch("io_iii.api.app._runtime_cfg", return_value={"file_store": {"session_quota_bytes": 4}}):
+            resp = TestClient(app).post(
+                "/upload",
+                data={"session_id": "quota-test"},
+                files={"file": ("a.txt", b"too many bytes", "text/plain")},
+            )
+    finally:
+        fs.reconfigure(original)
+    assert resp.status_code == 422
+    assert resp.json()["error"]["code"] == "FILE_STORE_QUOTA_EXCEEDED"
+    assert "too many" not in resp.text
+
+
+def test_upload_extracts_identical_bytes_once():
+    from fastapi.testclient import TestClient
+
+    api = importlib.import_module("io_iii.api.app")
+
+    calls = []
+    real = api._extract_file_text
+
+    def _counting(filename, data):
+        calls.append(filename)
+        return real(filename, data)
+
+    body = b"dedup-test " + os.urandom(8).hex().encode()
+    client = TestClient(api.app)
+    with patch.object(api, "_extract_file_text", _counting), patch.object(api, "_runtime_cfg", return_value={}):
+        refs = [
+            client.post(
+                "/upload",
+                data={"session_id": f"dedup-{i}"},
+                files={"file": (f"n{i}.txt", body, "text/plain")},
+            ).json()
+            for i in range(3)
+        ]
+    assert len(calls) == 1
+    assert len({r["file_ref"] for r in refs}) == 3 and all(r["chars"] == len(body) for r in refs)
+    assert file_store.resolve("dedup-2", refs[2]["file_ref"]) == ("n2.txt", body.decode())
+    for i in range(3):
+        file_store.delete(f"dedup-{i}")
@@ -0,0 +1,235 @@
+"""
+test_memory_sqlite_backend.py — pluggable MemoryStore backends (SQLite / WAL).
+
+Verifies:
+
+  Backend selection
+  - storage_root ending in .db / .sqlite selects SQLiteBackend
+  - any other storage_root selects DirectoryBackend
+  - both satisfy the MemoryBackend protocol
+  - stores on one SQLite file share one backend (one connection)
+
+  Contract parity (directory and SQLite)
+  - put/get roundtrip, overwrite, exists
+  - list_by_scope in file-name order and scope-isolated (same order on both)
+  - list_by_keys in declaration order, missing keys skipped, duplicates kept
+
+  SQLite specifics
+  - database runs in WAL mode
+  - list_by_keys is batched (one query per chunk, not per key)
+  - put_many is atomic (a failing batch writes nothing)
+  - records persist across store instances
+
+  Migration
+  - migrate_directory_store copies every scope; re-running is idempotent
+  - missing source raises MEMORY_MIGRATE_FAILED
+  - `memory migrate` CLI command
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from argparse import Namespace
+
+import pytest
+
+from io_iii.memory.store import (
+    DirectoryBackend,
+    MemoryBackend,
+    MemoryRecord,
+    MemoryStore,
+    SQLiteBackend,
+    close_backends,
+    get_backend,
+    migrate_directory_store,
+)
+
+
+def _rec(key: str, scope: str = "io_iii", value: str = "v", version: int = 1) -> MemoryRecord:
+    return MemoryRecord(
+        key=key,
+        scope=scope,
+        value=value,
+        version=version,
+        provenance="human",
+        created_at="2026-04-12T10:00:00Z",
+        updated_at="2026-04-12T10:00:00Z",
+        sensitivity="standard",
+    )
+
+
+@pytest.fixture(params=["dir", "sqlite"])
+def store(request, tmp_path):
+    root = tmp_path / ("store" if request.param == "dir" else "store.db")
+    s = MemoryStore(root)
+    yield s
+    if isinstance(s.backend, SQLiteBackend):
+        s.backend.close()
+
+
+# ---------------------------------------------------------------------------
+# Backend selection
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("name", ["m.db", "m.sqlite", "m.SQLITE3"])
+def test_sqlite_suffix_selects_sqlite(tmp_path, name):
+    assert isinstance(MemoryStore(tmp_path / name).backend, SQLiteBackend)
+
+
+def test_directory_is_default(tmp_path):
+    assert isinstance(MemoryStore(tmp_path / "memory_store").backend, DirectoryBackend)
+
+
+def test_backends_satisfy_protocol(tmp_path):
+    assert isinstance(DirectoryBackend(tmp_path), MemoryBackend)
+    assert isinstance(SQLiteBackend(tmp_path / "m.db"), MemoryBackend)
+
+    class _NoStamp:  # everything except change_stamp (needed by the continuity cache)
+        get = get_many = put = put_many = list_by_scope = exists = staticmethod(lambda *a: None)
+
+    assert not isinstance(_NoStamp(), MemoryBackend)
+
+
+def test_sqlite_backend_shared_per_path(tmp_path, monkeypatch):
+    close_backends()
+    connects = []
+    real = sqlite3.connect
+    monkeypatch.setattr(sqlite3, "connect", lambda *a, **kw: connects.append(a) or real(*a, **kw))
+
+    stores = [MemoryStore(tmp_path / "m.db") for _ in range(50)]
+    for i, s in enumerate(stores):
+        s.put(_rec(f"k{i}"))
+    assert len({id(s.backend) for s in stores}) == 1
+    assert get_backend(str(tmp_path / "m.db")) is stores[0].backend
+    assert len(connects) == 1
+    assert get_backend(tmp_path / "dir") is not get_backend(tmp_path / "dir")  # stateless
+    close_backends()
+
+
+# ---------------------------------------------------------------------------
+# Contract parity
+# ---------------------------------------------------------------------------
+
+def test_put_get_roundtrip(store):
+    r = _rec("a", value="hello")
+    store.put(r)
+    assert store.get("io_iii", "a") == r
+    assert store.get("other", "a") is None
+    assert store.exists("io_iii", "a")
+    assert not store.exists("io_iii", "b")
+
+
+def test_put_overwrites(store):
+    store.put(_rec("a", value="one"))
+    store.put(_rec("a", value="two", version=2))
+    assert store.get("io_iii", "a").version == 2
+    assert len(store.list_by_scope("io_iii")) == 1
+
+
+def test_list_by_scope_sorted_and_isolated(store):
+    for k in ("c", "a", "b"):
+        store.put(_rec(k))
+    store.put(_rec("z", scope="other"))
+    assert [r.key for r in store.list_by_scope("io_iii")] == ["a", "b", "c"]
+    assert store.list_by_scope("missing") == []
+
+
+def test_list_by_scope_orders_by_file_name(store):
+    for k in ("a.b", "a-b", "a", "a_b"):
+        store.put(_rec(k, scope="s"))
+    assert [r.key for r in store.list_by_scope("s")] == ["a-b", "a.b", "a", "a_b"]
+
+
+def test_list_by_keys_declaration_order(store):
+    for k in ("a", "b", "c"):
+        store.put(_rec(k))
+    got = store.list_by_keys("io_iii", ["c", "missing", "a", "c"])
+    assert [r.key for r in got] == ["c", "a", "c"]
+    assert store.list_by_keys("io_iii", []) == []
+
+
+# ---------------------------------------------------------------------------
+# SQLite specifics
+# ---------------------------------------------------------------------------
+
+def test_sqlite_uses_wal(tmp_path):
+    s = MemoryStore(tmp_path / "m.db")
+    s.put(_rec("a"))
+    s.backend.close()
+    conn = sqlite3.connect(str(tmp_path / "m.db"))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+
+
+def test_sqlite_list_by_keys_is_batched(tmp_path):
+    backend = SQLiteBackend(tmp_path / "m.db")
+    backend.put_many(_rec(f"k{i:04d}") for i in range(1200))
+    statements = []
+    backend._connection().set_trace_callback(statements.append)
+    got = MemoryStore(tmp_path / "m.db", backend=backend).list_by_keys(
+        "io_iii", [f"k{i:04d}" for i in range(1200)]
+    )
+    assert len(got) == 1200
+    assert [r.key for r in got[:2]] == ["k0000", "k0001"]
+    assert len([s for s in statements if s.startswith("SELECT")]) == 3  # 500 + 500 + 200
+    backend.close()
+
+
+def test_sqlite_put_many_is_atomic(tmp_path):
+    backend = SQLiteBackend(tmp_path / "m.db")
+
+    def _records():
+        yield _rec("a")
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        backend.put_many(_records())
+    assert backend.get("io_iii", "a") is None
+    backend.close()
+
+
+def test_sqlite_persists_across_instances(tmp_path):
+    a = MemoryStore(tmp_path / "m.db")
+    a.put(_rec("a", value="persisted"))
+    a.backend.close()
+    b = MemoryStore(tmp_path / "m.db")
+    assert b.get("io_iii", "a").value == "persisted"
+    b.backend.close()
+
+
+# ---------------------------------------------------------------------------
+# Migration
+# ---------------------------------------------------------------------------
+
+def test_migrate_directory_store(tmp_path):
+    src = MemoryStore(tmp_path / "memory_store")
+    for k in ("a", "b"):
+        src.put(_rec(k))
+    src.put(_rec("x", scope="other"))
+
+    dest = tmp_path / "memory.db"
+    assert migrate_directory_store(tmp_path / "memory_store", dest) == 3
+    assert migrate_directory_store(tmp_path / "memory_store", dest) == 3  # idempotent
+
+    migrated = MemoryStore(dest)
+    assert [r.key for r in migrated.list_by_scope("io_iii")] == ["a", "b"]
+    assert migrated.get("other", "x") == _rec("x", scope="other")
+    migrated.backend.close()
+
+
+def test_migrate_missing_source(tmp_path):
+    with pytest.raises(ValueError, match="MEMORY_MIGRATE_FAILED"):
+        migrate_directory_store(tmp_path / "nope", tmp_path / "m.db")
+
+
+def test_cli_memory_migrate(tmp_path, capsys):
+    from io_iii.cli import cmd_memory_migrate
+
+    MemoryStore(tmp_path / "memory_store").put(_rec("a"))
+    rc = cmd_memory_migrate(Namespace(
+        source=str(tmp_path / "memory_store"), dest=str(tmp_path / "m.db"), config_dir=None,
+    ))
+    assert rc == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["status"] == "ok"
+    assert out["records_copied"] == 1
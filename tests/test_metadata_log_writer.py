@@ -0,0 +1,153 @@
+"""
+test_metadata_log_writer.py — persistent, rotating metadata.jsonl writer.
+
+Verifies:
+  - append_metadata keeps one open handle and never rereads the log
+  - size-based rotation into numbered segments (.1 newest) bounded by max_segments
+  - record order is preserved across segments
+  - the writer reopens after the file is removed or rotated externally
+  - buffering=interval defers writes until the background flush
+  - fsync=always syncs every record; fsync=never does not
+  - settings validation and writer replacement on settings change
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from io_iii import metadata_logging as ml
+from io_iii.metadata_logging import (
+    MetadataLogSettings,
+    append_metadata,
+    get_writer,
+    load_metadata_log_settings,
+)
+
+
+@pytest.fixture(autouse=True)
+def _close_writers():
+    ml.close_writers()
+    yield
+    ml.close_writers()
+
+
+def _cfg(tmp_path, **metadata):
+    return {
+        "logging": {"metadata": {"enabled": True, **metadata}},
+        "storage": {"metadata_log_dir": str(tmp_path)},
+    }
+
+
+def _read(path: Path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_single_handle_and_no_reread(tmp_path, monkeypatch):
+    cfg = _cfg(tmp_path)
+    path = append_metadata(cfg, {"i": 0})
+    writer = get_writer(path, load_metadata_log_settings(cfg))
+    fh = writer._fh
+
+    def _no_read(*a, **k):
+        raise AssertionError("log must not be reread")
+
+    monkeypatch.setattr(Path, "read_bytes", _no_read)
+    for i in range(1, 50):
+        append_metadata(cfg, {"i": i})
+    assert writer._fh is fh
+    monkeypatch.undo()
+    assert [r["i"] for r in _read(path)] == list(range(50))
+
+
+def test_rotation_into_numbered_segments(tmp_path):
+    cfg = _cfg(tmp_path, max_bytes=600, max_segments=2)
+    for i in range(60):
+        append_metadata(cfg, {"i": i})
+    path = tmp_path / "metadata.jsonl"
+    seg1 = tmp_path / "metadata.jsonl.1"
+    seg2 = tmp_path / "metadata.jsonl.2"
+    assert seg1.exists() and seg2.exists()
+    assert not (tmp_path / "metadata.jsonl.3").exists()
+    for p in (path, seg1, seg2):
+        assert p.stat().st_size <= 600
+    ids = [r["i"] for p in (seg2, seg1, path) for r in _read(p)]
+    assert ids == sorted(ids)
+    assert ids[-1] == 59
+
+
+def test_reopens_after_external_removal(tmp_path):
+    cfg = _cfg(tmp_path)
+    path = append_metadata(cfg, {"i": 0})
+    path.unlink()
+    append_metadata(cfg, {"i": 1})
+    assert [r["i"] for r in _read(path)] == [1]
+
+
+def test_reopens_after_external_rotation(tmp_path):
+    cfg = _cfg(tmp_path)
+    path = append_metadata(cfg, {"i": 0})
+    os.replace(path, tmp_path / "moved.jsonl")
+    append_metadata(cfg, {"i": 1})
+    assert [r["i"] for r in _read(path)] == [1]
+    assert [r["i"] for r in _read(tmp_path / "moved.jsonl")] == [0]
+
+
+def test_interval_buffering_flushes_in_background(tmp_path):
+    cfg = _cfg(tmp_path, buffering="interval", flush_interval_seconds=0.05)
+    path = append_metadata(cfg, {"i": 0})
+    assert path.stat().st_size == 0  # still buffered
+    deadline = time.time() + 2
+    while path.stat().st_size == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert [r["i"] for r in _read(path)] == [0]
+
+
+def test_close_flushes_buffered_records(tmp_path):
+    cfg = _cfg(tmp_path, buffering="interval", flush_interval_seconds=60)
+    path = append_metadata(cfg, {"i": 0})
+    ml.close_writers()
+    assert [r["i"] for r in _read(path)] == [0]
+
+
+@pytest.mark.parametrize("policy,expected", [("always", 3), ("never", 0)])
+def test_fsync_policy(tmp_path, monkeypatch, policy, expected):
+    calls = []
+    real = os.fsync
+    monkeypatch.setattr(ml.os, "fsync", lambda fd: (calls.append(fd), real(fd)))
+    cfg = _cfg(tmp_path, fsync=policy)
+    for i in range(3):
+        append_metadata(cfg, {"i": i})
+    assert len(calls) == expected
+
+
+def test_settings_change_replaces_writer(tmp_path):
+    path = tmp_path / "metadata.jsonl"
+    first = get_writer(path, MetadataLogSettings())
+    assert get_writer(path, MetadataLogSettings()) is first
+    second = get_writer(path, MetadataLogSettings(max_bytes=10))
+    assert second is not first
+    first.write_line(b'{"late": true}\n')  # a closed writer still appends
+    assert _read(path) == [{"late": True}]
+
+
+def test_settings_defaults():
+    assert load_metadata_log_settings({}) == MetadataLogSettings()
+    assert load_metadata_log_settings(
+        {"logging": {"metadata": {"enabled": True, "max_bytes": 10, "fsync": "interval"}}}
+    ) == MetadataLogSettings(max_bytes=10, fsync="interval")
+
+
+@pytest.mark.parametrize("metadata", [
+    {"max_bytes": 0},
+    {"max_segments": True},
+    {"buffering": "block"},
+    {"fsync": "sometimes"},
+    {"flush_interval_seconds": 0},
+])
+def test_settings_invalid(metadata):
+    with pytest.raises(ValueError, match="METADATA_LOG_CONFIG_INVALID"):
+        load_metadata_log_settings({"logging": {"metadata": metadata}})
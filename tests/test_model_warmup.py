@@ -0,0 +1,202 @@
+"""
+test_model_warmup.py — model warm-up and keep-alive manager (api/_warmup.py).
+
+Verifies:
+  - routed_models collects distinct ollama models across modes (secondary on fallback)
+  - routed models are preloaded in parallel with the configured keep_alive
+  - keep-alive pings run on schedule and stop on close()
+  - a failed preload is reported as failed; a later successful ping recovers it
+  - GET /health exposes per-model state only when warm-up is enabled (both servers)
+  - an invalid model_warmup block fails FastAPI startup, as it does for `serve`
+  - settings validation and shared-manager lifecycle
+"""
+from __future__ import annotations
+
+import threading
+import time
+import types
+
+import pytest
+
+from io_iii.api import _warmup as warmup
+from io_iii.api._warmup import (
+    ModelWarmupManager,
+    WarmupSettings,
+    load_warmup_settings,
+    routed_models,
+    start_model_warmup,
+)
+
+
+class _Provider:
+    def __init__(self, *, delay=0.0, fail=()):
+        self.calls = []
+        self.delay = delay
+        self.fail = set(fail)
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def preload(self, *, model, keep_alive=None):
+        with self.lock:
+            self.calls.append((model, keep_alive))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if model in self.fail:
+                raise RuntimeError("load failed")
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _cfg(runtime=None, *, ollama_enabled=True):
+    return types.SimpleNamespace(
+        providers={"providers": {"ollama": {"enabled": ollama_enabled}}},
+        routing={"routing_table": {"modes": {
+            "executor": {"primary": "local:a", "secondary": "local:a"},
+            "explorer": {"primary": "local:b", "secondary": "local:c"},
+            "challenger": {"primary": "local:b", "secondary": "local:c"},
+            "offline": {"primary": "cloud:x", "secondary": "local:c"},
+        }}},
+        runtime=runtime or {},
+    )
+
+
+def _wait(pred, timeout=3.0):
+    deadline = time.time() + timeout
+    while not pred() and time.time() < deadline:
+        time.sleep(0.01)
+    return pred()
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_manager():
+    warmup.shutdown_model_warmup()
+    yield
+    warmup.shutdown_model_warmup()
+
+
+def test_routed_models_are_distinct_and_follow_fallback():
+    assert routed_models(_cfg()) == ["a", "b", "c"]
+    assert routed_models(_cfg(ollama_enabled=False)) == []
+
+
+def test_preloads_in_parallel_with_keep_alive():
+    provider = _Provider(delay=0.1)
+    m = ModelWarmupManager(["a", "b", "c"], WarmupSettings(keep_alive="1h", parallelism=3), provider)
+    m.warm_all()
+    assert sorted(provider.calls) == [("a", "1h"), ("b", "1h"), ("c", "1h")]
+    assert provider.max_active == 3
+    status = m.status()
+    assert {s["state"] for s in status.values()} == {"warm"}
+    assert all(s["load_ms"] >= 100 for s in status.values())
+
+
+def test_parallelism_bounds_concurrent_preloads():
+    provider = _Provider(delay=0.05)
+    ModelWarmupManager(["a", "b", "c", "d"], WarmupSettings(parallelism=2), provider).warm_all()
+    assert provider.max_active == 2
+
+
+def test_keep_alive_pings_and_close():
+    provider = _Provider()
+    m = ModelWarmupManager(["a"], WarmupSettings(ping_interval_seconds=0.02), provider).start()
+    assert _wait(lambda: m.status()["a"]["pings"] >= 2)
+    m.close()
+    calls = len(provider.calls)
+    time.sleep(0.1)
+    assert len(provider.calls) == calls
+    st = m.status()["a"]
+    assert st["state"] == "warm" and st["last_ping_ms"] is not None and st["last_ping_at"]
+
+
+def test_failed_preload_then_recovery():
+    provider = _Provider(fail={"b"})
+    m = ModelWarmupManager(["a", "b"], WarmupSettings(ping_interval_seconds=0.02), provider)
+    m.warm_all()
+    status = m.status()
+    assert status["a"]["state"] == "warm"
+    assert status["b"] == {
+        "state": "failed", "load_ms": None, "last_ping_ms": None,
+        "last_ping_at": None, "pings": 0, "error_code": "RuntimeError",
+    }
+    provider.fail.clear()
+    m.start()
+    assert _wait(lambda: m.status()["b"]["state"] == "warm")
+    assert m.status()["b"]["error_code"] is None
+    m.close()
+
+
+def test_models_start_cold():
+    m = ModelWarmupManager(["a"], WarmupSettings(), _Provider())
+    assert m.status()["a"]["state"] == "cold"
+
+
+def test_fastapi_health_reports_models():
+    from fastapi.testclient import TestClient
+
+    from io_iii.api.app import app
+
+    client = TestClient(app)
+    assert "models" not in client.get("/health").json()
+    provider = _Provider()
+    manager = start_model_warmup(_cfg({"model_warmup": {"ping_interval_seconds": 0}}), lambda _: provider)
+    assert _wait(lambda: all(s["state"] == "warm" for s in manager.status().values()))
+    body = client.get("/health").json()
+    assert body["status"] == "ok"
+    assert set(body["models"]) == {"a", "b", "c"}
+    assert body["models"]["a"]["state"] == "warm"
+
+
+def test_stdlib_server_health_payload():
+    from io_iii.api.server import health_payload
+
+    assert health_payload() == {"status": "ok", "runtime": "io-iii"}
+    start_model_warmup(_cfg({"model_warmup": True}), lambda _: _Provider())
+    assert set(health_payload()["models"]) == {"a", "b", "c"}
+
+
+def test_invalid_config_fails_fastapi_startup(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from io_iii import config
+    from io_iii.api.app import app
+
+    monkeypatch.setattr(config, "load_io3_config", lambda: _cfg({"model_warmup": "yes"}))
+    with pytest.raises(ValueError, match="MODEL_WARMUP_CONFIG_INVALID"):
+        with TestClient(app):
+            pass
+
+
+def test_shared_manager_lifecycle():
+    first = start_model_warmup(_cfg({"model_warmup": {"ping_interval_seconds": 0}}), lambda _: _Provider())
+    assert warmup.get_warmup_manager() is first
+    assert start_model_warmup(_cfg(), lambda _: _Provider()) is None
+    assert warmup.get_warmup_manager() is None
+    assert warmup.health_models() is None
+
+
+def test_load_settings():
+    assert load_warmup_settings({}) is None
+    assert load_warmup_settings({"model_warmup": False}) is None
+    assert load_warmup_settings({"model_warmup": {"enabled": False}}) is None
+    assert load_warmup_settings({"model_warmup": True}) == WarmupSettings()
+    assert load_warmup_settings(
+        {"model_warmup": {"keep_alive": -1, "ping_interval_seconds": 60, "parallelism": 2}}
+    ) == WarmupSettings(keep_alive=-1, ping_interval_seconds=60.0, parallelism=2)
+
+
+@pytest.mark.parametrize("block", [
+    "yes",
+    {"enabled": 1},
+    {"keep_alive": ""},
+    {"ping_interval_seconds": -1},
+    {"ping_interval_seconds": True},
+    {"parallelism": 0},
+    {"parallelism": 1.5},
+])
+def test_load_settings_invalid(block):
+    with pytest.raises(ValueError, match="MODEL_WARMUP_CONFIG_INVALID"):
+        load_warmup_settings({"model_warmup": block})
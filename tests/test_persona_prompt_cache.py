@@ -0,0 +1,135 @@
+"""
+test_persona_prompt_cache.py — memoised identity / profile loads and prompt prefix.
+
+Verifies:
+  - load_identity / load_user_profile parse YAML once while the file is unchanged
+  - an edited file is picked up (mtime-based invalidation)
+  - files inside the racy window are not cached
+  - returned blocks are copies (caller mutation cannot poison the cache)
+  - missing files fall back to defaults
+  - the static system-prompt prefix is reused across assemblies
+  - a persona edit changes the assembled system prompt
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import io_iii.persona_contract as pc
+from io_iii.core import context_assembly as ca
+from io_iii.core.session_state import AuditGateState, SessionState
+
+
+def _write(path: Path, text: str, *, age_s: int = 60) -> None:
+    path.write_text(text, encoding="utf-8")
+    if age_s:
+        past = os.stat(path).st_mtime - age_s
+        os.utime(path, (past, past))
+
+
+@pytest.fixture
+def cfg_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(pc, "_CONFIG_DIR", tmp_path)
+    pc.clear_persona_cache()
+    ca._static_prefix.cache_clear()
+    yield tmp_path
+    pc.clear_persona_cache()
+    ca._static_prefix.cache_clear()
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    calls = {"n": 0}
+    real = pc.yaml.safe_load
+
+    def _counting(stream):
+        calls["n"] += 1
+        return real(stream)
+
+    monkeypatch.setattr(pc.yaml, "safe_load", _counting)
+    return calls
+
+
+def test_identity_parsed_once_while_unchanged(cfg_dir, parse_count):
+    _write(cfg_dir / "persona.yaml", "identity:\n  name: Ada\n")
+    assert pc.load_identity()["name"] == "Ada"
+    assert pc.load_identity()["name"] == "Ada"
+    assert parse_count["n"] == 1
+
+
+def test_identity_edit_is_picked_up(cfg_dir):
+    _write(cfg_dir / "persona.yaml", "identity:\n  name: Ada\n")
+    assert pc.load_identity()["name"] == "Ada"
+    _write(cfg_dir / "persona.yaml", "identity:\n  name: Grace\n", age_s=30)
+    assert pc.load_identity()["name"] == "Grace"
+
+
+def test_racy_file_is_not_cached(cfg_dir, parse_count):
+    _write(cfg_dir / "user_profile.yaml", "user:\n  role: dev\n", age_s=0)
+    pc.load_user_profile()
+    pc.load_user_profile()
+    assert parse_count["n"] == 2
+
+
+def test_returned_block_is_a_copy(cfg_dir):
+    _write(cfg_dir / "user_profile.yaml", "user:\n  expertise: [python]\n")
+    pc.load_user_profile()["expertise"].append("mutated")
+    assert pc.load_user_profile()["expertise"] == ["python"]
+
+
+def test_missing_files_fall_back_to_defaults(cfg_dir):
+    assert pc.load_identity() == pc._IDENTITY_DEFAULTS
+    assert pc.load_user_profile() == pc._USER_PROFILE_DEFAULTS
+
+
+def _state(mode="executor", audit=False):
+    return SessionState(
+        request_id="r",
+        started_at_ms=0,
+        mode=mode,
+        provider="null",
+        route_id=mode,
+        audit=AuditGateState(audit_enabled=audit),
+    )
+
+
+def _prompt(**kw):
+    return ca._build_system_prompt(
+        session_state=_state(**kw), persona_contract="contract", route_metadata={}
+    )
+
+
+def test_static_prefix_is_reused(cfg_dir):
+    _write(cfg_dir / "persona.yaml", "identity:\n  name: Ada\n")
+    first = _prompt()
+    second = _prompt()
+    assert first == second
+    info = ca._static_prefix.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_prefix_keyed_by_mode_and_audit(cfg_dir):
+    a = _prompt(mode="executor", audit=False)
+    b = _prompt(mode="executor", audit=True)
+    assert "audit_enabled: False" in a
+    assert "audit_enabled: True" in b
+    assert ca._static_prefix.cache_info().misses == 2
+
+
+def test_persona_edit_changes_prompt(cfg_dir):
+    _write(cfg_dir / "persona.yaml", "identity:\n  name: Ada\n")
+    assert "Your name is Ada." in _prompt()
+    _write(cfg_dir / "persona.yaml", "identity:\n  name: Grace\n", age_s=30)
+    assert "Your name is Grace." in _prompt()
+
+
+def test_profile_preferences_keep_yaml_order(cfg_dir):
+    _write(
+        cfg_dir / "user_profile.yaml",
+        "user:\n  preferences:\n    zeta: z\n    alpha: a\n",
+    )
+    prompt = _prompt()
+    assert prompt.index("Zeta: z") < prompt.index("Alpha: a")
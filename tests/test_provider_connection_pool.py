@@ -0,0 +1,200 @@
+"""
+test_provider_connection_pool.py — shared keep-alive transport for OllamaProvider.
+
+Verifies:
+  - from_config reads pool_size from providers.yaml (default 0 = disabled)
+  - pooled generate() reuses one connection across calls (hit/miss counters)
+  - pools are shared across provider instances targeting the same host
+  - non-2xx status surfaces as ProviderError with "HTTP Error <code>"
+  - stale idle connection is retried once on a fresh socket
+  - ExecutionMetrics projects pool counters only when present
+  - engine attributes per-run pool hits/misses into telemetry
+"""
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from io_iii.core.telemetry import ExecutionMetrics
+from io_iii.providers import _http_pool
+from io_iii.providers.ollama_provider import OllamaProvider
+from io_iii.providers.provider_contract import ProviderError
+
+# ---------------------------------------------------------------------------
+# Local keep-alive server fixture
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    status = 200
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.server.connections.add(self.client_address)
+        body = json.dumps({"response": "ok", "prompt_eval_count": 3, "eval_count": 2}).encode()
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.daemon_threads = True
+    srv.connections = set()
+    srv.status = 200
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    _http_pool.close_all()
+
+
+def _host(srv) -> str:
+    return f"http://127.0.0.1:{srv.server_address[1]}"
+
+
+# ---------------------------------------------------------------------------
+# Config
+# ---------------------------------------------------------------------------
+
+def test_from_config_reads_pool_size(monkeypatch):
+    monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    p = OllamaProvider.from_config({"providers": {"ollama": {"base_url": "http://h:1", "pool_size": 6}}})
+    assert p.pool_size == 6
+
+
+def test_from_config_pool_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    p = OllamaProvider.from_config({"providers": {"ollama": {"base_url": "http://h:1"}}})
+    assert p.pool_size == 0
+    assert p.pool_counters() is None
+
+
+# ---------------------------------------------------------------------------
+# Pooled transport
+# ---------------------------------------------------------------------------
+
+def test_pooled_generate_reuses_connection(server):
+    p = OllamaProvider(host=_host(server), pool_size=2)
+    for _ in range(3):
+        assert p.generate(model="m", prompt="x") == "ok"
+    assert p.pool_counters() == (2, 1)
+    assert len(server.connections) == 1
+
+
+def test_pool_shared_across_provider_instances(server):
+    OllamaProvider(host=_host(server), pool_size=2).generate(model="m", prompt="x")
+    text, in_tok, out_tok = OllamaProvider(host=_host(server), pool_size=2).generate_with_metrics(
+        model="m", prompt="x"
+    )
+    assert (text, in_tok, out_tok) == ("ok", 3, 2)
+    stats = _http_pool.pool_stats()[_host(server)]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_pooled_non_2xx_raises_provider_error(server):
+    server.status = 404
+    p = OllamaProvider(host=_host(server), pool_size=2)
+    with pytest.raises(ProviderError) as exc_info:
+        p.generate(model="m", prompt="x")
+    assert exc_info.value.code == "PROVIDER_OLLAMA_FAILED"
+    assert "404" in exc_info.value.detail
+
+
+def test_stale_idle_connection_is_retried(server):
+    p = OllamaProvider(host=_host(server), pool_size=2)
+    p.generate(model="m", prompt="x")
+    pool = _http_pool.get_pool(_host(server), pool_size=2)
+    # Simulate a keep-alive socket that died while idle in the pool.
+    pool._idle[0].sock.shutdown(socket.SHUT_RDWR)
+    assert p.generate(model="m", prompt="x") == "ok"
+    assert pool.counters() == (1, 2)
+
+
+def test_pooled_transport_error_raises_provider_error():
+    p = OllamaProvider(host="http://127.0.0.1:9", pool_size=1)
+    with pytest.raises(ProviderError):
+        p.generate(model="m", prompt="x")
+    _http_pool.close_all()
+
+
+# ---------------------------------------------------------------------------
+# ExecutionMetrics projection
+# ---------------------------------------------------------------------------
+
+def test_metrics_to_dict_includes_pool_counters_when_set():
+    m = ExecutionMetrics(
+        call_count=2, input_tokens=10, output_tokens=4, latency_ms=5,
+        model_used="m", pool_hits=1, pool_misses=1,
+    )
+    d = m.to_dict()
+    assert d["pool_hits"] == 1
+    assert d["pool_misses"] == 1
+
+
+def test_metrics_to_dict_omits_pool_counters_when_unset():
+    m = ExecutionMetrics(call_count=1, input_tokens=10, output_tokens=None, latency_ms=5, model_used="m")
+    assert "pool_hits" not in m.to_dict()
+
+
+# ---------------------------------------------------------------------------
+# Engine integration
+# ---------------------------------------------------------------------------
+
+def _state():
+    from io_iii.core.session_state import AuditGateState, RouteInfo, SessionState
+    return SessionState(
+        request_id="t-pool",
+        started_at_ms=int(time.time() * 1000),
+        mode="executor",
+        config_dir="./architecture/runtime/config",
+        route=RouteInfo(
+            mode="executor",
+            primary_target="ollama:llama3.2",
+            secondary_target=None,
+            selected_target="ollama:llama3.2",
+            selected_provider="ollama",
+            fallback_used=False,
+            fallback_reason=None,
+        ),
+        audit=AuditGateState(audit_enabled=False),
+        status="ok",
+        provider="ollama",
+        model="llama3.2",
+        route_id="executor",
+        persona_contract_version="v1.0",
+        logging_policy={"content": "disabled"},
+    )
+
+
+def test_engine_telemetry_reports_pool_counters(server):
+    from io_iii.core.engine import run
+
+    cfg = types.SimpleNamespace(
+        providers={}, logging={}, routing={"routing_table": {}}, runtime={},
+    )
+    host = _host(server)
+    _, result = run(
+        cfg=cfg,
+        session_state=_state(),
+        user_prompt="hello",
+        audit=False,
+        ollama_provider_factory=lambda _: OllamaProvider(host=host, pool_size=2),
+    )
+    telemetry = result.meta["telemetry"]
+    assert telemetry["pool_hits"] + telemetry["pool_misses"] == telemetry["call_count"]
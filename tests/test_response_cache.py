@@ -0,0 +1,249 @@
+"""
+test_response_cache.py — opt-in executor response cache (prompt_hash × model).
+
+Verifies:
+
+  Settings
+  - absent / empty response_cache block disables the cache
+  - invalid values raise RESPONSE_CACHE_INVALID
+
+  ResponseCache
+  - LRU eviction by byte size; recently used entries survive
+  - entries expire after ttl_seconds
+  - disk tier survives a fresh memory tier and is written atomically
+  - key changes with model and provider options
+
+  Engine
+  - second identical run is served from cache (one provider call total)
+  - cache_hit recorded in telemetry and the provider_inference trace step
+  - modes not listed in `modes` bypass the cache (no cache_hit field)
+  - audited runs still run the challenger on a cached draft
+  - streaming callers receive the cached text as one delta
+"""
+from __future__ import annotations
+
+import time
+import types
+
+import pytest
+
+import io_iii.core.engine as engine
+from io_iii.core.response_cache import (
+    ResponseCache,
+    clear_response_caches,
+    load_response_cache_settings,
+    response_cache_key,
+)
+from io_iii.core.session_state import AuditGateState, RouteInfo, SessionState
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    clear_response_caches()
+    yield
+    clear_response_caches()
+
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("runtime", [{}, {"response_cache": None}, {"response_cache": {"modes": []}}])
+def test_settings_disabled_by_default(runtime):
+    assert load_response_cache_settings(runtime) is None
+
+
+@pytest.mark.parametrize("block", [
+    ["executor"],
+    {"modes": "executor"},
+    {"modes": ["executor"], "max_bytes": 0},
+    {"modes": ["executor"], "ttl_seconds": -1},
+    {"modes": ["executor"], "disk_dir": ""},
+])
+def test_settings_invalid(block):
+    with pytest.raises(ValueError, match="RESPONSE_CACHE_INVALID"):
+        load_response_cache_settings({"response_cache": block})
+
+
+def test_settings_defaults():
+    s = load_response_cache_settings({"response_cache": {"modes": ["executor"]}})
+    assert s.enabled_for("executor")
+    assert not s.enabled_for("challenger")
+    assert s.disk_dir is None
+
+
+# ---------------------------------------------------------------------------
+# ResponseCache
+# ---------------------------------------------------------------------------
+
+def test_lru_evicts_by_bytes():
+    c = ResponseCache(max_bytes=10)
+    c.put("a", "aaaa")
+    c.put("b", "bbbb")
+    assert c.get("a") is not None  # a is now most recently used
+    c.put("c", "cccc")             # 12 bytes > 10: evicts b
+    assert c.get("b") is None
+    assert c.get("a").text == "aaaa"
+    assert c.stats()["bytes"] == 8
+    assert c.stats()["evictions"] == 1
+
+
+def test_oversized_entry_not_kept_in_memory():
+    c = ResponseCache(max_bytes=3)
+    c.put("a", "toolong")
+    assert c.get("a") is None
+
+
+def test_ttl_expiry(monkeypatch):
+    c = ResponseCache(ttl_seconds=10)
+    c.put("a", "x")
+    real = time.time
+    monkeypatch.setattr(time, "time", lambda: real() + 11)
+    assert c.get("a") is None
+
+
+def test_disk_tier_roundtrip(tmp_path):
+    ResponseCache(disk_dir=tmp_path).put("ab12", "persisted", input_tokens=3, output_tokens=1)
+    assert not list(tmp_path.rglob("*.tmp"))
+    fresh = ResponseCache(disk_dir=tmp_path)
+    got = fresh.get("ab12")
+    assert (got.text, got.input_tokens, got.output_tokens) == ("persisted", 3, 1)
+    assert fresh.stats()["entries"] == 1  # promoted into memory
+
+
+def test_disk_tier_expired_entry_removed(tmp_path, monkeypatch):
+    ResponseCache(disk_dir=tmp_path, ttl_seconds=5).put("ab12", "old")
+    real = time.time
+    monkeypatch.setattr(time, "time", lambda: real() + 6)
+    assert ResponseCache(disk_dir=tmp_path, ttl_seconds=5).get("ab12") is None
+    assert not (tmp_path / "ab" / "ab12.json").exists()
+
+
+def test_key_includes_model_and_provider_options():
+    p1 = types.SimpleNamespace(name="ollama", host="http://a")
+    p2 = types.SimpleNamespace(name="ollama", host="http://a", options={"temperature": 0.2})
+    k = response_cache_key(prompt_hash="h", model="m", provider=p1)
+    assert k == response_cache_key(prompt_hash="h", model="m", provider=p1)
+    assert k != response_cache_key(prompt_hash="h", model="m2", provider=p1)
+    assert k != response_cache_key(prompt_hash="h", model="m", provider=p2)
+
+
+# ---------------------------------------------------------------------------
+# Engine integration
+# ---------------------------------------------------------------------------
+
+class _Provider:
+    name = "ollama"
+    host = "http://fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, *, model, prompt):
+        self.calls += 1
+        return " revised "
+
+    def generate_with_metrics(self, *, model, prompt):
+        self.calls += 1
+        return " draft ", 7, 2
+
+
+class _StreamingProvider(_Provider):
+    def generate_stream(self, *, model, prompt):
+        self.calls += 1
+        yield "dr"
+        yield "aft"
+        return 7, 2
+
+
+def _state(mode="executor"):
+    return SessionState(
+        request_id="rc",
+        started_at_ms=int(time.time() * 1000),
+        mode=mode,
+        config_dir="./architecture/runtime/config",
+        route=RouteInfo(
+            mode=mode,
+            primary_target="ollama:llama3.2",
+            secondary_target=None,
+            selected_target="ollama:llama3.2",
+            selected_provider="ollama",
+            fallback_used=False,
+            fallback_reason=None,
+        ),
+        audit=AuditGateState(audit_enabled=False),
+        status="ok",
+        provider="ollama",
+        model="llama3.2",
+        route_id=mode,
+        persona_contract_version="v1.0",
+        logging_policy={"content": "disabled"},
+    )
+
+
+def _cfg(modes=("executor",)):
+    return types.SimpleNamespace(
+        providers={}, logging={}, routing={"routing_table": {}},
+        runtime={"response_cache": {"modes": list(modes)}},
+    )
+
+
+def _run(provider, *, cfg=None, mode="executor", audit=False, **kw):
+    return engine.run(
+        cfg=cfg or _cfg(), session_state=_state(mode), user_prompt="hi", audit=audit,
+        ollama_provider_factory=lambda _: provider, **kw,
+    )
+
+
+def _inference_step(result):
+    return next(s for s in result.meta["trace"]["steps"] if s["stage"] == "provider_inference")
+
+
+def test_identical_run_served_from_cache():
+    provider = _Provider()
+    _, first = _run(provider)
+    _, second = _run(provider)
+    assert provider.calls == 1
+    assert second.message == first.message == "draft"
+    assert second.prompt_hash == first.prompt_hash
+    assert first.meta["telemetry"]["cache_hit"] is False
+    assert second.meta["telemetry"]["cache_hit"] is True
+    assert second.meta["telemetry"]["call_count"] == 0
+    # The hit reports the token counts recorded with the cached draft.
+    assert (second.meta["telemetry"]["input_tokens"], second.meta["telemetry"]["output_tokens"]) == (7, 2)
+    assert _inference_step(second)["meta"]["cache_hit"] is True
+
+
+def test_mode_not_enabled_bypasses_cache():
+    provider = _Provider()
+    _run(provider, cfg=_cfg(modes=("challenger",)))
+    _, result = _run(provider, cfg=_cfg(modes=("challenger",)))
+    assert provider.calls == 2
+    assert "cache_hit" not in result.meta["telemetry"]
+    assert "cache_hit" not in _inference_step(result)["meta"]
+
+
+def test_audit_still_runs_on_cached_draft():
+    provider = _Provider()
+    seen = []
+
+    def challenger(_cfg, _prompt, draft):
+        seen.append(draft)
+        return {"verdict": "pass", "issues": [], "high_risk_claims": [], "suggested_fixes": []}
+
+    _run(provider, audit=True, challenger_fn=challenger)
+    _, result = _run(provider, audit=True, challenger_fn=challenger)
+    assert seen == ["draft", "draft"]
+    assert provider.calls == 1
+    assert result.audit_meta["audit_used"] is True
+
+
+def test_streaming_hit_delivers_single_delta():
+    provider = _StreamingProvider()
+    first, second = [], []
+    _run(provider, on_output_delta=first.append)
+    _, result = _run(provider, on_output_delta=second.append)
+    assert first == ["dr", "aft"]
+    assert second == ["draft"]
+    assert provider.calls == 1
+    assert result.message == "draft"
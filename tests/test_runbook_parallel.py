@@ -0,0 +1,203 @@
+"""
+test_runbook_parallel.py — opt-in concurrent execution of independent runbook steps.
+
+Verifies:
+  - max_parallel > 1 overlaps steps (wall time ≈ slowest step, not the sum)
+  - pool width bounds concurrency
+  - lifecycle events keep the sequential ADR-015 ordering
+  - step_outcomes are in declared order
+  - fail-fast: first failure in declared order is reported, pending steps
+    after it are cancelled, earlier steps still complete
+  - max_parallel=1 is the sequential path; invalid widths are rejected
+  - CLI --parallel and API max_parallel (stdlib and FastAPI) reach the runner
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+import types
+from argparse import Namespace
+
+import pytest
+
+import io_iii.core.runbook_runner as runner
+from io_iii.capabilities.builtins import builtin_registry
+from io_iii.core.dependencies import RuntimeDependencies
+from io_iii.core.runbook import Runbook
+from io_iii.core.task_spec import TaskSpec
+
+
+def _cfg():
+    return types.SimpleNamespace(config_dir=".", providers={}, routing={}, logging={}, runtime={})
+
+
+def _deps():
+    return RuntimeDependencies(
+        ollama_provider_factory=lambda _cfg: None,
+        challenger_fn=None,
+        capability_registry=builtin_registry(),
+    )
+
+
+def _runbook(n):
+    return Runbook.create(steps=[TaskSpec.create(mode="executor", prompt=f"p{i}") for i in range(n)])
+
+
+class _FakeOrchestrator:
+    """Stand-in for orchestrator.run with per-step delay / failure and concurrency tracking."""
+
+    def __init__(self, runbook, *, delay=0.05, delays=None, fail_at=()):
+        self.index = {s.task_spec_id: i for i, s in enumerate(runbook.steps)}
+        self.delay = delay
+        self.delays = delays or {}
+        self.fail_at = set(fail_at)
+        self.started = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def run(self, *, task_spec, cfg, deps, audit):
+        i = self.index[task_spec.task_spec_id]
+        with self.lock:
+            self.started.append(i)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delays.get(i, self.delay))
+            if i in self.fail_at:
+                raise RuntimeError("boom")
+            return types.SimpleNamespace(request_id=f"req-{i}"), types.SimpleNamespace(message="ok")
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    def _install(runbook, **kw):
+        orch = _FakeOrchestrator(runbook, **kw)
+        monkeypatch.setattr(runner._orchestrator, "run", orch.run)
+        return orch
+    return _install
+
+
+def _events(result):
+    return [(e.event, e.step_index) for e in result.metadata.events]
+
+
+def test_parallel_overlaps_steps(fake):
+    rb = _runbook(20)
+    orch = fake(rb, delay=0.05)
+    t0 = time.perf_counter()
+    result = runner.run(runbook=rb, cfg=_cfg(), deps=_deps(), max_parallel=20)
+    elapsed = time.perf_counter() - t0
+    assert result.steps_completed == 20
+    assert not result.terminated_early
+    assert orch.peak > 1
+    assert elapsed < 0.5  # 20 × 50 ms sequentially would be 1 s
+
+
+def test_width_bounds_concurrency(fake):
+    rb = _runbook(8)
+    orch = fake(rb, delay=0.02)
+    runner.run(runbook=rb, cfg=_cfg(), deps=_deps(), max_parallel=3)
+    assert orch.peak <= 3
+
+
+def test_event_order_matches_sequential(fake):
+    rb = _runbook(4)
+    # Later steps finish first; events must still follow declared order.
+    fake(rb, delays={0: 0.08, 1: 0.04, 2: 0.0, 3: 0.0})
+    result = runner.run(runbook=rb, cfg=_cfg(), deps=_deps(), max_parallel=4)
+    expected = [("runbook_started", None)]
+    for i in range(4):
+        expected += [("runbook_step_started", i), ("runbook_step_completed", i)]
+    expected.append(("runbook_completed", None))
+    assert _events(result) == expected
+    assert [o.step_index for o in result.step_outcomes] == [0, 1, 2, 3]
+    assert [o.state.request_id for o in result.step_outcomes] == ["req-0", "req-1", "req-2", "req-3"]
+
+
+def test_fail_fast_cancels_pending_steps(fake):
+    rb = _runbook(10)
+    orch = fake(rb, delay=0.03, fail_at={1})
+    result = runner.run(runbook=rb, cfg=_cfg(), deps=_deps(), max_parallel=2)
+    assert result.terminated_early
+    assert result.failed_step_index == 1
+    assert result.steps_completed == 1
+    assert [o.success for o in result.step_outcomes] == [True, False]
+    assert _events(result)[-2:] == [("runbook_step_failed", 1), ("runbook_terminated", None)]
+    assert len(orch.started) < 10
+
+
+def test_first_failure_in_declared_order_is_reported(fake):
+    rb = _runbook(4)
+    # Step 3 fails immediately; step 1 fails later. Step 1 is the one reported.
+    fake(rb, delays={0: 0.0, 1: 0.05, 2: 0.05, 3: 0.0}, fail_at={1, 3})
+    result = runner.run(runbook=rb, cfg=_cfg(), deps=_deps(), max_parallel=4)
+    assert result.failed_step_index == 1
+    assert [o.step_index for o in result.step_outcomes] == [0, 1]
+
+
+def test_sequential_by_default(fake):
+    rb = _runbook(3)
+    orch = fake(rb, delay=0.0)
+    runner.run(runbook=rb, cfg=_cfg(), deps=_deps())
+    assert orch.peak == 1
+
+
+@pytest.mark.parametrize("width", [0, -1, 1.5, True])
+def test_invalid_width_rejected(width):
+    with pytest.raises(ValueError, match="RUNBOOK_PARALLEL_INVALID"):
+        runner.run(runbook=_runbook(2), cfg=_cfg(), deps=_deps(), max_parallel=width)
+
+
+def test_cli_parallel_flag(tmp_path, monkeypatch, capsys):
+    import io_iii.cli._runbook as cli_runbook
+
+    seen = {}
+
+    def _fake_run(**kw):
+        seen.update(kw)
+        return runner.RunbookResult(runbook_id="rb-x", steps_completed=2)
+
+    monkeypatch.setattr(cli_runbook._runbook_runner, "run", _fake_run)
+    monkeypatch.setattr(cli_runbook, "load_io3_config", lambda _d: _cfg())
+    path = tmp_path / "rb.json"
+    path.write_text(json.dumps(_runbook(2).to_dict()), encoding="utf-8")
+
+    result = cli_runbook.execute_runbook(Namespace(json_file=str(path), parallel=4, config_dir=None))
+    assert result.exit_code == 0
+    assert seen["max_parallel"] == 4
+
+    bad = cli_runbook.execute_runbook(Namespace(json_file=str(path), parallel=0, config_dir=None))
+    assert bad.payload["error_code"] == "RUNBOOK_PARALLEL_INVALID"
+
+
+def test_api_max_parallel_validated():
+    from io_iii.api._handlers import handle_runbook
+
+    status, body = handle_runbook({"runbook": _runbook(2).to_dict(), "max_parallel": 0}, _cfg())
+    assert status == 400
+    assert body["error_code"] == "INVALID_REQUEST_BODY"
+
+
+def test_fastapi_runbook_forwards_max_parallel():
+    from unittest.mock import patch
+
+    from fastapi.testclient import TestClient
+
+    from io_iii.api.app import app
+    from io_iii.cli import CommandResult
+
+    seen = {}
+
+    def _execute(args):
+        seen.update(vars(args))
+        return CommandResult(exit_code=0, payload={"status": "ok"})
+
+    with patch("io_iii.api.app._cli") as m:
+        m.return_value.execute_runbook = _execute
+        resp = TestClient(app).post("/runbook", json={"json_file": "rb.json", "max_parallel": 3})
+    assert resp.status_code == 200 and seen["parallel"] == 3
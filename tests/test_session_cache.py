@@ -0,0 +1,299 @@
+"""
+test_session_cache.py — hot DialogueSession cache with write-behind persistence.
+
+Verifies:
+  - repeated get() serves the live object without re-reading the file
+  - an external change to the session file is picked up (stat revalidation)
+  - sync durability writes on every save
+  - write_behind coalesces saves between flushes; flush/close persist the latest
+  - LRU eviction writes a pending snapshot first
+  - concurrent flushes never land an older snapshot after a newer one
+  - a failed write keeps the snapshot pending (flush and eviction)
+  - hold() serialises work on one session; its locks are refcounted and dropped
+  - the helpers fall back to plain load/save when the block is absent
+  - the CLI service layer (serve path) goes through the cache when enabled
+  - settings validation
+"""
+from __future__ import annotations
+
+import threading
+import time
+import types
+from unittest.mock import patch
+
+import pytest
+
+import io_iii.core.session_cache as sc
+from io_iii.core.dialogue_session import (
+    load_session,
+    new_session,
+    save_session,
+    session_status_summary,
+)
+from io_iii.core.session_cache import (
+    SessionCache,
+    SessionCacheSettings,
+    close_session_caches,
+    hold_session,
+    load_session_cache_settings,
+    load_session_cached,
+    save_session_cached,
+    session_cache_for,
+)
+from io_iii.core.session_mode import SessionMode
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches():
+    close_session_caches()
+    yield
+    close_session_caches()
+
+
+def _stored(tmp_path, **kw):
+    session = new_session(session_mode=SessionMode.WORK, **kw)
+    save_session(session, tmp_path)
+    return session
+
+
+def _on_disk(tmp_path, session_id):
+    return session_status_summary(load_session(session_id, tmp_path))
+
+
+def test_get_serves_live_object_without_reparse(tmp_path, monkeypatch):
+    sid = _stored(tmp_path).session_id
+    cache = SessionCache(tmp_path, SessionCacheSettings())
+    loads = []
+    real = sc.load_session
+    monkeypatch.setattr(sc, "load_session", lambda *a: loads.append(a) or real(*a))
+
+    first = cache.get(sid)
+    assert all(cache.get(sid) is first for _ in range(5))
+    assert len(loads) == 1
+    assert cache.stats()["hits"] == 5 and cache.stats()["misses"] == 1
+
+
+def test_external_change_is_reloaded(tmp_path):
+    sid = _stored(tmp_path).session_id
+    cache = SessionCache(tmp_path, SessionCacheSettings())
+    first = cache.get(sid)
+
+    other = load_session(sid, tmp_path)
+    other.status = "closed"
+    other.updated_at = "2099-01-01T00:00:00Z"  # size change guarantees a new signature
+    save_session(other, tmp_path)
+
+    fresh = cache.get(sid)
+    assert fresh is not first and fresh.status == "closed"
+    assert cache.stats()["reloads"] == 1
+
+
+def test_sync_durability_writes_every_save(tmp_path):
+    session = _stored(tmp_path)
+    cache = SessionCache(tmp_path, SessionCacheSettings(durability="sync"))
+    session.status = "paused"
+    cache.save(session)
+    assert _on_disk(tmp_path, session.session_id)["status"] == "paused"
+    assert cache.stats()["writes"] == 1 and cache.stats()["pending"] == 0
+    assert cache.get(session.session_id) is session  # own write does not force a reload
+
+
+def test_write_behind_coalesces_and_flushes(tmp_path):
+    session = _stored(tmp_path)
+    cache = SessionCache(tmp_path, SessionCacheSettings(durability="write_behind", flush_interval_seconds=60))
+    for status in ("paused", "active", "closed"):
+        session.status = status
+        cache.save(session)
+    assert _on_disk(tmp_path, session.session_id)["status"] == "active"  # nothing written yet
+    assert cache.get(session.session_id) is session  # pending entry is authoritative
+    stats = cache.stats()
+    assert stats["pending"] == 1 and stats["coalesced"] == 2 and stats["writes"] == 0
+
+    assert cache.flush() == 1
+    assert _on_disk(tmp_path, session.session_id)["status"] == "closed"
+    assert cache.stats()["writes"] == 1
+    cache.close()
+
+
+def test_background_flusher_and_close(tmp_path):
+    session = _stored(tmp_path)
+    cache = SessionCache(tmp_path, SessionCacheSettings(durability="write_behind", flush_interval_seconds=0.05))
+    session.status = "paused"
+    cache.save(session)
+    deadline = time.monotonic() + 2
+    while _on_disk(tmp_path, session.session_id)["status"] != "paused" and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert _on_disk(tmp_path, session.session_id)["status"] == "paused"
+
+    session.status = "closed"
+    cache.save(session)
+    cache.close()
+    assert _on_disk(tmp_path, session.session_id)["status"] == "closed"
+
+
+def test_lru_eviction_writes_pending_snapshot(tmp_path):
+    cache = SessionCache(
+        tmp_path, SessionCacheSettings(durability="write_behind", flush_interval_seconds=60, max_sessions=1),
+    )
+    a, b = _stored(tmp_path), _stored(tmp_path)
+    a.status = "paused"
+    cache.save(a)
+    cache.save(b)  # evicts a
+    assert _on_disk(tmp_path, a.session_id)["status"] == "paused"
+    assert cache.stats()["sessions"] == 1 and cache.stats()["evictions"] == 1
+    cache.close()
+
+
+def test_concurrent_flush_keeps_save_order(tmp_path, monkeypatch):
+    session = _stored(tmp_path)
+    cache = SessionCache(tmp_path, SessionCacheSettings(durability="write_behind", flush_interval_seconds=60))
+    real = sc._write_session_data
+    entered, release = threading.Event(), threading.Event()
+
+    def slow_first(data, root):
+        if not entered.is_set():
+            entered.set()
+            release.wait(2)
+        return real(data, root)
+
+    monkeypatch.setattr(sc, "_write_session_data", slow_first)
+    session.status = "paused"
+    cache.save(session)
+    first = threading.Thread(target=cache.flush)
+    first.start()
+    assert entered.wait(2)  # "paused" popped and mid-write
+
+    session.status = "closed"
+    cache.save(session)
+    second = threading.Thread(target=cache.flush)
+    second.start()
+    time.sleep(0.05)
+    assert second.is_alive()  # waits for the older write to finish ...
+    assert cache.stats()["pending"] == 1  # ... before taking the newer snapshot
+    release.set()
+    first.join(2)
+    second.join(2)
+    assert _on_disk(tmp_path, session.session_id)["status"] == "closed"
+    cache.close()
+
+
+def test_failed_write_keeps_snapshot_pending(tmp_path, monkeypatch):
+    session = _stored(tmp_path)
+    cache = SessionCache(
+        tmp_path, SessionCacheSettings(durability="write_behind", flush_interval_seconds=60, max_sessions=1),
+    )
+    real = sc._write_session_data
+
+    def failing(data, root):
+        raise ValueError("SESSION_PERSIST_FAILED: disk full")
+
+    session.status = "paused"
+    cache.save(session)
+    monkeypatch.setattr(sc, "_write_session_data", failing)
+    with pytest.raises(ValueError, match="SESSION_PERSIST_FAILED"):
+        cache.flush()
+    assert cache.stats()["pending"] == 1
+
+    cache.save(_stored(tmp_path))  # eviction write fails: entry and snapshot kept
+    assert cache.get(session.session_id) is session
+    assert cache.stats()["evictions"] == 0
+
+    monkeypatch.setattr(sc, "_write_session_data", real)
+    assert cache.flush() == 2
+    assert _on_disk(tmp_path, session.session_id)["status"] == "paused"
+    cache.close()
+
+
+def test_lock_serialises_one_session(tmp_path):
+    cache = SessionCache(tmp_path, SessionCacheSettings())
+    order = []
+
+    def _turn(tag):
+        with cache.hold("s1"):
+            order.append(f"{tag}-in")
+            time.sleep(0.05)
+            order.append(f"{tag}-out")
+
+    threads = [threading.Thread(target=_turn, args=(t,)) for t in ("a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert order[0][0] == order[1][0] and order[2][0] == order[3][0]
+
+
+def test_session_locks_are_refcounted(tmp_path):
+    cache = SessionCache(tmp_path, SessionCacheSettings(max_sessions=1))
+    for i in range(1000):
+        with pytest.raises(ValueError):
+            with cache.hold(f"missing-{i}"):
+                cache.get(f"missing-{i}")
+    assert cache._session_locks == {}
+
+    with cache.hold("s1"):
+        with cache.hold("s1"):  # re-entrant
+            assert cache._session_locks["s1"][1] == 2
+        assert "s2" not in cache._session_locks
+    assert cache._session_locks == {}
+
+
+def test_helpers_fall_back_without_config(tmp_path):
+    session = new_session(session_mode=SessionMode.WORK)
+    save_session_cached(session, tmp_path, {})
+    assert load_session_cached(session.session_id, tmp_path, {}) is not session
+    with hold_session(session.session_id, tmp_path, None):
+        pass
+    assert session_cache_for({}, tmp_path) is None
+
+
+def test_helpers_share_cache_per_root(tmp_path):
+    runtime = {"session_cache": {"durability": "write_behind", "flush_interval_seconds": 60}}
+    session = new_session(session_mode=SessionMode.WORK)
+    save_session_cached(session, tmp_path, runtime)
+    assert load_session_cached(session.session_id, tmp_path, runtime) is session
+    assert session_cache_for(runtime, tmp_path) is session_cache_for(runtime, str(tmp_path))
+    # Disabling the block flushes and drops the cache.
+    assert session_cache_for({}, tmp_path) is None
+    assert _on_disk(tmp_path, session.session_id)["session_id"] == session.session_id
+
+
+def test_cli_service_layer_uses_cache(tmp_path):
+    from io_iii.cli import _session_shell as shell
+
+    cfg = types.SimpleNamespace(runtime={
+        "session_storage_root": str(tmp_path),
+        "session_cache": {"durability": "write_behind", "flush_interval_seconds": 60},
+    })
+    args = types.SimpleNamespace(config_dir=None, mode="work", prompt=None)
+    with patch.object(shell, "load_io3_config", return_value=cfg):
+        started = shell.execute_session_start(args)
+        sid = started.payload["session_id"]
+        closed = shell.execute_session_close(types.SimpleNamespace(config_dir=None, session_id=sid))
+        status = shell.execute_session_status(types.SimpleNamespace(config_dir=None, session_id=sid))
+    assert closed.exit_code == 0 and status.payload["status"] == "closed"
+    cache = session_cache_for(cfg.runtime, tmp_path)
+    assert cache.stats()["misses"] == 0 and cache.stats()["coalesced"] == 1
+    close_session_caches()
+    assert _on_disk(tmp_path, sid)["status"] == "closed"
+
+
+def test_load_settings():
+    assert load_session_cache_settings(None) is None
+    assert load_session_cache_settings({"session_cache": {"enabled": False}}) is None
+    assert load_session_cache_settings({"session_cache": True}) == SessionCacheSettings()
+    assert load_session_cache_settings(
+        {"session_cache": {"durability": "write_behind", "flush_interval_seconds": 2, "max_sessions": 8}}
+    ) == SessionCacheSettings(durability="write_behind", flush_interval_seconds=2.0, max_sessions=8)
+
+
+@pytest.mark.parametrize("block", [
+    "yes",
+    {"enabled": "yes"},
+    {"durability": "async"},
+    {"flush_interval_seconds": 0},
+    {"max_sessions": 0},
+    {"max_sessions": True},
+])
+def test_load_settings_invalid(block):
+    with pytest.raises(ValueError, match="SESSION_CACHE_CONFIG_INVALID"):
+        load_session_cache_settings({"session_cache": block})
@@ -567,14 +567,15 @@ class TestPersistenceRoundTrip:
 
         storage = tmp_path / "sessions"
         path = save_session(session, storage)
-        raw = path.read_text()
+        journal = storage / f"{session.session_id}.turns.jsonl"
+        raw = path.read_text() + journal.read_text()
 
-        # The session JSON must not contain any memory record values
+        # The session files must not contain any memory record values
         assert "value-for-key.secret" not in raw
         assert "key.secret" not in raw
         # Only the count should be present
-        data = json.loads(raw)
-        assert data["turns"][0]["memory_keys_loaded"] == 1
+        turn = json.loads(journal.read_text().splitlines()[0])
+        assert turn["memory_keys_loaded"] == 1
 
 
 # ---------------------------------------------------------------------------
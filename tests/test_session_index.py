@@ -0,0 +1,267 @@
+"""
+test_session_index.py — SQLite session catalogue and `session gc`.
+
+Verifies:
+  - a missing index is built from the session files already on disk
+  - save_session upserts the row (status / turn_count changes are visible)
+  - query(): status / mode filters, sort keys and direction, pagination, total
+  - invalid query parameters raise SESSION_QUERY_INVALID
+  - list_sessions is served from the index (no session file parsing)
+  - list_sessions drops rows of deleted files and picks up copied-in ones
+  - list_sessions falls back to the file names when the index cannot be opened
+  - a failing index write does not fail the save; the index is rebuilt
+  - archive_closed_sessions moves only closed (and old enough) sessions; dry run
+  - archive_closed_sessions writes and evicts cached sessions before moving them
+  - CLI session list / session gc and GET /sessions
+"""
+from __future__ import annotations
+
+import sqlite3
+import types
+from argparse import Namespace
+from unittest.mock import patch
+
+import pytest
+
+import io_iii.core.dialogue_session as ds
+from io_iii.core.dialogue_session import list_sessions, load_session, new_session, save_session
+from io_iii.core.session_index import (
+    SESSION_ARCHIVE_DIRNAME,
+    SESSION_INDEX_FILENAME,
+    SessionIndex,
+    archive_closed_sessions,
+    close_session_indexes,
+    get_session_index,
+    query_sessions,
+)
+from io_iii.core.session_mode import SessionMode
+
+
+@pytest.fixture(autouse=True)
+def _isolated_indexes():
+    close_session_indexes()
+    yield
+    close_session_indexes()
+
+
+def _save(root, *, status="active", mode=SessionMode.WORK, turns=0, updated_at=None):
+    s = new_session(session_mode=mode)
+    s.status = status
+    s.turn_count = turns
+    if updated_at:
+        s.updated_at = updated_at
+    save_session(s, root)
+    return s
+
+
+def test_index_built_from_existing_files(tmp_path):
+    ids = {_save(tmp_path).session_id for _ in range(3)}
+    close_session_indexes()
+    for suffix in ("", "-wal", "-shm"):
+        (tmp_path / f"{SESSION_INDEX_FILENAME}{suffix}").unlink(missing_ok=True)
+    (tmp_path / "broken.session.json").write_text("not json")
+
+    assert set(list_sessions(tmp_path)) == ids
+    assert (tmp_path / SESSION_INDEX_FILENAME).exists()
+
+
+def test_save_updates_row(tmp_path):
+    s = _save(tmp_path)
+    s.status = "paused"
+    s.turn_count = 4
+    save_session(s, tmp_path)
+    (row,) = query_sessions(tmp_path).sessions
+    assert (row["status"], row["turn_count"], row["turns_remaining"]) == ("paused", 4, s.max_turns - 4)
+
+
+def test_query_filters_sorts_and_pages(tmp_path):
+    for i in range(5):
+        _save(tmp_path, status="closed" if i % 2 else "active", turns=i,
+              updated_at=f"2026-01-0{i + 1}T00:00:00Z")
+    _save(tmp_path, mode=SessionMode.STEWARD, updated_at="2026-02-01T00:00:00Z")
+
+    page = query_sessions(tmp_path, limit=2)
+    assert page.total == 6 and len(page.sessions) == 2
+    assert page.sessions[0]["session_mode"] == "steward"  # newest first by default
+    second = query_sessions(tmp_path, limit=2, offset=2)
+    assert {r["session_id"] for r in second.sessions}.isdisjoint(r["session_id"] for r in page.sessions)
+
+    closed = query_sessions(tmp_path, status="closed", order_by="turn_count", descending=False)
+    assert [r["turn_count"] for r in closed.sessions] == [1, 3] and closed.total == 2
+    both = query_sessions(tmp_path, status=["closed", "active"], session_mode="work")
+    assert both.total == 5
+    older = query_sessions(tmp_path, updated_before="2026-01-03T00:00:00Z")
+    assert older.total == 2
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"order_by": "prompt"},
+    {"limit": 0},
+    {"limit": 5000},
+    {"offset": -1},
+])
+def test_query_invalid(tmp_path, kwargs):
+    _save(tmp_path)
+    with pytest.raises(ValueError, match="SESSION_QUERY_INVALID"):
+        query_sessions(tmp_path, **kwargs)
+
+
+def test_absent_root_is_empty_and_not_created(tmp_path):
+    root = tmp_path / "nope"
+    assert query_sessions(root).total == 0
+    assert list_sessions(root) == []
+    assert archive_closed_sessions(root) == []
+    assert not root.exists()
+
+
+def test_list_sessions_does_not_parse_files(tmp_path, monkeypatch):
+    ids = sorted(_save(tmp_path).session_id for _ in range(3))
+    monkeypatch.setattr(ds, "load_session", lambda *a: pytest.fail("session file parsed"))
+    assert list_sessions(tmp_path) == ids
+
+
+def test_list_sessions_follows_files_changed_outside_the_app(tmp_path):
+    kept, gone = _save(tmp_path), _save(tmp_path)
+    assert set(list_sessions(tmp_path)) == {kept.session_id, gone.session_id}
+    other = tmp_path / "other"
+    copied = _save(other)
+    close_session_indexes()
+
+    for path in tmp_path.glob(f"{gone.session_id}.*"):
+        path.unlink()
+    for path in other.glob(f"{copied.session_id}.*"):
+        (tmp_path / path.name).write_bytes(path.read_bytes())
+
+    assert list_sessions(tmp_path) == sorted([kept.session_id, copied.session_id])
+    assert {r["session_id"] for r in query_sessions(tmp_path).sessions} == {kept.session_id, copied.session_id}
+
+
+def test_list_sessions_falls_back_when_index_cannot_open(tmp_path):
+    ids = sorted(_save(tmp_path).session_id for _ in range(2))
+    close_session_indexes()
+    for suffix in ("", "-wal", "-shm"):
+        (tmp_path / f"{SESSION_INDEX_FILENAME}{suffix}").unlink(missing_ok=True)
+    (tmp_path / SESSION_INDEX_FILENAME).mkdir()  # cannot be opened as a database
+    assert list_sessions(tmp_path) == ids
+
+
+def test_index_failure_does_not_fail_save(tmp_path, monkeypatch):
+    _save(tmp_path)
+
+    def _boom(self, data):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(SessionIndex, "record", _boom)
+    s = _save(tmp_path)
+    assert not (tmp_path / SESSION_INDEX_FILENAME).exists()
+    monkeypatch.undo()
+    assert s.session_id in list_sessions(tmp_path)  # rebuilt from the files
+
+
+def test_archive_closed_sessions(tmp_path):
+    old = _save(tmp_path, status="closed", updated_at="2020-01-01T00:00:00Z")
+    recent = _save(tmp_path, status="closed")
+    active = _save(tmp_path, updated_at="2020-01-01T00:00:00Z")
+
+    assert archive_closed_sessions(tmp_path, updated_before="2021-01-01T00:00:00Z", dry_run=True) == [old.session_id]
+    assert old.session_id in list_sessions(tmp_path)
+
+    assert archive_closed_sessions(tmp_path, updated_before="2021-01-01T00:00:00Z") == [old.session_id]
+    archive = tmp_path / SESSION_ARCHIVE_DIRNAME
+    assert (archive / f"{old.session_id}.session.json").exists()
+    assert (archive / f"{old.session_id}.turns.jsonl").exists()
+    assert set(list_sessions(tmp_path)) == {recent.session_id, active.session_id}
+    with pytest.raises(ValueError, match="SESSION_NOT_FOUND"):
+        load_session(old.session_id, tmp_path)
+
+    assert archive_closed_sessions(tmp_path) == [recent.session_id]
+    assert list_sessions(tmp_path) == [active.session_id]
+    # Archived sessions stay out of a rebuilt index.
+    assert get_session_index(tmp_path).rebuild() == 1
+
+
+def test_archive_limit(tmp_path):
+    for i in range(4):
+        _save(tmp_path, status="closed", updated_at=f"2020-01-0{i + 1}T00:00:00Z")
+    first = archive_closed_sessions(tmp_path, limit=3)
+    assert len(first) == 3 and query_sessions(tmp_path).total == 1
+
+
+def test_archive_flushes_and_evicts_cached_sessions(tmp_path):
+    from io_iii.core.session_cache import close_session_caches, session_cache_for
+
+    runtime = {"session_cache": {"durability": "write_behind", "flush_interval_seconds": 60}}
+    cache = session_cache_for(runtime, tmp_path)
+    closed = _save(tmp_path, status="closed")
+    reopened = _save(tmp_path, status="closed")
+    closed.updated_at = "2030-01-01T00:00:00Z"
+    cache.save(closed)
+    reopened.status = "active"
+    cache.save(reopened)  # the index still lists it as closed
+
+    try:
+        assert archive_closed_sessions(tmp_path, runtime_config=runtime) == [closed.session_id]
+        archive = tmp_path / SESSION_ARCHIVE_DIRNAME
+        assert load_session(closed.session_id, archive).updated_at == "2030-01-01T00:00:00Z"
+        assert cache.stats()["pending"] == 0 and cache.stats()["sessions"] == 0
+        assert cache.flush() == 0
+        assert not (tmp_path / f"{closed.session_id}.session.json").exists()
+        assert load_session(reopened.session_id, tmp_path).status == "active"
+    finally:
+        close_session_caches()
+
+
+def _cfg(root):
+    return types.SimpleNamespace(runtime={"session_storage_root": str(root)})
+
+
+def test_cli_list_and_gc(tmp_path):
+    from io_iii.cli import _session_shell as shell
+
+    _save(tmp_path, status="closed", updated_at="2020-01-01T00:00:00Z")
+    _save(tmp_path, status="closed")
+    _save(tmp_path)
+    with patch.object(shell, "load_io3_config", return_value=_cfg(tmp_path)):
+        listed = shell.execute_session_list(Namespace(config_dir=None, status=["closed"], limit=1))
+        assert listed.exit_code == 0
+        assert listed.payload["total"] == 2 and len(listed.payload["sessions"]) == 1
+
+        bad = shell.execute_session_list(Namespace(config_dir=None, sort="prompt"))
+        assert bad.exit_code != 0
+
+        gc = shell.execute_session_gc(Namespace(config_dir=None, older_than_days=30, limit=None, dry_run=False))
+        assert gc.payload["archived"] == 1
+
+        after = shell.execute_session_list(Namespace(config_dir=None, reindex=True))
+        assert after.payload["total"] == 2
+
+
+def test_cli_parser_accepts_list_and_gc():
+    import io_iii.cli as cli
+
+    seen = []
+    with patch.object(cli, "cmd_session_list", side_effect=lambda a: seen.append(a) or 0), \
+         patch.object(cli, "cmd_session_gc", side_effect=lambda a: seen.append(a) or 0):
+        assert cli.main(["session", "list", "--status", "closed", "--status", "paused", "--asc", "--limit", "5"]) == 0
+        assert cli.main(["session", "gc", "--older-than-days", "7", "--dry-run"]) == 0
+    assert seen[0].status == ["closed", "paused"] and seen[0].asc and seen[0].limit == 5
+    assert seen[1].older_than_days == 7.0 and seen[1].dry_run
+
+
+def test_api_sessions_route():
+    from fastapi.testclient import TestClient
+
+    from io_iii.api.app import app
+    from io_iii.cli import CommandResult
+
+    seen = {}
+
+    def _list(args):
+        seen.update(vars(args))
+        return CommandResult(exit_code=0, payload={"sessions": [], "total": 0, "limit": 5, "offset": 10})
+
+    with patch("io_iii.api.app._cli") as m:
+        m.return_value.execute_session_list = _list
+        resp = TestClient(app).get("/sessions?status=closed&status=paused&order=asc&limit=5&offset=10")
+    assert resp.status_code == 200 and resp.json()["offset"] == 10
+    assert seen["status"] == ["closed", "paused"] and seen["asc"] is True and seen["limit"] == 5
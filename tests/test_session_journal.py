@@ -0,0 +1,178 @@
+"""
+test_session_journal.py — append-only turn journal (session format v2).
+
+Verifies:
+  - a save appends only new turns plus one state record; the header is not rewritten
+  - load_session restores state from the journal tail and replays turns lazily
+  - turns appended to a lazily loaded session are persisted without a replay
+  - a torn append is ignored on load and dropped by the next compaction
+  - a snapshot with fewer turns than the journal commits is refused, not compacted
+  - superseded state records trigger compaction (journal stays bounded)
+  - v1 single-document sessions load and are migrated by their next save
+  - lazy turn lists copy / pickle as plain lists
+"""
+from __future__ import annotations
+
+import json
+import pickle
+
+import pytest
+
+import io_iii.core.dialogue_session as ds
+from io_iii.core.dialogue_session import (
+    DIALOGUE_SESSION_SCHEMA_V1,
+    DIALOGUE_SESSION_SCHEMA_VERSION,
+    SESSION_JOURNAL_COMPACT_SLACK,
+    TurnRecord,
+    load_session,
+    new_session,
+    save_session,
+)
+from io_iii.core.session_mode import SessionMode
+
+
+def _turn(i: int) -> TurnRecord:
+    return TurnRecord(turn_index=i, run_id=f"run-{i}", status="ok", persona_mode="executor", latency_ms=i)
+
+
+def _add_turn(session) -> None:
+    session.turns.append(_turn(session.turn_count))
+    session.turn_count += 1
+
+
+def _records(tmp_path, session_id):
+    text = (tmp_path / f"{session_id}.turns.jsonl").read_text(encoding="utf-8")
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_save_appends_only_new_records(tmp_path):
+    s = new_session(session_mode=SessionMode.WORK)
+    header = save_session(s, tmp_path)
+    header_stat = header.stat()
+    assert json.loads(header.read_text())["schema_version"] == DIALOGUE_SESSION_SCHEMA_VERSION
+
+    for n in range(1, 4):
+        _add_turn(s)
+        save_session(s, tmp_path)
+        records = _records(tmp_path, s.session_id)
+        assert [r["kind"] for r in records[-2:]] == ["turn", "state"]
+        assert records[-1]["turns"] == n
+    assert len(_records(tmp_path, s.session_id)) == 7  # initial state + 3 × (turn + state)
+    assert header.stat().st_ino == header_stat.st_ino
+    assert header.stat().st_mtime_ns == header_stat.st_mtime_ns
+
+
+def test_load_is_lazy_and_round_trips(tmp_path, monkeypatch):
+    s = new_session(session_mode=SessionMode.STEWARD, max_turns=9)
+    for _ in range(3):
+        _add_turn(s)
+    s.status = "paused"
+    save_session(s, tmp_path)
+
+    replays = []
+    real = ds._replay_turns
+    monkeypatch.setattr(ds, "_replay_turns", lambda *a: replays.append(a) or real(*a))
+
+    loaded = load_session(s.session_id, tmp_path)
+    assert (loaded.status, loaded.turn_count, loaded.max_turns) == ("paused", 3, 9)
+    assert loaded.session_mode is SessionMode.STEWARD and loaded.created_at == s.created_at
+    assert len(loaded.turns) == 3 and not replays
+
+    assert [t.run_id for t in loaded.turns] == ["run-0", "run-1", "run-2"]
+    assert len(replays) == 1
+
+
+def test_append_to_unreplayed_session(tmp_path, monkeypatch):
+    s = new_session(session_mode=SessionMode.WORK)
+    _add_turn(s)
+    save_session(s, tmp_path)
+
+    loaded = load_session(s.session_id, tmp_path)
+    monkeypatch.setattr(ds, "_replay_turns", lambda *a: pytest.fail("journal replayed"))
+    _add_turn(loaded)
+    save_session(loaded, tmp_path)
+    _add_turn(loaded)
+    save_session(loaded, tmp_path)
+    monkeypatch.undo()
+
+    turns = [r for r in _records(tmp_path, s.session_id) if r["kind"] == "turn"]
+    assert [t["run_id"] for t in turns] == ["run-0", "run-1", "run-2"]
+    assert [t.turn_index for t in load_session(s.session_id, tmp_path).turns] == [0, 1, 2]
+
+
+def test_torn_append_is_ignored_then_compacted(tmp_path):
+    s = new_session(session_mode=SessionMode.WORK)
+    _add_turn(s)
+    save_session(s, tmp_path)
+    journal = tmp_path / f"{s.session_id}.turns.jsonl"
+    with open(journal, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps({"kind": "turn", **_turn(1).__dict__}, separators=(",", ":")) + "\n")
+        fh.write('{"kind":"state","sta')  # crash mid-append
+
+    loaded = load_session(s.session_id, tmp_path)
+    assert loaded.turn_count == 1 and [t.run_id for t in loaded.turns] == ["run-0"]
+
+    _add_turn(loaded)
+    save_session(loaded, tmp_path)
+    records = _records(tmp_path, s.session_id)
+    assert [r["kind"] for r in records] == ["turn", "turn", "state"]
+    assert [t.run_id for t in load_session(s.session_id, tmp_path).turns] == ["run-0", "run-1"]
+
+
+def test_state_only_saves_trigger_compaction(tmp_path):
+    s = new_session(session_mode=SessionMode.WORK)
+    _add_turn(s)
+    for i in range(SESSION_JOURNAL_COMPACT_SLACK * 3):
+        s.status = "paused" if i % 2 else "active"
+        save_session(s, tmp_path)
+        assert len(_records(tmp_path, s.session_id)) <= 2 * s.turn_count + SESSION_JOURNAL_COMPACT_SLACK
+    loaded = load_session(s.session_id, tmp_path)
+    assert loaded.status == s.status and [t.run_id for t in loaded.turns] == ["run-0"]
+
+
+def test_v1_document_is_read_and_migrated(tmp_path):
+    s = new_session(session_mode=SessionMode.WORK)
+    _add_turn(s)
+    v1 = ds._serialise_session(s)
+    v1["schema_version"] = DIALOGUE_SESSION_SCHEMA_V1
+    (tmp_path / f"{s.session_id}.session.json").write_text(json.dumps(v1, indent=2), encoding="utf-8")
+
+    loaded = load_session(s.session_id, tmp_path)
+    assert [t.run_id for t in loaded.turns] == ["run-0"]
+
+    _add_turn(loaded)
+    save_session(loaded, tmp_path)
+    header = json.loads((tmp_path / f"{s.session_id}.session.json").read_text())
+    assert header["schema_version"] == DIALOGUE_SESSION_SCHEMA_VERSION and "turns" not in header
+    assert [t.run_id for t in load_session(s.session_id, tmp_path).turns] == ["run-0", "run-1"]
+
+
+def test_stale_snapshot_is_refused(tmp_path):
+    s = new_session(session_mode=SessionMode.WORK)
+    _add_turn(s)
+    save_session(s, tmp_path)
+    stale = ds._serialise_session(s)
+    _add_turn(s)
+    save_session(s, tmp_path)
+
+    with pytest.raises(ValueError, match="SESSION_PERSIST_FAILED"):
+        ds._write_session_data(stale, tmp_path)
+    assert [t.run_id for t in load_session(s.session_id, tmp_path).turns] == ["run-0", "run-1"]
+
+
+def test_lazy_turns_copy_and_pickle_as_lists(tmp_path):
+    s = new_session(session_mode=SessionMode.WORK)
+    _add_turn(s)
+    save_session(s, tmp_path)
+    loaded = load_session(s.session_id, tmp_path)
+    restored = pickle.loads(pickle.dumps(loaded.turns))
+    assert type(restored) is list and restored[0].run_id == "run-0"
+    assert loaded.turns.copy() == [_turn(0)]
+
+
+def test_missing_journal_is_schema_invalid(tmp_path):
+    s = new_session(session_mode=SessionMode.WORK)
+    save_session(s, tmp_path)
+    (tmp_path / f"{s.session_id}.turns.jsonl").unlink()
+    with pytest.raises(ValueError, match="SESSION_SCHEMA_INVALID"):
+        load_session(s.session_id, tmp_path)
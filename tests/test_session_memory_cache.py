@@ -0,0 +1,148 @@
+"""
+test_session_memory_cache.py — resolved-pack cache for session continuity memory.
+
+Verifies:
+  - steady-state loads reuse the cached records (no PackLoader / store reads)
+  - memory_write through MemoryStore.put invalidates the entry
+  - writes by another process (scope directory mtime) invalidate the entry
+  - memory_packs.yaml edits invalidate the entry
+  - cache is keyed by route (policy filtering differs per route)
+  - freshly modified files are not cached (racy window)
+  - absent pack still returns ([], None)
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import io_iii.memory.session_continuity as sc
+from io_iii.memory.store import MemoryRecord, MemoryStore, SQLiteBackend
+from io_iii.memory.write import memory_write
+
+
+def _age(*paths: Path, seconds: int = 60) -> None:
+    for p in paths:
+        st = os.stat(p)
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _record(key: str, value: str = "v") -> MemoryRecord:
+    return MemoryRecord(
+        key=key, scope="io_iii", value=value, version=1, provenance="human",
+        created_at="2026-04-12T10:00:00Z", updated_at="2026-04-12T10:00:00Z",
+        sensitivity="standard",
+    )
+
+
+@pytest.fixture
+def cfg_dir(tmp_path):
+    store_root = tmp_path / "store"
+    (tmp_path / "memory_packs.yaml").write_text(
+        f"storage_root: \"{store_root}\"\n"
+        "packs:\n"
+        "  - id: pack.io_iii.session_resume\n"
+        "    version: \"1.0\"\n"
+        "    description: test\n"
+        "    scope: io_iii\n"
+        "    keys: [a, b]\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "memory_retrieval_policy.yaml").write_text(
+        "route_allowlist: [executor]\n", encoding="utf-8",
+    )
+    store = MemoryStore(store_root)
+    store.put(_record("a", "one"))
+    _age(tmp_path / "memory_packs.yaml", tmp_path / "memory_retrieval_policy.yaml", store_root / "io_iii", store_root / "io_iii" / "a.json")
+    sc.clear_session_memory_cache()
+    yield tmp_path
+    sc.clear_session_memory_cache()
+
+
+@pytest.fixture
+def loader_count(monkeypatch):
+    calls = {"n": 0}
+    real = sc.PackLoader
+
+    def _counting(path):
+        calls["n"] += 1
+        return real(path)
+
+    monkeypatch.setattr(sc, "PackLoader", _counting)
+    return calls
+
+
+def _load(cfg_dir, route="executor"):
+    return sc.load_session_memory_cached(config_dir=cfg_dir, route=route)
+
+
+def test_steady_state_is_served_from_cache(cfg_dir, loader_count):
+    records, ctx = _load(cfg_dir)
+    again, ctx2 = _load(cfg_dir)
+    assert [r.value for r in again] == ["one"]
+    assert ctx2 == ctx
+    assert ctx.keys_loaded == 1
+    assert ctx.keys_missing == 1
+    assert loader_count["n"] == 1
+
+
+def test_returned_list_is_a_copy(cfg_dir):
+    _load(cfg_dir)[0].clear()
+    assert len(_load(cfg_dir)[0]) == 1
+
+
+def test_memory_write_invalidates(cfg_dir, loader_count):
+    _load(cfg_dir)
+    memory_write(
+        scope="io_iii", key="b", value="two", storage_root=str(cfg_dir / "store"),
+        confirm_fn=lambda: True,
+    )
+    records, ctx = _load(cfg_dir)
+    assert [r.value for r in records] == ["one", "two"]
+    assert ctx.keys_missing == 0
+    assert loader_count["n"] == 2
+
+
+def test_out_of_process_write_invalidates(cfg_dir):
+    _load(cfg_dir)
+    # Simulate another process: write the file directly, bypassing MemoryStore.put.
+    src = cfg_dir / "store" / "io_iii" / "a.json"
+    text = src.read_text(encoding="utf-8").replace('"key": "a"', '"key": "b"')
+    (cfg_dir / "store" / "io_iii" / "b.json").write_text(text, encoding="utf-8")
+    assert [r.key for r in _load(cfg_dir)[0]] == ["a", "b"]
+
+
+def test_pack_config_edit_invalidates(cfg_dir):
+    _load(cfg_dir)
+    packs = cfg_dir / "memory_packs.yaml"
+    packs.write_text(packs.read_text(encoding="utf-8").replace("keys: [a, b]", "keys: [a]"), encoding="utf-8")
+    _, ctx = _load(cfg_dir)
+    assert ctx.keys_declared == 1
+
+
+def test_cache_keyed_by_route(cfg_dir, loader_count):
+    assert len(_load(cfg_dir, route="executor")[0]) == 1
+    assert _load(cfg_dir, route="challenger")[0] == []  # not in route_allowlist
+    _load(cfg_dir, route="challenger")
+    assert loader_count["n"] == 2
+
+
+def test_fresh_files_are_not_cached(cfg_dir, loader_count):
+    MemoryStore(cfg_dir / "store").put(_record("b"))  # scope dir mtime is now "racy"
+    _load(cfg_dir)
+    _load(cfg_dir)
+    assert loader_count["n"] == 2
+
+
+def test_absent_pack(cfg_dir):
+    assert sc.load_session_memory_cached(config_dir=cfg_dir, pack_id="pack.none") == ([], None)
+
+
+def test_sqlite_change_stamp_tracks_commits(tmp_path):
+    backend = SQLiteBackend(tmp_path / "m.db")
+    backend.put(_record("a"))
+    before = backend.change_stamp("io_iii")
+    backend.put(_record("b"))
+    assert backend.change_stamp("io_iii") != before
+    backend.close()
@@ -355,11 +355,15 @@ class TestSessionPersistence:
             persona_mode="executor", latency_ms=50,
         ))
         s.turn_count = 1
-        path = save_session(s, tmp_path)
-        data = json.loads(path.read_text())
-        assert len(data["turns"]) == 1
-        assert data["turns"][0]["run_id"] == "r1"
-        assert "prompt" not in data["turns"][0]
+        save_session(s, tmp_path)
+        records = [
+            json.loads(line)
+            for line in (tmp_path / f"{s.session_id}.turns.jsonl").read_text().splitlines()
+        ]
+        turns = [r for r in records if r["kind"] == "turn"]
+        assert len(turns) == 1
+        assert turns[0]["run_id"] == "r1"
+        assert "prompt" not in turns[0]
 
     def test_load_not_found_raises(self, tmp_path):
         with pytest.raises(ValueError, match="SESSION_NOT_FOUND"):
@@ -0,0 +1,389 @@
+"""
+test_streaming_generate.py — opt-in token streaming path.
+
+Verifies:
+  - OllamaProvider.generate_stream parses NDJSON chunks and final token counts
+    (pooled and unpooled transports; pooled connection is reused afterwards)
+  - malformed / truncated streams raise ProviderError
+  - engine forwards chunks live when audit=False
+  - engine buffers when audit=True and releases one post-gate delta
+  - a failing delta consumer never fails the run
+  - no callback keeps the non-streaming path
+  - providers without generate_stream (sync or async) deliver the final text once
+  - stream_session_turn emits turn_output_delta before turn_output
+  - FastAPI publishes turn_output_delta only when content_release is open,
+    to attached subscribers only (never stored in the bus)
+"""
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from io_iii.providers import _http_pool
+from io_iii.providers.ollama_provider import OllamaProvider
+from io_iii.providers.provider_contract import ProviderError, StreamingProvider
+
+# ---------------------------------------------------------------------------
+# Local NDJSON server fixture
+# ---------------------------------------------------------------------------
+
+_DEFAULT_LINES = [
+    {"response": "Hel", "done": False},
+    {"response": "lo", "done": False},
+    {"response": "", "done": True, "prompt_eval_count": 7, "eval_count": 2},
+]
+
+
+class _StreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.payloads.append(json.loads(self.rfile.read(length)))
+        self.server.connections.add(self.client_address)
+        body = b"".join(
+            (line if isinstance(line, bytes) else json.dumps(line).encode()) + b"\n"
+            for line in self.server.lines
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _StreamHandler)
+    srv.daemon_threads = True
+    srv.connections = set()
+    srv.payloads = []
+    srv.lines = list(_DEFAULT_LINES)
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    _http_pool.close_all()
+
+
+def _host(srv) -> str:
+    return f"http://127.0.0.1:{srv.server_address[1]}"
+
+
+def _drain(gen):
+    chunks = []
+    while True:
+        try:
+            chunks.append(next(gen))
+        except StopIteration as stop:
+            return chunks, stop.value
+
+
+# ---------------------------------------------------------------------------
+# Provider
+# ---------------------------------------------------------------------------
+
+def test_ollama_provider_satisfies_streaming_protocol():
+    assert isinstance(OllamaProvider(), StreamingProvider)
+
+
+@pytest.mark.parametrize("pool_size", [0, 2])
+def test_generate_stream_yields_chunks_and_token_counts(server, pool_size):
+    p = OllamaProvider(host=_host(server), pool_size=pool_size)
+    chunks, totals = _drain(p.generate_stream(model="m", prompt="x"))
+    assert chunks == ["Hel", "lo"]
+    assert totals == (7, 2)
+    assert server.payloads[0]["stream"] is True
+    assert server.payloads[0]["prompt"].startswith("/no_think\n")
+
+
+def test_pooled_stream_returns_connection_for_reuse(server):
+    p = OllamaProvider(host=_host(server), pool_size=2)
+    _drain(p.generate_stream(model="m", prompt="x"))
+    _drain(p.generate_stream(model="m", prompt="x"))
+    assert p.pool_counters() == (1, 1)
+    assert len(server.connections) == 1
+
+
+def test_stream_without_done_raises(server):
+    server.lines = [{"response": "partial", "done": False}]
+    p = OllamaProvider(host=_host(server))
+    with pytest.raises(ProviderError) as exc_info:
+        _drain(p.generate_stream(model="m", prompt="x"))
+    assert exc_info.value.code == "PROVIDER_OLLAMA_BAD_SHAPE"
+
+
+def test_stream_bad_json_raises(server):
+    server.lines = [b"{not json"]
+    p = OllamaProvider(host=_host(server))
+    with pytest.raises(ProviderError) as exc_info:
+        _drain(p.generate_stream(model="m", prompt="x"))
+    assert exc_info.value.code == "PROVIDER_OLLAMA_BAD_JSON"
+
+
+def test_stream_in_band_error_raises(server):
+    server.lines = [{"error": "model not loaded"}]
+    p = OllamaProvider(host=_host(server))
+    with pytest.raises(ProviderError) as exc_info:
+        _drain(p.generate_stream(model="m", prompt="x"))
+    assert exc_info.value.code == "PROVIDER_OLLAMA_FAILED"
+    assert "model not loaded" not in exc_info.value.detail
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class _FakeStreamingProvider:
+    name = "ollama"
+
+    def __init__(self, chunks=(" Hello", ", ", "world ")):
+        self.chunks = list(chunks)
+        self.stream_calls = 0
+        self.generate_calls = 0
+
+    def generate(self, *, model, prompt):
+        self.generate_calls += 1
+        return "revised"
+
+    def generate_with_metrics(self, *, model, prompt):
+        self.generate_calls += 1
+        return "".join(self.chunks), None, None
+
+    def generate_stream(self, *, model, prompt):
+        self.stream_calls += 1
+        for c in self.chunks:
+            yield c
+        return 11, len(self.chunks)
+
+
+def _state():
+    from io_iii.core.session_state import AuditGateState, RouteInfo, SessionState
+    return SessionState(
+        request_id="t-stream",
+        started_at_ms=int(time.time() * 1000),
+        mode="executor",
+        config_dir="./architecture/runtime/config",
+        route=RouteInfo(
+            mode="executor",
+            primary_target="ollama:llama3.2",
+            secondary_target=None,
+            selected_target="ollama:llama3.2",
+            selected_provider="ollama",
+            fallback_used=False,
+            fallback_reason=None,
+        ),
+        audit=AuditGateState(audit_enabled=False),
+        status="ok",
+        provider="ollama",
+        model="llama3.2",
+        route_id="executor",
+        persona_contract_version="v1.0",
+        logging_policy={"content": "disabled"},
+    )
+
+
+def _cfg():
+    return types.SimpleNamespace(providers={}, logging={}, routing={"routing_table": {}}, runtime={})
+
+
+def _run(provider, *, audit=False, on_output_delta=None, challenger_fn=None):
+    from io_iii.core.engine import run
+    return run(
+        cfg=_cfg(),
+        session_state=_state(),
+        user_prompt="hello",
+        audit=audit,
+        challenger_fn=challenger_fn,
+        ollama_provider_factory=lambda _: provider,
+        on_output_delta=on_output_delta,
+    )
+
+
+def _inference_step(result):
+    return next(s for s in result.meta["trace"]["steps"] if s["stage"] == "provider_inference")
+
+
+def test_engine_forwards_chunks_live_without_audit():
+    provider = _FakeStreamingProvider()
+    deltas = []
+    _, result = _run(provider, on_output_delta=deltas.append)
+    assert deltas == [" Hello", ", ", "world "]
+    assert result.message == "Hello, world"
+    assert result.meta["telemetry"]["input_tokens"] == 11
+    assert result.meta["telemetry"]["output_tokens"] == 3
+    step = _inference_step(result)
+    assert step["meta"]["streamed"] is True
+    assert step["meta"]["stream_chunks"] == 3
+    assert provider.generate_calls == 0
+
+
+def test_engine_buffers_when_audit_enabled():
+    provider = _FakeStreamingProvider()
+    deltas = []
+
+    def challenger(_cfg, _prompt, _draft):
+        assert deltas == [], "draft must not leave the engine before the audit gate"
+        return {"verdict": "needs_work", "issues": ["x"], "high_risk_claims": [], "suggested_fixes": []}
+
+    _, result = _run(provider, audit=True, on_output_delta=deltas.append, challenger_fn=challenger)
+    assert result.message == "revised"
+    assert deltas == ["revised"]
+
+
+def test_engine_delta_consumer_failure_does_not_fail_run():
+    provider = _FakeStreamingProvider()
+    seen = []
+
+    def broken(delta):
+        seen.append(delta)
+        raise BrokenPipeError("client went away")
+
+    _, result = _run(provider, on_output_delta=broken)
+    assert result.message == "Hello, world"
+    assert seen == [" Hello"]
+
+
+def test_engine_without_callback_uses_non_streaming_path():
+    provider = _FakeStreamingProvider()
+    _, result = _run(provider)
+    assert provider.stream_calls == 0
+    assert provider.generate_calls == 1
+    assert "streamed" not in _inference_step(result)["meta"]
+
+
+def test_engine_non_streaming_provider_delivers_final_text_once():
+    class _Plain:
+        name = "ollama"
+
+        def generate(self, *, model, prompt):
+            return " whole answer "
+
+    deltas = []
+    _, result = _run(_Plain(), on_output_delta=deltas.append)
+    assert deltas == ["whole answer"] and result.message == "whole answer"
+
+
+def test_run_async_without_generate_stream_delivers_final_text_once():
+    import asyncio
+
+    from io_iii.core.engine import run_async
+
+    class _AsyncPlain:
+        name = "ollama"
+
+        async def generate(self, *, model, prompt):
+            return " async answer "
+
+    deltas = []
+    _, result = asyncio.run(run_async(
+        cfg=_cfg(), session_state=_state(), user_prompt="hello", audit=False,
+        ollama_provider_factory=lambda _: _AsyncPlain(), on_output_delta=deltas.append,
+    ))
+    assert deltas == ["async answer"] and result.message == "async answer"
+
+
+# ---------------------------------------------------------------------------
+# SSE (stdlib server)
+# ---------------------------------------------------------------------------
+
+def _collect_events(raw: bytes):
+    events, current = [], {}
+    for line in raw.decode("utf-8").splitlines():
+        if line.startswith("event: "):
+            current["event"] = line[len("event: "):]
+        elif line.startswith("data: "):
+            current["data"] = json.loads(line[len("data: "):])
+        elif line == "" and current:
+            events.append(current)
+            current = {}
+    return events
+
+
+def _dtr(message):
+    from io_iii.core.dialogue_session import DialogueTurnResult, TurnRecord, new_session
+    from io_iii.core.engine import ExecutionResult
+    from io_iii.core.session_state import SessionState
+
+    session = new_session(runtime_config={})
+    session.turn_count = 1
+    return DialogueTurnResult(
+        session=session,
+        turn_record=TurnRecord(turn_index=0, run_id="r", status="ok", persona_mode="executor", latency_ms=1),
+        result=ExecutionResult(
+            message=message, meta={}, provider="null", model=None,
+            route_id="executor", audit_meta=None, prompt_hash=None,
+        ),
+        state=SessionState(request_id="r", started_at_ms=0, mode="executor"),
+        pause_state=None,
+    )
+
+
+def _fake_execute(**kwargs):
+    cb = kwargs.get("on_output_delta")
+    if cb is not None:
+        cb("ab")
+        cb("c")
+    return _dtr("abc"), None
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_sse_stream_emits_deltas_only_when_requested(stream):
+    from io_iii.api._sse import stream_session_turn
+
+    buf = io.BytesIO()
+    with patch("io_iii.api._sse.execute_session_turn", side_effect=_fake_execute):
+        stream_session_turn("s1", "hi", MagicMock(), buf, stream=stream)
+
+    names = [e["event"] for e in _collect_events(buf.getvalue())]
+    if stream:
+        assert names == ["turn_started", "turn_output_delta", "turn_output_delta", "turn_output", "turn_completed"]
+    else:
+        assert names == ["turn_started", "turn_output", "turn_completed"]
+
+
+# ---------------------------------------------------------------------------
+# FastAPI bus (ADR-026 gate)
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("release", [True, False])
+def test_fastapi_turn_publishes_deltas_only_behind_content_release(release):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from io_iii.api import _bus as bus
+    from io_iii.api.app import app
+    from io_iii.cli import CommandResult
+
+    def _cmd(args):
+        if args.on_output_delta is not None:
+            args.on_output_delta("tok")
+        return CommandResult(exit_code=0, payload={"status": "ok", "session_status": "active", "turn_count": 1})
+
+    bus.clear("s-delta")
+    with bus.subscribe("s-delta") as sub, \
+         patch("io_iii.api.app._cli") as mock_cli, \
+         patch("io_iii.api.app._content_release_enabled", return_value=release), \
+         patch("io_iii.api.app._runtime_cfg", return_value={}):
+        mock_cli.return_value.execute_session_continue = _cmd
+        resp = TestClient(app).post("/session/s-delta/turn", json={"prompt": "hi", "stream": True})
+        live = [e["event"] for e in sub.drain()]
+
+    assert resp.status_code == 200
+    assert ("turn_output_delta" in live) is release
+    if release:
+        assert live.index("turn_started") < live.index("turn_output_delta") < live.index("turn_completed")
+    stored = [e["event"] for e in bus.get_events_since("s-delta", 0)]
+    assert "turn_output_delta" not in stored  # never kept for replay
+    bus.clear("s-delta")
@@ -0,0 +1,253 @@
+"""
+test_webhook_delivery.py — pooled webhook delivery worker (api/_webhooks.py).
+
+Verifies:
+  - WebhookDispatcher uses the shared worker; defaults apply without webhooks.delivery
+  - a closed worker's idle threads exit even when no stop signal was queued
+  - delivery uses a fixed number of threads and reuses keep-alive connections
+  - batch_max > 1 groups events per endpoint into one POST
+  - 5xx responses are retried with backoff; 4xx are not; retries are bounded
+  - a full queue drops new events without blocking and counts them
+  - latency / delivered counters; module-level dispatch() uses the worker
+  - load_delivery_settings / configure_delivery validation and lifecycle
+"""
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from io_iii.api import _webhooks as webhooks
+from io_iii.api._webhooks import (
+    DeliverySettings,
+    WebhookDeliveryWorker,
+    WebhookDispatcher,
+    configure_delivery,
+    load_delivery_settings,
+)
+from io_iii.providers import _http_pool
+
+
+class _Sink:
+    """Local HTTP/1.1 webhook receiver returning scripted statuses."""
+
+    def __init__(self):
+        self.requests = []
+        self.statuses = []
+        self.lock = threading.Lock()
+        sink = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with sink.lock:
+                    sink.requests.append({
+                        "path": self.path,
+                        "event": self.headers.get("X-Io3-Event"),
+                        "batch": self.headers.get("X-Io3-Batch-Size"),
+                        "body": body,
+                        "peer": self.client_address[1],
+                    })
+                    status = sink.statuses.pop(0) if sink.statuses else 200
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def sink():
+    s = _Sink()
+    yield s
+    s.server.shutdown()
+    s.server.server_close()
+    _http_pool.close_all()
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_worker():
+    webhooks.shutdown_delivery_worker()
+    yield
+    webhooks.shutdown_delivery_worker()
+
+
+def _worker(**kw):
+    kw.setdefault("backoff_seconds", 0.01)
+    return WebhookDeliveryWorker(DeliverySettings(**kw))
+
+
+def test_dispatcher_uses_pooled_worker(sink):
+    d = WebhookDispatcher.from_runtime_config({"webhooks": {
+        "session_complete": {"url": sink.url + "/hook"},
+        "delivery": {"workers": 2},
+    }})
+    assert d.worker is not None
+    for i in range(40):
+        d.dispatch("session_complete", {"session_id": f"s{i}"})
+    assert d.worker.flush(timeout=5)
+    assert d.worker.stats()["workers"] == 2  # fixed pool, not a thread per event
+    assert d.worker.stats()["delivered"] == 40
+    assert sorted(r["body"]["session_id"] for r in sink.requests) == sorted(f"s{i}" for i in range(40))
+    assert {r["event"] for r in sink.requests} == {"session_complete"}
+    assert len({r["peer"] for r in sink.requests}) <= 2  # keep-alive connections reused
+
+
+def test_batches_per_endpoint(sink):
+    w = _worker(workers=1, batch_max=10, batch_wait_seconds=0.3)
+    for i in range(4):
+        w.submit(sink.url + "/a", "session_complete", {"i": i}, timeout=5)
+    w.submit(sink.url + "/b", "runbook_complete", {"i": 9}, timeout=5)
+    assert w.flush(timeout=5)
+    by_path = {r["path"]: r for r in sink.requests}
+    assert len(sink.requests) == 2
+    assert by_path["/a"]["event"] == "batch"
+    assert by_path["/a"]["batch"] == "4"
+    assert [e["i"] for e in by_path["/a"]["body"]["events"]] == [0, 1, 2, 3]
+    assert by_path["/b"]["event"] == "runbook_complete"  # single event: unbatched body
+    assert by_path["/b"]["body"] == {"i": 9}
+    w.close()
+
+
+def test_server_errors_are_retried(sink):
+    sink.statuses = [503, 500]
+    w = _worker(workers=1, max_retries=3)
+    w.submit(sink.url + "/hook", "session_complete", {"session_id": "s"}, timeout=5)
+    assert w.flush(timeout=5)
+    stats = w.stats()
+    assert (stats["delivered"], stats["retried"], stats["failed"]) == (1, 2, 0)
+    assert len(sink.requests) == 3
+    w.close()
+
+
+def test_retries_are_bounded(sink):
+    sink.statuses = [500] * 10
+    w = _worker(workers=1, max_retries=2)
+    w.submit(sink.url + "/hook", "session_complete", {}, timeout=5)
+    assert w.flush(timeout=5)
+    assert (w.failed, w.retried) == (1, 2)
+    assert len(sink.requests) == 3
+    w.close()
+
+
+def test_client_errors_are_not_retried(sink):
+    sink.statuses = [404]
+    w = _worker(workers=1, max_retries=3)
+    w.submit(sink.url + "/hook", "session_complete", {}, timeout=5)
+    assert w.flush(timeout=5)
+    assert (w.failed, w.retried) == (1, 0)
+    w.close()
+
+
+def test_unreachable_host_fails_after_retries():
+    w = _worker(workers=1, max_retries=1)
+    w.submit("http://127.0.0.1:9/hook", "session_complete", {}, timeout=1)
+    assert w.flush(timeout=5)
+    assert (w.failed, w.retried) == (1, 1)
+    w.close()
+
+
+def test_full_queue_drops_without_blocking(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(webhooks, "_post", lambda *a: release.wait(5) and 200)
+    w = _worker(workers=1, queue_size=2)
+    accepted = [w.submit("http://h/x", "session_complete", {}, timeout=1) for _ in range(10)]
+    release.set()
+    assert w.flush(timeout=5)
+    assert accepted.count(False) == w.dropped >= 7
+    assert w.delivered == accepted.count(True)
+    w.close()
+
+
+def test_latency_counters(sink):
+    w = _worker(workers=1)
+    w.submit(sink.url + "/hook", "session_complete", {}, timeout=5)
+    assert w.flush(timeout=5)
+    stats = w.stats()
+    assert stats["latency_ms_avg"] is not None and stats["latency_ms_avg"] >= 0
+    assert stats["latency_ms_max"] >= stats["latency_ms_avg"]
+    assert stats["requests"] == 1 and stats["pending"] == 0
+    w.close()
+
+
+def test_closed_worker_rejects_submissions():
+    w = _worker()
+    w.close()
+    assert w.submit("http://h/x", "session_complete", {}, timeout=1) is False
+    assert w.dropped == 1
+
+
+def test_closed_idle_worker_exits_without_stop_signal(monkeypatch):
+    monkeypatch.setattr(webhooks, "_post", lambda *a: 200)
+    w = _worker(workers=1)
+    w.submit("http://h/x", "session_complete", {}, timeout=1)
+    assert w.flush(timeout=5)
+    with w._lock:
+        w._closed = True  # as when close() found the queue full: no None enqueued
+    w._threads[0].join(timeout=5)
+    assert not w._threads[0].is_alive()
+
+
+def test_default_dispatch_uses_bounded_worker(sink):
+    d = WebhookDispatcher.from_runtime_config({"webhooks": {
+        "session_complete": {"url": sink.url + "/hook"},
+    }})
+    assert d.worker is not None and d.worker.settings == DeliverySettings()
+    for i in range(20):
+        d.dispatch("session_complete", {"session_id": f"s{i}"})
+    assert d.worker.flush(timeout=5)
+    assert d.worker.stats()["workers"] == DeliverySettings().workers
+    assert len(sink.requests) == 20 and {r["batch"] for r in sink.requests} == {None}
+
+
+def test_module_dispatch_uses_configured_worker(sink):
+    worker = configure_delivery({"webhooks": {"delivery": {"workers": 1}}})
+    webhooks.dispatch(sink.url + "/legacy", "SESSION_COMPLETE", {"session_id": "s"})
+    assert worker.flush(timeout=5)
+    assert sink.requests[0]["body"] == {"event": "SESSION_COMPLETE", "session_id": "s"}
+
+
+def test_configure_delivery_lifecycle():
+    cfg = {"webhooks": {"delivery": {"workers": 1}}}
+    first = configure_delivery(cfg)
+    assert configure_delivery(cfg) is first
+    second = configure_delivery({"webhooks": {"delivery": {"workers": 2}}})
+    assert second is not first
+    assert first.submit("http://h/x", "e", {}, timeout=1) is False  # retired
+    default = configure_delivery({})
+    assert default.settings == DeliverySettings()
+    assert webhooks.shared_delivery_worker() is default
+    webhooks.shutdown_delivery_worker()
+    assert webhooks._worker is None
+
+
+def test_load_delivery_settings():
+    assert load_delivery_settings({}) == DeliverySettings()
+    assert load_delivery_settings({"webhooks": {"session_complete": {"url": "x"}}}) == DeliverySettings()
+    settings = load_delivery_settings({"webhooks": {"delivery": {"batch_max": 5, "backoff_seconds": 1}}})
+    assert settings == DeliverySettings(batch_max=5, backoff_seconds=1.0)
+    assert [settings.backoff(n) for n in (1, 2, 3)] == [1.0, 2.0, 4.0]
+    assert DeliverySettings(backoff_seconds=10, backoff_max_seconds=15).backoff(3) == 15
+
+
+@pytest.mark.parametrize("delivery", [
+    [],
+    {"workers": 0},
+    {"queue_size": True},
+    {"max_retries": -1},
+    {"batch_wait_seconds": "soon"},
+    {"backoff_seconds": -0.5},
+])
+def test_load_delivery_settings_invalid(delivery):
+    with pytest.raises(ValueError, match="WEBHOOK_DELIVERY_INVALID"):
+        load_delivery_settings({"webhooks": {"delivery": delivery}})